@@ -0,0 +1,26 @@
+"""
+Shared in-memory indexes over the ByOnco seed catalog
+Each index is built on first use through its get_* accessor.
+"""
+from .ids import stable_id
+from .index import TopK, HospitalIndex, DoctorIndex, get_hospital_index, get_doctor_index
+from .directory import DoctorDirectory, get_doctor_directory
+from .lookup import parse_ids, lookup_many, get_hospitals_by_id, get_doctors_by_id, get_specialists_by_id
+
+__all__ = [
+    'stable_id',
+    'TopK', 'HospitalIndex', 'DoctorIndex', 'get_hospital_index', 'get_doctor_index',
+    'DoctorDirectory', 'get_doctor_directory',
+    'parse_ids', 'lookup_many', 'get_hospitals_by_id', 'get_doctors_by_id', 'get_specialists_by_id',
+    'warm_up',
+]
+
+
+def warm_up():
+    """Load the seed catalog and build every index (e.g. in the background after startup)"""
+    get_hospital_index()
+    get_doctor_index()
+    get_doctor_directory()
+    get_hospitals_by_id()
+    get_doctors_by_id()
+    get_specialists_by_id()
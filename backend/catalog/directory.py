@@ -0,0 +1,96 @@
+"""
+Materialised doctor directory: seed doctors plus rare cancer specialists
+Built once (on first use) so /api/doctors filtering is an index lookup instead of a rebuild
+"""
+from typing import List, Optional, Dict, Any, Iterable
+from functools import lru_cache
+import sys
+from pathlib import Path
+
+# Add parent directory to path to import from data_seed
+parent_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(parent_dir))
+
+import data_seed
+from .ids import stable_id
+
+# Defaults applied to specialists, who are not linked to seed hospitals
+SPECIALIST_RATING = 4.8
+
+
+def specialist_entry(cancer_name: str, specialist: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert a rare cancer specialist into the doctor directory format"""
+    return {
+        "id": stable_id("specialist", cancer_name, specialist.get("name", "")),
+        "name": specialist.get("name", ""),
+        "specialty": ", ".join(specialist.get("specialties", [])) if specialist.get("specialties") else specialist.get("title", "Oncology"),
+        "experience": specialist.get("experience_years", 0),
+        "city": specialist.get("city", ""),
+        "country": specialist.get("country", ""),
+        "region": specialist.get("region", ""),
+        "institution": specialist.get("institution", ""),
+        "title": specialist.get("title", ""),
+        "specialties": specialist.get("specialties", []),
+        "cancer_specialization": cancer_name,
+        "hospital_id": "",
+        "rating": SPECIALIST_RATING,
+        "consultations": 0,
+        "is_specialist": True,
+    }
+
+
+class DoctorDirectory:
+    """
+    Seed doctors followed by every rare cancer specialist, in catalog order.
+
+    Search fields are lowercased once. City lookups go through an exact-match
+    posting list; specialty lookups are a substring match over the (small)
+    set of distinct specialty strings, memoized per query, whose posting
+    lists are then unioned.
+    """
+
+    def __init__(self, doctors: List[Dict[str, Any]], specialists_by_cancer: Dict[str, List[Dict[str, Any]]]):
+        self.entries: List[Dict[str, Any]] = list(doctors)
+        for cancer_name, specialists in specialists_by_cancer.items():
+            for specialist in specialists:
+                self.entries.append(specialist_entry(cancer_name, specialist))
+
+        self.by_city: Dict[str, List[int]] = {}
+        self.by_specialty: Dict[str, List[int]] = {}
+        for position, entry in enumerate(self.entries):
+            self.by_city.setdefault(entry.get("city", "").lower(), []).append(position)
+            terms = [entry.get("specialty", "")] + list(entry.get("specialties", []))
+            for term in dict.fromkeys(t.lower() for t in terms):
+                self.by_specialty.setdefault(term, []).append(position)
+
+        self._specialty_terms = list(self.by_specialty)
+        self._specialty_positions = lru_cache(maxsize=256)(self._match_specialty)
+
+    def _match_specialty(self, query: str) -> frozenset:
+        """Positions of entries with a specialty containing query (lowercase)"""
+        positions = set()
+        for term in self._specialty_terms:
+            if query in term:
+                positions.update(self.by_specialty[term])
+        return frozenset(positions)
+
+    def _positions(self, city: Optional[str], specialty: Optional[str]) -> Iterable[int]:
+        if city:
+            positions: Iterable[int] = self.by_city.get(city.lower(), [])
+        else:
+            positions = range(len(self.entries))
+        if specialty:
+            matches = self._specialty_positions(specialty.lower())
+            positions = [p for p in positions if p in matches]
+        return positions
+
+    def search(self, city: Optional[str] = None, specialty: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Directory entries matching city (case-insensitive) and specialty (contains), in catalog order"""
+        return [self.entries[position] for position in self._positions(city, specialty)]
+
+
+@lru_cache(maxsize=None)
+def get_doctor_directory() -> DoctorDirectory:
+    """Shared doctor directory, built on first use"""
+    from rare_cancers.seed_data import RARE_CANCER_SPECIALISTS
+    return DoctorDirectory(data_seed.DOCTORS, RARE_CANCER_SPECIALISTS)
@@ -0,0 +1,13 @@
+"""
+Deterministic IDs for seed catalog records
+The same record always gets the same ID, across requests, processes and deploys
+"""
+import uuid
+
+# Namespace for uuid5 IDs derived from catalog record names
+CATALOG_ID_NAMESPACE = uuid.uuid5(uuid.NAMESPACE_URL, "https://byoncocare.com/catalog")
+
+
+def stable_id(*parts: str) -> str:
+    """UUID derived from the given name parts (e.g. stable_id("cancer", name))"""
+    return str(uuid.uuid5(CATALOG_ID_NAMESPACE, ":".join(parts)))
@@ -0,0 +1,202 @@
+"""
+Precompiled indexes over the seed hospital and doctor catalogs
+Built once (on first use) so matching endpoints never scan the full catalog per request
+"""
+from typing import List, Optional, Dict, Any, Iterator, Iterable, Tuple, NamedTuple
+from bisect import bisect_right
+from functools import lru_cache
+from itertools import islice
+import heapq
+import sys
+from pathlib import Path
+
+# Add parent directory to path to import from data_seed
+parent_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(parent_dir))
+
+import data_seed
+
+
+def hospital_rank_key(hospital: Dict[str, Any]):
+    """Sort key used by hospital matching (higher is better)"""
+    return (hospital["success_rate"], hospital["beds_available"])
+
+
+def doctor_rank_key(doctor: Dict[str, Any]):
+    """Sort key used by doctor listings (higher is better)"""
+    return (doctor["rating"], doctor["experience"])
+
+
+def iter_bits(mask: int) -> Iterator[int]:
+    """Yield the positions of set bits in ascending order"""
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+
+def count_bits(mask: int) -> int:
+    """Number of set bits in a bitset"""
+    return bin(mask).count("1")
+
+
+class TopK(NamedTuple):
+    """First K matches of a query plus the exact number of matches"""
+    items: List[Dict[str, Any]]
+    total: int
+
+
+class HospitalIndex:
+    """
+    Inverted index over HOSPITALS.
+
+    Every hospital gets a rank position in the global
+    (success_rate, beds_available) descending order. Each filterable
+    attribute maps to a bitset of rank positions, so a match query is a
+    handful of integer ANDs and the surviving bits come out already sorted.
+    """
+
+    def __init__(self, hospitals_by_city: Dict[str, List[Dict[str, Any]]], cities: List[str]):
+        # Catalog order: listed cities first (in CITIES order), then any extra keys.
+        # The ranking sort is stable, so ties keep this order - same as the old scan.
+        ordered_cities = list(dict.fromkeys(c for c in cities if c in hospitals_by_city))
+        ordered_cities += [c for c in hospitals_by_city if c not in ordered_cities]
+
+        catalog = []
+        for city_name in ordered_cities:
+            for hospital in hospitals_by_city[city_name]:
+                catalog.append((city_name, hospital))
+
+        ranked = sorted(catalog, key=lambda item: hospital_rank_key(item[1]), reverse=True)
+        self.hospitals: List[Dict[str, Any]] = [hospital for _, hospital in ranked]
+
+        self.by_city: Dict[str, int] = {}
+        self.by_cancer_type: Dict[str, int] = {}
+        self.by_insurance: Dict[str, int] = {}
+        self.international_mask = 0
+        listed = set(cities)
+        self.listed_cities_mask = 0
+
+        for position, (city_name, hospital) in enumerate(ranked):
+            bit = 1 << position
+            self.by_city[city_name] = self.by_city.get(city_name, 0) | bit
+            if city_name in listed:
+                self.listed_cities_mask |= bit
+            for specialization in hospital["specializations"]:
+                self.by_cancer_type[specialization] = self.by_cancer_type.get(specialization, 0) | bit
+            for insurance_type in hospital.get("insurance_types", []):
+                self.by_insurance[insurance_type] = self.by_insurance.get(insurance_type, 0) | bit
+            if hospital.get("international_patients", False):
+                self.international_mask |= bit
+
+        # Budget filter is a range predicate on cost_range.min: keep the minimum
+        # costs sorted with cumulative bitsets so "min <= budget" is one bisect.
+        by_cost = sorted(range(len(self.hospitals)), key=lambda p: self.hospitals[p]["cost_range"]["min"])
+        self._cost_mins = [self.hospitals[p]["cost_range"]["min"] for p in by_cost]
+        self._cost_prefix_masks = [0]
+        for position in by_cost:
+            self._cost_prefix_masks.append(self._cost_prefix_masks[-1] | (1 << position))
+
+    def match_mask(
+        self,
+        city: Optional[str] = None,
+        cancer_type: Optional[str] = None,
+        budget_max: Optional[int] = None,
+        insurance: Optional[str] = None,
+        international_patient: Optional[bool] = False,
+    ) -> int:
+        """Bitset of ranked hospitals matching every given filter"""
+        mask = self.by_city.get(city, 0) if city else self.listed_cities_mask
+        if cancer_type:
+            mask &= self.by_cancer_type.get(cancer_type, 0)
+        if budget_max:
+            mask &= self._cost_prefix_masks[bisect_right(self._cost_mins, budget_max)]
+        if insurance:
+            mask &= self.by_insurance.get(insurance, 0)
+        if international_patient:
+            mask &= self.international_mask
+        return mask
+
+    def ids(self, mask: int) -> List[str]:
+        """Hospital IDs for a match bitset, in rank order"""
+        return [self.hospitals[position]["id"] for position in iter_bits(mask)]
+
+    def top_k(self, k: Optional[int], mask: Optional[int] = None, **filters) -> TopK:
+        """
+        Top k matching hospitals plus the exact match count.
+        The count is the bitset cardinality; only the returned hospitals are
+        materialised.
+        """
+        if mask is None:
+            mask = self.match_mask(**filters)
+        records = (self.hospitals[position] for position in iter_bits(mask))
+        return TopK(list(islice(records, k)), count_bits(mask))
+
+
+class DoctorIndex:
+    """
+    Join index between hospitals and DOCTORS.
+
+    Doctors are ranked once by (rating, experience) descending. Posting lists
+    of rank positions are kept per hospital, per city and per (hospital, city),
+    so joining a set of matched hospitals is a k-way merge of already sorted
+    lists that can stop as soon as enough doctors have been produced.
+    """
+
+    def __init__(self, doctors: List[Dict[str, Any]]):
+        self.doctors: List[Dict[str, Any]] = sorted(doctors, key=doctor_rank_key, reverse=True)
+
+        # hospital_id -> doctors in catalog order (for per-hospital listings)
+        self.by_hospital: Dict[str, List[Dict[str, Any]]] = {}
+        for doctor in doctors:
+            self.by_hospital.setdefault(doctor.get("hospital_id"), []).append(doctor)
+
+        # Posting lists of rank positions, ascending (= best first)
+        self._by_city: Dict[str, List[int]] = {}
+        self._by_hospital_city: Dict[Tuple[str, Optional[str]], List[int]] = {}
+        for position, doctor in enumerate(self.doctors):
+            hospital_id = doctor.get("hospital_id")
+            self._by_city.setdefault(doctor.get("city"), []).append(position)
+            self._by_hospital_city.setdefault((hospital_id, None), []).append(position)
+            self._by_hospital_city.setdefault((hospital_id, doctor.get("city")), []).append(position)
+
+    def _postings(self, city: Optional[str], hospital_ids: Optional[Iterable[str]]) -> List[List[int]]:
+        """Sorted rank lists whose union is exactly the matching doctors"""
+        if hospital_ids:
+            lists = []
+            for hospital_id in dict.fromkeys(hospital_ids):
+                positions = self._by_hospital_city.get((hospital_id, city or None))
+                if positions:
+                    lists.append(positions)
+            return lists
+        if city:
+            return [self._by_city.get(city, [])]
+        return [range(len(self.doctors))]
+
+    def top_k(
+        self,
+        k: Optional[int],
+        city: Optional[str] = None,
+        hospital_ids: Optional[List[str]] = None,
+    ) -> TopK:
+        """
+        Top k matching doctors, by (rating, experience) descending, plus the
+        exact match count. The k-way merge stops at the k-th doctor; the count
+        is read from the posting list sizes.
+        """
+        postings = self._postings(city, hospital_ids)
+        records = (self.doctors[position] for position in heapq.merge(*postings))
+        total = sum(len(positions) for positions in postings)
+        return TopK(list(islice(records, k)), total)
+
+
+@lru_cache(maxsize=None)
+def get_hospital_index() -> HospitalIndex:
+    """Shared hospital index, built on first use"""
+    return HospitalIndex(data_seed.HOSPITALS, data_seed.CITIES)
+
+
+@lru_cache(maxsize=None)
+def get_doctor_index() -> DoctorIndex:
+    """Shared doctor index, built on first use"""
+    return DoctorIndex(data_seed.DOCTORS)
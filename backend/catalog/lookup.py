@@ -0,0 +1,58 @@
+"""
+Immutable ID -> record maps over the seed catalog
+Shared by every by-ID path so lookups are a dict hit instead of a nested scan
+"""
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, List, Mapping, Optional
+import sys
+from pathlib import Path
+
+# Add parent directory to path to import from data_seed
+parent_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(parent_dir))
+
+import data_seed
+from .directory import get_doctor_directory
+
+
+def build_id_map(records: Iterable[Dict[str, Any]]) -> Mapping[str, Dict[str, Any]]:
+    """Read-only map of record["id"] -> record (first record wins on duplicate IDs)"""
+    by_id: Dict[str, Dict[str, Any]] = {}
+    for record in records:
+        by_id.setdefault(record.get("id"), record)
+    return MappingProxyType(by_id)
+
+
+def parse_ids(ids: Optional[str]) -> List[str]:
+    """Split a comma-separated ?ids= value, dropping blanks and duplicates"""
+    if not ids:
+        return []
+    return list(dict.fromkeys(part.strip() for part in ids.split(",") if part.strip()))
+
+
+def lookup_many(by_id: Mapping[str, Dict[str, Any]], ids: Iterable[str]) -> List[Dict[str, Any]]:
+    """Records for ids in request order; unknown IDs are skipped"""
+    return [by_id[record_id] for record_id in ids if record_id in by_id]
+
+
+@lru_cache(maxsize=None)
+def get_hospitals_by_id() -> Mapping[str, Dict[str, Any]]:
+    """Hospital ID map, built on first use"""
+    return build_id_map(
+        hospital for city_hospitals in data_seed.HOSPITALS.values() for hospital in city_hospitals
+    )
+
+
+@lru_cache(maxsize=None)
+def get_doctors_by_id() -> Mapping[str, Dict[str, Any]]:
+    """Seed doctor ID map, built on first use"""
+    return build_id_map(data_seed.DOCTORS)
+
+
+@lru_cache(maxsize=None)
+def get_specialists_by_id() -> Mapping[str, Dict[str, Any]]:
+    """Rare cancer specialist ID map, built on first use"""
+    return build_id_map(
+        entry for entry in get_doctor_directory().entries if entry.get("is_specialist")
+    )
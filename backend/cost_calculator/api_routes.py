@@ -1,10 +1,25 @@
-from fastapi import APIRouter, HTTPException, Query, Depends
+from fastapi import APIRouter, HTTPException, Query, Depends, Request
 from models import (
     Country, Insurer, CancerType, Stage, HospitalTier,
-    CostCalculationRequest, CostCalculationResponse
+    CostCalculationRequest, CostCalculationResponse,
+    CostCalculationBatchRequest, CostCalculationBatchResponse,
+    CostGridRequest, CostGridResponse, CostUncertaintyResponse,
+    BudgetSolveRequest, BudgetSolveResponse,
+    CostComparisonRequest, CostComparisonResponse,
+    ReferenceBootstrap
 )
-from cost_calculator_service import CostCalculatorService
-from typing import List
+from cost_calculator_service import CostCalculatorService, expand_batch
+from vectorized_engine import calculate_grid
+from monte_carlo import estimate_uncertainty, DEFAULT_SAMPLES, MAX_SAMPLES
+from budget_solver import solve_budget
+from country_comparison import compare_countries
+from assumptions import present
+from fx_rates import fallback_snapshot
+from seed_pipeline import seed_reference_data
+from reference_lists import ReferenceLists, EMPTY_LIST
+from http_cache import cached_json_response
+from typing import List, Optional
+from pydantic import ValidationError
 import logging
 import os
 
@@ -27,6 +42,13 @@ except ImportError:
 def create_api_router(db):
     router = APIRouter(prefix="/api/cost-calculator")
     calculator_service = CostCalculatorService(db)
+    reference_cache = calculator_service.reference_cache
+    
+    @router.on_event("startup")
+    async def watch_reference_tables():
+        """Optionally invalidate the reference cache from a Mongo change stream"""
+        if os.environ.get("COST_REFERENCE_CHANGE_STREAM", "").strip() == "1":
+            reference_cache.start_change_stream()
     
     # Import subscription middleware
     import sys
@@ -36,85 +58,78 @@ def create_api_router(db):
     from payments.middleware import create_subscription_checker
     subscription_checker = create_subscription_checker(db)
     
-    @router.get("/countries", response_model=List[Country])
-    async def get_countries():
-        """Get all available countries - returns mock data if database is empty"""
+    reference_lists = ReferenceLists(reference_cache, {
+        'countries': COUNTRIES_DATA,
+        'insurers': INSURERS_DATA,
+        'cancer_types': CANCER_TYPES_DATA,
+        'stages': STAGES_DATA,
+        'hospital_tiers': HOSPITAL_TIERS_DATA,
+    })
+    
+    async def reference_list_response(request: Request, name: str, label: str):
+        """A pre-serialized reference list with ETag/304 support"""
         try:
-            countries = await db.countries.find().to_list(100)
-            # If database is empty, return fallback mock data
-            if not countries:
-                logger.info("Database empty for countries, returning fallback mock data")
-                return COUNTRIES_DATA
-            return countries
+            snapshot = await reference_lists.snapshot()
+            return cached_json_response(request, snapshot.lists[name])
         except Exception as e:
-            logger.warning(f"Error fetching countries from DB: {str(e)}, returning fallback mock data")
-            return COUNTRIES_DATA
+            logger.error(f"Error fetching {label}: {str(e)}")
+            raise HTTPException(status_code=500, detail=f"Failed to fetch {label}")
+    
+    @router.get("/countries", response_model=List[Country])
+    async def get_countries(request: Request):
+        """Get all available countries - returns mock data if database is empty"""
+        return await reference_list_response(request, 'countries', 'countries')
     
     @router.get("/insurers/{country_id}", response_model=List[Insurer])
-    async def get_insurers_by_country(country_id: str):
+    async def get_insurers_by_country(request: Request, country_id: str):
         """Get all insurers for a specific country - returns mock data if database is empty"""
         try:
-            insurers = await db.insurers.find({'country_id': country_id}).to_list(100)
-            # If database is empty, return fallback mock data
-            if not insurers:
-                logger.info(f"Database empty for insurers ({country_id}), returning fallback mock data")
-                return INSURERS_DATA.get(country_id, [])
-            return insurers
+            snapshot = await reference_lists.snapshot()
+            return cached_json_response(request, snapshot.insurers.get(country_id, EMPTY_LIST))
         except Exception as e:
-            logger.warning(f"Error fetching insurers from DB: {str(e)}, returning fallback mock data")
-            return INSURERS_DATA.get(country_id, [])
+            logger.error(f"Error fetching insurers: {str(e)}")
+            raise HTTPException(status_code=500, detail="Failed to fetch insurers")
     
     @router.get("/cancer-types", response_model=List[CancerType])
-    async def get_cancer_types():
+    async def get_cancer_types(request: Request):
         """Get all cancer types - returns mock data if database is empty"""
-        try:
-            cancer_types = await db.cancer_types.find().to_list(100)
-            # If database is empty, return fallback mock data
-            if not cancer_types:
-                logger.info("Database empty for cancer types, returning fallback mock data")
-                return CANCER_TYPES_DATA
-            return cancer_types
-        except Exception as e:
-            logger.warning(f"Error fetching cancer types from DB: {str(e)}, returning fallback mock data")
-            return CANCER_TYPES_DATA
+        return await reference_list_response(request, 'cancer_types', 'cancer types')
     
     @router.get("/stages", response_model=List[Stage])
-    async def get_stages():
+    async def get_stages(request: Request):
         """Get all cancer stages - returns mock data if database is empty"""
-        try:
-            stages = await db.stages.find().to_list(100)
-            # If database is empty, return fallback mock data
-            if not stages:
-                logger.info("Database empty for stages, returning fallback mock data")
-                return STAGES_DATA
-            return stages
-        except Exception as e:
-            logger.warning(f"Error fetching stages from DB: {str(e)}, returning fallback mock data")
-            return STAGES_DATA
+        return await reference_list_response(request, 'stages', 'stages')
     
     @router.get("/hospital-tiers", response_model=List[HospitalTier])
-    async def get_hospital_tiers():
+    async def get_hospital_tiers(request: Request):
         """Get all hospital tiers - returns mock data if database is empty"""
+        return await reference_list_response(request, 'hospital_tiers', 'hospital tiers')
+    
+    @router.get("/bootstrap", response_model=ReferenceBootstrap)
+    async def get_bootstrap(request: Request):
+        """
+        Every reference list the calculator page needs, in one response:
+        countries, insurers by country, cancer types, stages and hospital tiers,
+        plus a version hash that changes whenever any of them does.
+        """
         try:
-            tiers = await db.hospital_tiers.find().to_list(100)
-            # If database is empty, return fallback mock data
-            if not tiers:
-                logger.info("Database empty for hospital tiers, returning fallback mock data")
-                return HOSPITAL_TIERS_DATA
-            return tiers
+            snapshot = await reference_lists.snapshot()
+            return cached_json_response(request, snapshot.bootstrap)
         except Exception as e:
-            logger.warning(f"Error fetching hospital tiers from DB: {str(e)}, returning fallback mock data")
-            return HOSPITAL_TIERS_DATA
+            logger.error(f"Error fetching reference bootstrap: {str(e)}")
+            raise HTTPException(status_code=500, detail="Failed to fetch reference data")
     
     @router.post("/calculate-cost", response_model=CostCalculationResponse)
     async def calculate_cost(
         request: CostCalculationRequest,
+        include: Optional[str] = Query(None, description="Comma-separated: assumptions, assumption_codes"),
+        locale: Optional[str] = Query(None, description="Render assumptions in this locale (implies include=assumptions)"),
         user: dict = Depends(subscription_checker)
     ):
         """Calculate treatment cost based on all input parameters - Requires active subscription"""
         try:
             result = await calculator_service.calculate_treatment_cost(request)
-            return result
+            return present(result, include, locale)
         except ValueError as e:
             logger.error(f"Validation error: {str(e)}")
             raise HTTPException(status_code=400, detail=str(e))
@@ -122,6 +137,161 @@ def create_api_router(db):
             logger.error(f"Error calculating cost: {str(e)}")
             raise HTTPException(status_code=500, detail="Failed to calculate cost")
     
+    @router.post("/calculate-cost/batch", response_model=CostCalculationBatchResponse)
+    async def calculate_cost_batch(
+        batch: CostCalculationBatchRequest,
+        include: Optional[str] = Query(None, description="Comma-separated: assumptions, assumption_codes"),
+        locale: Optional[str] = Query(None, description="Render assumptions in this locale (implies include=assumptions)"),
+        user: dict = Depends(subscription_checker)
+    ):
+        """
+        Calculate many scenarios in one call - Requires active subscription.
+        Send either {"requests": [...]} or {"base": {...}, "overrides": [{...}, ...]};
+        results are returned in the same order.
+        """
+        try:
+            requests = expand_batch(batch)
+        except ValidationError as e:
+            raise HTTPException(status_code=422, detail=e.errors(include_url=False))
+        except ValueError as e:
+            logger.error(f"Validation error: {str(e)}")
+            raise HTTPException(status_code=400, detail=str(e))
+        
+        try:
+            results = await calculator_service.calculate_batch(requests)
+            return {"count": len(results), "results": [present(result, include, locale) for result in results]}
+        except Exception as e:
+            logger.error(f"Error calculating cost batch: {str(e)}")
+            raise HTTPException(status_code=500, detail="Failed to calculate cost batch")
+    
+    @router.post("/calculate-cost/grid", response_model=CostGridResponse)
+    async def calculate_cost_grid(
+        grid_request: CostGridRequest,
+        user: dict = Depends(subscription_checker)
+    ):
+        """
+        What-if grid over request fields - Requires active subscription.
+        e.g. {"base": {...}, "axes": {"chemo_cycles": [1, 6, 12], "hospital_tier": ["tier_1", "tier_3"]}}
+        returns totals and breakdowns as nested lists indexed [chemo_cycles][hospital_tier].
+        """
+        try:
+            grid = await calculate_grid(calculator_service, grid_request.base, grid_request.axes)
+        except ValidationError as e:
+            raise HTTPException(status_code=422, detail=e.errors(include_url=False))
+        except ValueError as e:
+            logger.error(f"Validation error: {str(e)}")
+            raise HTTPException(status_code=400, detail=str(e))
+        except Exception as e:
+            logger.error(f"Error calculating cost grid: {str(e)}")
+            raise HTTPException(status_code=500, detail="Failed to calculate cost grid")
+        
+        return {
+            "shape": list(grid.shape),
+            "fx_snapshot_id": grid.fx_snapshot_id,
+            "axes": grid.axes,
+            "currency_code": grid.currency_code.tolist(),
+            "totals": {name: values.tolist() for name, values in grid.totals.items()},
+            "breakdown": {name: values.tolist() for name, values in grid.breakdown.items()},
+            "breakdown_usd": {name: values.tolist() for name, values in grid.breakdown_usd.items()},
+        }
+    
+    @router.post("/calculate-cost/uncertainty", response_model=CostUncertaintyResponse)
+    async def calculate_cost_uncertainty(
+        request: CostCalculationRequest,
+        samples: int = Query(DEFAULT_SAMPLES, ge=1, le=MAX_SAMPLES),
+        seed: Optional[int] = None,
+        user: dict = Depends(subscription_checker)
+    ):
+        """
+        P10/P50/P90 cost bands from Monte Carlo sampling - Requires active subscription.
+        Samples complication buffer, stay duration, ICU days, FX drift and
+        insurance coverage; pass seed for reproducible bands.
+        """
+        try:
+            bands = await estimate_uncertainty(calculator_service, request, samples=samples, seed=seed)
+            return bands._asdict()
+        except ValueError as e:
+            logger.error(f"Validation error: {str(e)}")
+            raise HTTPException(status_code=400, detail=str(e))
+        except Exception as e:
+            logger.error(f"Error estimating cost uncertainty: {str(e)}")
+            raise HTTPException(status_code=500, detail="Failed to estimate cost uncertainty")
+    
+    @router.post("/calculate-cost/budget", response_model=BudgetSolveResponse)
+    async def calculate_cost_budget(
+        solve_request: BudgetSolveRequest,
+        user: dict = Depends(subscription_checker)
+    ):
+        """
+        Treatment configurations that fit a budget - Requires active subscription.
+        Searches hospital tier, room category, accommodation level, travel type
+        and drug access across countries and returns the cost/comfort Pareto
+        frontier of the configurations under budget, cheapest first.
+        """
+        try:
+            result = await solve_budget(
+                calculator_service,
+                solve_request.base,
+                solve_request.budget,
+                countries=solve_request.countries,
+                budget_currency=solve_request.budget_currency,
+                budget_basis=solve_request.budget_basis,
+                options=solve_request.options,
+                max_options=solve_request.max_options,
+            )
+            return result._asdict()
+        except ValidationError as e:
+            raise HTTPException(status_code=422, detail=e.errors(include_url=False))
+        except ValueError as e:
+            logger.error(f"Validation error: {str(e)}")
+            raise HTTPException(status_code=400, detail=str(e))
+        except Exception as e:
+            logger.error(f"Error solving cost budget: {str(e)}")
+            raise HTTPException(status_code=500, detail="Failed to find configurations for budget")
+    
+    @router.post("/compare", response_model=CostComparisonResponse)
+    async def compare_cost_across_countries(
+        comparison: CostComparisonRequest,
+        user: dict = Depends(subscription_checker)
+    ):
+        """
+        One treatment priced in several countries, ranked cheapest first - Requires active subscription.
+        e.g. {"request": {...}, "country_ids": ["india", "thailand", "turkey"]}; all countries are
+        evaluated in a single pass with USD and INR totals side by side.
+        """
+        try:
+            result = await compare_countries(
+                calculator_service,
+                comparison.request,
+                country_ids=comparison.country_ids,
+                rank_by=comparison.rank_by,
+            )
+            return result._asdict()
+        except ValidationError as e:
+            raise HTTPException(status_code=422, detail=e.errors(include_url=False))
+        except ValueError as e:
+            logger.error(f"Validation error: {str(e)}")
+            raise HTTPException(status_code=400, detail=str(e))
+        except Exception as e:
+            logger.error(f"Error comparing countries: {str(e)}")
+            raise HTTPException(status_code=500, detail="Failed to compare costs across countries")
+    
+    @router.get("/fx-rates")
+    async def get_fx_rates():
+        """The exchange-rate snapshot cost conversions currently use"""
+        snapshot = await calculator_service.fx_rates.current()
+        return {**snapshot.to_document(), "source": snapshot.source}
+    
+    @router.get("/cache-stats")
+    async def get_cache_stats():
+        """Hit/miss counters for the reference table cache and the memoized results"""
+        return {
+            "reference_tables": reference_cache.stats(),
+            "results": calculator_service.result_cache.stats(),
+            "reference_lists": reference_lists.stats(),
+            "fx_rates": calculator_service.fx_rates.stats(),
+        }
+    
     @router.post("/seed-database")
     async def seed_database(secret: str = Query(..., description="Secret key to authorize seeding")):
         """Seed the database with initial data. Requires secret key for security."""
@@ -131,65 +301,27 @@ def create_api_router(db):
             raise HTTPException(status_code=403, detail="Unauthorized")
         
         try:
-            from seed_data import (
-                COUNTRIES_DATA, INSURERS_DATA, CANCER_TYPES_DATA,
-                STAGES_DATA, HOSPITAL_TIERS_DATA, BASE_COSTS_DATA,
-                ACCOMMODATION_COSTS_DATA
-            )
-            
-            # Clear existing data
-            await db.countries.delete_many({})
-            await db.insurers.delete_many({})
-            await db.cancer_types.delete_many({})
-            await db.stages.delete_many({})
-            await db.hospital_tiers.delete_many({})
-            await db.base_costs.delete_many({})
-            await db.accommodation_costs.delete_many({})
-            
-            # Insert countries
-            await db.countries.insert_many(COUNTRIES_DATA)
-            countries_count = len(COUNTRIES_DATA)
-            
-            # Insert insurers
-            all_insurers = []
-            for country_insurers in INSURERS_DATA.values():
-                all_insurers.extend(country_insurers)
-            await db.insurers.insert_many(all_insurers)
-            insurers_count = len(all_insurers)
-            
-            # Insert cancer types
-            await db.cancer_types.insert_many(CANCER_TYPES_DATA)
-            cancer_types_count = len(CANCER_TYPES_DATA)
-            
-            # Insert stages
-            await db.stages.insert_many(STAGES_DATA)
-            stages_count = len(STAGES_DATA)
-            
-            # Insert hospital tiers
-            await db.hospital_tiers.insert_many(HOSPITAL_TIERS_DATA)
-            tiers_count = len(HOSPITAL_TIERS_DATA)
+            # Written as a new version and activated in one step - live
+            # calculations keep reading the current tables meanwhile
+            seeded = await seed_reference_data(db)
             
-            # Insert base costs
-            await db.base_costs.insert_many(BASE_COSTS_DATA)
-            base_costs_count = len(BASE_COSTS_DATA)
+            # Make sure the shipped FX snapshot exists (newer snapshots are kept)
+            fx_snapshot = fallback_snapshot().to_document()
+            await db.fx_rates.replace_one({"snapshot_id": fx_snapshot["snapshot_id"]}, fx_snapshot, upsert=True)
+            calculator_service.fx_rates.invalidate()
             
-            # Insert accommodation costs
-            await db.accommodation_costs.insert_many(ACCOMMODATION_COSTS_DATA)
-            accommodation_count = len(ACCOMMODATION_COSTS_DATA)
+            # Active version moved - drop cached copies (memoized results follow the version bump)
+            reference_cache.invalidate()
             
             return {
                 "message": "Database seeded successfully",
-                "counts": {
-                    "countries": countries_count,
-                    "insurers": insurers_count,
-                    "cancer_types": cancer_types_count,
-                    "stages": stages_count,
-                    "hospital_tiers": tiers_count,
-                    "base_costs": base_costs_count,
-                    "accommodation_costs": accommodation_count
-                }
+                "seed_version": seeded.version,
+                "previous_seed_version": seeded.previous_version,
+                "counts": seeded.counts
             }
         except Exception as e:
+            # Live tables are intact; the pointer may have moved if only the cleanup failed
+            reference_cache.invalidate()
             logger.error(f"Error seeding database: {str(e)}")
             raise HTTPException(status_code=500, detail=f"Failed to seed database: {str(e)}")
     
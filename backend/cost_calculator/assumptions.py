@@ -0,0 +1,107 @@
+"""
+Structured calculation assumptions and their text rendering
+The calculator records each assumption as a code plus parameters; text is
+only rendered for clients that ask for it (?include=assumptions or a
+locale), so totals-only callers, batches and grids skip it entirely.
+"""
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Set
+
+DEFAULT_LOCALE = 'en'
+
+# locale -> code -> str.format template over the assumption's params
+MESSAGES: Dict[str, Dict[str, str]] = {
+    'en': {
+        'default_country_data': "Using default country data for {country_id}",
+        'default_base_costs': "Using default base costs for {country_id}",
+        'surgery': "Surgery: {surgery_type}, {surgery_days} days ward + {icu_days} days ICU, Room: {room_category}",
+        'chemotherapy': "Chemotherapy: {chemo_cycles} cycles of {regimen_type}, Drug access: {drug_access}",
+        'concurrent_chemo': "Concurrent chemotherapy included with radiation",
+        'radiation': "Radiation: {radiation_fractions} fractions using {radiation_technique}",
+        'transplant': "Transplant: {transplant_type}, {transplant_days} days hospitalization",
+        'ngs_panel': "NGS panel testing included",
+        'diagnostics': "Diagnostics: {pet_ct_count} PET-CT, {mri_ct_count} MRI/CT scans, {opd_consults} OPD consultations",
+        'medical_tourism': "Medical tourism: {companions} companion(s), {stay_duration} days, {accommodation_level} accommodation, {travel_type} travel",
+        'custom_coverage': "Custom insurance coverage: Inpatient {inpatient}%, Outpatient {outpatient}%, Drugs {drugs}%",
+        'insurer_coverage': "Insurance: {insurer} - Inpatient {inpatient}%, Outpatient {outpatient}%, Drugs {drugs}%",
+        'default_coverage': "Using default insurance coverage: Inpatient {inpatient}%, Outpatient {outpatient}%, Drugs {drugs}%",
+        'insurance_terms': "Insurance deductible: {deductible} {currency}, Co-pay: {copay_percent}%",
+        'no_insurance': "No insurance coverage",
+        'base_currency': "Currency: {currency_code} (base currency)",
+        'exchange_rate': "Exchange rate: 1 USD = {exchange_rate} {currency_code} (reference rate as of {as_of})",
+        'usd_conversion': "Converted to USD using exchange rate: {exchange_rate}",
+        'hospital_tier': "Hospital tier: {name} (multiplier: {multiplier}x)",
+        'complication_buffer': "Complication buffer: {percent}%",
+        'confidence_level': "Confidence level: {level}",
+        'country_baseline': "Country-level baseline data used for {country}",
+        'data_version': "Estimate based on data updated: Dec 29, 2025 (v3.1 - Multi-country with updated exchange rates)",
+        'national_averages': "⚠️ Using conservative national averages - city-level pricing not available",
+        'diagnostics_only': "⚠️ No treatment modalities selected - estimate includes diagnostics only",
+        'cancer_type_missing': "⚠️ Cancer type not specified - using generic cost estimates",
+        'stage_missing': "⚠️ Stage not specified - using average stage cost estimates",
+        'calculation_error': "⚠️ Calculation error occurred - showing conservative estimate",
+        'verify_inputs': "Please verify your inputs and try again",
+        'error_detail': "Error: {error}",
+        'critical_error': "⚠️ Critical error - unable to calculate estimate",
+        'contact_support': "Please contact support or try again later",
+    },
+}
+
+# What ?include= can ask for
+INCLUDE_ASSUMPTIONS = 'assumptions'
+INCLUDE_ASSUMPTION_CODES = 'assumption_codes'
+
+
+class Assumption(NamedTuple):
+    """One assumption as recorded during a calculation"""
+    code: str
+    params: Dict[str, Any]
+
+
+def note(code: str, **params) -> Assumption:
+    return Assumption(code, params)
+
+
+def resolve_locale(locale: Optional[str]) -> str:
+    """Best supported locale for e.g. 'en-IN' or an Accept-Language style 'hi-IN,en;q=0.8'"""
+    if locale:
+        for candidate in locale.split(','):
+            tag = candidate.split(';')[0].strip().lower()
+            for option in (tag, tag.split('-')[0]):
+                if option in MESSAGES:
+                    return option
+    return DEFAULT_LOCALE
+
+
+def render(assumptions: Iterable[Any], locale: Optional[str] = None) -> List[str]:
+    """
+    Text for recorded assumptions (Assumption tuples or objects with
+    code/params), falling back to English for codes a locale lacks.
+    """
+    messages = MESSAGES[resolve_locale(locale)]
+    fallback = MESSAGES[DEFAULT_LOCALE]
+    rendered = []
+    for assumption in assumptions:
+        template = messages.get(assumption.code) or fallback.get(assumption.code)
+        rendered.append(template.format(**assumption.params) if template else assumption.code)
+    return rendered
+
+
+def parse_include(include: Optional[str]) -> Set[str]:
+    """?include=assumptions,assumption_codes -> {'assumptions', 'assumption_codes'}"""
+    if not include:
+        return set()
+    return {part.strip() for part in include.split(',') if part.strip()}
+
+
+def present(response, include: Optional[str] = None, locale: Optional[str] = None):
+    """
+    Copy of a CostCalculationResponse shaped for the client: assumption text
+    only if asked for (or a locale is given), structured codes only if asked for.
+    """
+    parts = parse_include(include)
+    update: Dict[str, Any] = {'assumptions': [], 'assumption_codes': []}
+    if INCLUDE_ASSUMPTIONS in parts or locale:
+        update['assumptions'] = render(response.assumption_codes, locale)
+    if INCLUDE_ASSUMPTION_CODES in parts:
+        update['assumption_codes'] = response.assumption_codes
+    return response.model_copy(update=update)
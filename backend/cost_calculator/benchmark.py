@@ -0,0 +1,437 @@
+"""
+Benchmark and regression check for the cost calculator hot path
+
+Runs a fixture corpus of realistic requests (every country x hospital tier
+x treatment profile x insurance setup) against CostCalculatorService backed
+by an in-memory Mongo (mongomock-motor, seeded from seed_data.py) and
+reports, per scenario:
+
+    throughput_per_s         calls per second
+    p50_ms / p99_ms          per-call latency
+    alloc_kib_per_call       peak traced memory per call (tracemalloc pass)
+    db_round_trips_per_call  awaited Mongo operations per call
+    db_serial_round_trips_per_call
+                             round-trips on the critical path: operations
+                             that overlap (asyncio.gather) count once
+
+Scenarios:
+    cold      fresh service per call - every reference table comes from Mongo
+    warm      reference tables cached, result memo disabled - the real hot path
+    memoized  repeat requests answered from the result memo
+
+Needs the dev requirements (pip install -r backend/requirements-dev.txt).
+
+Usage (from backend/cost_calculator):
+    python benchmark.py                    # compare against benchmark_baseline.json
+    python benchmark.py --update-baseline  # record this run as the baseline
+    python benchmark.py --output run.json  # also keep this run's results
+
+Exits 1 if a deterministic metric regressed: any extra round-trip, or
+allocations past their tolerance (only gated when the Python version
+matches the baseline's). Timings depend on the machine, so they are
+reported against the baseline as advisory and never fail the run.
+"""
+import argparse
+import asyncio
+import inspect
+import json
+import logging
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from models import CostCalculationRequest
+from cost_calculator_service import CostCalculatorService
+from fx_rates import fallback_snapshot
+from seed_pipeline import seed_reference_data
+from seed_data import COUNTRIES_DATA, INSURERS_DATA, HOSPITAL_TIERS_DATA
+
+BASELINE_PATH = Path(__file__).parent / 'benchmark_baseline.json'
+
+DEFAULT_REPEAT = 3
+# Event loop turns each simulated round-trip takes: enough for every
+# operation started in the same asyncio.gather stage (through wait_for
+# and nested gathers) to be in flight together. Deterministic, unlike sleeping.
+LATENCY_LOOP_TURNS = 10
+# Allowed relative change before a metric is reported (timings) or fails
+# the run (allocations)
+DEFAULT_TIME_TOLERANCE = 0.30
+DEFAULT_ALLOC_TOLERANCE = 0.10
+
+# metric -> True if higher is better
+# Machine dependent: compared for information only
+ADVISORY_METRICS = {
+    'throughput_per_s': True,
+    'p50_ms': False,
+    'p99_ms': False,
+}
+# Deterministic for a given corpus and Python version: these gate the run
+GATED_METRICS = {
+    'alloc_kib_per_call': False,
+    'db_round_trips_per_call': False,
+    'db_serial_round_trips_per_call': False,
+}
+METRICS = {**ADVISORY_METRICS, **GATED_METRICS}
+
+# Treatment plans families actually price
+TREATMENT_PROFILES = {
+    'breast_surgery_chemo': {
+        'cancer_type': 'breast', 'stage': 'stage_2',
+        'include_surgery': True, 'surgery_type': 'mastectomy', 'surgery_days': 5, 'icu_days': 1,
+        'include_chemo': True, 'regimen_type': 'standard_chemo', 'chemo_cycles': 6,
+    },
+    'lung_chemoradiation': {
+        'cancer_type': 'lung_nsclc', 'stage': 'stage_3',
+        'include_chemo': True, 'regimen_type': 'targeted', 'chemo_cycles': 4, 'drug_access': 'originator',
+        'include_radiation': True, 'radiation_technique': 'imrt', 'radiation_fractions': 30,
+        'concurrent_chemo': True, 'include_ngs': True,
+    },
+    'leukemia_transplant': {
+        'cancer_type': 'leukemia_aml', 'stage': 'stage_4', 'cancer_category': 'rare',
+        'include_chemo': True, 'regimen_type': 'standard_chemo', 'chemo_cycles': 4,
+        'include_transplant': True, 'transplant_type': 'allogeneic', 'transplant_days': 45,
+        'room_category': 'private', 'icu_days': 7,
+    },
+    'prostate_radiation': {
+        'cancer_type': 'prostate', 'stage': 'stage_1',
+        'include_radiation': True, 'radiation_technique': 'sbrt', 'radiation_fractions': 5,
+        'pet_ct_count': 1, 'mri_ct_count': 2, 'opd_consults': 6,
+    },
+    'diagnostics_only': {
+        'cancer_type': 'pancreatic', 'stage': 'stage_4',
+        'pet_ct_count': 3, 'mri_ct_count': 6, 'include_ngs': True,
+    },
+}
+
+INSURANCE_SETUPS = ('uninsured', 'insurer', 'custom')
+
+
+def build_corpus() -> List[CostCalculationRequest]:
+    """Deterministic requests covering every country, tier, profile and insurance setup"""
+    corpus = []
+    for country in COUNTRIES_DATA:
+        insurers = INSURERS_DATA.get(country['id']) or [{}]
+        for tier in HOSPITAL_TIERS_DATA:
+            for profile in TREATMENT_PROFILES.values():
+                for setup in INSURANCE_SETUPS:
+                    fields: Dict[str, Any] = {
+                        'country': country['id'],
+                        'hospital_tier': tier['id'],
+                        **profile,
+                        'companions': 1 if country['id'] == 'india' else 2,
+                        'stay_duration': 30 if profile.get('include_transplant') else 60,
+                        'travel_type': 'economy',
+                    }
+                    if setup == 'insurer':
+                        fields.update(has_insurance=True, insurer=insurers[len(corpus) % len(insurers)].get('id'))
+                    elif setup == 'custom':
+                        fields.update(has_insurance=True, custom_coverage=True, deductible=1000, copay_percent=10)
+                    corpus.append(CostCalculationRequest(**fields))
+    return corpus
+
+
+class _CountingCursor:
+    """Cursor proxy: one round-trip per to_list() / async iteration"""
+
+    def __init__(self, database: 'CountingDatabase', cursor):
+        self._database = database
+        self._cursor = cursor
+
+    def sort(self, *args, **kwargs):
+        self._cursor = self._cursor.sort(*args, **kwargs)
+        return self
+
+    def limit(self, *args, **kwargs):
+        self._cursor = self._cursor.limit(*args, **kwargs)
+        return self
+
+    def skip(self, *args, **kwargs):
+        self._cursor = self._cursor.skip(*args, **kwargs)
+        return self
+
+    async def to_list(self, *args, **kwargs):
+        return await self._database.round_trip(self._cursor.to_list(*args, **kwargs))
+
+    def __aiter__(self):
+        self._database.round_trips += 1
+        return self._cursor.__aiter__()
+
+
+class _CountingCollection:
+    """Collection proxy: every awaited operation counts as a round-trip"""
+
+    def __init__(self, database: 'CountingDatabase', collection):
+        self._database = database
+        self._collection = collection
+
+    def find(self, *args, **kwargs) -> _CountingCursor:
+        return _CountingCursor(self._database, self._collection.find(*args, **kwargs))
+
+    def __getattr__(self, name: str):
+        attribute = getattr(self._collection, name)
+        if not callable(attribute):
+            return attribute
+
+        def call(*args, **kwargs):
+            result = attribute(*args, **kwargs)
+            if inspect.isawaitable(result):
+                return self._database.round_trip(result)
+            return result
+        return call
+
+
+class CountingDatabase:
+    """Motor-style database proxy that counts round-trips, and those on the critical path"""
+
+    def __init__(self, db):
+        self._db = db
+        self.round_trips = 0
+        # Round-trips started while no other was in flight
+        self.serial_round_trips = 0
+        self._in_flight = 0
+
+    async def round_trip(self, operation: Awaitable[Any]) -> Any:
+        self.round_trips += 1
+        if self._in_flight == 0:
+            self.serial_round_trips += 1
+        self._in_flight += 1
+        try:
+            # Simulated latency, so operations that are gathered overlap
+            for _ in range(LATENCY_LOOP_TURNS):
+                await asyncio.sleep(0)
+            return await operation
+        finally:
+            self._in_flight -= 1
+
+    def __getitem__(self, name: str) -> _CountingCollection:
+        return _CountingCollection(self, self._db[name])
+
+    def __getattr__(self, name: str) -> _CountingCollection:
+        if name.startswith('_'):
+            raise AttributeError(name)
+        return self[name]
+
+
+async def create_database() -> CountingDatabase:
+    """In-memory Mongo seeded like seed_database.py"""
+    try:
+        from mongomock_motor import AsyncMongoMockClient
+    except ImportError:
+        sys.exit("benchmark.py needs mongomock-motor: pip install -r requirements-dev.txt (in backend/)")
+    db = AsyncMongoMockClient()['cost_calculator_benchmark']
+    await seed_reference_data(db)
+    await db.fx_rates.insert_one(fallback_snapshot().to_document())
+    return CountingDatabase(db)
+
+
+def _percentile(sorted_values: List[float], percent: float) -> float:
+    """Nearest-rank percentile"""
+    index = max(0, min(len(sorted_values) - 1, round(percent / 100.0 * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+async def measure(
+    db: CountingDatabase,
+    call: Callable[[CostCalculationRequest], Awaitable[Any]],
+    corpus: List[CostCalculationRequest],
+    repeat: int,
+) -> Dict[str, float]:
+    """Time `repeat` passes over corpus, then one tracemalloc pass for allocations"""
+    latencies = []
+    round_trips, serial_round_trips = db.round_trips, db.serial_round_trips
+    started = time.perf_counter()
+    for _ in range(repeat):
+        for request in corpus:
+            call_started = time.perf_counter()
+            await call(request)
+            latencies.append(time.perf_counter() - call_started)
+    elapsed = time.perf_counter() - started
+    calls = len(latencies)
+    round_trips = db.round_trips - round_trips
+    serial_round_trips = db.serial_round_trips - serial_round_trips
+
+    # Separate pass: tracing slows everything down, so it must not skew the timings
+    peaks = []
+    tracemalloc.start()
+    try:
+        for request in corpus:
+            tracemalloc.reset_peak()
+            before, _ = tracemalloc.get_traced_memory()
+            await call(request)
+            _, peak = tracemalloc.get_traced_memory()
+            peaks.append(peak - before)
+    finally:
+        tracemalloc.stop()
+
+    latencies.sort()
+    return {
+        'calls': calls,
+        'throughput_per_s': round(calls / elapsed, 1),
+        'p50_ms': round(_percentile(latencies, 50) * 1000, 4),
+        'p99_ms': round(_percentile(latencies, 99) * 1000, 4),
+        'alloc_kib_per_call': round(statistics.mean(peaks) / 1024, 2),
+        'db_round_trips_per_call': round(round_trips / calls, 3),
+        'db_serial_round_trips_per_call': round(serial_round_trips / calls, 3),
+    }
+
+
+async def run_benchmark(repeat: int = DEFAULT_REPEAT) -> Dict[str, Any]:
+    corpus = build_corpus()
+    db = await create_database()
+
+    async def cold(request):
+        await CostCalculatorService(db).calculate_treatment_cost(request)
+
+    warm_service = CostCalculatorService(db)
+    warm_service.result_cache.max_entries = 0
+    for request in corpus:
+        await warm_service.calculate_treatment_cost(request)
+
+    memo_service = CostCalculatorService(db)
+    for request in corpus:
+        await memo_service.calculate_treatment_cost(request)
+
+    scenarios = {
+        'cold': cold,
+        'warm': warm_service.calculate_treatment_cost,
+        'memoized': memo_service.calculate_treatment_cost,
+    }
+    results = {}
+    for name, call in scenarios.items():
+        # The cold scenario reloads every table per call - keep it to one pass
+        results[name] = await measure(db, call, corpus, 1 if name == 'cold' else repeat)
+    return {
+        'environment': {
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'corpus_size': len(corpus),
+            'repeat': repeat,
+        },
+        'scenarios': results,
+    }
+
+
+def _python_minor(results: Dict[str, Any]) -> str:
+    return '.'.join(str(results.get('environment', {}).get('python', '')).split('.')[:2])
+
+
+def allocations_comparable(results: Dict[str, Any], baseline: Dict[str, Any]) -> bool:
+    """Allocation sizes only compare across runs of the same Python version"""
+    return _python_minor(results) == _python_minor(baseline)
+
+
+def _worse(
+    results: Dict[str, Any],
+    baseline: Dict[str, Any],
+    tolerances: Dict[str, float],
+    higher_is_better: Dict[str, bool],
+) -> List[str]:
+    """Metrics that moved the wrong way past their tolerance, as human-readable lines"""
+    lines = []
+    for scenario, metrics in results['scenarios'].items():
+        expected = baseline.get('scenarios', {}).get(scenario)
+        if not expected:
+            continue
+        for metric, tolerance in tolerances.items():
+            if metric not in expected:
+                continue
+            old, new = expected[metric], metrics[metric]
+            if higher_is_better[metric]:
+                worse = new < old * (1 - tolerance)
+            else:
+                worse = new > old * (1 + tolerance) + 1e-9
+            if worse:
+                lines.append(f"{scenario}.{metric}: {old} -> {new} (tolerance {tolerance:.0%})")
+    return lines
+
+
+def compare(
+    results: Dict[str, Any],
+    baseline: Dict[str, Any],
+    alloc_tolerance: float = DEFAULT_ALLOC_TOLERANCE,
+) -> List[str]:
+    """Regressions in the gated (deterministic) metrics"""
+    # Any extra round-trip is a regression
+    tolerances = {'db_round_trips_per_call': 0.0, 'db_serial_round_trips_per_call': 0.0}
+    if allocations_comparable(results, baseline):
+        tolerances['alloc_kib_per_call'] = alloc_tolerance
+    return _worse(results, baseline, tolerances, GATED_METRICS)
+
+
+def timing_changes(
+    results: Dict[str, Any],
+    baseline: Dict[str, Any],
+    time_tolerance: float = DEFAULT_TIME_TOLERANCE,
+) -> List[str]:
+    """Timings slower than the baseline past time_tolerance - advisory, never a failure"""
+    return _worse(results, baseline, dict.fromkeys(ADVISORY_METRICS, time_tolerance), ADVISORY_METRICS)
+
+
+def print_report(results: Dict[str, Any], baseline: Optional[Dict[str, Any]]):
+    print(f"Corpus: {results['environment']['corpus_size']} requests, repeat {results['environment']['repeat']}")
+    header = f"{'scenario':<10}" + ''.join(f"{metric:>32}" for metric in METRICS)
+    print(header)
+    print('-' * len(header))
+    for scenario, metrics in results['scenarios'].items():
+        row = f"{scenario:<10}"
+        expected = (baseline or {}).get('scenarios', {}).get(scenario, {})
+        for metric in METRICS:
+            cell = f"{metrics[metric]}"
+            if metric in expected:
+                cell += f" ({expected[metric]})"
+            row += f"{cell:>32}"
+        print(row)
+    if baseline:
+        print("(baseline values in parentheses; timings are advisory)")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--repeat', type=int, default=DEFAULT_REPEAT, help="passes over the corpus per scenario")
+    parser.add_argument('--baseline', type=Path, default=BASELINE_PATH)
+    parser.add_argument('--update-baseline', action='store_true', help="record this run as the baseline")
+    parser.add_argument('--output', type=Path, help="also write this run's results here")
+    parser.add_argument('--time-tolerance', type=float, default=DEFAULT_TIME_TOLERANCE, help="report timings this much slower (advisory)")
+    parser.add_argument('--alloc-tolerance', type=float, default=DEFAULT_ALLOC_TOLERANCE)
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.ERROR)
+    results = asyncio.run(run_benchmark(args.repeat))
+
+    baseline = None
+    if args.baseline.exists() and not args.update_baseline:
+        baseline = json.loads(args.baseline.read_text())
+    print_report(results, baseline)
+
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2) + '\n')
+    if baseline is None:
+        args.baseline.write_text(json.dumps(results, indent=2) + '\n')
+        print(f"\nBaseline written to {args.baseline}")
+        return 0
+
+    slower = timing_changes(results, baseline, args.time_tolerance)
+    if slower:
+        print("\n⚠️ Slower than the baseline (advisory - timings depend on the machine):")
+        for line in slower:
+            print(f"   {line}")
+    if not allocations_comparable(results, baseline):
+        print(f"\n⚠️ Baseline recorded on Python {baseline.get('environment', {}).get('python')}, "
+              f"allocations not gated")
+
+    regressions = compare(results, baseline, args.alloc_tolerance)
+    if regressions:
+        print("\n❌ Regressions against baseline:")
+        for line in regressions:
+            print(f"   {line}")
+        return 1
+    print("\n✅ No regressions against baseline")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,182 @@
+"""
+Reverse cost solver: treatment configurations that fit a budget
+Patients start from a budget rather than a configuration. Given the
+treatment (required modalities and their details) and a set of countries,
+this searches hospital tier, room category, accommodation level, travel
+type and drug access with the vectorized engine, and returns the
+configurations under budget that are Pareto-optimal for cost vs. comfort.
+
+Comfort is derived from the same tables the calculator prices with: within
+each searched field, options are ranked by their multiplier in
+default_data.py (a pricier option is the more comfortable one), scaled to
+0-1, and the comfort score is the mean rank x 100. Fields that can't change
+the price (room category without surgery, drug access without chemo) are
+left at the request's value and don't count towards comfort.
+"""
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence
+import numpy as np
+
+from models import CostCalculationRequest
+from vectorized_engine import MAX_GRID_SIZE, calculate_grid
+from default_data import (
+    HOSPITAL_TIER_MULTIPLIERS, ROOM_CATEGORY_MULTIPLIERS, DRUG_ACCESS_MULTIPLIERS,
+    TRAVEL_TYPE_MULTIPLIERS, DEFAULT_COUNTRY,
+)
+
+# Searched field -> option -> value ordering its comfort (higher = more comfortable)
+SEARCH_FIELDS: Dict[str, Dict[str, float]] = {
+    'hospital_tier': HOSPITAL_TIER_MULTIPLIERS,
+    'room_category': ROOM_CATEGORY_MULTIPLIERS,
+    'accommodation_level': DEFAULT_COUNTRY['accommodation'],
+    'travel_type': TRAVEL_TYPE_MULTIPLIERS,
+    'drug_access': DRUG_ACCESS_MULTIPLIERS,
+}
+
+# Searched field -> request flag without which it doesn't affect the price
+RELEVANT_WHEN = {
+    'room_category': 'include_surgery',
+    'drug_access': 'include_chemo',
+}
+
+# What the budget is compared against
+BUDGET_BASES = {
+    'out_of_pocket': 'patient_out_of_pocket_usd',
+    'total': 'total_cost_usd',
+}
+
+DEFAULT_MAX_OPTIONS = 50
+
+
+class BudgetFrontier(NamedTuple):
+    """Pareto frontier of a budget search, cheapest first"""
+    budget_usd: float
+    fx_snapshot_id: str
+    searched: Dict[str, List[str]]
+    evaluated: int
+    feasible: int
+    frontier: List[Dict[str, Any]]
+    cheapest: Optional[Dict[str, Any]]  # cheapest configuration overall, even if over budget
+
+
+def comfort_ranks(field: str, options: Sequence[str]) -> np.ndarray:
+    """Comfort of each option in 0-1 by its rank in SEARCH_FIELDS[field]"""
+    ordered = sorted(SEARCH_FIELDS[field], key=SEARCH_FIELDS[field].get)
+    if len(ordered) < 2:
+        return np.zeros(len(options))
+    return np.array([ordered.index(option) / (len(ordered) - 1) for option in options])
+
+
+def search_space(
+    base: CostCalculationRequest,
+    options: Optional[Dict[str, List[str]]] = None,
+) -> Dict[str, List[str]]:
+    """
+    Options to try per searched field: every known option, or the caller's
+    subset; fields that can't change the price are left out.
+    """
+    options = options or {}
+    unknown = set(options) - set(SEARCH_FIELDS)
+    if unknown:
+        raise ValueError(f"Cannot search fields: {', '.join(sorted(unknown))}")
+    space = {}
+    for field, table in SEARCH_FIELDS.items():
+        flag = RELEVANT_WHEN.get(field)
+        if flag and not getattr(base, flag):
+            continue
+        values = list(dict.fromkeys(options.get(field) or table))
+        invalid = [value for value in values if value not in table]
+        if invalid:
+            raise ValueError(f"Unknown {field} options: {', '.join(invalid)} (expected one of {', '.join(table)})")
+        space[field] = values
+    return space
+
+
+def pareto_frontier(cost: np.ndarray, comfort: np.ndarray) -> np.ndarray:
+    """
+    Indices of the points no other point beats on both lower cost and
+    higher comfort, cheapest first (ties keep a single point).
+    """
+    if cost.size == 0:
+        return np.zeros(0, dtype=np.int64)
+    # Cheapest first, most comfortable first among equal costs
+    order = np.lexsort((-comfort, cost))
+    sorted_comfort = comfort[order]
+    best_before = np.concatenate(([-np.inf], np.maximum.accumulate(sorted_comfort)[:-1]))
+    return order[sorted_comfort > best_before]
+
+
+async def solve_budget(
+    service,
+    base: CostCalculationRequest,
+    budget: float,
+    countries: Optional[List[str]] = None,
+    budget_currency: str = 'USD',
+    budget_basis: str = 'out_of_pocket',
+    options: Optional[Dict[str, List[str]]] = None,
+    max_options: int = DEFAULT_MAX_OPTIONS,
+) -> BudgetFrontier:
+    """
+    Configurations of base across countries that cost at most budget,
+    reduced to the cost/comfort Pareto frontier.
+    base carries the treatment itself (include_* flags, cycles, insurance);
+    its country is replaced by each of countries (default: base.country).
+    """
+    if budget_basis not in BUDGET_BASES:
+        raise ValueError(f"budget_basis must be one of: {', '.join(BUDGET_BASES)}")
+    if not budget > 0:
+        raise ValueError("budget must be positive")
+
+    countries = list(dict.fromkeys(countries or [base.country]))
+    space = search_space(base, options)
+    axes = {'country': countries, **space}
+    size = int(np.prod([len(values) for values in axes.values()], dtype=np.int64))
+    if size > MAX_GRID_SIZE:
+        raise ValueError(f"Search too large: {size} configurations (max {MAX_GRID_SIZE})")
+
+    fx = await service.fx_rates.current()
+    rate = fx.rate(budget_currency)
+    if rate is None:
+        raise ValueError(f"No exchange rate for budget currency {budget_currency}")
+    budget_usd = budget / rate
+
+    grid = await calculate_grid(service, base, axes, fx)
+
+    # Mean comfort rank over the searched fields, broadcast to the grid
+    comfort = np.zeros(grid.shape)
+    for dim, field in enumerate(space, start=1):
+        shape = [1] * len(grid.shape)
+        shape[dim] = len(space[field])
+        comfort = comfort + comfort_ranks(field, space[field]).reshape(shape)
+    comfort = np.round(comfort / max(len(space), 1) * 100.0, 1)
+
+    cost = grid.totals[BUDGET_BASES[budget_basis]].ravel()
+    comfort = comfort.ravel()
+    feasible = np.flatnonzero(cost <= budget_usd)
+    frontier = feasible[pareto_frontier(cost[feasible], comfort[feasible])][:max_options]
+
+    names = list(axes)
+
+    def option(index: int) -> Dict[str, Any]:
+        position = np.unravel_index(index, grid.shape)
+        configuration = {name: grid.axes[name][i] for name, i in zip(names, position)}
+        return {
+            'country': configuration.pop('country'),
+            'configuration': configuration,
+            'comfort_score': float(comfort[index]),
+            'currency_code': str(grid.currency_code[position]),
+            'total_cost_local': float(grid.totals['total_cost_local'][position]),
+            'total_cost_usd': float(grid.totals['total_cost_usd'][position]),
+            'total_cost_inr': float(grid.totals['total_cost_inr'][position]),
+            'patient_out_of_pocket_usd': float(grid.totals['patient_out_of_pocket_usd'][position]),
+        }
+
+    cheapest = int(np.lexsort((-comfort, cost))[0]) if cost.size else None
+    return BudgetFrontier(
+        budget_usd=round(budget_usd, 2),
+        fx_snapshot_id=grid.fx_snapshot_id,
+        searched=space,
+        evaluated=int(cost.size),
+        feasible=int(feasible.size),
+        frontier=[option(int(index)) for index in frontier],
+        cheapest=option(cheapest) if cheapest is not None else None,
+    )
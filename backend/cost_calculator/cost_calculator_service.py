@@ -1,6 +1,10 @@
-from models import CostCalculationRequest, CostCalculationResponse, CostBreakdown
-from typing import Dict, Any, List
+from models import CostCalculationRequest, CostCalculationResponse, CostBreakdown, CostCalculationBatchRequest
+from typing import Dict, Any, List, NamedTuple, Optional, Tuple
+import asyncio
+import hashlib
+import json
 import logging
+import os
 from default_data import (
     DEFAULT_COUNTRY, DEFAULT_BASE_COSTS, DEFAULT_ACCOMMODATION_COSTS,
     HOSPITAL_TIER_MULTIPLIERS, DEFAULT_HOSPITAL_TIER_MULTIPLIER,
@@ -10,110 +14,422 @@ from default_data import (
     FOOD_COST_PER_DAY_USD, DEFAULT_INSURANCE_COVERAGE,
     normalize_number, clamp_number, get_country_data, get_base_costs, get_accommodation_costs
 )
+from reference_cache import ReferenceCache
+from result_cache import ResultCache
+from assumptions import Assumption, note
+from fx_rates import FxRateTable, FxSnapshot
 
 logger = logging.getLogger(__name__)
 
+
+def _lookup_timeout_from_env() -> float:
+    try:
+        return float(os.environ.get('COST_REFERENCE_LOOKUP_TIMEOUT_SECONDS', '').strip() or 2.0)
+    except ValueError:
+        return 2.0
+
+
+# Per-lookup timeout when reference data has to come from Mongo
+REFERENCE_LOOKUP_TIMEOUT_SECONDS = _lookup_timeout_from_env()
+
+# Upper bound on scenarios in one /calculate-cost/batch call
+MAX_BATCH_SIZE = 500
+
+# Numeric inputs: field -> (default, min, max)
+INPUT_LIMITS: Dict[str, Tuple[float, float, float]] = {
+    'surgery_days': (3, 1, 30),
+    'icu_days': (0, 0, 15),
+    'chemo_cycles': (6, 1, 24),
+    'radiation_fractions': (25, 1, 40),
+    'transplant_days': (30, 14, 60),
+    'pet_ct_count': (2, 0, 10),
+    'mri_ct_count': (4, 0, 20),
+    'opd_consults': (10, 1, 30),
+    'companions': (1, 0, 5),
+    'stay_duration': (60, 7, 180),
+    'return_trips': (1, 1, 5),
+    'complication_buffer': (15, 0, 30),
+    'copay_percent': (20, 0, 50),
+}
+
+# Option fields and the value the calculator uses when they are unset
+OPTION_DEFAULTS: Dict[str, str] = {
+    'surgery_type': 'Not specified',
+    'room_category': 'semi_private',
+    'regimen_type': 'standard_chemo',
+    'drug_access': 'generics',
+    'radiation_technique': '3d_crt',
+    'transplant_type': 'autologous',
+    'accommodation_level': 'mid',
+    'travel_type': 'economy',
+    'local_transport': 'daily_cab',
+}
+
+FLAG_FIELDS = (
+    'include_surgery', 'include_chemo', 'include_radiation', 'include_transplant',
+    'include_ngs', 'concurrent_chemo', 'has_insurance', 'custom_coverage',
+)
+
+
+def reference_key(request: CostCalculationRequest) -> Tuple[str, str, Optional[str]]:
+    """(country, hospital tier, insurer) - the reference data a request depends on"""
+    return (
+        request.country or 'india',
+        request.hospital_tier or 'tier_3',
+        request.insurer if request.has_insurance else None,
+    )
+
+
+def expand_batch(batch: CostCalculationBatchRequest) -> List[CostCalculationRequest]:
+    """
+    Turn a batch request into the list of scenarios to calculate.
+    Raises ValueError for an empty/ambiguous batch, unknown override fields
+    or more than MAX_BATCH_SIZE scenarios.
+    """
+    if (batch.requests is None) == (batch.base is None):
+        raise ValueError("Provide either 'requests' or 'base' (with optional 'overrides'), not both")
+    
+    if batch.requests is not None:
+        requests = batch.requests
+    else:
+        base = batch.base.model_dump()
+        overrides = batch.overrides or [{}]
+        if len(overrides) > MAX_BATCH_SIZE:
+            raise ValueError(f"Batch too large: {len(overrides)} scenarios (max {MAX_BATCH_SIZE})")
+        requests = []
+        for index, override in enumerate(overrides):
+            unknown = set(override) - set(CostCalculationRequest.model_fields)
+            if unknown:
+                raise ValueError(f"Override {index} has unknown fields: {', '.join(sorted(unknown))}")
+            requests.append(CostCalculationRequest.model_validate({**base, **override}))
+    
+    if not requests:
+        raise ValueError("Batch contains no scenarios")
+    if len(requests) > MAX_BATCH_SIZE:
+        raise ValueError(f"Batch too large: {len(requests)} scenarios (max {MAX_BATCH_SIZE})")
+    return requests
+
+
+def normalize_inputs(request: CostCalculationRequest) -> Dict[str, float]:
+    """Numeric request inputs with defaults applied and clamped to INPUT_LIMITS"""
+    inputs = {
+        field: clamp_number(normalize_number(getattr(request, field), default), low, high)
+        for field, (default, low, high) in INPUT_LIMITS.items()
+    }
+    inputs['deductible'] = normalize_number(request.deductible, 0, 0)
+    return inputs
+
+
+def request_fingerprint(request: CostCalculationRequest) -> str:
+    """
+    Hash of everything calculate_treatment_cost reads, after defaults and clamping.
+    Requests that normalize to the same inputs share a fingerprint; fields the
+    calculation ignores (city, age group, follow-up...) are left out.
+    """
+    canonical = {
+        'reference': reference_key(request),
+        # json keeps 3 and 3.0 apart - they render differently in assumptions
+        'inputs': normalize_inputs(request),
+        'flags': [bool(getattr(request, field)) for field in FLAG_FIELDS],
+        'options': {field: getattr(request, field) or default for field, default in OPTION_DEFAULTS.items()},
+        'coverage': insurance_coverage(request, None)[:3] if request.custom_coverage else None,
+        'has_cancer_type': bool(request.cancer_type),
+        'has_stage': bool(request.stage),
+    }
+    return hashlib.sha256(json.dumps(canonical, sort_keys=True).encode()).hexdigest()
+
+
+class ResolvedReference(NamedTuple):
+    """Reference data for one calculation after falling back to default_data"""
+    country: Dict[str, Any]
+    base_costs: Dict[str, Any]
+    tier_multiplier: float
+    hospital_tier_name: str
+    accommodation_costs: Dict[str, Any]
+    insurer: Optional[Dict[str, Any]]
+    currency_code: str
+    exchange_rate_to_usd: float  # local currency per USD
+    fallbacks: Tuple[str, ...]  # 'country' and/or 'base_costs' when defaults were used
+    
+    @property
+    def usd_to_local(self) -> float:
+        """
+        Snapshot factor between USD and local amounts, both ways: USD-denominated
+        costs are multiplied by it, local totals divided (1.0 for USD itself)
+        """
+        return 1.0 if self.currency_code == 'USD' else self.exchange_rate_to_usd
+
+
+def resolve_reference(
+    country_id: str,
+    hospital_tier_id: str,
+    reference: Dict[str, Optional[Dict[str, Any]]],
+    fx: FxSnapshot,
+) -> ResolvedReference:
+    """Fill gaps in prefetched reference documents from default_data; take the USD rate from fx"""
+    fallbacks: List[str] = []
+    
+    country = reference['country']
+    if not country:
+        country = get_country_data(country_id)
+        # Convert to dict format if needed (for backward compatibility)
+        if not isinstance(country, dict):
+            country = {
+                'id': country.get('id', country_id),
+                'name': country.get('name', country_id),
+                'currency': country.get('currency_code', country.get('currency', 'USD')),
+                'currency_code': country.get('currency_code', country.get('currency', 'USD')),
+                'currency_symbol': country.get('currency_symbol', '$'),
+                'fx_rate': country.get('exchange_rate_to_usd', 1.0),
+                'exchange_rate_to_usd': country.get('exchange_rate_to_usd', 1.0),
+                'data_quality': country.get('data_quality', 'medium'),
+            }
+        fallbacks.append('country')
+    else:
+        # Ensure country dict has all required fields (on a copy - the cached document is shared)
+        country = dict(country)
+        if 'currency_code' not in country:
+            country['currency_code'] = country.get('currency', 'USD')
+        if 'currency_symbol' not in country:
+            country['currency_symbol'] = '$'
+        if 'exchange_rate_to_usd' not in country:
+            country['exchange_rate_to_usd'] = country.get('fx_rate', 1.0)
+    
+    # Base costs with fallback
+    base_costs = reference['base_costs']
+    if not base_costs:
+        base_costs = get_base_costs(country_id)
+        fallbacks.append('base_costs')
+    
+    # Hospital tier with fallback
+    tier_multiplier = DEFAULT_HOSPITAL_TIER_MULTIPLIER
+    hospital_tier_name = "Tier 3 - Regional Private Hospital"
+    hospital_tier = reference['hospital_tier']
+    if hospital_tier:
+        tier_multiplier = normalize_number(hospital_tier.get('multiplier'), DEFAULT_HOSPITAL_TIER_MULTIPLIER)
+        hospital_tier_name = hospital_tier.get('name', hospital_tier_name)
+    
+    if tier_multiplier == DEFAULT_HOSPITAL_TIER_MULTIPLIER:
+        tier_multiplier = HOSPITAL_TIER_MULTIPLIERS.get(hospital_tier_id, DEFAULT_HOSPITAL_TIER_MULTIPLIER)
+    
+    accommodation_costs = reference['accommodation_costs']
+    if not accommodation_costs:
+        accommodation_costs = get_accommodation_costs(country_id)
+    
+    # The FX snapshot is authoritative; the country's own rate covers currencies it lacks
+    currency_code = country.get('currency_code', country.get('currency', 'USD'))
+    exchange_rate_to_usd = fx.rate(currency_code) or normalize_number(country.get('exchange_rate_to_usd', 1.0), 1.0)
+    
+    return ResolvedReference(
+        country=country,
+        base_costs=base_costs,
+        tier_multiplier=tier_multiplier,
+        hospital_tier_name=hospital_tier_name,
+        accommodation_costs=accommodation_costs,
+        insurer=reference['insurer'],
+        currency_code=currency_code,
+        exchange_rate_to_usd=exchange_rate_to_usd,
+        fallbacks=tuple(fallbacks),
+    )
+
+
+def insurance_coverage(
+    request: CostCalculationRequest,
+    insurer: Optional[Dict[str, Any]],
+) -> Tuple[float, float, float, str]:
+    """(inpatient, outpatient, drug) coverage fractions and their source: 'custom', 'insurer' or 'default'"""
+    if request.custom_coverage:
+        return (
+            clamp_number(normalize_number(request.inpatient_coverage, 80), 0, 100) / 100.0,
+            clamp_number(normalize_number(request.outpatient_coverage, 50), 0, 100) / 100.0,
+            clamp_number(normalize_number(request.drug_coverage, 70), 0, 100) / 100.0,
+            'custom',
+        )
+    if insurer:
+        return (
+            normalize_number(insurer.get('inpatient_coverage', 80), 80) / 100.0,
+            normalize_number(insurer.get('outpatient_coverage', 50), 50) / 100.0,
+            normalize_number(insurer.get('drug_coverage', 70), 70) / 100.0,
+            'insurer',
+        )
+    default_cov = DEFAULT_INSURANCE_COVERAGE
+    return (
+        default_cov['inpatient_coverage'] / 100.0,
+        default_cov['outpatient_coverage'] / 100.0,
+        default_cov['drug_coverage'] / 100.0,
+        'default',
+    )
+
 # Indentation errors fixed - all code blocks properly aligned
 
 class CostCalculatorService:
     def __init__(self, db):
         self.db = db
+        # Reference tables are served from memory; see reference_cache.py
+        self.reference_cache = ReferenceCache(db)
+        self.lookup_timeout = REFERENCE_LOOKUP_TIMEOUT_SECONDS
+        # Versioned USD exchange rates; see fx_rates.py
+        self.fx_rates = FxRateTable(db, timeout=self.lookup_timeout)
+        # Finished responses by request fingerprint; see result_cache.py
+        self.result_cache = ResultCache(
+            ttl_seconds=self.reference_cache.ttl_seconds,
+            version_provider=lambda: (self.reference_cache.version, self.fx_rates.snapshot.snapshot_id),
+        )
+    
+    async def _lookup(self, collection: str, key: Any) -> Optional[Dict[str, Any]]:
+        """One reference lookup bounded by lookup_timeout; None on failure so callers fall back to default_data"""
+        try:
+            return await asyncio.wait_for(self.reference_cache.lookup(collection, key), self.lookup_timeout)
+        except asyncio.TimeoutError:
+            logger.warning(f"Timed out after {self.lookup_timeout}s fetching {collection} ({key}) from DB")
+        except Exception as e:
+            logger.warning(f"Could not fetch {collection} ({key}) from DB: {e}")
+        return None
+    
+    @staticmethod
+    def _reference_lookups(
+        country_id: str,
+        hospital_tier_id: str,
+        insurer_id: Optional[str] = None,
+    ) -> Dict[str, Tuple[str, Any]]:
+        """Reference name -> (collection, key) for one calculation"""
+        return {
+            'country': ('countries', country_id),
+            'base_costs': ('base_costs', country_id),
+            'hospital_tier': ('hospital_tiers', hospital_tier_id),
+            'accommodation_costs': ('accommodation_costs', country_id),
+            'insurer': ('insurers', insurer_id),
+        }
+    
+    def _reference_cached(self, country_id: str, hospital_tier_id: str, insurer_id: Optional[str]) -> bool:
+        """
+        True if every table behind this key is loaded, i.e. a calculation
+        did not fall back to defaults because a lookup timed out or failed.
+        """
+        return all(
+            key is None or self.reference_cache.is_cached(collection)
+            for collection, key in self._reference_lookups(country_id, hospital_tier_id, insurer_id).values()
+        )
+    
+    async def prefetch_reference_data(
+        self,
+        country_id: str,
+        hospital_tier_id: str,
+        insurer_id: Optional[str] = None,
+    ) -> Dict[str, Optional[Dict[str, Any]]]:
+        """
+        Fetch every reference document a calculation needs in one stage.
+        Lookups are independent, so cache misses go to Mongo concurrently
+        (one round-trip of latency instead of five); warm lookups are
+        answered from memory without scheduling any tasks.
+        """
+        lookups = self._reference_lookups(country_id, hospital_tier_id, insurer_id)
+        reference: Dict[str, Optional[Dict[str, Any]]] = {}
+        pending: Dict[str, Tuple[str, Any]] = {}
+        for name, (collection, key) in lookups.items():
+            cached, document = self.reference_cache.peek(collection, key)
+            if cached:
+                reference[name] = document
+            else:
+                pending[name] = (collection, key)
+        if pending:
+            results = await asyncio.gather(*(self._lookup(collection, key) for collection, key in pending.values()))
+            reference.update(zip(pending, results))
+        return reference
     
-    async def calculate_treatment_cost(self, request: CostCalculationRequest) -> CostCalculationResponse:
+    async def calculate_batch(self, requests: List[CostCalculationRequest]) -> List[CostCalculationResponse]:
+        """
+        Calculate many scenarios in one call.
+        Reference data is resolved once per distinct (country, tier, insurer)
+        and shared by every scenario that needs it; a due FX refresh runs in
+        the same stage.
+        """
+        keys = list(dict.fromkeys(reference_key(request) for request in requests))
+        _, *prefetched = await asyncio.gather(
+            self.fx_rates.current(),
+            *(self.prefetch_reference_data(*key) for key in keys),
+        )
+        references = dict(zip(keys, prefetched))
+        return [
+            await self.calculate_treatment_cost(request, reference=references[reference_key(request)])
+            for request in requests
+        ]
+    
+    async def calculate_treatment_cost(
+        self,
+        request: CostCalculationRequest,
+        reference: Optional[Dict[str, Optional[Dict[str, Any]]]] = None,
+    ) -> CostCalculationResponse:
         """
         Main cost calculation engine with robust fallbacks.
         Formula: Total Cost = Clinical Cost + Non-clinical Cost - Insurance Coverage + Risk Buffer
         ALWAYS returns a result, never crashes.
+        reference: output of prefetch_reference_data, when already resolved (batch calls).
+        Responses are memoized by request fingerprint and may be shared - don't modify them.
         """
-        assumptions: List[str] = []
+        assumptions: List[Assumption] = []
         confidence_level = "High"
         
         try:
+            # Memoized results are keyed on the active FX snapshot. A hit is only
+            # served once any due refresh has run (a new snapshot clears the
+            # cache); on a miss the refresh is fetched below with the reference tables
+            fingerprint = request_fingerprint(request)
+            cached = self.result_cache.get(fingerprint)
+            if cached is not None and self.fx_rates.refresh_due:
+                await self.fx_rates.current()
+                cached = self.result_cache.get(fingerprint)
+            if cached is not None:
+                return cached
+            reference_version = self.reference_cache.version
+            
             # ========================================================================
             # 1. NORMALIZE & VALIDATE INPUTS
             # ========================================================================
-            country_id = request.country or 'india'
-            hospital_tier_id = request.hospital_tier or 'tier_3'
+            country_id, hospital_tier_id, insurer_id = reference_key(request)
             
             # Normalize numeric inputs
-            surgery_days = clamp_number(normalize_number(request.surgery_days, 3), 1, 30)
-            icu_days = clamp_number(normalize_number(request.icu_days, 0), 0, 15)
-            chemo_cycles = clamp_number(normalize_number(request.chemo_cycles, 6), 1, 24)
-            radiation_fractions = clamp_number(normalize_number(request.radiation_fractions, 25), 1, 40)
-            transplant_days = clamp_number(normalize_number(request.transplant_days, 30), 14, 60)
-            pet_ct_count = clamp_number(normalize_number(request.pet_ct_count, 2), 0, 10)
-            mri_ct_count = clamp_number(normalize_number(request.mri_ct_count, 4), 0, 20)
-            opd_consults = clamp_number(normalize_number(request.opd_consults, 10), 1, 30)
-            companions = clamp_number(normalize_number(request.companions, 1), 0, 5)
-            stay_duration = clamp_number(normalize_number(request.stay_duration, 60), 7, 180)
-            return_trips = clamp_number(normalize_number(request.return_trips, 1), 1, 5)
-            complication_buffer = clamp_number(normalize_number(request.complication_buffer, 15), 0, 30)
-            deductible = normalize_number(request.deductible, 0, 0)
-            copay_percent = clamp_number(normalize_number(request.copay_percent, 20), 0, 50)
+            inputs = normalize_inputs(request)
+            surgery_days = inputs['surgery_days']
+            icu_days = inputs['icu_days']
+            chemo_cycles = inputs['chemo_cycles']
+            radiation_fractions = inputs['radiation_fractions']
+            transplant_days = inputs['transplant_days']
+            pet_ct_count = inputs['pet_ct_count']
+            mri_ct_count = inputs['mri_ct_count']
+            opd_consults = inputs['opd_consults']
+            companions = inputs['companions']
+            stay_duration = inputs['stay_duration']
+            return_trips = inputs['return_trips']
+            complication_buffer = inputs['complication_buffer']
+            deductible = inputs['deductible']
+            copay_percent = inputs['copay_percent']
             
             # ========================================================================
             # 2. FETCH DATA WITH FALLBACKS
             # ========================================================================
-            # Try to fetch from DB, fallback to defaults
-            country = None
-            try:
-                if self.db:
-                    country = await self.db.countries.find_one({'id': country_id})
-            except Exception as e:
-                logger.warning(f"Could not fetch country from DB: {e}")
-            
-            if not country:
-                country = get_country_data(country_id)
-                # Convert to dict format if needed (for backward compatibility)
-                if not isinstance(country, dict):
-                    country = {
-                        'id': country.get('id', country_id),
-                        'name': country.get('name', country_id),
-                        'currency': country.get('currency_code', country.get('currency', 'USD')),
-                        'currency_code': country.get('currency_code', country.get('currency', 'USD')),
-                        'currency_symbol': country.get('currency_symbol', '$'),
-                        'fx_rate': country.get('exchange_rate_to_usd', 1.0),
-                        'exchange_rate_to_usd': country.get('exchange_rate_to_usd', 1.0),
-                        'data_quality': country.get('data_quality', 'medium'),
-                    }
-                assumptions.append(f"Using default country data for {country_id}")
-                confidence_level = "Medium" if confidence_level == "High" else confidence_level
+            # Fetch all reference data and the FX snapshot concurrently, fallback to
+            # defaults per lookup; one snapshot for the whole calculation (a
+            # refresh swaps in a new object)
+            if reference is None:
+                fx, reference = await asyncio.gather(
+                    self.fx_rates.current(),
+                    self.prefetch_reference_data(country_id, hospital_tier_id, insurer_id),
+                )
             else:
-                # Ensure country dict has all required fields
-                if 'currency_code' not in country:
-                    country['currency_code'] = country.get('currency', 'USD')
-                if 'currency_symbol' not in country:
-                    country['currency_symbol'] = '$'
-                if 'exchange_rate_to_usd' not in country:
-                    country['exchange_rate_to_usd'] = country.get('fx_rate', 1.0)
-            
-            # Fetch base costs with fallback
-            base_costs = None
-            try:
-                if self.db:
-                    base_costs = await self.db.base_costs.find_one({'country_id': country_id})
-            except Exception as e:
-                logger.warning(f"Could not fetch base costs from DB: {e}")
-            
-            if not base_costs:
-                base_costs = get_base_costs(country_id)
-                assumptions.append(f"Using default base costs for {country_id}")
+                fx = await self.fx_rates.current()
+            
+            resolved = resolve_reference(country_id, hospital_tier_id, reference, fx)
+            country = resolved.country
+            base_costs = resolved.base_costs
+            tier_multiplier = resolved.tier_multiplier
+            hospital_tier_name = resolved.hospital_tier_name
+            if 'country' in resolved.fallbacks:
+                assumptions.append(note("default_country_data", country_id=country_id))
+                confidence_level = "Medium" if confidence_level == "High" else confidence_level
+            if 'base_costs' in resolved.fallbacks:
+                assumptions.append(note("default_base_costs", country_id=country_id))
                 confidence_level = "Medium" if confidence_level == "High" else confidence_level
-            
-            # Fetch hospital tier with fallback
-            tier_multiplier = DEFAULT_HOSPITAL_TIER_MULTIPLIER
-            hospital_tier_name = "Tier 3 - Regional Private Hospital"
-            try:
-                if self.db:
-                    hospital_tier = await self.db.hospital_tiers.find_one({'id': hospital_tier_id})
-                    if hospital_tier:
-                        tier_multiplier = normalize_number(hospital_tier.get('multiplier'), DEFAULT_HOSPITAL_TIER_MULTIPLIER)
-                        hospital_tier_name = hospital_tier.get('name', hospital_tier_name)
-            except Exception as e:
-                logger.warning(f"Could not fetch hospital tier from DB: {e}")
-            
-            if tier_multiplier == DEFAULT_HOSPITAL_TIER_MULTIPLIER:
-                tier_multiplier = HOSPITAL_TIER_MULTIPLIERS.get(hospital_tier_id, DEFAULT_HOSPITAL_TIER_MULTIPLIER)
             
             # Initialize breakdown
             breakdown = CostBreakdown()
@@ -139,7 +455,7 @@ class CostCalculatorService:
                 clinical_cost += total_surgery
                 
                 surgery_type = request.surgery_type or 'Not specified'
-                assumptions.append(f"Surgery: {surgery_type}, {surgery_days} days ward + {icu_days} days ICU, Room: {room_category}")
+                assumptions.append(note("surgery", surgery_type=surgery_type, surgery_days=surgery_days, icu_days=icu_days, room_category=room_category))
             
             # Chemotherapy cost
             if request.include_chemo:
@@ -162,7 +478,7 @@ class CostCalculatorService:
                 breakdown.chemotherapy = round(total_chemo, 2)
                 clinical_cost += total_chemo
                 
-                assumptions.append(f"Chemotherapy: {chemo_cycles} cycles of {regimen_type}, Drug access: {drug_access}")
+                assumptions.append(note("chemotherapy", chemo_cycles=chemo_cycles, regimen_type=regimen_type, drug_access=drug_access))
             
             # Radiation cost
             if request.include_radiation:
@@ -178,12 +494,12 @@ class CostCalculatorService:
                 if request.concurrent_chemo:
                     concurrent_chemo_cost = normalize_number(base_costs.get('chemo_per_cycle', 0)) * 0.3 * tier_multiplier
                     total_radiation += concurrent_chemo_cost
-                    assumptions.append("Concurrent chemotherapy included with radiation")
+                    assumptions.append(note("concurrent_chemo"))
                 
                 breakdown.radiation = round(total_radiation, 2)
                 clinical_cost += total_radiation
                 
-                assumptions.append(f"Radiation: {radiation_fractions} fractions using {radiation_technique}")
+                assumptions.append(note("radiation", radiation_fractions=radiation_fractions, radiation_technique=radiation_technique))
             
             # Transplant cost
             if request.include_transplant:
@@ -201,7 +517,7 @@ class CostCalculatorService:
                 breakdown.transplant = round(transplant_cost, 2)
                 clinical_cost += transplant_cost
                 
-                assumptions.append(f"Transplant: {transplant_type}, {transplant_days} days hospitalization")
+                assumptions.append(note("transplant", transplant_type=transplant_type, transplant_days=transplant_days))
             
             # Diagnostics cost
             diagnostics_cost = 0.0
@@ -209,14 +525,14 @@ class CostCalculatorService:
             diagnostics_cost += normalize_number(base_costs.get('mri_ct', 0)) * mri_ct_count
             if request.include_ngs:
                 diagnostics_cost += normalize_number(base_costs.get('ngsp_panel', 0))
-                assumptions.append("NGS panel testing included")
+                assumptions.append(note("ngs_panel"))
             diagnostics_cost += normalize_number(base_costs.get('opd_consult', 0)) * opd_consults
             
             breakdown.diagnostics = round(diagnostics_cost, 2)
             clinical_cost += diagnostics_cost
             
             if pet_ct_count > 0 or mri_ct_count > 0:
-                assumptions.append(f"Diagnostics: {pet_ct_count} PET-CT, {mri_ct_count} MRI/CT scans, {opd_consults} OPD consultations")
+                assumptions.append(note("diagnostics", pet_ct_count=pet_ct_count, mri_ct_count=mri_ct_count, opd_consults=opd_consults))
             
             # ========================================================================
             # 4. CALCULATE NON-CLINICAL COSTS (Medical Tourism)
@@ -224,16 +540,7 @@ class CostCalculatorService:
             non_clinical_cost = 0.0
             
             # Accommodation
-            accommodation_costs_data = None
-            try:
-                if self.db:
-                    accommodation_costs_data = await self.db.accommodation_costs.find_one({'country_id': country_id})
-            except Exception as e:
-                logger.warning(f"Could not fetch accommodation costs from DB: {e}")
-            
-            if not accommodation_costs_data:
-                accommodation_costs_data = get_accommodation_costs(country_id)
-            
+            accommodation_costs_data = resolved.accommodation_costs
             accommodation_level = request.accommodation_level or 'mid'
             accommodation_rate = normalize_number(accommodation_costs_data.get(accommodation_level, 0), 0)
             total_accommodation = accommodation_rate * stay_duration * (companions + 1)
@@ -243,7 +550,9 @@ class CostCalculatorService:
             # Travel costs (estimated)
             travel_type = request.travel_type or 'economy'
             travel_mult = TRAVEL_TYPE_MULTIPLIERS.get(travel_type, 1.0)
-            base_flight_cost = BASE_FLIGHT_COST_USD * normalize_number(country.get('fx_rate', 1.0))
+            # USD-denominated estimates use the same snapshot rate as the conversion back to USD
+            usd_to_local = resolved.usd_to_local
+            base_flight_cost = BASE_FLIGHT_COST_USD * usd_to_local
             total_travel = base_flight_cost * travel_mult * return_trips * (companions + 1)
             breakdown.travel = round(total_travel, 2)
             non_clinical_cost += total_travel
@@ -251,18 +560,18 @@ class CostCalculatorService:
             # Local transport
             local_transport = request.local_transport or 'daily_cab'
             daily_transport_usd = LOCAL_TRANSPORT_COSTS.get(local_transport, 30)
-            daily_transport = daily_transport_usd * normalize_number(country.get('fx_rate', 1.0))
+            daily_transport = daily_transport_usd * usd_to_local
             total_transport = daily_transport * stay_duration
             breakdown.local_transport = round(total_transport, 2)
             non_clinical_cost += total_transport
             
             # Food allowance
-            food_per_day = FOOD_COST_PER_DAY_USD * normalize_number(country.get('fx_rate', 1.0))
+            food_per_day = FOOD_COST_PER_DAY_USD * usd_to_local
             total_food = food_per_day * stay_duration * (companions + 1)
             breakdown.food = round(total_food, 2)
             non_clinical_cost += total_food
             
-            assumptions.append(f"Medical tourism: {companions} companion(s), {stay_duration} days, {accommodation_level} accommodation, {travel_type} travel")
+            assumptions.append(note("medical_tourism", companions=companions, stay_duration=stay_duration, accommodation_level=accommodation_level, travel_type=travel_type))
             
             # ========================================================================
             # 5. APPLY COMPLICATION BUFFER
@@ -279,31 +588,16 @@ class CostCalculatorService:
             # ========================================================================
             insurance_pays = 0.0
             if request.has_insurance:
-                insurer = None
-                try:
-                    if self.db and request.insurer:
-                        insurer = await self.db.insurers.find_one({'id': request.insurer})
-                except Exception as e:
-                    logger.warning(f"Could not fetch insurer from DB: {e}")
+                insurer = resolved.insurer
                 
                 # Get coverage percentages
-                if request.custom_coverage:
-                    inpatient_cov = clamp_number(normalize_number(request.inpatient_coverage, 80), 0, 100) / 100.0
-                    outpatient_cov = clamp_number(normalize_number(request.outpatient_coverage, 50), 0, 100) / 100.0
-                    drug_cov = clamp_number(normalize_number(request.drug_coverage, 70), 0, 100) / 100.0
-                    assumptions.append(f"Custom insurance coverage: Inpatient {inpatient_cov*100}%, Outpatient {outpatient_cov*100}%, Drugs {drug_cov*100}%")
-                elif insurer:
-                    inpatient_cov = normalize_number(insurer.get('inpatient_coverage', 80), 80) / 100.0
-                    outpatient_cov = normalize_number(insurer.get('outpatient_coverage', 50), 50) / 100.0
-                    drug_cov = normalize_number(insurer.get('drug_coverage', 70), 70) / 100.0
-                    assumptions.append(f"Insurance: {insurer.get('name', 'Unknown')} - Inpatient {inpatient_cov*100}%, Outpatient {outpatient_cov*100}%, Drugs {drug_cov*100}%")
+                inpatient_cov, outpatient_cov, drug_cov, coverage_source = insurance_coverage(request, insurer)
+                if coverage_source == 'custom':
+                    assumptions.append(note("custom_coverage", inpatient=inpatient_cov*100, outpatient=outpatient_cov*100, drugs=drug_cov*100))
+                elif coverage_source == 'insurer':
+                    assumptions.append(note("insurer_coverage", insurer=insurer.get('name', 'Unknown'), inpatient=inpatient_cov*100, outpatient=outpatient_cov*100, drugs=drug_cov*100))
                 else:
-                    # Use defaults
-                    default_cov = DEFAULT_INSURANCE_COVERAGE
-                    inpatient_cov = default_cov['inpatient_coverage'] / 100.0
-                    outpatient_cov = default_cov['outpatient_coverage'] / 100.0
-                    drug_cov = default_cov['drug_coverage'] / 100.0
-                    assumptions.append(f"Using default insurance coverage: Inpatient {inpatient_cov*100}%, Outpatient {outpatient_cov*100}%, Drugs {drug_cov*100}%")
+                    assumptions.append(note("default_coverage", inpatient=inpatient_cov*100, outpatient=outpatient_cov*100, drugs=drug_cov*100))
                     confidence_level = "Medium" if confidence_level == "High" else confidence_level
                 
                 # Calculate covered amounts
@@ -326,9 +620,9 @@ class CostCalculatorService:
                 # Apply co-pay
                 insurance_pays = covered_after_deductible * (1.0 - copay_percent / 100.0)
                 
-                assumptions.append(f"Insurance deductible: {deductible} {country.get('currency', 'USD')}, Co-pay: {copay_percent}%")
+                assumptions.append(note("insurance_terms", deductible=deductible, currency=country.get('currency', 'USD'), copay_percent=copay_percent))
             else:
-                assumptions.append("No insurance coverage")
+                assumptions.append(note("no_insurance"))
             
             # ========================================================================
             # 8. CALCULATE FINAL OUT-OF-POCKET
@@ -338,83 +632,61 @@ class CostCalculatorService:
             # ========================================================================
             # 9. CURRENCY CONVERSIONS
             # ========================================================================
-            # Get exchange rate to USD (from country data)
-            exchange_rate_to_usd = normalize_number(
-                country.get('exchange_rate_to_usd', 1.0), 
-                1.0
-            )
-            currency_code = country.get('currency_code', country.get('currency', 'USD'))
+            # Exchange rate to USD from the FX snapshot (local currency per USD)
+            exchange_rate_to_usd = resolved.exchange_rate_to_usd
+            currency_code = resolved.currency_code
             currency_symbol = country.get('currency_symbol', '$')
             
-            # Convert local currency to USD
-            # If local currency is USD, no conversion needed
-            if currency_code == 'USD':
-                total_cost_usd = total_before_insurance
-                clinical_cost_usd = clinical_cost
-                non_clinical_cost_usd = non_clinical_cost
-                insurance_pays_usd = insurance_pays
-                patient_out_of_pocket_usd = patient_out_of_pocket
-            else:
-                # Convert from local currency to USD
-                # exchange_rate_to_usd = local_currency_per_usd
-                # So: usd = local / exchange_rate_to_usd
-                total_cost_usd = total_before_insurance / exchange_rate_to_usd
-                clinical_cost_usd = clinical_cost / exchange_rate_to_usd
-                non_clinical_cost_usd = non_clinical_cost / exchange_rate_to_usd
-                insurance_pays_usd = insurance_pays / exchange_rate_to_usd
-                patient_out_of_pocket_usd = patient_out_of_pocket / exchange_rate_to_usd
-            
-            # Convert to INR (for backward compatibility)
-            # Use exchange_rate_to_usd to get USD first, then convert USD to INR
-            usd_to_inr_rate = 89.899376  # 1 USD = 89.899376 INR (Dec 29, 2025 21:01 UTC)
-            total_in_inr = total_cost_usd * usd_to_inr_rate
+            # Convert local currency to USD with one divisor for every amount
+            # (usd = local / exchange_rate_to_usd; USD amounts pass through unchanged)
+            usd_divisor = usd_to_local
+            total_cost_usd = total_before_insurance / usd_divisor
+            clinical_cost_usd = clinical_cost / usd_divisor
+            non_clinical_cost_usd = non_clinical_cost / usd_divisor
+            insurance_pays_usd = insurance_pays / usd_divisor
+            patient_out_of_pocket_usd = patient_out_of_pocket / usd_divisor
+            
+            # Convert to INR (for backward compatibility) at the snapshot's USD/INR rate
+            total_in_inr = total_cost_usd * fx.usd_to_inr
             
             # Create USD breakdown
-            breakdown_usd = CostBreakdown(
-                surgery=round(breakdown.surgery / exchange_rate_to_usd if currency_code != 'USD' else breakdown.surgery, 2),
-                chemotherapy=round(breakdown.chemotherapy / exchange_rate_to_usd if currency_code != 'USD' else breakdown.chemotherapy, 2),
-                radiation=round(breakdown.radiation / exchange_rate_to_usd if currency_code != 'USD' else breakdown.radiation, 2),
-                transplant=round(breakdown.transplant / exchange_rate_to_usd if currency_code != 'USD' else breakdown.transplant, 2),
-                diagnostics=round(breakdown.diagnostics / exchange_rate_to_usd if currency_code != 'USD' else breakdown.diagnostics, 2),
-                accommodation=round(breakdown.accommodation / exchange_rate_to_usd if currency_code != 'USD' else breakdown.accommodation, 2),
-                travel=round(breakdown.travel / exchange_rate_to_usd if currency_code != 'USD' else breakdown.travel, 2),
-                local_transport=round(breakdown.local_transport / exchange_rate_to_usd if currency_code != 'USD' else breakdown.local_transport, 2),
-                food=round(breakdown.food / exchange_rate_to_usd if currency_code != 'USD' else breakdown.food, 2),
-            )
+            breakdown_usd = CostBreakdown(**{
+                line: round(amount / usd_divisor, 2) for line, amount in breakdown.model_dump().items()
+            })
             
             # ========================================================================
             # 10. FINALIZE ASSUMPTIONS
             # ========================================================================
             if currency_code == 'USD':
-                assumptions.insert(0, f"Currency: {currency_code} (base currency)")
+                assumptions.insert(0, note("base_currency", currency_code=currency_code))
             else:
-                assumptions.insert(0, f"Exchange rate: 1 USD = {exchange_rate_to_usd} {currency_code} (reference rate as of Dec 29, 2025 21:01 UTC)")
-                assumptions.insert(1, f"Converted to USD using exchange rate: {exchange_rate_to_usd}")
+                assumptions.insert(0, note("exchange_rate", exchange_rate=exchange_rate_to_usd, currency_code=currency_code, as_of=fx.as_of_label))
+                assumptions.insert(1, note("usd_conversion", exchange_rate=exchange_rate_to_usd))
             
-            assumptions.insert(len(assumptions) - 3, f"Hospital tier: {hospital_tier_name} (multiplier: {tier_multiplier}x)")
-            assumptions.append(f"Complication buffer: {complication_buffer}%")
-            assumptions.append(f"Confidence level: {confidence_level}")
-            assumptions.append(f"Country-level baseline data used for {country.get('name', 'selected country')}")
-            assumptions.append(f"Estimate based on data updated: Dec 29, 2025 (v3.1 - Multi-country with updated exchange rates)")
+            assumptions.insert(len(assumptions) - 3, note("hospital_tier", name=hospital_tier_name, multiplier=tier_multiplier))
+            assumptions.append(note("complication_buffer", percent=complication_buffer))
+            assumptions.append(note("confidence_level", level=confidence_level))
+            assumptions.append(note("country_baseline", country=country.get('name', 'selected country')))
+            assumptions.append(note("data_version"))
             
             # Add data quality note
             data_quality = country.get('data_quality', 'medium')
             if data_quality == 'medium':
-                assumptions.append("⚠️ Using conservative national averages - city-level pricing not available")
+                assumptions.append(note("national_averages"))
                 if confidence_level == "High":
                     confidence_level = "Medium"
             
             # Add missing input assumptions
             if not request.include_surgery and not request.include_chemo and not request.include_radiation and not request.include_transplant:
-                assumptions.append("⚠️ No treatment modalities selected - estimate includes diagnostics only")
+                assumptions.append(note("diagnostics_only"))
                 confidence_level = "Low"
             
             if not request.cancer_type:
-                assumptions.append("⚠️ Cancer type not specified - using generic cost estimates")
+                assumptions.append(note("cancer_type_missing"))
                 confidence_level = "Low"
             
             if not request.stage:
-                assumptions.append("⚠️ Stage not specified - using average stage cost estimates")
+                assumptions.append(note("stage_missing"))
                 confidence_level = "Low"
             
             # ========================================================================
@@ -437,9 +709,15 @@ class CostCalculatorService:
                 currency_code=currency_code,
                 currency_symbol=currency_symbol,
                 exchange_rate_to_usd=exchange_rate_to_usd,
-                assumptions=assumptions
+                fx_snapshot_id=fx.snapshot_id,
+                assumption_codes=[assumption._asdict() for assumption in assumptions]
             )
             
+            # Only memoize results built from complete, current reference data (not timeout fallbacks)
+            if (reference_version == self.reference_cache.version
+                    and self._reference_cached(country_id, hospital_tier_id, insurer_id)):
+                self.result_cache.put(fingerprint, response)
+            
             return response
             
         except Exception as e:
@@ -448,22 +726,22 @@ class CostCalculatorService:
             try:
                 # Try to get at least country data
                 country = get_country_data(request.country if request else 'india')
-                fx_rate = normalize_number(country.get('fx_rate', 83.0), 83.0)
-                
-                # Return minimal safe estimate
-                breakdown = CostBreakdown()
-                breakdown.diagnostics = 1000 * fx_rate  # Minimal diagnostic cost
-                
-                exchange_rate_to_usd = normalize_number(country.get('exchange_rate_to_usd', 1.0), 1.0)
+                fx = self.fx_rates.snapshot
                 currency_code = country.get('currency_code', country.get('currency', 'USD'))
+                exchange_rate_to_usd = fx.rate(currency_code) or normalize_number(country.get('exchange_rate_to_usd', 1.0), 1.0)
+                usd_to_local = 1.0 if currency_code == 'USD' else exchange_rate_to_usd
                 currency_symbol = country.get('currency_symbol', '$')
-                local_cost = 1000 * normalize_number(country.get('fx_rate', 83.0), 83.0)
-                usd_cost = local_cost / exchange_rate_to_usd if currency_code != 'USD' else local_cost
+                
+                # Return minimal safe estimate: USD 1000 of diagnostics at the snapshot rate
+                usd_cost = 1000.0
+                local_cost = usd_cost * usd_to_local
+                breakdown = CostBreakdown()
+                breakdown.diagnostics = local_cost
                 
                 return CostCalculationResponse(
                     total_cost_local=round(local_cost, 2),
                     total_cost_usd=round(usd_cost, 2),
-                    total_cost_inr=round(usd_cost * 83.0, 2),
+                    total_cost_inr=round(usd_cost * fx.usd_to_inr, 2),
                     clinical_cost=round(local_cost, 2),
                     clinical_cost_usd=round(usd_cost, 2),
                     non_clinical_cost=0.0,
@@ -477,21 +755,22 @@ class CostCalculatorService:
                     currency_code=currency_code,
                     currency_symbol=currency_symbol,
                     exchange_rate_to_usd=exchange_rate_to_usd,
-                    assumptions=[
-                        "⚠️ Calculation error occurred - showing conservative estimate",
-                        f"Please verify your inputs and try again",
-                        f"Error: {str(e)}"
+                    fx_snapshot_id=fx.snapshot_id,
+                    assumption_codes=[
+                        {"code": "calculation_error", "params": {}},
+                        {"code": "verify_inputs", "params": {}},
+                        {"code": "error_detail", "params": {"error": str(e)}},
                     ]
                 )
             except Exception as fallback_error:
                 logger.error(f"Even fallback failed: {str(fallback_error)}")
                 # Absolute last resort
                 breakdown = CostBreakdown()
-                usd_to_inr_rate = 89.899376  # Dec 29, 2025
+                fx = self.fx_rates.snapshot
                 return CostCalculationResponse(
                     total_cost_local=50000.0,
                     total_cost_usd=50000.0,
-                    total_cost_inr=round(50000.0 * usd_to_inr_rate, 2),
+                    total_cost_inr=round(50000.0 * fx.usd_to_inr, 2),
                     clinical_cost=50000.0,
                     clinical_cost_usd=50000.0,
                     non_clinical_cost=0.0,
@@ -505,8 +784,9 @@ class CostCalculatorService:
                     currency_code='USD',
                     currency_symbol='$',
                     exchange_rate_to_usd=1.0,
-                    assumptions=[
-                        "⚠️ Critical error - unable to calculate estimate",
-                        "Please contact support or try again later"
+                    fx_snapshot_id=fx.snapshot_id,
+                    assumption_codes=[
+                        {"code": "critical_error", "params": {}},
+                        {"code": "contact_support", "params": {}},
                     ]
                 )
@@ -0,0 +1,61 @@
+"""
+Side-by-side cost comparison of one treatment across countries
+Evaluates the request for every country in a single vectorized pass (one
+grid axis over country) against the cached reference data, and ranks the
+countries by their normalized USD totals, with INR alongside.
+"""
+from typing import Any, Dict, List, NamedTuple, Optional
+
+from models import CostCalculationRequest
+from vectorized_engine import calculate_grid
+from default_data import DEFAULT_BASE_COSTS
+
+# What countries can be ranked by
+RANK_FIELDS = ('total_cost_usd', 'patient_out_of_pocket_usd')
+
+
+class CountryComparison(NamedTuple):
+    """Countries ranked cheapest first"""
+    fx_snapshot_id: str
+    rank_by: str
+    results: List[Dict[str, Any]]
+
+
+async def compare_countries(
+    service,
+    request: CostCalculationRequest,
+    country_ids: Optional[List[str]] = None,
+    rank_by: str = 'total_cost_usd',
+) -> CountryComparison:
+    """
+    request priced in each of country_ids (default: every country with
+    built-in base costs), ranked by rank_by ascending.
+    """
+    if rank_by not in RANK_FIELDS:
+        raise ValueError(f"rank_by must be one of: {', '.join(RANK_FIELDS)}")
+    country_ids = list(dict.fromkeys(country_ids or DEFAULT_BASE_COSTS))
+
+    fx = await service.fx_rates.current()
+    grid = await calculate_grid(service, request, {'country': country_ids}, fx)
+    totals = grid.totals
+
+    results = []
+    for i, country_id in enumerate(country_ids):
+        out_of_pocket_usd = float(totals['patient_out_of_pocket_usd'][i])
+        results.append({
+            'country': country_id,
+            'currency_code': str(grid.currency_code[i]),
+            'exchange_rate_to_usd': float(totals['exchange_rate_to_usd'][i]),
+            'total_cost_local': float(totals['total_cost_local'][i]),
+            'total_cost_usd': float(totals['total_cost_usd'][i]),
+            'total_cost_inr': float(totals['total_cost_inr'][i]),
+            'patient_out_of_pocket_usd': out_of_pocket_usd,
+            'patient_out_of_pocket_inr': round(out_of_pocket_usd * fx.usd_to_inr, 2),
+        })
+
+    results.sort(key=lambda result: result[rank_by])
+    cheapest = results[0][rank_by] if results else 0.0
+    for rank, result in enumerate(results, start=1):
+        result['rank'] = rank
+        result['relative_to_cheapest'] = round(result[rank_by] / cheapest, 3) if cheapest > 0 else None
+    return CountryComparison(fx_snapshot_id=grid.fx_snapshot_id, rank_by=rank_by, results=results)
@@ -0,0 +1,184 @@
+"""
+Versioned USD exchange-rate snapshots for cost conversions
+Snapshots are documents in the Mongo `fx_rates` collection (the newest
+`as_of` wins), with fx_rates.json as the fallback when the database is
+unavailable or empty. The active snapshot is immutable and replaced by a
+single reference swap, so a calculation converts with one consistent set
+of rates and can report which snapshot it used.
+
+Snapshot document:
+    {"snapshot_id": "...", "as_of": "<ISO 8601>", "base": "USD",
+     "rates": {"INR": 89.899376, ...}}   # units of currency per 1 USD
+"""
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import time
+from datetime import datetime
+from functools import lru_cache
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, NamedTuple, Optional
+
+logger = logging.getLogger(__name__)
+
+FALLBACK_PATH = Path(__file__).parent / 'fx_rates.json'
+
+DEFAULT_REFRESH_SECONDS = 3600.0
+# After a failed refresh, try again sooner than the normal interval
+RETRY_SECONDS = 60.0
+LOOKUP_TIMEOUT_SECONDS = 2.0
+
+
+def _refresh_seconds_from_env() -> float:
+    try:
+        return float(os.environ.get('COST_FX_REFRESH_SECONDS', '').strip() or DEFAULT_REFRESH_SECONDS)
+    except ValueError:
+        logger.warning("Invalid COST_FX_REFRESH_SECONDS, using default")
+        return DEFAULT_REFRESH_SECONDS
+
+
+class FxSnapshot(NamedTuple):
+    """One immutable set of rates: currency -> units per 1 USD"""
+    snapshot_id: str
+    as_of: str
+    source: str  # 'mongo' or 'file'
+    rates: Mapping[str, float]
+
+    def rate(self, currency: Optional[str]) -> Optional[float]:
+        """Units of currency per USD, or None if the snapshot has no rate for it"""
+        return self.rates.get((currency or '').upper())
+
+    @property
+    def usd_to_inr(self) -> float:
+        return self.rates['INR']
+
+    @property
+    def as_of_label(self) -> str:
+        """as_of for humans, e.g. 'Dec 29, 2025 21:01 UTC'"""
+        try:
+            return datetime.fromisoformat(self.as_of).strftime('%b %d, %Y %H:%M UTC')
+        except ValueError:
+            return self.as_of
+
+    def to_document(self) -> Dict[str, Any]:
+        return {
+            'snapshot_id': self.snapshot_id,
+            'as_of': self.as_of,
+            'base': 'USD',
+            'rates': dict(self.rates),
+        }
+
+
+def snapshot_from_document(document: Dict[str, Any], source: str) -> FxSnapshot:
+    """Validate a snapshot document; raises ValueError if it can't be used"""
+    if (document.get('base') or 'USD') != 'USD':
+        raise ValueError(f"FX snapshot base must be USD, got {document.get('base')}")
+    rates: Dict[str, float] = {}
+    for currency, value in (document.get('rates') or {}).items():
+        try:
+            rate = float(value)
+        except (TypeError, ValueError):
+            raise ValueError(f"FX rate for {currency} is not a number: {value!r}")
+        if not rate > 0:  # also rejects NaN
+            raise ValueError(f"FX rate for {currency} must be positive, got {value!r}")
+        rates[str(currency).upper()] = rate
+    if 'INR' not in rates:
+        raise ValueError("FX snapshot has no INR rate")
+    rates['USD'] = 1.0
+    snapshot_id = document.get('snapshot_id') or hashlib.sha256(
+        json.dumps(rates, sort_keys=True).encode()
+    ).hexdigest()[:12]
+    as_of = document.get('as_of')
+    if isinstance(as_of, datetime):
+        as_of = as_of.isoformat()
+    return FxSnapshot(str(snapshot_id), str(as_of or ''), source, MappingProxyType(rates))
+
+
+@lru_cache(maxsize=None)
+def fallback_snapshot(path: Path = FALLBACK_PATH) -> FxSnapshot:
+    """The file-backed snapshot shipped with the code"""
+    with open(path, encoding='utf-8') as f:
+        return snapshot_from_document(json.load(f), 'file')
+
+
+class FxRateTable:
+    """
+    The active FX snapshot, refreshed from Mongo in the background of
+    requests: current() reloads at most once per refresh interval (single
+    flight) and keeps serving the previous snapshot if the reload fails.
+    """
+
+    def __init__(self, db, refresh_seconds: Optional[float] = None, timeout: float = LOOKUP_TIMEOUT_SECONDS):
+        self.db = db
+        self.refresh_seconds = _refresh_seconds_from_env() if refresh_seconds is None else refresh_seconds
+        self.timeout = timeout
+        self._snapshot = fallback_snapshot()
+        self._next_refresh = 0.0
+        self._lock = asyncio.Lock()
+        self.swaps = 0
+        self.refresh_errors = 0
+
+    @property
+    def snapshot(self) -> FxSnapshot:
+        """Active snapshot, without checking for a newer one"""
+        return self._snapshot
+
+    def install(self, snapshot: FxSnapshot):
+        """Make snapshot the active one (a single reference swap)"""
+        if snapshot.snapshot_id != self._snapshot.snapshot_id:
+            logger.info(f"FX snapshot {self._snapshot.snapshot_id} -> {snapshot.snapshot_id} ({snapshot.source})")
+            self.swaps += 1
+        self._snapshot = snapshot
+
+    async def _load_latest(self) -> Optional[FxSnapshot]:
+        documents = await self.db.fx_rates.find({}).sort('as_of', -1).limit(1).to_list(1)
+        return snapshot_from_document(documents[0], 'mongo') if documents else None
+
+    async def refresh(self) -> FxSnapshot:
+        """Load the newest snapshot from Mongo and swap it in; keep the current one on failure"""
+        try:
+            latest = await asyncio.wait_for(self._load_latest(), self.timeout)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            self.refresh_errors += 1
+            self._next_refresh = time.monotonic() + min(RETRY_SECONDS, self.refresh_seconds)
+            logger.warning(f"Could not refresh FX rates, keeping {self._snapshot.snapshot_id}: {e}")
+            return self._snapshot
+        self._next_refresh = time.monotonic() + self.refresh_seconds
+        if latest is not None:
+            self.install(latest)
+        return self._snapshot
+
+    def _stale(self) -> bool:
+        return self.db is not None and time.monotonic() >= self._next_refresh
+
+    @property
+    def refresh_due(self) -> bool:
+        """True if the next current() call reloads from Mongo"""
+        return self._stale()
+
+    async def current(self) -> FxSnapshot:
+        """Active snapshot, reloading it first if the refresh interval has passed"""
+        if self._stale():
+            async with self._lock:
+                if self._stale():
+                    await self.refresh()
+        return self._snapshot
+
+    def invalidate(self):
+        """Reload on the next current() call (e.g. after new rates were written)"""
+        self._next_refresh = 0.0
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            'snapshot_id': self._snapshot.snapshot_id,
+            'as_of': self._snapshot.as_of,
+            'source': self._snapshot.source,
+            'currencies': len(self._snapshot.rates),
+            'swaps': self.swaps,
+            'refresh_errors': self.refresh_errors,
+        }
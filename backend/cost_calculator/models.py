@@ -1,5 +1,5 @@
 from pydantic import BaseModel, Field
-from typing import List, Optional, Dict
+from typing import List, Optional, Dict, Any
 from datetime import datetime
 import uuid
 
@@ -38,6 +38,15 @@ class HospitalTier(BaseModel):
     name: str
     multiplier: float
 
+# Every reference list in one response (GET /bootstrap)
+class ReferenceBootstrap(BaseModel):
+    version: str  # changes whenever any list does
+    countries: List[Country]
+    insurers: Dict[str, List[Insurer]]  # country_id -> insurers
+    cancer_types: List[CancerType]
+    stages: List[Stage]
+    hospital_tiers: List[HospitalTier]
+
 # Base Costs Model
 class BaseCosts(BaseModel):
     country_id: str
@@ -140,6 +149,11 @@ class CostBreakdown(BaseModel):
     local_transport: float = 0
     food: float = 0
 
+# Structured assumption - rendered to text by assumptions.render
+class AssumptionCode(BaseModel):
+    code: str
+    params: Dict[str, Any] = {}
+
 # Cost Calculation Response Model
 class CostCalculationResponse(BaseModel):
     total_cost_local: float
@@ -158,4 +172,99 @@ class CostCalculationResponse(BaseModel):
     currency_code: str  # e.g., 'INR', 'USD', 'EUR'
     currency_symbol: str  # e.g., '₹', '$', '€'
     exchange_rate_to_usd: float  # Exchange rate used
-    assumptions: List[str] = []
+    fx_snapshot_id: Optional[str] = None  # FX rate snapshot the conversions came from
+    assumptions: List[str] = []  # rendered text, only with ?include=assumptions or ?locale=
+    assumption_codes: List[AssumptionCode] = []  # structured, only with ?include=assumption_codes
+
+# Batch Calculation Models
+# Either a list of full requests, or one base request plus per-scenario overrides
+class CostCalculationBatchRequest(BaseModel):
+    requests: Optional[List[CostCalculationRequest]] = None
+    base: Optional[CostCalculationRequest] = None
+    overrides: List[Dict[str, Any]] = []
+
+class CostCalculationBatchResponse(BaseModel):
+    count: int
+    results: List[CostCalculationResponse]
+
+# What-if Grid Models
+# axes maps request fields to the values to try; tensors have one dimension per axis, in axes order
+class CostGridRequest(BaseModel):
+    base: CostCalculationRequest
+    axes: Dict[str, List[Any]] = {}
+
+class CostGridResponse(BaseModel):
+    shape: List[int]
+    fx_snapshot_id: Optional[str] = None
+    axes: Dict[str, List[Any]]
+    currency_code: Any  # nested lists of currency codes
+    totals: Dict[str, Any]  # field -> nested lists of amounts
+    breakdown: Dict[str, Any]
+    breakdown_usd: Dict[str, Any]
+
+# Uncertainty Band Models
+class CostBand(BaseModel):
+    p10: float
+    p50: float
+    p90: float
+
+class CostUncertaintyResponse(BaseModel):
+    samples: int
+    currency_code: str
+    fx_snapshot_id: Optional[str] = None
+    totals: Dict[str, CostBand]
+    breakdown: Dict[str, CostBand]
+    breakdown_usd: Dict[str, CostBand]
+
+# Budget Solver Models
+# base carries the treatment (required modalities and their details); its country is replaced by each of countries
+class BudgetSolveRequest(BaseModel):
+    base: CostCalculationRequest
+    budget: float
+    budget_currency: str = 'USD'
+    budget_basis: str = 'out_of_pocket'  # out_of_pocket or total
+    countries: List[str] = []  # empty = base.country
+    options: Dict[str, List[str]] = {}  # restrict a searched field to these options
+    max_options: int = Field(default=50, ge=1, le=500)
+
+class BudgetOption(BaseModel):
+    country: str
+    configuration: Dict[str, str]  # searched field -> chosen option
+    comfort_score: float  # 0-100
+    currency_code: str
+    total_cost_local: float
+    total_cost_usd: float
+    total_cost_inr: float
+    patient_out_of_pocket_usd: float
+
+class BudgetSolveResponse(BaseModel):
+    budget_usd: float
+    fx_snapshot_id: Optional[str] = None
+    searched: Dict[str, List[str]]
+    evaluated: int
+    feasible: int
+    frontier: List[BudgetOption]  # cheapest first, each more comfortable than the last
+    cheapest: Optional[BudgetOption] = None
+
+# Country Comparison Models
+class CostComparisonRequest(BaseModel):
+    request: CostCalculationRequest  # its country is replaced by each of country_ids
+    country_ids: List[str] = []  # empty = every country with built-in base costs
+    rank_by: str = 'total_cost_usd'  # or patient_out_of_pocket_usd
+
+class CountryCostComparison(BaseModel):
+    rank: int
+    country: str
+    currency_code: str
+    exchange_rate_to_usd: float
+    total_cost_local: float
+    total_cost_usd: float
+    total_cost_inr: float
+    patient_out_of_pocket_usd: float
+    patient_out_of_pocket_inr: float
+    relative_to_cheapest: Optional[float] = None  # rank_by value / the cheapest country's
+
+class CostComparisonResponse(BaseModel):
+    fx_snapshot_id: Optional[str] = None
+    rank_by: str
+    results: List[CountryCostComparison]  # cheapest first
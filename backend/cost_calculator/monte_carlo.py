@@ -0,0 +1,127 @@
+"""
+Monte Carlo uncertainty bands for treatment cost estimates
+Samples the inputs families are least sure about - complication buffer,
+stay duration, ICU days, exchange-rate drift and insurer coverage - and
+evaluates every draw at once with the vectorized engine, returning
+P10/P50/P90 per total and per breakdown line.
+"""
+from typing import Dict, NamedTuple, Optional
+import numpy as np
+
+from models import CostCalculationRequest
+from cost_calculator_service import (
+    INPUT_LIMITS, ResolvedReference, reference_key, normalize_inputs,
+    resolve_reference, insurance_coverage,
+)
+from vectorized_engine import (
+    COVERAGE_PARAMETERS, BREAKDOWN_FIELDS, ScenarioGrid, evaluate_grid,
+)
+
+DEFAULT_SAMPLES = 10000
+MAX_SAMPLES = 50000
+PERCENTILES = (10, 50, 90)
+
+# Distributions around the request's own (normalized) values
+STAY_DURATION_SIGMA = 0.25      # lognormal spread of the stay, in log-days
+ICU_DAYS_MIN_MEAN = 0.5         # Poisson mean when no ICU days are planned - complications happen
+FX_DRIFT_SIGMA = 0.05           # lognormal drift of local-per-USD rates over the treatment period
+COVERAGE_CONCENTRATION = 40.0   # Beta concentration: higher = coverage closer to the policy value
+
+# Totals reported with bands (exchange_rate_to_usd is an input, not a cost)
+BAND_TOTALS = (
+    'total_cost_local', 'total_cost_usd', 'total_cost_inr',
+    'clinical_cost', 'clinical_cost_usd',
+    'non_clinical_cost', 'non_clinical_cost_usd',
+    'insurance_pays', 'insurance_pays_usd',
+    'patient_out_of_pocket', 'patient_out_of_pocket_usd',
+)
+
+
+class UncertaintyBands(NamedTuple):
+    """Percentile bands of a sampled estimate: name -> {'p10': .., 'p50': .., 'p90': ..}"""
+    samples: int
+    currency_code: str
+    fx_snapshot_id: str
+    totals: Dict[str, Dict[str, float]]
+    breakdown: Dict[str, Dict[str, float]]
+    breakdown_usd: Dict[str, Dict[str, float]]
+
+
+def _clamp(values: np.ndarray, field: str) -> np.ndarray:
+    _, low, high = INPUT_LIMITS[field]
+    return np.clip(values, low, high)
+
+
+def _beta_around(rng: np.random.Generator, mean: float, n: int) -> np.ndarray:
+    """Fractions in [0, 1] centred on mean; exactly mean at the edges"""
+    if mean <= 0.0 or mean >= 1.0:
+        return np.full(n, mean)
+    return rng.beta(COVERAGE_CONCENTRATION * mean, COVERAGE_CONCENTRATION * (1.0 - mean), n)
+
+
+def sample_parameters(
+    request: CostCalculationRequest,
+    resolved: ResolvedReference,
+    n: int,
+    rng: np.random.Generator,
+) -> Dict[str, np.ndarray]:
+    """n draws of each uncertain parameter, in evaluate_grid's samples format"""
+    inputs = normalize_inputs(request)
+    _, _, buffer_high = INPUT_LIMITS['complication_buffer']
+    buffer_mode = inputs['complication_buffer']
+
+    samples = {
+        # Anywhere from no complications to the maximum buffer, most likely the requested one
+        'complication_buffer': rng.triangular(0.0, buffer_mode, buffer_high, n) if buffer_high > 0 else np.zeros(n),
+        'stay_duration': _clamp(np.round(inputs['stay_duration'] * rng.lognormal(0.0, STAY_DURATION_SIGMA, n)), 'stay_duration'),
+        'icu_days': _clamp(rng.poisson(max(inputs['icu_days'], ICU_DAYS_MIN_MEAN), n).astype(float), 'icu_days'),
+        # Mean-one drift so the P50 stays near today's rate
+        'fx_drift': rng.lognormal(-FX_DRIFT_SIGMA ** 2 / 2, FX_DRIFT_SIGMA, n),
+    }
+    if request.has_insurance:
+        coverage = insurance_coverage(request, resolved.insurer)
+        for i, name in enumerate(COVERAGE_PARAMETERS):
+            samples[name] = _beta_around(rng, coverage[i], n)
+    return samples
+
+
+def _bands(tensors: Dict[str, np.ndarray]) -> Dict[str, Dict[str, float]]:
+    """Percentiles of each sample vector, computed in one call"""
+    names = list(tensors)
+    stacked = np.stack([tensors[name] for name in names])
+    values = np.percentile(stacked, PERCENTILES, axis=1)
+    return {
+        name: {f"p{p}": round(float(values[row, column]), 2) for row, p in enumerate(PERCENTILES)}
+        for column, name in enumerate(names)
+    }
+
+
+async def estimate_uncertainty(
+    service,
+    request: CostCalculationRequest,
+    samples: int = DEFAULT_SAMPLES,
+    seed: Optional[int] = None,
+) -> UncertaintyBands:
+    """
+    P10/P50/P90 bands for request, from `samples` vectorized draws.
+    Pass seed for reproducible bands.
+    """
+    if not 1 <= samples <= MAX_SAMPLES:
+        raise ValueError(f"samples must be between 1 and {MAX_SAMPLES}")
+    key = reference_key(request)
+    reference = await service.prefetch_reference_data(*key)
+    fx = await service.fx_rates.current()
+    resolved = resolve_reference(key[0], key[1], reference, fx)
+
+    rng = np.random.default_rng(seed)
+    drawn = sample_parameters(request, resolved, samples, rng)
+    result = evaluate_grid(ScenarioGrid(request, {}), {key: reference}, drawn, fx)
+
+    return UncertaintyBands(
+        samples=samples,
+        currency_code=str(result.currency_code.flat[0]),
+        fx_snapshot_id=result.fx_snapshot_id,
+        totals=_bands({name: result.totals[name] for name in BAND_TOTALS}),
+        breakdown=_bands({name: result.breakdown[name] for name in BREAKDOWN_FIELDS}),
+        breakdown_usd=_bands({name: result.breakdown_usd[name] for name in BREAKDOWN_FIELDS}),
+    )
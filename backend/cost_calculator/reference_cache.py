@@ -0,0 +1,251 @@
+"""
+Process-local cache of the cost calculator's reference tables.
+
+countries, base_costs, hospital_tiers, accommodation_costs, insurers,
+cancer_types and stages are tiny and change only when the database is
+reseeded, so each table is loaded whole on first use and served from memory
+until its TTL expires or it is invalidated (by /seed-database or,
+optionally, a Mongo change stream).
+In the steady state a calculation does no database I/O.
+
+Tables are seeded in versions (see seed_pipeline.py): only documents of
+the version named by the seed_state pointer are served, and when the
+pointer moves every cached table is dropped, so a reseed switches all
+tables together. The pointer is cached like a table; when it is due for a
+re-read, it is read alongside the table instead of before it, and
+documents of other versions are discarded. Databases seeded before
+versioning (no pointer) are read whole.
+
+Cached documents are shared between requests - callers must copy before
+modifying them.
+"""
+import asyncio
+import logging
+import os
+import time
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# collection -> field the calculator looks documents up by
+REFERENCE_TABLES: Dict[str, str] = {
+    'countries': 'id',
+    'base_costs': 'country_id',
+    'hospital_tiers': 'id',
+    'accommodation_costs': 'country_id',
+    'insurers': 'id',
+    'cancer_types': 'id',
+    'stages': 'id',
+}
+
+DEFAULT_TTL_SECONDS = 300.0
+
+# Versioned seeding: documents carry SEED_VERSION_FIELD, and the
+# SEED_STATE_ID document in SEED_STATE_COLLECTION names the active version
+SEED_VERSION_FIELD = 'seed_version'
+SEED_STATE_COLLECTION = 'seed_state'
+SEED_STATE_ID = 'cost_calculator'
+
+
+def _ttl_from_env() -> float:
+    try:
+        return float(os.environ.get('COST_REFERENCE_CACHE_TTL_SECONDS', '').strip() or DEFAULT_TTL_SECONDS)
+    except ValueError:
+        logger.warning("Invalid COST_REFERENCE_CACHE_TTL_SECONDS, using default")
+        return DEFAULT_TTL_SECONDS
+
+
+class ReferenceCache:
+    """TTL cache of whole reference tables, keyed by their lookup field"""
+
+    def __init__(self, db, ttl_seconds: Optional[float] = None, tables: Optional[Dict[str, str]] = None):
+        self.db = db
+        self.ttl_seconds = _ttl_from_env() if ttl_seconds is None else ttl_seconds
+        self.tables = dict(tables or REFERENCE_TABLES)
+        # collection -> (loaded_at monotonic time, {key: document})
+        self._entries: Dict[str, Any] = {}
+        self._locks: Dict[str, asyncio.Lock] = {}
+        # Active seed version the cached tables belong to (None = unversioned data)
+        self.seed_version: Optional[str] = None
+        self._seed_counts: Dict[str, int] = {}
+        self._seed_known = False
+        self._seed_expires = 0.0
+        # Pointer read in flight, shared by concurrent cold loads
+        self._seed_read: Optional[asyncio.Future] = None
+        # Bumped on every invalidation so derived caches can tell data changed
+        self.version = 0
+        self.hits = 0
+        self.loads = 0
+        self._watch_task: Optional[asyncio.Task] = None
+
+    def _fresh(self, collection: str) -> Optional[Dict[str, Dict[str, Any]]]:
+        entry = self._entries.get(collection)
+        if entry is None:
+            return None
+        loaded_at, documents = entry
+        if self.ttl_seconds > 0 and time.monotonic() - loaded_at > self.ttl_seconds:
+            return None
+        return documents
+
+    def _seed_fresh(self) -> bool:
+        return self._seed_known and time.monotonic() < self._seed_expires
+
+    async def _read_seed_state(self) -> Optional[Dict[str, Any]]:
+        return await self.db[SEED_STATE_COLLECTION].find_one({'_id': SEED_STATE_ID})
+
+    def _shared_seed_read(self) -> asyncio.Future:
+        """The pointer read in flight, or a new one"""
+        if self._seed_read is None or self._seed_read.done():
+            self._seed_read = asyncio.ensure_future(self._read_seed_state())
+        return self._seed_read
+
+    def _adopt_seed_state(self, state: Optional[Dict[str, Any]], version: int) -> int:
+        """
+        Record a freshly read pointer (trusted for one TTL). If it moved since
+        the last read, every cached table belongs to a retired version and is
+        dropped. Returns the cache version a load that started at version may
+        be published under.
+        """
+        active = state.get('active_version') if state else None
+        unchanged_since_start = version == self.version
+        if self._seed_known and active != self.seed_version:
+            logger.info(f"Cost calculator seed version changed: {self.seed_version} -> {active}")
+            self.invalidate()
+        self.seed_version = active
+        self._seed_counts = (state or {}).get('counts') or {}
+        self._seed_known = True
+        self._seed_expires = time.monotonic() + self.ttl_seconds if self.ttl_seconds > 0 else float('inf')
+        # Our own pointer switch doesn't make the load stale; an invalidation meanwhile does
+        return self.version if unchanged_since_start else version
+
+    async def _find(self, collection: str, seed_version: Optional[str]) -> List[Dict[str, Any]]:
+        query = {SEED_VERSION_FIELD: seed_version} if seed_version is not None else {}
+        documents = await self.db[collection].find(query).to_list(None)
+        self.loads += 1
+        return documents
+
+    def _complete(self, collection: str, documents: List[Dict[str, Any]]) -> bool:
+        """False if documents can't be the whole active version (still being written, or already retired)"""
+        if self.seed_version is None:
+            return True
+        expected = self._seed_counts.get(collection)
+        return len(documents) == expected if expected is not None else bool(documents)
+
+    async def _load(self, collection: str) -> Tuple[Dict[str, Dict[str, Any]], int]:
+        """
+        Documents of the active seed version by key (the first wins for
+        duplicate keys, like find_one), and the cache version they belong to.
+        With the pointer fresh only its version is read; otherwise the pointer
+        and the whole table are read concurrently - one round-trip of latency,
+        not two - and other versions are discarded.
+        """
+        version = self.version
+        if self._seed_fresh():
+            documents = await self._find(collection, self.seed_version)
+        else:
+            state, documents = await asyncio.gather(self._shared_seed_read(), self._find(collection, None))
+            version = self._adopt_seed_state(state, version)
+            if self.seed_version is not None:
+                documents = [d for d in documents if d.get(SEED_VERSION_FIELD) == self.seed_version]
+        if not self._complete(collection, documents):
+            # A seed was activated or retired versions while we read - follow the pointer
+            version = self.version
+            state = await self._read_seed_state()
+            version = self._adopt_seed_state(state, version)
+            documents = await self._find(collection, self.seed_version)
+
+        key_field = self.tables[collection]
+        by_key: Dict[str, Dict[str, Any]] = {}
+        for document in documents:
+            by_key.setdefault(document.get(key_field), document)
+        return by_key, version
+
+    async def table(self, collection: str) -> Dict[str, Dict[str, Any]]:
+        """All documents of a reference table by key, loading it if missing or expired"""
+        documents = self._fresh(collection)
+        if documents is not None:
+            self.hits += 1
+            return documents
+        # Single flight: concurrent cold requests share one load
+        lock = self._locks.setdefault(collection, asyncio.Lock())
+        async with lock:
+            documents = self._fresh(collection)
+            if documents is not None:
+                self.hits += 1
+                return documents
+            documents, version = await self._load(collection)
+            # Don't publish a load that raced with an invalidation
+            if version == self.version:
+                self._entries[collection] = (time.monotonic(), documents)
+            return documents
+
+    async def lookup(self, collection: str, key: Any) -> Optional[Dict[str, Any]]:
+        """Equivalent of find_one({key_field: key}) served from the cache"""
+        if self.db is None or key is None:
+            return None
+        return (await self.table(collection)).get(key)
+
+    def peek(self, collection: str, key: Any):
+        """
+        (True, document-or-None) if the table is cached and fresh, else (False, None).
+        Lets callers skip scheduling async work when everything is already in memory.
+        """
+        if self.db is None or key is None:
+            return True, None
+        documents = self._fresh(collection)
+        if documents is None:
+            return False, None
+        self.hits += 1
+        return True, documents.get(key)
+
+    def is_cached(self, collection: str) -> bool:
+        """True if lookups in collection are currently answered from memory (or there is no DB)"""
+        return self.db is None or self._fresh(collection) is not None
+
+    def invalidate(self, collections: Optional[Iterable[str]] = None):
+        """Drop cached tables (all of them by default)"""
+        if collections is None:
+            self._entries.clear()
+        else:
+            for collection in collections:
+                self._entries.pop(collection, None)
+        # Re-read the seed pointer with the next load, not reusing a read already in flight
+        self._seed_expires = 0.0
+        self._seed_read = None
+        self.version += 1
+        logger.info(f"Cost calculator reference cache invalidated (version {self.version})")
+
+    async def watch_changes(self):
+        """
+        Invalidate tables as they change, using a Mongo change stream.
+        Requires a replica set (e.g. Atlas); otherwise logs and returns,
+        leaving TTL expiry and explicit invalidation in place.
+        """
+        pipeline = [{'$match': {'ns.coll': {'$in': [*self.tables, SEED_STATE_COLLECTION]}}}]
+        try:
+            async with self.db.watch(pipeline) as stream:
+                logger.info("Watching cost calculator reference tables for changes")
+                async for change in stream:
+                    collection = change.get('ns', {}).get('coll')
+                    # A pointer flip switches every table at once
+                    self.invalidate(None if collection == SEED_STATE_COLLECTION else [collection])
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning(f"Reference change stream unavailable, relying on TTL: {e}")
+
+    def start_change_stream(self):
+        """Run watch_changes in the background (call from a running event loop)"""
+        if self.db is None or self._watch_task is not None:
+            return
+        self._watch_task = asyncio.get_running_loop().create_task(self.watch_changes())
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            'version': self.version,
+            'seed_version': self.seed_version,
+            'ttl_seconds': self.ttl_seconds,
+            'cached_tables': sorted(self._entries),
+            'hits': self.hits,
+            'loads': self.loads,
+        }
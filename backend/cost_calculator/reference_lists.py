@@ -0,0 +1,127 @@
+"""
+Pre-serialized reference lists for the calculator's dropdowns
+/countries, /insurers/{country_id}, /cancer-types, /stages, /hospital-tiers
+and the combined /bootstrap are served from one immutable snapshot built
+from the reference cache (see reference_cache.py). Each body is serialized
+once with a strong ETag, so clients can revalidate with If-None-Match and
+get 304s; the snapshot is rebuilt only when a reference table is reloaded
+or the cache is invalidated (e.g. by /seed-database).
+"""
+import asyncio
+import hashlib
+import logging
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple, Type
+
+from pydantic import BaseModel
+
+from http_cache import CachedBody
+from models import Country, Insurer, CancerType, Stage, HospitalTier
+
+logger = logging.getLogger(__name__)
+
+# Matches the find().to_list(100) the list endpoints used to run
+LIST_LIMIT = 100
+
+# list name -> (collection, response model)
+REFERENCE_LISTS: Dict[str, Tuple[str, Type[BaseModel]]] = {
+    'countries': ('countries', Country),
+    'cancer_types': ('cancer_types', CancerType),
+    'stages': ('stages', Stage),
+    'hospital_tiers': ('hospital_tiers', HospitalTier),
+}
+INSURERS_COLLECTION = 'insurers'
+
+EMPTY_LIST = CachedBody.from_payload([])
+
+
+class ReferenceListSnapshot(NamedTuple):
+    """Serialized lists for one version of the reference tables"""
+    version: str
+    lists: Dict[str, CachedBody]
+    insurers: Dict[str, CachedBody]  # country_id -> body
+    bootstrap: CachedBody
+    # Table dicts the snapshot was built from (None = fallback data), compared by identity
+    sources: Tuple[Optional[Dict[str, Any]], ...]
+
+
+def _dump(model: Type[BaseModel], documents: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """What response_model=List[model] would have sent for these documents"""
+    return [model.model_validate(document).model_dump(mode='json') for document in documents[:LIST_LIMIT]]
+
+
+class ReferenceLists:
+    """
+    Builds and holds the current ReferenceListSnapshot.
+    fallbacks maps list names (and 'insurers' -> {country_id: [...]}) to the
+    seed data served when a table is empty or can't be loaded.
+    """
+
+    def __init__(self, reference_cache, fallbacks: Dict[str, Any]):
+        self.reference_cache = reference_cache
+        self.fallbacks = fallbacks
+        self._snapshot: Optional[ReferenceListSnapshot] = None
+        self.builds = 0
+
+    async def _table(self, collection: str) -> Optional[Dict[str, Any]]:
+        """Cached table by key, or None if there is no database or it can't be read"""
+        if self.reference_cache.db is None:
+            return None
+        try:
+            return await self.reference_cache.table(collection)
+        except Exception as e:
+            logger.warning(f"Error fetching {collection} from DB: {str(e)}, returning fallback data")
+            return None
+
+    async def snapshot(self) -> ReferenceListSnapshot:
+        """Current snapshot, rebuilt if any table behind it was reloaded"""
+        collections = [collection for collection, _ in REFERENCE_LISTS.values()] + [INSURERS_COLLECTION]
+        if all(self.reference_cache.is_cached(collection) for collection in collections):
+            sources = tuple([await self._table(collection) for collection in collections])
+        else:
+            sources = tuple(await asyncio.gather(*(self._table(collection) for collection in collections)))
+        # With a database, None means a table couldn't be read: serve fallbacks but retry next time
+        complete = self.reference_cache.db is None or all(source is not None for source in sources)
+        current = self._snapshot
+        if complete and current is not None and all(a is b for a, b in zip(current.sources, sources)):
+            return current
+        snapshot = self._build(sources)
+        if complete:
+            self._snapshot = snapshot
+        return snapshot
+
+    def _build(self, sources: Tuple[Optional[Dict[str, Any]], ...]) -> ReferenceListSnapshot:
+        payloads: Dict[str, Any] = {}
+        for (name, (collection, model)), table in zip(REFERENCE_LISTS.items(), sources):
+            documents = list(table.values()) if table else []
+            if not documents:
+                logger.info(f"Database empty for {collection}, returning fallback mock data")
+                documents = self.fallbacks.get(name, [])
+            payloads[name] = _dump(model, documents)
+
+        insurers_table = sources[-1]
+        by_country: Dict[str, List[Dict[str, Any]]] = {}
+        for insurer in (insurers_table or {}).values():
+            by_country.setdefault(insurer.get('country_id'), []).append(insurer)
+        fallback_insurers = self.fallbacks.get('insurers', {})
+        insurers = {
+            country_id: _dump(Insurer, by_country.get(country_id) or fallback_insurers.get(country_id, []))
+            for country_id in dict.fromkeys([*fallback_insurers, *by_country])
+            if country_id is not None
+        }
+
+        bootstrap = {**payloads, 'insurers': insurers}
+        version = hashlib.sha256(CachedBody.from_payload(bootstrap).body).hexdigest()[:16]
+        self.builds += 1
+        return ReferenceListSnapshot(
+            version=version,
+            lists={name: CachedBody.from_payload(payload) for name, payload in payloads.items()},
+            insurers={country_id: CachedBody.from_payload(payload) for country_id, payload in insurers.items()},
+            bootstrap=CachedBody.from_payload({'version': version, **bootstrap}),
+            sources=sources,
+        )
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            'version': self._snapshot.version if self._snapshot else None,
+            'builds': self.builds,
+        }
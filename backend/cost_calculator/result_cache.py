@@ -0,0 +1,103 @@
+"""
+Process-local LRU of finished cost calculations
+Keyed on the request fingerprint (see request_fingerprint in
+cost_calculator_service.py), so requests that normalize to the same inputs
+share one entry. Everything is dropped when the reference data version
+changes (reseed, change stream), and entries expire with the reference
+cache TTL so they never outlive the tables they were computed from.
+
+Cached responses are shared between requests - callers must copy before
+modifying them.
+"""
+import logging
+import os
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_ENTRIES = 4096
+
+
+def _max_entries_from_env() -> int:
+    try:
+        return int(os.environ.get('COST_RESULT_CACHE_MAX_ENTRIES', '').strip() or DEFAULT_MAX_ENTRIES)
+    except ValueError:
+        logger.warning("Invalid COST_RESULT_CACHE_MAX_ENTRIES, using default")
+        return DEFAULT_MAX_ENTRIES
+
+
+class ResultCache:
+    """Bounded LRU of responses by fingerprint, cleared when version_provider() changes"""
+
+    def __init__(
+        self,
+        max_entries: Optional[int] = None,
+        ttl_seconds: float = 0.0,
+        version_provider: Optional[Callable[[], Any]] = None,
+    ):
+        self.max_entries = _max_entries_from_env() if max_entries is None else max_entries
+        self.ttl_seconds = ttl_seconds
+        self.version_provider = version_provider
+        # fingerprint -> (stored_at monotonic time, response)
+        self._entries: "OrderedDict[str, Any]" = OrderedDict()
+        self._version: Any = None
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def _check_version(self):
+        """Drop all entries if the reference data version moved since they were stored"""
+        if not self.version_provider:
+            return
+        current = self.version_provider()
+        if current != self._version:
+            if self._version is not None:
+                logger.info(f"Reference data version changed {self._version} -> {current}, clearing result cache")
+                self.clear()
+            self._version = current
+
+    def get(self, fingerprint: str) -> Optional[Any]:
+        """Cached response, or None (counts as a miss)"""
+        self._check_version()
+        entry = self._entries.get(fingerprint)
+        if entry is not None:
+            stored_at, response = entry
+            if self.ttl_seconds <= 0 or time.monotonic() - stored_at <= self.ttl_seconds:
+                self._entries.move_to_end(fingerprint)
+                self.hits += 1
+                return response
+            del self._entries[fingerprint]
+        self.misses += 1
+        return None
+
+    def put(self, fingerprint: str, response: Any) -> Any:
+        """Store a response, evicting the least recently used past max_entries"""
+        if self.max_entries <= 0:
+            return response
+        self._check_version()
+        self._entries[fingerprint] = (time.monotonic(), response)
+        self._entries.move_to_end(fingerprint)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+        return response
+
+    def clear(self):
+        """Explicitly invalidate every entry"""
+        self._entries.clear()
+        self.invalidations += 1
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            'entries': len(self._entries),
+            'max_entries': self.max_entries,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': round(self.hits / lookups, 4) if lookups else 0.0,
+            'evictions': self.evictions,
+            'invalidations': self.invalidations,
+        }
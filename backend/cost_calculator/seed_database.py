@@ -3,11 +3,8 @@ from motor.motor_asyncio import AsyncIOMotorClient
 import os
 from dotenv import load_dotenv
 from pathlib import Path
-from seed_data import (
-    COUNTRIES_DATA, INSURERS_DATA, CANCER_TYPES_DATA,
-    STAGES_DATA, HOSPITAL_TIERS_DATA, BASE_COSTS_DATA,
-    ACCOMMODATION_COSTS_DATA
-)
+from seed_pipeline import seed_reference_data
+from fx_rates import fallback_snapshot
 
 ROOT_DIR = Path(__file__).parent
 load_dotenv(ROOT_DIR / '.env')
@@ -28,50 +25,21 @@ async def seed_database():
     
     print("Starting database seeding...")
     
-    # Clear existing data
-    print("Clearing existing data...")
-    await db.countries.delete_many({})
-    await db.insurers.delete_many({})
-    await db.cancer_types.delete_many({})
-    await db.stages.delete_many({})
-    await db.hospital_tiers.delete_many({})
-    await db.base_costs.delete_many({})
-    await db.accommodation_costs.delete_many({})
+    # Write a new version, then switch readers to it in one step
+    print("Writing a new seed version...")
+    seeded = await seed_reference_data(db)
+    for collection, count in seeded.counts.items():
+        print(f"Inserted {count} {collection.replace('_', ' ')}")
+    print(f"Activated seed version {seeded.version} (previous: {seeded.previous_version})")
+    print(f"Removed {sum(seeded.removed.values())} documents of retired versions")
     
-    # Insert countries
-    print(f"Inserting {len(COUNTRIES_DATA)} countries...")
-    await db.countries.insert_many(COUNTRIES_DATA)
-    
-    # Insert insurers
-    print("Inserting insurers...")
-    all_insurers = []
-    for country_insurers in INSURERS_DATA.values():
-        all_insurers.extend(country_insurers)
-    await db.insurers.insert_many(all_insurers)
-    print(f"Inserted {len(all_insurers)} insurers")
-    
-    # Insert cancer types
-    print(f"Inserting {len(CANCER_TYPES_DATA)} cancer types...")
-    await db.cancer_types.insert_many(CANCER_TYPES_DATA)
-    
-    # Insert stages
-    print(f"Inserting {len(STAGES_DATA)} stages...")
-    await db.stages.insert_many(STAGES_DATA)
-    
-    # Insert hospital tiers
-    print(f"Inserting {len(HOSPITAL_TIERS_DATA)} hospital tiers...")
-    await db.hospital_tiers.insert_many(HOSPITAL_TIERS_DATA)
-    
-    # Insert base costs
-    print(f"Inserting {len(BASE_COSTS_DATA)} base costs...")
-    await db.base_costs.insert_many(BASE_COSTS_DATA)
-    
-    # Insert accommodation costs
-    print(f"Inserting {len(ACCOMMODATION_COSTS_DATA)} accommodation costs...")
-    await db.accommodation_costs.insert_many(ACCOMMODATION_COSTS_DATA)
+    # Upsert the shipped FX snapshot (newer snapshots are kept)
+    fx_snapshot = fallback_snapshot().to_document()
+    print(f"Upserting FX snapshot {fx_snapshot['snapshot_id']}...")
+    await db.fx_rates.replace_one({"snapshot_id": fx_snapshot["snapshot_id"]}, fx_snapshot, upsert=True)
     
     print("\n✅ Database seeding completed successfully!")
-    print(f"Total collections seeded: 7")
+    print(f"Total collections seeded: 8")
     
     client.close()
 
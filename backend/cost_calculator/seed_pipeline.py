@@ -0,0 +1,139 @@
+"""
+Versioned seeding of the cost calculator's reference tables
+A reseed never empties the live tables. Every document is written with a
+new seed_version (ordered bulk inserts, after making sure the
+(seed_version, key) indexes exist), and only once all seven tables are in
+place is the active-version pointer in seed_state flipped - a single
+document update, so readers see either the old version or the new one.
+The reference cache (see reference_cache.py) reads only the active
+version and drops its tables when the pointer moves.
+
+The previous version is kept for readers that looked at the pointer just
+before the flip; anything older, and unversioned documents from before
+versioned seeding, is removed after the flip. A failed seed removes its
+own partial version and leaves the pointer alone.
+Run one seed at a time.
+"""
+import asyncio
+import copy
+import logging
+import uuid
+from datetime import datetime, timezone
+from typing import Any, Dict, List, NamedTuple, Optional
+
+from pymongo import ASCENDING, InsertOne
+
+from reference_cache import REFERENCE_TABLES, SEED_STATE_COLLECTION, SEED_STATE_ID, SEED_VERSION_FIELD
+
+logger = logging.getLogger(__name__)
+
+# Extra lookup fields worth an index, besides the cache's key field
+SECONDARY_KEYS: Dict[str, List[str]] = {
+    'insurers': ['country_id'],
+}
+
+
+class SeedResult(NamedTuple):
+    """Outcome of a seed that was activated"""
+    version: str
+    previous_version: Optional[str]
+    counts: Dict[str, int]
+    removed: Dict[str, int]  # collection -> retired documents deleted
+
+
+def seed_tables() -> Dict[str, List[Dict[str, Any]]]:
+    """The shipped seed data (seed_data.py), by collection"""
+    from seed_data import (
+        COUNTRIES_DATA, INSURERS_DATA, CANCER_TYPES_DATA,
+        STAGES_DATA, HOSPITAL_TIERS_DATA, BASE_COSTS_DATA,
+        ACCOMMODATION_COSTS_DATA
+    )
+    return {
+        'countries': COUNTRIES_DATA,
+        'insurers': [insurer for insurers in INSURERS_DATA.values() for insurer in insurers],
+        'cancer_types': CANCER_TYPES_DATA,
+        'stages': STAGES_DATA,
+        'hospital_tiers': HOSPITAL_TIERS_DATA,
+        'base_costs': BASE_COSTS_DATA,
+        'accommodation_costs': ACCOMMODATION_COSTS_DATA,
+    }
+
+
+def new_seed_version() -> str:
+    """Time-ordered version id: later seeds compare greater as strings"""
+    return f"{datetime.now(timezone.utc):%Y%m%dT%H%M%S%fZ}-{uuid.uuid4().hex[:6]}"
+
+
+async def ensure_indexes(db, collections: List[str]):
+    """(seed_version, key) indexes, so versioned reads and cleanup don't scan"""
+    for collection in collections:
+        keys = [REFERENCE_TABLES[collection], *SECONDARY_KEYS.get(collection, [])]
+        for key in keys:
+            await db[collection].create_index([(SEED_VERSION_FIELD, ASCENDING), (key, ASCENDING)])
+
+
+async def _write_version(db, collection: str, documents: List[Dict[str, Any]], version: str) -> int:
+    # Copies: the driver adds _id to what it inserts, and seed data is module-level
+    requests = [InsertOne({**copy.deepcopy(document), SEED_VERSION_FIELD: version}) for document in documents]
+    if not requests:
+        return 0
+    result = await db[collection].bulk_write(requests, ordered=True)
+    return result.inserted_count
+
+
+async def active_seed_version(db) -> Optional[str]:
+    state = await db[SEED_STATE_COLLECTION].find_one({'_id': SEED_STATE_ID})
+    return state.get('active_version') if state else None
+
+
+async def seed_reference_data(db, tables: Optional[Dict[str, List[Dict[str, Any]]]] = None) -> SeedResult:
+    """
+    Write tables (default: seed_tables()) as a new version, activate it and
+    retire older versions. Live readers keep the previous version until the
+    pointer flips.
+    """
+    tables = seed_tables() if tables is None else tables
+    unknown = set(tables) - set(REFERENCE_TABLES)
+    if unknown:
+        raise ValueError(f"Not reference tables: {', '.join(sorted(unknown))}")
+    collections = list(tables)
+    version = new_seed_version()
+
+    await ensure_indexes(db, collections)
+    try:
+        inserted = await asyncio.gather(*(
+            _write_version(db, collection, tables[collection], version) for collection in collections
+        ))
+    except Exception:
+        # Nothing points at this version yet - drop what made it in
+        await asyncio.gather(*(
+            db[collection].delete_many({SEED_VERSION_FIELD: version}) for collection in collections
+        ), return_exceptions=True)
+        raise
+    counts = dict(zip(collections, inserted))
+
+    # The flip: one document, so readers switch all tables at once
+    previous = await active_seed_version(db)
+    await db[SEED_STATE_COLLECTION].update_one(
+        {'_id': SEED_STATE_ID},
+        {'$set': {
+            'active_version': version,
+            'previous_version': previous,
+            'activated_at': datetime.now(timezone.utc),
+            'counts': counts,
+        }},
+        upsert=True,
+    )
+    logger.info(f"Activated cost calculator seed {version} (previous: {previous})")
+
+    # Keep the previous version for in-flight readers; a seed newer than
+    # this one (ids sort by time) is never touched
+    oldest_kept = min(filter(None, [previous, version]))
+    retired = {'$or': [
+        {SEED_VERSION_FIELD: {'$exists': False}},
+        {SEED_VERSION_FIELD: {'$lt': oldest_kept}},
+    ]}
+    results = await asyncio.gather(*(db[collection].delete_many(retired) for collection in collections))
+    removed = {collection: result.deleted_count for collection, result in zip(collections, results)}
+
+    return SeedResult(version=version, previous_version=previous, counts=counts, removed=removed)
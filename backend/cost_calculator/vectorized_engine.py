@@ -0,0 +1,320 @@
+"""
+Vectorized cost engine for what-if grids and sensitivity analysis
+Evaluates the same formulas as CostCalculatorService.calculate_treatment_cost
+over NumPy arrays, one array axis per varied request field, e.g.
+chemo cycles 1-24 x radiation fractions 1-40 x hospital tier x room category.
+
+Every derived parameter (normalized input, multiplier, reference value) is
+computed once per combination of the fields it depends on and broadcast, so
+the per-scenario work is a handful of array operations. Operations are
+applied in the scalar path's order, so results match it to the cent.
+
+Parameters can also be replaced by arrays of samples (see SAMPLED_PARAMETERS),
+which is how monte_carlo.py evaluates thousands of draws in one pass.
+"""
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+import asyncio
+import itertools
+import numpy as np
+
+from models import CostCalculationRequest, CostBreakdown
+from cost_calculator_service import (
+    ResolvedReference, reference_key, normalize_inputs,
+    resolve_reference, insurance_coverage,
+)
+from fx_rates import FxSnapshot, fallback_snapshot
+from default_data import (
+    ROOM_CATEGORY_MULTIPLIERS, REGIMEN_MULTIPLIERS, DRUG_ACCESS_MULTIPLIERS,
+    RADIATION_TECHNIQUE_MULTIPLIERS, TRANSPLANT_TYPE_MULTIPLIERS,
+    TRAVEL_TYPE_MULTIPLIERS, BASE_FLIGHT_COST_USD, LOCAL_TRANSPORT_COSTS,
+    FOOD_COST_PER_DAY_USD, normalize_number,
+)
+
+# Upper bound on scenarios in one grid evaluation
+MAX_GRID_SIZE = 50000
+
+# Columns over at most this many axis combinations keep their request copies for reuse
+MAX_CACHED_COMBINATIONS = 1024
+
+# Request fields that select reference documents (see reference_key)
+REFERENCE_FIELDS = ('country', 'hospital_tier', 'insurer', 'has_insurance')
+
+BREAKDOWN_FIELDS = tuple(CostBreakdown.model_fields)
+
+TOTAL_FIELDS = (
+    'total_cost_local', 'total_cost_usd', 'total_cost_inr',
+    'clinical_cost', 'clinical_cost_usd',
+    'non_clinical_cost', 'non_clinical_cost_usd',
+    'insurance_pays', 'insurance_pays_usd',
+    'patient_out_of_pocket', 'patient_out_of_pocket_usd',
+    'exchange_rate_to_usd',
+)
+
+Reference = Dict[str, Optional[Dict[str, Any]]]
+
+# Parameters evaluate_grid accepts sample arrays for, besides the INPUT_LIMITS fields
+COVERAGE_PARAMETERS = ('inpatient_coverage', 'outpatient_coverage', 'drug_coverage')  # fractions 0-1
+SAMPLED_PARAMETERS = COVERAGE_PARAMETERS + ('fx_drift',)  # fx_drift multiplies local-per-USD rates
+
+
+def round_cents(values: np.ndarray) -> np.ndarray:
+    """Round to 2 decimals like the scalar path's round(x, 2)"""
+    return np.round(values, 2)
+
+
+class ScenarioGrid:
+    """
+    Cartesian product of axis values applied to a base request.
+    axes maps request field names to the values to try; axis order is the
+    order of the returned tensors' dimensions.
+    """
+
+    def __init__(self, base: CostCalculationRequest, axes: Dict[str, Sequence[Any]]):
+        unknown = set(axes) - set(CostCalculationRequest.model_fields)
+        if unknown:
+            raise ValueError(f"Unknown grid fields: {', '.join(sorted(unknown))}")
+        self.base = base
+        self.names: List[str] = list(axes)
+        self.values: List[List[Any]] = []
+        base_fields = base.model_dump()
+        for name in self.names:
+            values = list(axes[name])
+            if not values:
+                raise ValueError(f"Grid axis '{name}' has no values")
+            # Validate through the request model so axis values get the same coercion as a request
+            self.values.append([
+                getattr(CostCalculationRequest.model_validate({**base_fields, name: value}), name)
+                for value in values
+            ])
+        self.shape: Tuple[int, ...] = tuple(len(values) for values in self.values)
+        self.size = int(np.prod(self.shape, dtype=np.int64))
+        if self.size > MAX_GRID_SIZE:
+            raise ValueError(f"Grid too large: {self.size} scenarios (max {MAX_GRID_SIZE})")
+        # ((axis, value index), ...) -> base with those axis values; most columns share a few
+        self._requests: Dict[Tuple[Tuple[int, int], ...], CostCalculationRequest] = {(): base}
+
+    def _request(self, assignment: Tuple[Tuple[int, int], ...], cache: bool) -> CostCalculationRequest:
+        request = self._requests.get(assignment)
+        if request is None:
+            request = self.base.model_copy(update={self.names[i]: self.values[i][j] for i, j in assignment})
+            if cache:
+                self._requests[assignment] = request
+        return request
+
+    def column(self, fields: Iterable[str], fn: Callable[[CostCalculationRequest], Any], dtype=float) -> np.ndarray:
+        """
+        fn evaluated once per combination of the given fields' axis values,
+        shaped to broadcast against the grid (size-1 dims for other axes).
+        """
+        fields = set(fields)
+        dims = [i for i, name in enumerate(self.names) if name in fields]
+        out = np.empty([self.shape[i] for i in dims], dtype=dtype)
+        cache = out.size <= MAX_CACHED_COMBINATIONS
+        for combo in itertools.product(*(range(self.shape[i]) for i in dims)):
+            out[combo] = fn(self._request(tuple(zip(dims, combo)), cache))
+        return out.reshape([self.shape[i] if i in dims else 1 for i in range(len(self.shape))])
+
+    def reference_keys(self) -> List[Tuple[str, str, Optional[str]]]:
+        """Distinct reference_key values across the grid"""
+        keys = self.column(REFERENCE_FIELDS, reference_key, dtype=object)
+        return list(dict.fromkeys(keys.ravel().tolist()))
+
+
+class CostGrid(NamedTuple):
+    """Cost tensors for a scenario grid, one dimension per axis"""
+    axes: Dict[str, List[Any]]
+    totals: Dict[str, np.ndarray]
+    breakdown: Dict[str, np.ndarray]
+    breakdown_usd: Dict[str, np.ndarray]
+    currency_code: np.ndarray
+    fx_snapshot_id: str
+
+    @property
+    def shape(self) -> Tuple[int, ...]:
+        return self.totals['total_cost_local'].shape
+
+
+def evaluate_grid(
+    grid: ScenarioGrid,
+    references: Dict[Tuple[str, str, Optional[str]], Reference],
+    samples: Optional[Dict[str, np.ndarray]] = None,
+    fx: Optional[FxSnapshot] = None,
+) -> CostGrid:
+    """
+    Cost tensors for every scenario of grid.
+    references maps each of grid.reference_keys() to the output of
+    CostCalculatorService.prefetch_reference_data for that key.
+    samples optionally replaces normalized inputs (INPUT_LIMITS fields) or
+    SAMPLED_PARAMETERS with arrays broadcastable against the grid; the
+    result then has the broadcast shape.
+    fx is the rate snapshot to convert with (the shipped fallback by default).
+    """
+    samples = samples or {}
+    fx = fx or fallback_snapshot()
+    column = grid.column
+    resolved_by_key: Dict[Tuple[str, str, Optional[str]], ResolvedReference] = {}
+
+    def resolved(request: CostCalculationRequest) -> ResolvedReference:
+        key = reference_key(request)
+        if key not in resolved_by_key:
+            resolved_by_key[key] = resolve_reference(key[0], key[1], references[key], fx)
+        return resolved_by_key[key]
+
+    def reference_column(fields: Tuple[str, ...], fn, dtype=float) -> np.ndarray:
+        return column(REFERENCE_FIELDS + fields, lambda request: fn(request, resolved(request)), dtype)
+
+    base_inputs = normalize_inputs(grid.base)
+
+    def input_column(name: str) -> np.ndarray:
+        if name in samples:
+            return samples[name]
+        if name not in grid.names:
+            return np.array(base_inputs[name])
+        return column((name,), lambda request: normalize_inputs(request)[name])
+
+    def flag(name: str) -> np.ndarray:
+        return column((name,), lambda request: bool(getattr(request, name)), dtype=bool)
+
+    def multiplier(name: str, table: Dict[str, float], default_key: str, missing: float) -> np.ndarray:
+        return column((name,), lambda request: table.get(getattr(request, name) or default_key, missing))
+
+    def base_cost(item: str) -> np.ndarray:
+        return reference_column((), lambda request, ref: normalize_number(ref.base_costs.get(item, 0)))
+
+    tier_multiplier = reference_column((), lambda request, ref: ref.tier_multiplier)
+    companions_plus_one = input_column('companions') + 1
+
+    # Clinical costs
+    surgery_cost = base_cost('surgery') * tier_multiplier
+    room_cost = base_cost('room_per_day') * input_column('surgery_days')
+    icu_cost = base_cost('icu_per_day') * input_column('icu_days')
+    room_cost = room_cost * multiplier('room_category', ROOM_CATEGORY_MULTIPLIERS, 'semi_private', 1.0)
+    total_surgery = np.where(flag('include_surgery'), surgery_cost + room_cost + icu_cost, 0.0)
+
+    chemo_cost = base_cost('chemo_per_cycle') * multiplier('regimen_type', REGIMEN_MULTIPLIERS, 'standard_chemo', 1.0)
+    chemo_cost = chemo_cost * multiplier('drug_access', DRUG_ACCESS_MULTIPLIERS, 'generics', 0.6)
+    daycare_cost = chemo_cost * 0.1
+    total_chemo = (chemo_cost + daycare_cost) * input_column('chemo_cycles') * tier_multiplier
+    total_chemo = np.where(flag('include_chemo'), total_chemo, 0.0)
+
+    radiation_cost = base_cost('radiation_per_fraction') * multiplier(
+        'radiation_technique', RADIATION_TECHNIQUE_MULTIPLIERS, '3d_crt', 1.0)
+    total_radiation = radiation_cost * input_column('radiation_fractions') * tier_multiplier
+    concurrent_chemo_cost = base_cost('chemo_per_cycle') * 0.3 * tier_multiplier
+    total_radiation = np.where(flag('concurrent_chemo'), total_radiation + concurrent_chemo_cost, total_radiation)
+    total_radiation = np.where(flag('include_radiation'), total_radiation, 0.0)
+
+    transplant_cost = base_cost('transplant') * tier_multiplier
+    transplant_cost = transplant_cost * multiplier('transplant_type', TRANSPLANT_TYPE_MULTIPLIERS, 'autologous', 1.0)
+    transplant_cost = transplant_cost + base_cost('room_per_day') * input_column('transplant_days')
+    transplant_cost = np.where(flag('include_transplant'), transplant_cost, 0.0)
+
+    diagnostics_cost = 0.0 + base_cost('pet_ct') * input_column('pet_ct_count')
+    diagnostics_cost = diagnostics_cost + base_cost('mri_ct') * input_column('mri_ct_count')
+    diagnostics_cost = np.where(flag('include_ngs'), diagnostics_cost + base_cost('ngsp_panel'), diagnostics_cost)
+    diagnostics_cost = diagnostics_cost + base_cost('opd_consult') * input_column('opd_consults')
+
+    clinical_cost = 0.0 + total_surgery + total_chemo + total_radiation + transplant_cost + diagnostics_cost
+
+    # Non-clinical costs (medical tourism)
+    # USD-denominated estimates use the snapshot rate the totals are converted back with
+    fx_drift = samples.get('fx_drift', 1.0)
+    exchange_rate_to_usd = reference_column((), lambda request, ref: ref.exchange_rate_to_usd) * fx_drift
+    currency_code = reference_column((), lambda request, ref: ref.currency_code, dtype=object)
+    is_usd = currency_code == 'USD'
+    usd_to_local = np.where(is_usd, 1.0, exchange_rate_to_usd)
+    stay_duration = input_column('stay_duration')
+    accommodation_rate = reference_column(
+        ('accommodation_level',),
+        lambda request, ref: normalize_number(ref.accommodation_costs.get(request.accommodation_level or 'mid', 0), 0),
+    )
+    total_accommodation = accommodation_rate * stay_duration * companions_plus_one
+    travel_multiplier = multiplier('travel_type', TRAVEL_TYPE_MULTIPLIERS, 'economy', 1.0)
+    total_travel = BASE_FLIGHT_COST_USD * usd_to_local * travel_multiplier * input_column('return_trips') * companions_plus_one
+    daily_transport_usd = column(('local_transport',), lambda request: LOCAL_TRANSPORT_COSTS.get(request.local_transport or 'daily_cab', 30))
+    total_transport = daily_transport_usd * usd_to_local * stay_duration
+    total_food = FOOD_COST_PER_DAY_USD * usd_to_local * stay_duration * companions_plus_one
+
+    non_clinical_cost = 0.0 + total_accommodation + total_travel + total_transport + total_food
+
+    buffer_amount = clinical_cost * (input_column('complication_buffer') / 100.0)
+    total_before_insurance = clinical_cost + non_clinical_cost + buffer_amount
+
+    breakdown = {
+        'surgery': round_cents(total_surgery),
+        'chemotherapy': round_cents(total_chemo),
+        'radiation': round_cents(total_radiation),
+        'transplant': round_cents(transplant_cost),
+        'diagnostics': round_cents(diagnostics_cost),
+        'accommodation': round_cents(total_accommodation),
+        'travel': round_cents(total_travel),
+        'local_transport': round_cents(total_transport),
+        'food': round_cents(total_food),
+    }
+
+    # Insurance works on the rounded breakdown lines, like the scalar path
+    coverage_fields = ('custom_coverage', 'inpatient_coverage', 'outpatient_coverage', 'drug_coverage')
+    inpatient_cov, outpatient_cov, drug_cov = (
+        samples[name] if name in samples else
+        reference_column(coverage_fields, lambda request, ref, i=i: insurance_coverage(request, ref.insurer)[i])
+        for i, name in enumerate(COVERAGE_PARAMETERS)
+    )
+    inpatient_covered = (breakdown['surgery'] + breakdown['transplant']) * inpatient_cov
+    outpatient_covered = (breakdown['radiation'] + breakdown['diagnostics']) * outpatient_cov
+    drug_covered = breakdown['chemotherapy'] * drug_cov
+    total_covered = inpatient_covered + outpatient_covered + drug_covered
+    covered_after_deductible = np.maximum(0.0, total_covered - input_column('deductible'))
+    insurance_pays = covered_after_deductible * (1.0 - input_column('copay_percent') / 100.0)
+    insurance_pays = np.where(flag('has_insurance'), insurance_pays, 0.0)
+
+    patient_out_of_pocket = np.maximum(0.0, total_before_insurance - insurance_pays)
+
+    # Currency conversion
+    def to_usd(values: np.ndarray) -> np.ndarray:
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return np.where(is_usd, values, values / exchange_rate_to_usd)
+
+    total_cost_usd = to_usd(total_before_insurance)
+
+    shape = np.broadcast_shapes(grid.shape, *(np.shape(values) for values in samples.values()))
+    totals = {
+        'total_cost_local': total_before_insurance,
+        'total_cost_usd': total_cost_usd,
+        'total_cost_inr': total_cost_usd * fx.usd_to_inr,
+        'clinical_cost': clinical_cost,
+        'clinical_cost_usd': to_usd(clinical_cost),
+        'non_clinical_cost': non_clinical_cost,
+        'non_clinical_cost_usd': to_usd(non_clinical_cost),
+        'insurance_pays': insurance_pays,
+        'insurance_pays_usd': to_usd(insurance_pays),
+        'patient_out_of_pocket': patient_out_of_pocket,
+        'patient_out_of_pocket_usd': to_usd(patient_out_of_pocket),
+    }
+    totals = {name: np.broadcast_to(round_cents(values), shape) for name, values in totals.items()}
+    totals['exchange_rate_to_usd'] = np.broadcast_to(exchange_rate_to_usd, shape)
+
+    return CostGrid(
+        axes=dict(zip(grid.names, grid.values)),
+        totals=totals,
+        breakdown={name: np.broadcast_to(values, shape) for name, values in breakdown.items()},
+        breakdown_usd={name: np.broadcast_to(round_cents(to_usd(values)), shape) for name, values in breakdown.items()},
+        currency_code=np.broadcast_to(currency_code, shape),
+        fx_snapshot_id=fx.snapshot_id,
+    )
+
+
+async def calculate_grid(
+    service,
+    base: CostCalculationRequest,
+    axes: Dict[str, Sequence[Any]],
+    fx: Optional[FxSnapshot] = None,
+) -> CostGrid:
+    """
+    Prefetch reference data for every key in the grid through service, then
+    evaluate it with fx (default: the service's current snapshot).
+    """
+    grid = ScenarioGrid(base, axes)
+    keys = grid.reference_keys()
+    prefetched = await asyncio.gather(*(service.prefetch_reference_data(*key) for key in keys))
+    fx = fx or await service.fx_rates.current()
+    return evaluate_grid(grid, dict(zip(keys, prefetched)), fx=fx)
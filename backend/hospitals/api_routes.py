@@ -1,9 +1,12 @@
 """
 API routes for Hospitals feature
 """
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, HTTPException, Query, Request
 from .models import Hospital, Doctor
 from .service import HospitalsService
+from http_cache import cached_json_response
+from response_cache import response_cache
+from catalog import parse_ids
 from typing import List, Optional
 import uuid
 import logging
@@ -19,21 +22,74 @@ def create_api_router():
     router = APIRouter(prefix="/api", tags=["hospitals"])
     service = HospitalsService()
     
+    def hospital_detail(hospital):
+        """Convert a seed hospital to the frontend detail format"""
+        return {
+            "id": hospital.get("id", str(uuid.uuid4())),
+            "name": hospital.get("name", ""),
+            "city": hospital.get("city", ""),
+            "address": hospital.get("address", f"{hospital.get('name', '')}, {hospital.get('city', '')}, India"),
+            "contact": hospital.get("contact", "+91-XX-XXXX-XXXX"),
+            "email": hospital.get("email", f"info@{hospital.get('name', '').lower().replace(' ', '')}.com"),
+            "rating": hospital.get("rating", 4.5),
+            "total_reviews": hospital.get("reviews_count", 0),
+            "specialties": hospital.get("specializations", []),
+            "cancer_types": hospital.get("specializations", []),
+            "facilities": hospital.get("treatments", []),
+            "image_url": hospital.get("image_url", "https://images.unsplash.com/photo-1519494026892-80bbd2d6fd0d?w=800"),
+            "established_year": hospital.get("established_year", 2000)
+        }
+    
+    def doctor_detail(doctor):
+        """Convert a seed doctor or rare cancer specialist to the frontend Doctor format"""
+        if doctor.get("is_specialist"):
+            # Specialists list every specialty and use their title as qualifications
+            specialization = doctor.get("specialty", doctor.get("title", "Oncology"))
+            if doctor.get("specialties"):
+                specialization = ", ".join(doctor.get("specialties", []))
+            qualifications = doctor.get("title", "MD, DM")
+        else:
+            specialization = doctor.get("specialty", "Oncology")
+            qualifications = "MD, DM"
+        return Doctor.model_validate({
+            "id": doctor["id"],
+            "name": doctor["name"],
+            "specialization": specialization,
+            "qualifications": qualifications,
+            "experience": doctor.get("experience", doctor.get("experience_years", 0)),
+            "hospital_id": doctor.get("hospital_id", ""),
+        }).model_dump(mode="json")
+    
+    def build_hospitals(city: Optional[str], cancer_type: Optional[str]):
+        hospitals = service.get_all_hospitals(city=city, cancer_type=cancer_type)
+        # Ensure email field exists for all hospitals (required by frontend)
+        for h in hospitals:
+            if not h.get("email") and h.get("contactEmail"):
+                h["email"] = h["contactEmail"].split(",")[0].strip() if h["contactEmail"] else ""
+            elif not h.get("email"):
+                h["email"] = f"info@{h.get('name', '').lower().replace(' ', '')}.com"
+        return hospitals
+    
     @router.get("/hospitals")
     async def get_all_hospitals(
+        request: Request,
         city: Optional[str] = Query(None, description="Filter by city"),
-        cancer_type: Optional[str] = Query(None, description="Filter by cancer type")
+        cancer_type: Optional[str] = Query(None, description="Filter by cancer type"),
+        ids: Optional[str] = Query(None, description="Comma-separated hospital IDs (bulk lookup)")
     ):
-        """Get all hospitals with optional filtering"""
+        """Get all hospitals with optional filtering, or several hospitals by ID with ?ids=a,b,c"""
         try:
-            hospitals = service.get_all_hospitals(city=city, cancer_type=cancer_type)
-            # Ensure email field exists for all hospitals (required by frontend)
-            for h in hospitals:
-                if not h.get("email") and h.get("contactEmail"):
-                    h["email"] = h["contactEmail"].split(",")[0].strip() if h["contactEmail"] else ""
-                elif not h.get("email"):
-                    h["email"] = f"info@{h.get('name', '').lower().replace(' ', '')}.com"
-            return hospitals
+            if ids is not None:
+                return [
+                    Hospital.model_validate(hospital_detail(hospital)).model_dump()
+                    for hospital in service.get_hospitals_by_ids(parse_ids(ids))
+                ]
+            cached = response_cache.get_or_build(
+                "/api/hospitals",
+                {"city": city, "cancer_type": cancer_type},
+                lambda: build_hospitals(city, cancer_type),
+            )
+            return cached_json_response(request, cached)
         except Exception as e:
             logger.error(f"Error fetching hospitals: {str(e)}", exc_info=True)
             raise HTTPException(status_code=500, detail=f"Failed to fetch hospitals: {str(e)}")
@@ -46,22 +102,7 @@ def create_api_router():
             if not hospital:
                 raise HTTPException(status_code=404, detail="Hospital not found")
             
-            # Convert to frontend format
-            return {
-                "id": hospital.get("id", str(uuid.uuid4())),
-                "name": hospital.get("name", ""),
-                "city": hospital.get("city", ""),
-                "address": hospital.get("address", f"{hospital.get('name', '')}, {hospital.get('city', '')}, India"),
-                "contact": hospital.get("contact", "+91-XX-XXXX-XXXX"),
-                "email": hospital.get("email", f"info@{hospital.get('name', '').lower().replace(' ', '')}.com"),
-                "rating": hospital.get("rating", 4.5),
-                "total_reviews": hospital.get("reviews_count", 0),
-                "specialties": hospital.get("specializations", []),
-                "cancer_types": hospital.get("specializations", []),
-                "facilities": hospital.get("treatments", []),
-                "image_url": hospital.get("image_url", "https://images.unsplash.com/photo-1519494026892-80bbd2d6fd0d?w=800"),
-                "established_year": hospital.get("established_year", 2000)
-            }
+            return hospital_detail(hospital)
         except HTTPException:
             raise
         except Exception as e:
@@ -78,42 +119,30 @@ def create_api_router():
             logger.error(f"Error fetching doctors: {str(e)}")
             raise HTTPException(status_code=500, detail="Failed to fetch doctors")
     
+    def build_doctors(city: Optional[str], specialty: Optional[str]):
+        doctors = service.get_all_doctors(city=city, specialty=specialty)
+        return [doctor_detail(doc) for doc in doctors]
+    
     @router.get("/doctors", response_model=List[Doctor])
     async def get_all_doctors(
+        request: Request,
         city: Optional[str] = Query(None, description="Filter by city"),
-        specialty: Optional[str] = Query(None, description="Filter by specialty")
+        specialty: Optional[str] = Query(None, description="Filter by specialty"),
+        ids: Optional[str] = Query(None, description="Comma-separated doctor IDs (bulk lookup)")
     ):
-        """Get all doctors with optional filtering - includes both general doctors and rare cancer specialists"""
+        """
+        Get all doctors with optional filtering - includes both general doctors and rare cancer specialists.
+        With ?ids=a,b,c returns those doctors in the order requested.
+        """
         try:
-            doctors = service.get_all_doctors(city=city, specialty=specialty)
-            # Convert to Doctor model format
-            result = []
-            for doc in doctors:
-                # Handle both regular doctors and specialists
-                if doc.get("is_specialist"):
-                    # For specialists, use title as specialization and include additional info
-                    specialization = doc.get("specialty", doc.get("title", "Oncology"))
-                    if doc.get("specialties"):
-                        specialization = ", ".join(doc.get("specialties", []))
-                else:
-                    specialization = doc.get("specialty", "Oncology")
-                
-                result.append({
-                    "id": doc["id"],
-                    "name": doc["name"],
-                    "specialization": specialization,
-                    "qualifications": doc.get("title", "MD, DM") if doc.get("is_specialist") else "MD, DM",
-                    "experience": doc.get("experience", doc.get("experience_years", 0)),
-                    "hospital_id": doc.get("hospital_id", ""),
-                    # Include additional fields for specialists (will be ignored by model but useful for frontend)
-                    "institution": doc.get("institution", ""),
-                    "city": doc.get("city", ""),
-                    "country": doc.get("country", ""),
-                    "region": doc.get("region", ""),
-                    "cancer_specialization": doc.get("cancer_specialization", ""),
-                    "is_specialist": doc.get("is_specialist", False)
-                })
-            return result
+            if ids is not None:
+                return [doctor_detail(doctor) for doctor in service.get_doctors_by_ids(parse_ids(ids))]
+            cached = response_cache.get_or_build(
+                "/api/doctors",
+                {"city": city, "specialty": specialty},
+                lambda: build_doctors(city, specialty),
+            )
+            return cached_json_response(request, cached)
         except Exception as e:
             logger.error(f"Error fetching doctors: {str(e)}")
             raise HTTPException(status_code=500, detail="Failed to fetch doctors")
@@ -126,14 +155,7 @@ def create_api_router():
             if not doctor:
                 raise HTTPException(status_code=404, detail="Doctor not found")
             
-            return {
-                "id": doctor["id"],
-                "name": doctor["name"],
-                "specialization": doctor.get("specialty", "Oncology"),
-                "qualifications": "MD, DM",
-                "experience": doctor.get("experience", 0),
-                "hospital_id": doctor.get("hospital_id", "")
-            }
+            return doctor_detail(doctor)
         except HTTPException:
             raise
         except Exception as e:
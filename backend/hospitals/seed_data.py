@@ -9,26 +9,14 @@ from pathlib import Path
 parent_dir = Path(__file__).parent.parent
 sys.path.insert(0, str(parent_dir))
 
-from data_seed import HOSPITALS, DOCTORS, ALL_CANCERS, CITIES
+import data_seed
 
 # Export for use in other modules
 __all__ = ['HOSPITALS', 'DOCTORS', 'ALL_CANCERS', 'CITIES']
 
 
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
+def __getattr__(name):
+    # Resolved lazily so importing this module does not load the catalog
+    if name in __all__:
+        return getattr(data_seed, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
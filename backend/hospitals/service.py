@@ -2,26 +2,25 @@
 Business logic for Hospitals API
 """
 from typing import List, Optional, Dict, Any
-from .seed_data import HOSPITALS, DOCTORS
+from . import seed_data
+from catalog import (
+    get_doctor_index, get_doctor_directory, get_hospitals_by_id, get_doctors_by_id,
+    get_specialists_by_id, lookup_many,
+)
 import uuid
-import sys
-from pathlib import Path
-
-# Import rare cancer specialists
-rare_cancers_path = Path(__file__).parent.parent / "rare_cancers"
-sys.path.insert(0, str(rare_cancers_path))
-try:
-    from seed_data import RARE_CANCER_SPECIALISTS
-except ImportError:
-    RARE_CANCER_SPECIALISTS = {}
 
 
 class HospitalsService:
     """Service class for hospital-related operations"""
     
-    def __init__(self):
-        self.hospitals = HOSPITALS
-        self.doctors = DOCTORS
+    # Seed catalogs are read on first use rather than at construction
+    @property
+    def hospitals(self) -> Dict[str, List[Dict[str, Any]]]:
+        return seed_data.HOSPITALS
+    
+    @property
+    def doctors(self) -> List[Dict[str, Any]]:
+        return seed_data.DOCTORS
     
     def get_all_hospitals(
         self,
@@ -73,11 +72,11 @@ class HospitalsService:
     
     def get_hospital_by_id(self, hospital_id: str) -> Optional[Dict[str, Any]]:
         """Get a specific hospital by ID"""
-        for city_hospitals in self.hospitals.values():
-            for hospital in city_hospitals:
-                if hospital.get("id") == hospital_id:
-                    return hospital
-        return None
+        return get_hospitals_by_id().get(hospital_id)
+    
+    def get_hospitals_by_ids(self, hospital_ids: List[str]) -> List[Dict[str, Any]]:
+        """Get several hospitals by ID, in the order requested (unknown IDs skipped)"""
+        return lookup_many(get_hospitals_by_id(), hospital_ids)
     
     def get_doctors_by_hospital(self, hospital_id: str) -> List[Dict[str, Any]]:
         """Get doctors for a specific hospital"""
@@ -90,8 +89,7 @@ class HospitalsService:
                 "experience": doc.get("experience", 0),
                 "hospital_id": doc.get("hospital_id", hospital_id)
             }
-            for doc in self.doctors
-            if doc.get("hospital_id") == hospital_id
+            for doc in get_doctor_index().by_hospital.get(hospital_id, [])
         ]
         return hospital_doctors
     
@@ -101,51 +99,12 @@ class HospitalsService:
         specialty: Optional[str] = None
     ) -> List[Dict[str, Any]]:
         """Get all doctors with optional filtering - includes both general doctors and rare cancer specialists"""
-        doctors = self.doctors.copy()
-        
-        # Add rare cancer specialists to the list
-        specialist_counter = len(doctors) + 1
-        for cancer_name, specialists in RARE_CANCER_SPECIALISTS.items():
-            for specialist in specialists:
-                # Convert specialist format to doctor format
-                doctor_entry = {
-                    "id": f"specialist-{specialist_counter}",
-                    "name": specialist.get("name", ""),
-                    "specialty": ", ".join(specialist.get("specialties", [])) if specialist.get("specialties") else specialist.get("title", "Oncology"),
-                    "experience": specialist.get("experience_years", 0),
-                    "city": specialist.get("city", ""),
-                    "country": specialist.get("country", ""),
-                    "region": specialist.get("region", ""),
-                    "institution": specialist.get("institution", ""),
-                    "title": specialist.get("title", ""),
-                    "specialties": specialist.get("specialties", []),
-                    "cancer_specialization": cancer_name,
-                    "hospital_id": "",  # Specialists may not be linked to specific hospitals
-                    "rating": 4.8,  # Default rating for specialists
-                    "consultations": 0,
-                    "is_specialist": True  # Flag to identify specialists
-                }
-                doctors.append(doctor_entry)
-                specialist_counter += 1
-        
-        # Apply filters
-        if city:
-            doctors = [d for d in doctors if d.get("city", "").lower() == city.lower()]
-        
-        if specialty:
-            # Check both specialty field and specialties array
-            doctors = [
-                d for d in doctors 
-                if specialty.lower() in d.get("specialty", "").lower() 
-                or any(specialty.lower() in s.lower() for s in d.get("specialties", []))
-            ]
-        
-        return doctors
+        return get_doctor_directory().search(city=city, specialty=specialty)
     
     def get_doctor_by_id(self, doctor_id: str) -> Optional[Dict[str, Any]]:
-        """Get a specific doctor by ID"""
-        for doctor in self.doctors:
-            if doctor.get("id") == doctor_id:
-                return doctor
-        return None
-
+        """Get a specific doctor (or rare cancer specialist) by ID"""
+        return get_doctors_by_id().get(doctor_id) or get_specialists_by_id().get(doctor_id)
+    
+    def get_doctors_by_ids(self, doctor_ids: List[str]) -> List[Dict[str, Any]]:
+        """Get several doctors/specialists by ID, in the order requested (unknown IDs skipped)"""
+        return [doctor for doctor in map(self.get_doctor_by_id, doctor_ids) if doctor]
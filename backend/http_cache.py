@@ -0,0 +1,70 @@
+"""
+Helpers for serving pre-serialized JSON payloads with strong ETags
+Lets read-only endpoints answer If-None-Match with 304 Not Modified
+"""
+import hashlib
+import json
+from typing import Any, Optional
+from starlette.requests import Request
+from starlette.responses import Response
+
+# Default Cache-Control for catalog payloads that only change on deploy/reseed
+DEFAULT_CACHE_CONTROL = "public, max-age=300"
+
+
+def serialize_json(payload: Any) -> bytes:
+    """Serialize exactly like FastAPI's JSONResponse does"""
+    return json.dumps(
+        payload,
+        ensure_ascii=False,
+        allow_nan=False,
+        indent=None,
+        separators=(",", ":"),
+    ).encode("utf-8")
+
+
+class CachedBody:
+    """A JSON body serialized once, plus its strong ETag"""
+
+    __slots__ = ("body", "etag")
+
+    def __init__(self, body: bytes):
+        self.body = body
+        self.etag = '"' + hashlib.sha256(body).hexdigest()[:32] + '"'
+
+    @classmethod
+    def from_payload(cls, payload: Any) -> "CachedBody":
+        return cls(serialize_json(payload))
+
+    def __len__(self) -> int:
+        return len(self.body)
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    If-None-Match check (RFC 7232 weak comparison).
+    Accepts "*", comma-separated lists and W/ prefixed tags.
+    """
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*":
+            return True
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == etag:
+            return True
+    return False
+
+
+def cached_json_response(
+    request: Request,
+    cached: CachedBody,
+    cache_control: str = DEFAULT_CACHE_CONTROL,
+) -> Response:
+    """Return 304 when the client already has this body, else the pre-serialized bytes"""
+    headers = {"ETag": cached.etag, "Cache-Control": cache_control}
+    if etag_matches(request.headers.get("if-none-match"), cached.etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=cached.body, media_type="application/json", headers=headers)
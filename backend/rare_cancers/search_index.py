@@ -0,0 +1,230 @@
+"""
+In-process full-text search over rare cancers and specialists
+Tokenised, case- and diacritic-folded BM25F ranking with prefix, infix
+and trigram (typo-tolerant) term expansion, plus a trigram substring index
+for the existing "contains" filters.
+"""
+from typing import List, Optional, Dict, Any, Iterable, Callable, NamedTuple, Sequence, Set, Tuple, Union
+from bisect import bisect_left
+from functools import lru_cache
+import heapq
+import math
+import re
+import unicodedata
+
+FieldValue = Union[str, Iterable[str], None]
+
+_TOKEN_RE = re.compile(r"\w+")
+
+# Term expansion weights: exact hits count fully, prefix and typo matches less
+PREFIX_MATCH_WEIGHT = 0.7
+INFIX_MATCH_WEIGHT = 0.6
+FUZZY_MATCH_WEIGHT = 0.5
+FUZZY_MIN_SIMILARITY = 0.4
+MIN_PREFIX_LENGTH = 2
+
+
+def fold(text: str) -> str:
+    """Casefold and strip diacritics (e.g. 'Ménière' -> 'meniere')"""
+    decomposed = unicodedata.normalize("NFKD", text)
+    return "".join(ch for ch in decomposed if not unicodedata.combining(ch)).casefold()
+
+
+def tokenize(text: str) -> List[str]:
+    """Folded word tokens"""
+    return _TOKEN_RE.findall(fold(text))
+
+
+def trigrams(text: str) -> Set[str]:
+    """Character trigrams of a string"""
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+def term_trigrams(term: str) -> Set[str]:
+    """Trigrams of a token, padded so short tokens and word edges still produce some"""
+    return trigrams(f"  {term} ")
+
+
+def _field_text(value: FieldValue) -> str:
+    if value is None:
+        return ""
+    if isinstance(value, str):
+        return value
+    return " ".join(str(v) for v in value)
+
+
+class SearchResults(NamedTuple):
+    """One page of ranked matches plus the total number of matches"""
+    items: List[Dict[str, Any]]
+    total: int
+
+
+class SearchIndex:
+    """
+    BM25F index over a fixed list of documents.
+
+    fields maps a field name to an extractor (or None to read doc[name]) and
+    a weight. Per-field term frequencies are length-normalised and weighted
+    at build time, so a query only sums precomputed posting values.
+    Every query token must match (exactly, by prefix, inside a term or by
+    trigram similarity); results are ranked by score, ties in document order.
+
+    substring_fields names fields whose raw text is also matched with a
+    plain "query in field" check, so a search built on top of a substring
+    filter still returns everything that filter did. Documents matching
+    only that way rank after the scored ones.
+    """
+
+    def __init__(
+        self,
+        documents: List[Dict[str, Any]],
+        fields: Dict[str, Tuple[Optional[Callable[[Dict[str, Any]], FieldValue]], float]],
+        k1: float = 1.2,
+        b: float = 0.75,
+        substring_fields: Sequence[str] = (),
+    ):
+        self.documents = documents
+        self.k1 = k1
+
+        field_texts: Dict[str, List[str]] = {}
+        field_tokens: Dict[str, List[List[str]]] = {}
+        for field_name, (extract, _) in fields.items():
+            getter = extract or (lambda doc, name=field_name: doc.get(name))
+            field_texts[field_name] = [_field_text(getter(doc)) for doc in documents]
+            field_tokens[field_name] = [tokenize(text) for text in field_texts[field_name]]
+        self._substrings = [SubstringIndex(field_texts[field_name]) for field_name in substring_fields]
+
+        # term -> {doc position: weighted, length-normalised tf}
+        self._postings: Dict[str, Dict[int, float]] = {}
+        for field_name, (_, weight) in fields.items():
+            token_lists = field_tokens[field_name]
+            avg_length = (sum(len(tokens) for tokens in token_lists) / len(token_lists)) if token_lists else 0.0
+            for position, tokens in enumerate(token_lists):
+                if not tokens:
+                    continue
+                norm = 1 - b + b * (len(tokens) / avg_length)
+                counts: Dict[str, int] = {}
+                for token in tokens:
+                    counts[token] = counts.get(token, 0) + 1
+                for term, tf in counts.items():
+                    postings = self._postings.setdefault(term, {})
+                    postings[position] = postings.get(position, 0.0) + weight * tf / norm
+
+        doc_count = len(documents)
+        self._idf = {
+            term: math.log(1 + (doc_count - len(postings) + 0.5) / (len(postings) + 0.5))
+            for term, postings in self._postings.items()
+        }
+        self._terms = sorted(self._postings)
+
+        self._by_trigram: Dict[str, Set[str]] = {}
+        for term in self._terms:
+            for gram in term_trigrams(term):
+                self._by_trigram.setdefault(gram, set()).add(term)
+
+        self._expand = lru_cache(maxsize=1024)(self._expand_token)
+
+    def _expand_token(self, token: str) -> Tuple[Tuple[str, float], ...]:
+        """Index terms a query token matches, with their match weight"""
+        expansions: Dict[str, float] = {}
+        if token in self._postings:
+            expansions[token] = 1.0
+        if len(token) >= MIN_PREFIX_LENGTH:
+            start = bisect_left(self._terms, token)
+            for term in self._terms[start:]:
+                if not term.startswith(token):
+                    break
+                expansions.setdefault(term, PREFIX_MATCH_WEIGHT)
+        # Terms containing the token (e.g. 'sarcoma' in 'osteosarcoma'); every
+        # plain trigram of the token is among the padded trigrams of such a term
+        inner = trigrams(token)
+        if inner:
+            postings = sorted((self._by_trigram.get(gram, set()) for gram in inner), key=len)
+            for term in set(postings[0]).intersection(*postings[1:]):
+                if token in term:
+                    expansions.setdefault(term, INFIX_MATCH_WEIGHT)
+        if not expansions:
+            grams = term_trigrams(token)
+            candidates: Dict[str, int] = {}
+            for gram in grams:
+                for term in self._by_trigram.get(gram, ()):
+                    candidates[term] = candidates.get(term, 0) + 1
+            for term, shared in candidates.items():
+                similarity = shared / (len(grams) + len(term_trigrams(term)) - shared)
+                if similarity >= FUZZY_MIN_SIMILARITY:
+                    expansions[term] = FUZZY_MATCH_WEIGHT * similarity
+        return tuple(expansions.items())
+
+    def _token_scores(self, token: str) -> Dict[int, float]:
+        """Best score per document for one query token"""
+        scores: Dict[int, float] = {}
+        k1 = self.k1
+        for term, match_weight in self._expand(token):
+            idf = self._idf[term]
+            for position, tf in self._postings[term].items():
+                score = match_weight * idf * tf * (k1 + 1) / (tf + k1)
+                if score > scores.get(position, 0.0):
+                    scores[position] = score
+        return scores
+
+    def search(
+        self,
+        query: str,
+        limit: Optional[int] = None,
+        offset: int = 0,
+        allowed: Optional[Set[int]] = None,
+    ) -> SearchResults:
+        """
+        Ranked documents matching every token of query, paginated.
+        allowed restricts matches to those document positions (pre-filtering).
+        """
+        tokens = list(dict.fromkeys(tokenize(query)))
+
+        totals: Dict[int, float] = {}
+        for index, token in enumerate(tokens):
+            scores = self._token_scores(token)
+            if index == 0:
+                totals = scores if allowed is None else {p: s for p, s in scores.items() if p in allowed}
+            else:
+                totals = {position: totals[position] + score for position, score in scores.items() if position in totals}
+            if not totals:
+                break
+        for substrings in self._substrings:
+            for position in substrings.matches(query):
+                if allowed is None or position in allowed:
+                    totals.setdefault(position, 0.0)
+        if not totals:
+            return SearchResults([], 0)
+
+        ranked = ((-score, position) for position, score in totals.items())
+        if limit is None:
+            page = sorted(ranked)[offset:]
+        else:
+            page = heapq.nsmallest(offset + limit, ranked)[offset:]
+        return SearchResults([self.documents[position] for _, position in page], len(totals))
+
+
+class SubstringIndex:
+    """
+    Trigram index answering "value contains query" (case-insensitive) for a
+    fixed list of strings. Trigram postings give candidates, which are then
+    verified, so results are exactly those of a lowercase `in` scan.
+    """
+
+    def __init__(self, values: Iterable[str]):
+        self.values = [value.lower() for value in values]
+        self._by_trigram: Dict[str, Set[int]] = {}
+        for position, value in enumerate(self.values):
+            for gram in trigrams(value):
+                self._by_trigram.setdefault(gram, set()).add(position)
+
+    def matches(self, query: str) -> Set[int]:
+        """Positions whose value contains query"""
+        query = query.lower()
+        grams = trigrams(query)
+        if not grams:
+            # Too short for trigrams - plain scan over the lowercased values
+            return {position for position, value in enumerate(self.values) if query in value}
+        postings = sorted((self._by_trigram.get(gram, set()) for gram in grams), key=len)
+        candidates = set(postings[0]).intersection(*postings[1:])
+        return {position for position in candidates if query in self.values[position]}
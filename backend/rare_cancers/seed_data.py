@@ -1,6 +1,9 @@
 """
 Seed data for Rare Cancers API
 Imports from the main data_seed.py file
+
+Details and specialist mappings live in seed_data.json and are loaded on
+first use, not when this module is imported.
 """
 import sys
 from pathlib import Path
@@ -9,3788 +12,17 @@ from pathlib import Path
 parent_dir = Path(__file__).parent.parent
 sys.path.insert(0, str(parent_dir))
 
-from data_seed import RARE_CANCERS, ALL_CANCERS
+import data_seed
+from seed_loader import lazy_seed_module
 
 
 # Export for use in other modules
 __all__ = ['RARE_CANCERS', 'ALL_CANCERS', 'RARE_CANCER_DETAILS', 'RARE_CANCER_SPECIALISTS', 'COMMON_CANCER_SPECIALISTS']
 
 
-# Enhanced rare cancer data with additional details
-RARE_CANCER_DETAILS = {
-    "Diffuse Intrinsic Pontine Glioma (DIPG)": {
-        "description": "A highly aggressive brain tumor located in the pons region of the brainstem, primarily affecting children.",
-        "symptoms": ["Difficulty walking", "Double vision", "Facial weakness", "Difficulty swallowing", "Headaches"],
-        "treatment_options": ["Radiation therapy", "Clinical trials", "Palliative care", "Experimental therapies"],
-        "prognosis": "Very poor, typically 9-12 months survival",
-        "research_status": "Active research in immunotherapy and targeted therapies"
-    },
-    "Atypical Teratoid Rhabdoid Tumor (ATRT)": {
-        "description": "A rare, aggressive tumor of the central nervous system, most commonly found in children under 3 years.",
-        "symptoms": ["Headaches", "Nausea", "Vomiting", "Lethargy", "Cranial nerve deficits"],
-        "treatment_options": ["Surgery", "High-dose chemotherapy", "Radiation therapy", "Stem cell transplant"],
-        "prognosis": "Poor, but improved with aggressive multimodal therapy",
-        "research_status": "Ongoing trials with targeted therapies"
-    },
-    "Embryonal Tumor with Multilayered Rosettes (ETMR)": {
-        "description": "An ultra-rare, highly malignant pediatric brain tumor arising in young children, often involving the supratentorial region or brainstem.",
-        "symptoms": ["Seizures", "Increased head size", "Vomiting", "Irritability", "Focal neurologic deficits"],
-        "treatment_options": ["Maximal safe resection", "High-dose chemotherapy", "Radiation in selected cases", "Clinical trials"],
-        "prognosis": "Generally poor, but outcomes are improving in specialized centers",
-        "research_status": "Active research in genomics and novel targeted therapies"
-    },
-}
-
-
-# Mapping of rare cancer -> list of global specialist oncologists
-# Each specialist entry is intentionally compact but structured so it can be
-# reused both by the RareCancers detail view and the Find Oncologists page.
-RARE_CANCER_SPECIALISTS = {
-    "Diffuse Intrinsic Pontine Glioma (DIPG)": [
-        {
-            "name": "Dr. Mark M. Souweidane",
-            "region": "USA",
-            "title": "Pediatric Neurosurgeon, Vice Chair of Neurological Surgery",
-            "experience_years": 30,
-            "city": "New York",
-            "country": "USA",
-            "institution": "Weill Cornell Medicine / NewYork-Presbyterian Hospital",
-            "specialties": ["Pediatric brain tumors", "Brainstem tumors", "DIPG"],
-        },
-        {
-            "name": "Dr. Enrica Tan",
-            "region": "Singapore",
-            "title": "Senior Consultant, Pediatric Oncologist",
-            "experience_years": 15,
-            "city": "Singapore",
-            "country": "Singapore",
-            "institution": "KK Women’s and Children’s Hospital (KKH)",
-            "specialties": ["Pediatric neuro-oncology", "Brain tumors", "DIPG"],
-        },
-        {
-            "name": "Dr. Jacques Grill",
-            "region": "Europe",
-            "title": "Head, Pediatric Brain Tumor Program",
-            "experience_years": 20,
-            "city": "Paris",
-            "country": "France",
-            "institution": "Gustave Roussy Cancer Campus",
-            "specialties": ["Pediatric brain tumors", "DIPG", "Clinical trials"],
-        },
-        {
-            "name": "Dr. Rakesh Jalali",
-            "region": "India",
-            "title": "Radiation Oncologist, Medical Director",
-            "experience_years": 28,
-            "city": "Chennai",
-            "country": "India",
-            "institution": "Apollo Proton Cancer Centre",
-            "specialties": ["Pediatric brain tumors", "Proton therapy", "DIPG"],
-        },
-    ],
-    "Atypical Teratoid Rhabdoid Tumor (ATRT)": [
-        {
-            "name": "Dr. Amar Gajjar",
-            "region": "USA",
-            "title": "Pediatric Neuro-Oncologist, Chair of Oncology",
-            "experience_years": 35,
-            "city": "Memphis",
-            "country": "USA",
-            "institution": "St. Jude Children’s Research Hospital",
-            "specialties": ["Pediatric brain tumors", "ATRT", "Clinical research"],
-        },
-        {
-            "name": "Dr. Soh Shui Yen",
-            "region": "Singapore",
-            "title": "Senior Consultant, Pediatric Hematology/Oncology",
-            "experience_years": 15,
-            "city": "Singapore",
-            "country": "Singapore",
-            "institution": "KK Women’s and Children’s Hospital (KKH)",
-            "specialties": ["Pediatric CNS tumors", "ATRT", "Leukemias"],
-        },
-        {
-            "name": "Prof. Darren Hargrave",
-            "region": "Europe",
-            "title": "Consultant Pediatric Neuro-Oncologist",
-            "experience_years": 20,
-            "city": "London",
-            "country": "United Kingdom",
-            "institution": "Great Ormond Street Hospital",
-            "specialties": ["Pediatric brain tumors", "ATRT", "Early phase trials"],
-        },
-        {
-            "name": "Dr. Girish Chinnaswamy",
-            "region": "India",
-            "title": "Professor & Head, Pediatric Oncology",
-            "experience_years": 20,
-            "city": "Mumbai",
-            "country": "India",
-            "institution": "Tata Memorial Centre",
-            "specialties": ["Pediatric oncology", "Neuro-oncology", "ATRT"],
-        },
-    ],
-    "Embryonal Tumor with Multilayered Rosettes (ETMR)": [
-        {
-            "name": "Dr. Maryam Fouladi",
-            "region": "USA",
-            "title": "Co-Director, Pediatric Neuro-Oncology Program",
-            "experience_years": 20,
-            "city": "Columbus",
-            "country": "USA",
-            "institution": "Nationwide Children’s Hospital",
-            "specialties": ["Pediatric brain tumors", "ETMR", "Clinical trials"],
-        },
-        {
-            "name": "Dr. Chan Mei Yoke",
-            "region": "Singapore",
-            "title": "Senior Consultant, Pediatric Oncology",
-            "experience_years": 15,
-            "city": "Singapore",
-            "country": "Singapore",
-            "institution": "KK Women’s and Children’s Hospital (KKH)",
-            "specialties": ["Pediatric oncology", "Rare brain tumors", "ETMR"],
-        },
-        {
-            "name": "Prof. Stefan Pfister",
-            "region": "Europe",
-            "title": "Director, Hopp Children’s Cancer Center",
-            "experience_years": 15,
-            "city": "Heidelberg",
-            "country": "Germany",
-            "institution": "Hopp Children’s Cancer Center / Heidelberg University",
-            "specialties": ["Pediatric neuro-oncology", "Genomics", "ETMR"],
-        },
-        {
-            "name": "Dr. Sameer Bakshi",
-            "region": "India",
-            "title": "Professor of Medical Oncology",
-            "experience_years": 20,
-            "city": "New Delhi",
-            "country": "India",
-            "institution": "AIIMS, New Delhi",
-            "specialties": ["Pediatric and adolescent oncology", "Rare CNS tumors", "ETMR"],
-        },
-    ],
-    "Midline NUT Carcinoma": [
-        {
-            "name": "Dr. Jia Luo",
-            "region": "USA",
-            "title": "Medical Oncologist, Thoracic Oncology",
-            "experience_years": 15,
-            "city": "Boston",
-            "country": "USA",
-            "institution": "Dana-Farber Cancer Institute",
-            "specialties": ["Thoracic Oncology", "NUT Carcinoma", "Rare Carcinomas"],
-        },
-        {
-            "name": "Dr. Toh Chee Keong",
-            "region": "Singapore",
-            "title": "Senior Consultant Medical Oncologist",
-            "experience_years": 20,
-            "city": "Singapore",
-            "country": "Singapore",
-            "institution": "NCCS/OncoCare",
-            "specialties": ["Thoracic Oncology", "Head & Neck Cancers", "NUT Carcinoma"],
-        },
-        {
-            "name": "Prof. Lisa Licitra",
-            "region": "Europe",
-            "title": "Head of Head & Neck Oncology",
-            "experience_years": 30,
-            "city": "Milan",
-            "country": "Italy",
-            "institution": "Istituto Nazionale Tumori",
-            "specialties": ["Head & Neck Oncology", "Rare Head-Neck Cancers", "NUT Carcinoma"],
-        },
-        {
-            "name": "Dr. Anil D'Cruz",
-            "region": "India",
-            "title": "Surgical Oncologist, Ex-Director",
-            "experience_years": 33,
-            "city": "Mumbai",
-            "country": "India",
-            "institution": "Tata Memorial Hospital",
-            "specialties": ["Head-Neck Cancer", "Surgical Oncology", "NUT Carcinoma"],
-        },
-    ],
-    "Small Cell Carcinoma of the Ovary, Hypercalcemic Type (SCCOHT)": [
-        {
-            "name": "Dr. Douglas A. Levine",
-            "region": "USA",
-            "title": "Gynecologic Oncologist",
-            "experience_years": 25,
-            "city": "New York",
-            "country": "USA",
-            "institution": "NYU Langone (formerly MSKCC)",
-            "specialties": ["Gynecologic Oncology", "SCCOHT", "Ovarian Cancers"],
-        },
-        {
-            "name": "Dr. Jeffrey Low",
-            "region": "Singapore",
-            "title": "Senior Consultant Gynecologic Oncologist",
-            "experience_years": 20,
-            "city": "Singapore",
-            "country": "Singapore",
-            "institution": "National University Cancer Institute Singapore (NUH)",
-            "specialties": ["Gynecologic Oncology", "Rare Ovarian Cancers", "SCCOHT"],
-        },
-        {
-            "name": "Prof. Susana Banerjee",
-            "region": "Europe",
-            "title": "Medical Oncologist",
-            "experience_years": 24,
-            "city": "London",
-            "country": "United Kingdom",
-            "institution": "Royal Marsden Hospital",
-            "specialties": ["Gynecologic Cancers", "Rare Ovarian Tumors", "SCCOHT"],
-        },
-        {
-            "name": "Dr. Amita Maheshwari",
-            "region": "India",
-            "title": "Professor & Head, Gyne-Oncology",
-            "experience_years": 30,
-            "city": "Mumbai",
-            "country": "India",
-            "institution": "Tata Memorial Hospital",
-            "specialties": ["Gynecologic Oncology", "Rare Ovarian Cancers", "SCCOHT"],
-        },
-    ],
-    "Anaplastic Thyroid Carcinoma (ATC)": [
-        {
-            "name": "Dr. Maria E. Cabanillas",
-            "region": "USA",
-            "title": "Oncologic Endocrinologist",
-            "experience_years": 20,
-            "city": "Houston",
-            "country": "USA",
-            "institution": "MD Anderson Cancer Center",
-            "specialties": ["Endocrine Oncology", "Thyroid Cancer", "ATC"],
-        },
-        {
-            "name": "Dr. Samantha Yang Peiling",
-            "region": "Singapore",
-            "title": "Endocrinologist",
-            "experience_years": 15,
-            "city": "Singapore",
-            "country": "Singapore",
-            "institution": "NCIS/NUH Singapore",
-            "specialties": ["Thyroid Cancer", "Endocrinology", "ATC"],
-        },
-        {
-            "name": "Prof. Martin Schlumberger",
-            "region": "Europe",
-            "title": "Oncologist",
-            "experience_years": 40,
-            "city": "Paris",
-            "country": "France",
-            "institution": "Gustave Roussy",
-            "specialties": ["Thyroid Cancers", "Endocrine Oncology", "ATC"],
-        },
-        {
-            "name": "Dr. Sanu P. Moideen",
-            "region": "India",
-            "title": "Head & Neck Oncosurgeon (ENT)",
-            "experience_years": 25,
-            "city": "Kerala",
-            "country": "India",
-            "institution": "Private Practice",
-            "specialties": ["Head & Neck Surgery", "Thyroid Cancer", "ATC"],
-        },
-    ],
-    "Desmoplastic Small Round Cell Tumor (DSRCT)": [
-        {
-            "name": "Dr. Andrea Hayes-Jordan",
-            "region": "USA",
-            "title": "Pediatric Surgical Oncologist",
-            "experience_years": 25,
-            "city": "Chapel Hill",
-            "country": "USA",
-            "institution": "UNC (formerly MD Anderson)",
-            "specialties": ["Pediatric Surgical Oncology", "DSRCT", "HIPEC"],
-        },
-        {
-            "name": "Dr. Richard Quek",
-            "region": "Singapore",
-            "title": "Senior Consultant Medical Oncologist",
-            "experience_years": 16,
-            "city": "Singapore",
-            "country": "Singapore",
-            "institution": "NCCS (formerly)",
-            "specialties": ["Sarcoma Oncology", "DSRCT", "Multimodal Therapy"],
-        },
-        {
-            "name": "Prof. Jeremy Whelan",
-            "region": "Europe",
-            "title": "Medical Oncologist",
-            "experience_years": 24,
-            "city": "London",
-            "country": "United Kingdom",
-            "institution": "UCLH",
-            "specialties": ["Sarcoma Oncology", "Rare Abdominal Sarcomas", "DSRCT"],
-        },
-        {
-            "name": "Dr. Sameer Rastogi",
-            "region": "India",
-            "title": "Sarcoma Medical Oncologist",
-            "experience_years": 15,
-            "city": "New Delhi",
-            "country": "India",
-            "institution": "AIIMS, New Delhi",
-            "specialties": ["Sarcoma Oncology", "Rare Sarcomas", "DSRCT"],
-        },
-    ],
-    "Epithelioid Hemangioendothelioma (EHE)": [
-        {
-            "name": "Dr. Vinod Ravi",
-            "region": "USA",
-            "title": "Sarcoma Medical Oncologist",
-            "experience_years": 20,
-            "city": "Houston",
-            "country": "USA",
-            "institution": "MD Anderson",
-            "specialties": ["Sarcoma Oncology", "Vascular Sarcomas", "EHE"],
-        },
-        {
-            "name": "Dr. Richard Quek",
-            "region": "Singapore",
-            "title": "Senior Consultant Medical Oncologist",
-            "experience_years": 16,
-            "city": "Singapore",
-            "country": "Singapore",
-            "institution": "Sarcoma Consortium",
-            "specialties": ["Sarcoma Oncology", "EHE", "Rare Sarcomas"],
-        },
-        {
-            "name": "Prof. Jean-Yves Blay",
-            "region": "Europe",
-            "title": "Oncologist, Director",
-            "experience_years": 25,
-            "city": "Lyon",
-            "country": "France",
-            "institution": "Centre Léon Bérard",
-            "specialties": ["Rare Sarcomas", "EHE", "Angiosarcomas"],
-        },
-        {
-            "name": "Dr. Sameer Rastogi",
-            "region": "India",
-            "title": "Sarcoma Medical Oncologist",
-            "experience_years": 15,
-            "city": "New Delhi",
-            "country": "India",
-            "institution": "AIIMS, New Delhi",
-            "specialties": ["Sarcoma Oncology", "Rare Vascular Tumors", "EHE"],
-        },
-    ],
-    "Histiocytic Sarcoma": [
-        {
-            "name": "Dr. Eli L. Diamond",
-            "region": "USA",
-            "title": "Neuro-oncologist",
-            "experience_years": 10,
-            "city": "New York",
-            "country": "USA",
-            "institution": "MSKCC",
-            "specialties": ["Histiocytic Disorders", "Rare Histiocytic Neoplasms", "Histiocytic Sarcoma"],
-        },
-        {
-            "name": "Dr. Kevin Tay",
-            "region": "Singapore",
-            "title": "Hematologist-Oncologist",
-            "experience_years": 15,
-            "city": "Singapore",
-            "country": "Singapore",
-            "institution": "OncoCare / NCCS",
-            "specialties": ["Hematology-Oncology", "Lymphomas", "Histiocytic Sarcoma"],
-        },
-        {
-            "name": "Dr. Julien Haroche",
-            "region": "Europe",
-            "title": "Internist",
-            "experience_years": 20,
-            "city": "Paris",
-            "country": "France",
-            "institution": "Pitié-Salpêtrière Hospital",
-            "specialties": ["Histiocytoses", "Erdheim-Chester Disease", "Histiocytic Sarcoma"],
-        },
-        {
-            "name": "Dr. Sameer Rastogi",
-            "region": "India",
-            "title": "Sarcoma Medical Oncologist",
-            "experience_years": 15,
-            "city": "New Delhi",
-            "country": "India",
-            "institution": "AIIMS, New Delhi",
-            "specialties": ["Rare Cancer Specialist", "Histiocytic Sarcoma", "Multimodal Treatment"],
-        },
-    ],
-    "Erdheim-Chester Disease (ECD)": [
-        {
-            "name": "Dr. Eli L. Diamond",
-            "region": "USA",
-            "title": "Neuro-oncologist",
-            "experience_years": 10,
-            "city": "New York",
-            "country": "USA",
-            "institution": "MSKCC",
-            "specialties": ["Erdheim-Chester Disease", "Histiocytic Disorders", "Clinical Trials"],
-        },
-        {
-            "name": "Dr. Chng Wee Joo",
-            "region": "Singapore",
-            "title": "Senior Hematologist",
-            "experience_years": 40,
-            "city": "Singapore",
-            "country": "Singapore",
-            "institution": "NUH",
-            "specialties": ["Hematology", "Histiocytic Disorders", "ECD"],
-        },
-        {
-            "name": "Dr. Julien Haroche",
-            "region": "Europe",
-            "title": "Internist",
-            "experience_years": 20,
-            "city": "Paris",
-            "country": "France",
-            "institution": "Pitié-Salpêtrière Hospital",
-            "specialties": ["Erdheim-Chester Disease", "Histiocytic Neoplasms", "Targeted Therapies"],
-        },
-        {
-            "name": "Dr. Sameer Rastogi",
-            "region": "India",
-            "title": "Sarcoma Medical Oncologist",
-            "experience_years": 15,
-            "city": "New Delhi",
-            "country": "India",
-            "institution": "AIIMS, New Delhi",
-            "specialties": ["Rare Histiocytoses", "ECD", "Targeted Therapies"],
-        },
-    ],
-    "Blastic Plasmacytoid Dendritic Cell Neoplasm (BPDCN)": [
-        {
-            "name": "Dr. Naveen Pemmaraju",
-            "region": "USA",
-            "title": "Hematologist-Oncologist",
-            "experience_years": 10,
-            "city": "Houston",
-            "country": "USA",
-            "institution": "MD Anderson",
-            "specialties": ["Hematology-Oncology", "BPDCN", "Clinical Research"],
-        },
-        {
-            "name": "Prof. Chng Wee Joo",
-            "region": "Singapore",
-            "title": "Senior Hematologist",
-            "experience_years": 40,
-            "city": "Singapore",
-            "country": "Singapore",
-            "institution": "NUH",
-            "specialties": ["Hematology", "Rare Leukemias", "BPDCN"],
-        },
-        {
-            "name": "Prof. Pier Luigi Zinzani",
-            "region": "Europe",
-            "title": "Hematologist",
-            "experience_years": 30,
-            "city": "Bologna",
-            "country": "Italy",
-            "institution": "University of Bologna",
-            "specialties": ["Lymphoid Malignancies", "BPDCN", "Expert Panels"],
-        },
-        {
-            "name": "Dr. Lalit Kumar",
-            "region": "India",
-            "title": "Medical Oncologist, Former Head of Medical Oncology",
-            "experience_years": 30,
-            "city": "New Delhi",
-            "country": "India",
-            "institution": "AIIMS, New Delhi",
-            "specialties": ["Hemato-Oncology", "Blood Cancers", "BPDCN", "Bone Marrow Transplant"],
-        },
-    ],
-    "T-cell Prolymphocytic Leukemia (T-PLL)": [
-        {
-            "name": "Dr. Susan O'Brien",
-            "region": "USA",
-            "title": "Hematologist",
-            "experience_years": 30,
-            "city": "Irvine",
-            "country": "USA",
-            "institution": "UC Irvine (formerly MD Anderson)",
-            "specialties": ["Hematology", "CLL/T-PLL", "Alemtuzumab Trials"],
-        },
-        {
-            "name": "Dr. Daryl Tan",
-            "region": "Singapore",
-            "title": "Hematologist",
-            "experience_years": 20,
-            "city": "Singapore",
-            "country": "Singapore",
-            "institution": "SGH",
-            "specialties": ["Hematology", "Leukemias/Lymphomas", "T-PLL"],
-        },
-        {
-            "name": "Dr. Hugues de Thé",
-            "region": "Europe",
-            "title": "Hematologist",
-            "experience_years": 35,
-            "city": "Paris",
-            "country": "France",
-            "institution": "Hôpital Saint-Louis",
-            "specialties": ["Hematology", "T-cell Leukemias", "T-PLL"],
-        },
-        {
-            "name": "Dr. Lalit Kumar",
-            "region": "India",
-            "title": "Medical Oncologist",
-            "experience_years": 30,
-            "city": "New Delhi",
-            "country": "India",
-            "institution": "AIIMS, New Delhi",
-            "specialties": ["Hematologic Cancers", "Rare Leukemias", "T-PLL"],
-        },
-    ],
-    "Hepatosplenic T-cell Lymphoma (HSTCL)": [
-        {
-            "name": "Dr. Steven Horwitz",
-            "region": "USA",
-            "title": "Medical Oncologist",
-            "experience_years": 20,
-            "city": "New York",
-            "country": "USA",
-            "institution": "MSKCC",
-            "specialties": ["T-cell Lymphoma", "HSTCL", "Novel Immunotherapies"],
-        },
-        {
-            "name": "Dr. Lim Soon Thye",
-            "region": "Singapore",
-            "title": "Medical Oncologist",
-            "experience_years": 25,
-            "city": "Singapore",
-            "country": "Singapore",
-            "institution": "NCCS",
-            "specialties": ["Lymphoma Service", "T-cell Lymphomas", "HSTCL"],
-        },
-        {
-            "name": "Prof. Marie José Kersten",
-            "region": "Europe",
-            "title": "Hematologist",
-            "experience_years": 20,
-            "city": "Amsterdam",
-            "country": "Netherlands",
-            "institution": "NKI/AVL",
-            "specialties": ["T-cell Lymphomas", "HSTCL", "European Outcomes"],
-        },
-        {
-            "name": "Dr. Lalit Kumar",
-            "region": "India",
-            "title": "Medical Oncologist, Former Head of Medical Oncology",
-            "experience_years": 30,
-            "city": "New Delhi",
-            "country": "India",
-            "institution": "AIIMS, New Delhi",
-            "specialties": ["Hemato-Oncology", "Blood Cancers", "HSTCL", "T-cell Lymphomas"],
-        },
-    ],
-    "Malignant Rhabdoid Tumor": [
-        {
-            "name": "Dr. Jack Su",
-            "region": "USA",
-            "title": "Pediatric Oncologist",
-            "experience_years": 15,
-            "city": "Houston",
-            "country": "USA",
-            "institution": "Texas Children's Hospital",
-            "specialties": ["Pediatric Oncology", "MRT", "INI1-targeted Therapies"],
-        },
-        {
-            "name": "Dr. Ann-Marie Teo",
-            "region": "Singapore",
-            "title": "Pediatric Oncologist",
-            "experience_years": 15,
-            "city": "Singapore",
-            "country": "Singapore",
-            "institution": "KK Women's and Children's Hospital (KKH)",
-            "specialties": ["Pediatric Oncology", "MRT", "Multidisciplinary Care"],
-        },
-        {
-            "name": "Dr. Dominique Valteau-Couanet",
-            "region": "Europe",
-            "title": "Pediatric Oncologist",
-            "experience_years": 30,
-            "city": "Villejuif",
-            "country": "France",
-            "institution": "Gustave Roussy",
-            "specialties": ["Pediatric Solid Tumors", "MRT", "Intensive Multimodal Regimens"],
-        },
-        {
-            "name": "Dr. Girish Chinnaswamy",
-            "region": "India",
-            "title": "Professor & Head, Pediatric Oncology",
-            "experience_years": 20,
-            "city": "Mumbai",
-            "country": "India",
-            "institution": "Tata Memorial Centre",
-            "specialties": ["Pediatric Oncology", "MRT", "Intensive Multimodal Therapy"],
-        },
-    ],
-    "Alveolar Soft Part Sarcoma (ASPS)": [
-        {
-            "name": "Dr. Breelyn Wilky",
-            "region": "USA",
-            "title": "Sarcoma Oncologist",
-            "experience_years": 10,
-            "city": "Denver",
-            "country": "USA",
-            "institution": "UCHealth",
-            "specialties": ["Sarcoma Oncology", "ASPS", "TKI Trials"],
-        },
-        {
-            "name": "Dr. Richard Quek",
-            "region": "Singapore",
-            "title": "Senior Consultant Medical Oncologist",
-            "experience_years": 16,
-            "city": "Singapore",
-            "country": "Singapore",
-            "institution": "Sarcoma Specialist",
-            "specialties": ["Sarcoma Oncology", "ASPS", "Targeted Therapies"],
-        },
-        {
-            "name": "Dr. Peter Hohenberger",
-            "region": "Europe",
-            "title": "Surgical Oncologist",
-            "experience_years": 25,
-            "city": "Mannheim",
-            "country": "Germany",
-            "institution": "University Hospital Mannheim",
-            "specialties": ["Soft-tissue Sarcomas", "ASPS", "Surgical Resection"],
-        },
-        {
-            "name": "Dr. Ashish Gulia",
-            "region": "India",
-            "title": "Orthopedic Oncologist",
-            "experience_years": 15,
-            "city": "Mumbai",
-            "country": "India",
-            "institution": "Tata Memorial",
-            "specialties": ["Orthopedic Oncology", "ASPS", "Sarcoma Guidelines"],
-        },
-    ],
-    "Clear Cell Sarcoma": [
-        {
-            "name": "Dr. Mark Dickson",
-            "region": "USA",
-            "title": "Medical Oncologist",
-            "experience_years": 15,
-            "city": "New York",
-            "country": "USA",
-            "institution": "MSKCC",
-            "specialties": ["Rare Sarcomas", "Clear Cell Sarcoma", "Immunotherapy"],
-        },
-        {
-            "name": "Dr. Wong Seng Weng",
-            "region": "Singapore",
-            "title": "Medical Oncologist",
-            "experience_years": 20,
-            "city": "Singapore",
-            "country": "Singapore",
-            "institution": "Parkway Cancer Centre",
-            "specialties": ["Melanocytic Clear Cell Sarcoma", "Novel Agents", "Sarcoma"],
-        },
-        {
-            "name": "Prof. Paolo Casali",
-            "region": "Europe",
-            "title": "Medical Oncologist",
-            "experience_years": 30,
-            "city": "Milan",
-            "country": "Italy",
-            "institution": "Istituto Nazionale Tumori (INT)",
-            "specialties": ["Sarcoma Oncology", "Clear Cell Sarcoma", "Systemic Therapy"],
-        },
-        {
-            "name": "Dr. Sameer Rastogi",
-            "region": "India",
-            "title": "Sarcoma Medical Oncologist",
-            "experience_years": 15,
-            "city": "New Delhi",
-            "country": "India",
-            "institution": "AIIMS, New Delhi",
-            "specialties": ["Sarcoma Clinic", "Clear Cell Sarcoma", "Targeted Therapy"],
-        },
-    ],
-    "Angiosarcoma": [
-        {
-            "name": "Dr. Sandra D'Angelo",
-            "region": "USA",
-            "title": "Medical Oncologist",
-            "experience_years": 15,
-            "city": "New York",
-            "country": "USA",
-            "institution": "MSKCC",
-            "specialties": ["Angiosarcoma", "Immunotherapy Combinations", "Clinical Trials"],
-        },
-        {
-            "name": "Dr. Toh Wei Peng",
-            "region": "Singapore",
-            "title": "Surgical Oncologist",
-            "experience_years": 20,
-            "city": "Singapore",
-            "country": "Singapore",
-            "institution": "National Cancer Centre",
-            "specialties": ["Surgical Oncology", "Head/Neck Angiosarcoma", "Multimodal Therapy"],
-        },
-        {
-            "name": "Prof. Henrik Falch",
-            "region": "Europe",
-            "title": "Surgical Oncologist",
-            "experience_years": 20,
-            "city": "Copenhagen",
-            "country": "Denmark",
-            "institution": "University Hospital Copenhagen",
-            "specialties": ["Cutaneous Angiosarcoma", "Surgery", "Intralesional Therapy"],
-        },
-        {
-            "name": "Dr. Navin Khattry",
-            "region": "India",
-            "title": "Medical Oncologist",
-            "experience_years": 15,
-            "city": "Mumbai",
-            "country": "India",
-            "institution": "ACTREC",
-            "specialties": ["Rare Sarcomas", "Angiosarcoma", "Metronomic Regimens"],
-        },
-    ],
-    "Chordoma": [
-        {
-            "name": "Dr. Ian F. Pollack",
-            "region": "USA",
-            "title": "Neurosurgeon",
-            "experience_years": 30,
-            "city": "Pittsburgh",
-            "country": "USA",
-            "institution": "University of Pittsburgh",
-            "specialties": ["Skull-base Surgery", "Chordoma", "Proton Therapy"],
-        },
-        {
-            "name": "Dr. Iqbal Muttaqin",
-            "region": "Singapore",
-            "title": "Neurosurgeon",
-            "experience_years": 20,
-            "city": "Singapore",
-            "country": "Singapore",
-            "institution": "NCCS Singapore",
-            "specialties": ["Spine/Skull-base Tumors", "Chordoma", "Advanced Techniques"],
-        },
-        {
-            "name": "Prof. Ralph Weber",
-            "region": "Europe",
-            "title": "Orthopedic Surgeon",
-            "experience_years": 25,
-            "city": "Berlin",
-            "country": "Germany",
-            "institution": "Charité Berlin",
-            "specialties": ["Chordoma Resection", "Sacral/Pelvic Sites", "Proton Centers"],
-        },
-        {
-            "name": "Dr. S. Karunakaran",
-            "region": "India",
-            "title": "Neurosurgeon",
-            "experience_years": 20,
-            "city": "Chennai",
-            "country": "India",
-            "institution": "Apollo Hospitals",
-            "specialties": ["Skull-base Surgery", "Clival/Sacral Chordoma", "Proton Therapy"],
-        },
-    ],
-    "Adrenocortical Carcinoma (ACC)": [
-        {
-            "name": "Dr. Gary D. Hammer",
-            "region": "USA",
-            "title": "Endocrine Oncologist",
-            "experience_years": 25,
-            "city": "Ann Arbor",
-            "country": "USA",
-            "institution": "University of Michigan",
-            "specialties": ["Endocrine Oncology", "ACC", "Clinical Trials"],
-        },
-        {
-            "name": "Dr. Khoo Kei Siong",
-            "region": "Singapore",
-            "title": "Medical Oncologist",
-            "experience_years": 30,
-            "city": "Singapore",
-            "country": "Singapore",
-            "institution": "Parkway Cancer Centre",
-            "specialties": ["Medical Oncology", "ACC", "Mitotane Therapy"],
-        },
-        {
-            "name": "Prof. Martin Fassnacht",
-            "region": "Europe",
-            "title": "Endocrinologist",
-            "experience_years": 20,
-            "city": "Würzburg",
-            "country": "Germany",
-            "institution": "University of Würzburg",
-            "specialties": ["Endocrinology", "ACC Research", "European Guidelines"],
-        },
-        {
-            "name": "Dr. Rajeev Agarwal",
-            "region": "India",
-            "title": "Surgical Oncologist",
-            "experience_years": 30,
-            "city": "New Delhi",
-            "country": "India",
-            "institution": "Private Practice",
-            "specialties": ["Adrenal Tumor Surgery", "ACC", "Multidisciplinary Management"],
-        },
-    ],
-    "Merkel Cell Carcinoma": [
-        {
-            "name": "Dr. Paul Nghiem",
-            "region": "USA",
-            "title": "Dermatologic Oncologist",
-            "experience_years": 20,
-            "city": "Seattle",
-            "country": "USA",
-            "institution": "UW/Fred Hutch",
-            "specialties": ["Dermatologic Oncology", "Merkel Cell Carcinoma", "Immunotherapy"],
-        },
-        {
-            "name": "Dr. Lee Soo Chin",
-            "region": "Singapore",
-            "title": "Medical Oncologist",
-            "experience_years": 25,
-            "city": "Singapore",
-            "country": "Singapore",
-            "institution": "NCIS",
-            "specialties": ["Medical Oncology", "Merkel Cell Carcinoma", "Checkpoint Inhibitors"],
-        },
-        {
-            "name": "Prof. Dirk Schadendorf",
-            "region": "Europe",
-            "title": "Dermatologic Oncologist",
-            "experience_years": 30,
-            "city": "Essen",
-            "country": "Germany",
-            "institution": "University Hospital Essen",
-            "specialties": ["Dermatologic Oncology", "Merkel Cell Carcinoma", "Clinical Trials"],
-        },
-        {
-            "name": "Dr. Nikhil Vasudev",
-            "region": "India",
-            "title": "Medical Oncologist",
-            "experience_years": 15,
-            "city": "Mumbai",
-            "country": "India",
-            "institution": "Tata Memorial",
-            "specialties": ["Medical Oncology", "Merkel Cell Carcinoma", "Rare Skin Cancers"],
-        },
-    ],
-    "Uveal Melanoma": [
-        {
-            "name": "Dr. Takami Sato",
-            "region": "USA",
-            "title": "Medical Oncologist",
-            "experience_years": 30,
-            "city": "Philadelphia",
-            "country": "USA",
-            "institution": "Jefferson Hospital",
-            "specialties": ["Uveal Melanoma", "Hepatic Perfusion", "Clinical Trials"],
-        },
-        {
-            "name": "Dr. Adrian Tan",
-            "region": "Singapore",
-            "title": "Senior Consultant Ophthalmologist",
-            "experience_years": 20,
-            "city": "Singapore",
-            "country": "Singapore",
-            "institution": "SNEC",
-            "specialties": ["Ocular Oncology", "Uveal Melanoma", "Plaque Brachytherapy"],
-        },
-        {
-            "name": "Prof. Sarah Coupland",
-            "region": "Europe",
-            "title": "Ocular Pathologist/Oncologist",
-            "experience_years": 25,
-            "city": "Liverpool",
-            "country": "United Kingdom",
-            "institution": "University of Liverpool",
-            "specialties": ["Ocular Oncology", "Uveal Melanoma Research", "Ocular Tumors"],
-        },
-        {
-            "name": "Dr. Santosh Honavar",
-            "region": "India",
-            "title": "Ocular Oncologist",
-            "experience_years": 25,
-            "city": "Hyderabad",
-            "country": "India",
-            "institution": "LV Prasad Eye Institute",
-            "specialties": ["Ocular Oncology", "Uveal Melanoma", "Plaque Radiotherapy"],
-        },
-    ],
-    "Fibrolamellar Hepatocellular Carcinoma (FL-HCC)": [
-        {
-            "name": "Dr. Milind Javle",
-            "region": "USA",
-            "title": "Medical Oncologist",
-            "experience_years": 20,
-            "city": "Houston",
-            "country": "USA",
-            "institution": "MD Anderson",
-            "specialties": ["Hepatobiliary Oncology", "FL-HCC", "Targeted Therapy"],
-        },
-        {
-            "name": "Dr. Pierce Chow",
-            "region": "Singapore",
-            "title": "Hepatobiliary Surgeon",
-            "experience_years": 25,
-            "city": "Singapore",
-            "country": "Singapore",
-            "institution": "NCCS/NHCS",
-            "specialties": ["Hepatobiliary Surgery", "FL-HCC", "Liver Tumor Board"],
-        },
-        {
-            "name": "Prof. Philip Johnson",
-            "region": "Europe",
-            "title": "Hepatologist",
-            "experience_years": 30,
-            "city": "London",
-            "country": "United Kingdom",
-            "institution": "University College London",
-            "specialties": ["Hepatology", "FL-HCC Registry", "Management Guidelines"],
-        },
-        {
-            "name": "Dr. Shripad Banavali",
-            "region": "India",
-            "title": "Medical Oncologist",
-            "experience_years": 30,
-            "city": "Mumbai",
-            "country": "India",
-            "institution": "Tata Memorial",
-            "specialties": ["Medical Oncology", "Rare Liver Tumors", "FL-HCC"],
-        },
-    ],
-    "Adenoid Cystic Carcinoma (ACC – Salivary)": [
-        {
-            "name": "Dr. Alan L. Ho",
-            "region": "USA",
-            "title": "Medical Oncologist",
-            "experience_years": 15,
-            "city": "New York",
-            "country": "USA",
-            "institution": "MSKCC",
-            "specialties": ["Head & Neck Oncology", "Adenoid Cystic Carcinoma", "Targeted Agents"],
-        },
-        {
-            "name": "Dr. Gopal Iyer",
-            "region": "Singapore",
-            "title": "Head & Neck Surgeon",
-            "experience_years": 20,
-            "city": "Singapore",
-            "country": "Singapore",
-            "institution": "SingHealth",
-            "specialties": ["Head & Neck Surgery", "Salivary Gland Tumors", "Molecular Targets"],
-        },
-        {
-            "name": "Prof. Laura V. Locati",
-            "region": "Europe",
-            "title": "Medical Oncologist",
-            "experience_years": 20,
-            "city": "Milan",
-            "country": "Italy",
-            "institution": "Istituto Nazionale Tumori",
-            "specialties": ["Salivary Gland Cancers", "Adenoid Cystic Carcinoma", "European Guidelines"],
-        },
-        {
-            "name": "Dr. Pankaj Chaturvedi",
-            "region": "India",
-            "title": "Head & Neck Surgical Oncologist",
-            "experience_years": 25,
-            "city": "Mumbai",
-            "country": "India",
-            "institution": "Tata Memorial",
-            "specialties": ["Head & Neck Surgery", "Adenoid Cystic Carcinoma", "Postoperative Radiotherapy"],
-        },
-    ],
-    "Esthesioneuroblastoma": [
-        {
-            "name": "Dr. Alexander G. Chiu",
-            "region": "USA",
-            "title": "Head & Neck Surgeon",
-            "experience_years": 20,
-            "city": "Phoenix",
-            "country": "USA",
-            "institution": "Mayo Clinic",
-            "specialties": ["Head & Neck Surgery", "Esthesioneuroblastoma", "Endoscopic Resection"],
-        },
-        {
-            "name": "Dr. Ian Loh",
-            "region": "Singapore",
-            "title": "ENT Surgeon",
-            "experience_years": 15,
-            "city": "Singapore",
-            "country": "Singapore",
-            "institution": "SGH",
-            "specialties": ["ENT Surgery", "Sinonasal Tumors", "Minimally Invasive Surgery"],
-        },
-        {
-            "name": "Prof. Daniele Marchioni",
-            "region": "Europe",
-            "title": "ENT Surgeon",
-            "experience_years": 20,
-            "city": "Verona",
-            "country": "Italy",
-            "institution": "University of Verona",
-            "specialties": ["ENT Surgery", "Esthesioneuroblastoma", "Endoscopic Endonasal Approach"],
-        },
-        {
-            "name": "Dr. G. K. Rath",
-            "region": "India",
-            "title": "Radiation Oncologist",
-            "experience_years": 40,
-            "city": "New Delhi",
-            "country": "India",
-            "institution": "AIIMS (former)",
-            "specialties": ["Radiation Oncology", "Esthesioneuroblastoma", "IMRT"],
-        },
-    ],
-    "Appendiceal Carcinoma": [
-        {
-            "name": "Dr. Muhammad M. Sardi",
-            "region": "USA",
-            "title": "Surgical Oncologist",
-            "experience_years": 30,
-            "city": "Baltimore",
-            "country": "USA",
-            "institution": "Mercy Medical Center",
-            "specialties": ["Surgical Oncology", "Appendiceal Cancer", "CRS+HIPEC"],
-        },
-        {
-            "name": "Dr. Tan Ker Kan",
-            "region": "Singapore",
-            "title": "Surgical Oncologist",
-            "experience_years": 15,
-            "city": "Singapore",
-            "country": "Singapore",
-            "institution": "NUH",
-            "specialties": ["Surgical Oncology", "Appendiceal Tumors", "CRS+HIPEC"],
-        },
-        {
-            "name": "Prof. Norman Carr",
-            "region": "Europe",
-            "title": "Gastrointestinal Oncologist",
-            "experience_years": 25,
-            "city": "Basingstoke",
-            "country": "United Kingdom",
-            "institution": "Basingstoke Hospital",
-            "specialties": ["GI Oncology", "Peritoneal Malignancy", "Appendix Tumors"],
-        },
-        {
-            "name": "Dr. Anil Heroor",
-            "region": "India",
-            "title": "Surgical Oncologist",
-            "experience_years": 20,
-            "city": "Mumbai",
-            "country": "India",
-            "institution": "Private Practice",
-            "specialties": ["Surgical Oncology", "HIPEC", "Appendiceal Mucinous Carcinoma"],
-        },
-    ],
-    "Angioimmunoblastic T-cell Lymphoma (AITL)": [
-        {
-            "name": "Dr. Steven M. Horwitz",
-            "region": "USA",
-            "title": "Medical Oncologist",
-            "experience_years": 20,
-            "city": "New York",
-            "country": "USA",
-            "institution": "MSKCC",
-            "specialties": ["T-cell Lymphomas", "AITL", "Novel Therapies"],
-        },
-        {
-            "name": "Dr. Francesca Lim",
-            "region": "Singapore",
-            "title": "Hematologist",
-            "experience_years": 20,
-            "city": "Singapore",
-            "country": "Singapore",
-            "institution": "SGH",
-            "specialties": ["Hematology", "AITL", "Combined Chemo-immunotherapy"],
-        },
-        {
-            "name": "Prof. Ulrich Jäger",
-            "region": "Europe",
-            "title": "Hematologist",
-            "experience_years": 30,
-            "city": "Vienna",
-            "country": "Austria",
-            "institution": "Medical University of Vienna",
-            "specialties": ["Hematology", "AITL Trials", "Treatment Guidelines"],
-        },
-        {
-            "name": "Dr. Reena Nair",
-            "region": "India",
-            "title": "Hematologist",
-            "experience_years": 25,
-            "city": "Kolkata",
-            "country": "India",
-            "institution": "TMC",
-            "specialties": ["Hematology", "AITL", "Novel Agents"],
-        },
-    ],
-    "Cholangiocarcinoma": [
-        {
-            "name": "Dr. Ghassan K. Abou-Alfa",
-            "region": "USA",
-            "title": "Medical Oncologist",
-            "experience_years": 25,
-            "city": "New York",
-            "country": "USA",
-            "institution": "MSKCC",
-            "specialties": ["Hepatobiliary Oncology", "Cholangiocarcinoma", "FGFR/IDH Inhibitors"],
-        },
-        {
-            "name": "Dr. Joanne Ngeow",
-            "region": "Singapore",
-            "title": "Medical Oncologist",
-            "experience_years": 15,
-            "city": "Singapore",
-            "country": "Singapore",
-            "institution": "NCCS",
-            "specialties": ["Medical Oncology", "Biliary Tract Cancers", "Precision Oncology"],
-        },
-        {
-            "name": "Prof. Juan Valle",
-            "region": "Europe",
-            "title": "Medical Oncologist",
-            "experience_years": 20,
-            "city": "Manchester",
-            "country": "United Kingdom",
-            "institution": "The Christie",
-            "specialties": ["Medical Oncology", "Cholangiocarcinoma", "ABC Trials"],
-        },
-        {
-            "name": "Dr. Amit Jain",
-            "region": "India",
-            "title": "HPB Surgeon",
-            "experience_years": 15,
-            "city": "New Delhi",
-            "country": "India",
-            "institution": "ILBS",
-            "specialties": ["HPB Surgery", "Cholangiocarcinoma", "Curative Resections"],
-        },
-    ],
-    "Gestational Trophoblastic Neoplasia": [
-        {
-            "name": "Dr. Neil Horowitz",
-            "region": "USA",
-            "title": "Director of Clinical Research in Gynecologic Oncology",
-            "experience_years": 20,
-            "city": "Boston",
-            "country": "USA",
-            "institution": "Dana-Farber Cancer Institute",
-            "specialties": ["Gynecologic Oncology", "GTN", "Trophoblastic Disease Center"],
-        },
-        {
-            "name": "Dr. Ann Tan",
-            "region": "Singapore",
-            "title": "Senior Consultant OBGYN",
-            "experience_years": 30,
-            "city": "Singapore",
-            "country": "Singapore",
-            "institution": "Mount Elizabeth",
-            "specialties": ["OBGYN", "Molar Pregnancies", "GTN"],
-        },
-        {
-            "name": "Prof. Michael J. Seckl",
-            "region": "Europe",
-            "title": "Medical Oncologist",
-            "experience_years": 25,
-            "city": "London",
-            "country": "United Kingdom",
-            "institution": "Charing Cross Trophoblast Center",
-            "specialties": ["Medical Oncology", "GTN", "Clinical Trials"],
-        },
-        {
-            "name": "Dr. Niranjan Chavan",
-            "region": "India",
-            "title": "Gynecologic Oncologist",
-            "experience_years": 20,
-            "city": "Mumbai",
-            "country": "India",
-            "institution": "King Edward Memorial Hospital",
-            "specialties": ["Gynecologic Oncology", "High-risk GTN", "Combination Chemotherapy"],
-        },
-    ],
-    "Thymic Carcinoma": [
-        {
-            "name": "Dr. Giuseppe Giaccone",
-            "region": "USA",
-            "title": "Medical Oncologist",
-            "experience_years": 30,
-            "city": "Washington, DC",
-            "country": "USA",
-            "institution": "Georgetown University (formerly NCI)",
-            "specialties": ["Medical Oncology", "Thymic Malignancies", "Global Trials"],
-        },
-        {
-            "name": "Dr. Toh Han Chong",
-            "region": "Singapore",
-            "title": "Medical Oncologist",
-            "experience_years": 25,
-            "city": "Singapore",
-            "country": "Singapore",
-            "institution": "NCCS",
-            "specialties": ["Medical Oncology", "Thymic Carcinoma", "Targeted Agents"],
-        },
-        {
-            "name": "Prof. Luciano Mariani",
-            "region": "Europe",
-            "title": "Thoracic Surgeon",
-            "experience_years": 20,
-            "city": "Rome",
-            "country": "Italy",
-            "institution": "Regina Elena Institute",
-            "specialties": ["Thoracic Surgery", "Thymic Carcinoma", "Extensive Resections"],
-        },
-        {
-            "name": "Dr. Raja Sundaram",
-            "region": "India",
-            "title": "Surgical Oncologist",
-            "experience_years": 30,
-            "city": "Chennai",
-            "country": "India",
-            "institution": "Apollo Hospitals",
-            "specialties": ["Surgical Oncology", "Thymic Tumor Resection", "Thymoma Teams"],
-        },
-    ],
-    "Gastrointestinal Stromal Tumor (GIST)": [
-        {
-            "name": "Dr. George D. Demetri",
-            "region": "USA",
-            "title": "Medical Oncologist",
-            "experience_years": 30,
-            "city": "Boston",
-            "country": "USA",
-            "institution": "Dana-Farber",
-            "specialties": ["Medical Oncology", "GIST", "Imatinib Pioneer"],
-        },
-        {
-            "name": "Dr. Wong Seng Weng",
-            "region": "Singapore",
-            "title": "Medical Oncologist",
-            "experience_years": 20,
-            "city": "Singapore",
-            "country": "Singapore",
-            "institution": "Parkway Cancer Centre",
-            "specialties": ["Medical Oncology", "GIST", "TKIs"],
-        },
-        {
-            "name": "Prof. Peter Reichardt",
-            "region": "Europe",
-            "title": "Oncologist",
-            "experience_years": 25,
-            "city": "Berlin",
-            "country": "Germany",
-            "institution": "HELIOS Clinic",
-            "specialties": ["Sarcoma Oncology", "GIST Studies", "EORTC"],
-        },
-        {
-            "name": "Dr. Rajiv Agarwal",
-            "region": "India",
-            "title": "Medical Oncologist",
-            "experience_years": 20,
-            "city": "Mumbai",
-            "country": "India",
-            "institution": "Tata Memorial",
-            "specialties": ["Medical Oncology", "GIST", "Imatinib"],
-        },
-    ],
-    "Pancreatic Neuroendocrine Tumors (pNETs)": [
-        {
-            "name": "Dr. James Yao",
-            "region": "USA",
-            "title": "Medical Oncologist",
-            "experience_years": 20,
-            "city": "Houston",
-            "country": "USA",
-            "institution": "MD Anderson",
-            "specialties": ["Medical Oncology", "Neuroendocrine Tumors", "Everolimus/Sunitinib"],
-        },
-        {
-            "name": "Dr. Thng Choon Hua",
-            "region": "Singapore",
-            "title": "Endocrinologist",
-            "experience_years": 15,
-            "city": "Singapore",
-            "country": "Singapore",
-            "institution": "SGH",
-            "specialties": ["Endocrinology", "pNETs", "SSA Therapy/PRRT"],
-        },
-        {
-            "name": "Prof. Kjell Öberg",
-            "region": "Europe",
-            "title": "Endocrine Oncologist",
-            "experience_years": 40,
-            "city": "Uppsala",
-            "country": "Sweden",
-            "institution": "Uppsala University",
-            "specialties": ["Endocrine Oncology", "NETs", "ENETS Guidelines"],
-        },
-        {
-            "name": "Dr. C. S. Pramesh",
-            "region": "India",
-            "title": "GI Surgical Oncologist, Director",
-            "experience_years": 25,
-            "city": "Mumbai",
-            "country": "India",
-            "institution": "Tata Memorial",
-            "specialties": ["GI Surgical Oncology", "Pancreas Surgery", "pNETs"],
-        },
-    ],
-    "Penile Squamous Cell Carcinoma": [
-        {
-            "name": "Dr. Philippe E. Spiess",
-            "region": "USA",
-            "title": "Urologic Oncologist",
-            "experience_years": 15,
-            "city": "Tampa",
-            "country": "USA",
-            "institution": "Moffitt Cancer Center",
-            "specialties": ["Urologic Oncology", "Penile Cancer", "Nodal Dissection"],
-        },
-        {
-            "name": "Dr. Tan Teing Ee",
-            "region": "Singapore",
-            "title": "Urologist",
-            "experience_years": 20,
-            "city": "Singapore",
-            "country": "Singapore",
-            "institution": "SGH",
-            "specialties": ["Urology", "Penile Cancer", "Penectomy"],
-        },
-        {
-            "name": "Prof. Henk van der Poel",
-            "region": "Europe",
-            "title": "Urologic Oncologist",
-            "experience_years": 25,
-            "city": "Amsterdam",
-            "country": "Netherlands",
-            "institution": "Netherlands Cancer Institute",
-            "specialties": ["Urologic Oncology", "Penile Sparing Techniques", "Sentinel Node"],
-        },
-        {
-            "name": "Dr. Anup Kumar",
-            "region": "India",
-            "title": "Urologic Oncologist",
-            "experience_years": 20,
-            "city": "New Delhi",
-            "country": "India",
-            "institution": "Safdarjung Hospital",
-            "specialties": ["Urologic Oncology", "Penile Cancer Surgery", "Reconstructive Techniques"],
-        },
-    ],
-    "Vulvar Cancer": [
-        {
-            "name": "Dr. Kathleen M. Schmeler",
-            "region": "USA",
-            "title": "Gynecologic Oncologist",
-            "experience_years": 15,
-            "city": "Houston",
-            "country": "USA",
-            "institution": "MD Anderson",
-            "specialties": ["Gynecologic Oncology", "Vulvar Cancer", "Sentinel Node Dissection"],
-        },
-        {
-            "name": "Dr. See Tho Kai Yin",
-            "region": "Singapore",
-            "title": "Senior Gynecologic Oncologist",
-            "experience_years": 30,
-            "city": "Singapore",
-            "country": "Singapore",
-            "institution": "KKH",
-            "specialties": ["Gynecologic Oncology", "Vulvar Cancer", "Combined Modality"],
-        },
-        {
-            "name": "Prof. Lukas J. Bamberg",
-            "region": "Europe",
-            "title": "Gynecologic Oncologist",
-            "experience_years": 20,
-            "city": "Berlin",
-            "country": "Germany",
-            "institution": "Charité Berlin",
-            "specialties": ["Gynecologic Oncology", "Vulvar Reconstructive Surgery", "Radical Excision"],
-        },
-        {
-            "name": "Dr. Amita Maheshwari",
-            "region": "India",
-            "title": "Professor & Head, Gyne-Oncology",
-            "experience_years": 30,
-            "city": "Mumbai",
-            "country": "India",
-            "institution": "Tata Memorial Hospital",
-            "specialties": ["Gynecologic Oncology", "Vulvar Cancer", "Women's Cancer Center"],
-        },
-    ],
-    "Vaginal Cancer": [
-        {
-            "name": "Dr. Sarah M. Temkin",
-            "region": "USA",
-            "title": "Gynecologic Oncologist",
-            "experience_years": 20,
-            "city": "Cleveland",
-            "country": "USA",
-            "institution": "Case Western/Seidman Cancer Center",
-            "specialties": ["Gynecologic Oncology", "Vaginal Cancer", "Brachytherapy"],
-        },
-        {
-            "name": "Dr. Lim Lay Hoon",
-            "region": "Singapore",
-            "title": "Radiation Oncologist",
-            "experience_years": 15,
-            "city": "Singapore",
-            "country": "Singapore",
-            "institution": "NCIS",
-            "specialties": ["Radiation Oncology", "Gynecologic Brachytherapy", "Interstitial Implants"],
-        },
-        {
-            "name": "Prof. Ignace Vergote",
-            "region": "Europe",
-            "title": "Gynecologic Oncologist",
-            "experience_years": 35,
-            "city": "Leuven",
-            "country": "Belgium",
-            "institution": "University Hospital Leuven",
-            "specialties": ["Gynecologic Oncology", "Rare Vaginal Cancers", "European Guidelines"],
-        },
-        {
-            "name": "Dr. Swapna Misra",
-            "region": "India",
-            "title": "Gynecologic Oncologist",
-            "experience_years": 20,
-            "city": "Mumbai",
-            "country": "India",
-            "institution": "KEM Hospital",
-            "specialties": ["Gynecologic Oncology", "Vaginal Cancer", "Multidisciplinary Care"],
-        },
-    ],
-    "Osteosarcoma": [
-        {
-            "name": "Dr. Richard Gorlick",
-            "region": "USA",
-            "title": "Division Head of Pediatrics, Director of Osteosarcoma Research Laboratory",
-            "experience_years": 25,
-            "city": "Houston",
-            "country": "USA",
-            "institution": "MD Anderson Cancer Center",
-            "specialties": ["Pediatric Oncology", "Osteosarcoma", "Osteosarcoma Research"],
-        },
-        {
-            "name": "Dr. Paul A. Meyers",
-            "region": "USA",
-            "title": "Pediatric Oncologist",
-            "experience_years": 40,
-            "city": "New York",
-            "country": "USA",
-            "institution": "MSKCC",
-            "specialties": ["Pediatric Oncology", "Osteosarcoma", "Chemotherapy Protocols"],
-        },
-        {
-            "name": "Dr. Kam Chan Hui",
-            "region": "Singapore",
-            "title": "Pediatric Oncologist",
-            "experience_years": 15,
-            "city": "Singapore",
-            "country": "Singapore",
-            "institution": "KKH",
-            "specialties": ["Pediatric Oncology", "Osteosarcoma", "MAP Chemotherapy"],
-        },
-        {
-            "name": "Prof. Stefan Bielack",
-            "region": "Europe",
-            "title": "Pediatric Oncologist",
-            "experience_years": 30,
-            "city": "Stuttgart",
-            "country": "Germany",
-            "institution": "Olgahospital",
-            "specialties": ["Pediatric Oncology", "Osteosarcoma", "COSS Trials"],
-        },
-        {
-            "name": "Dr. G. K. Prabhu",
-            "region": "India",
-            "title": "Orthopedic Oncologist",
-            "experience_years": 20,
-            "city": "Bengaluru",
-            "country": "India",
-            "institution": "HCG",
-            "specialties": ["Orthopedic Oncology", "Limb-sparing Surgery", "Osteosarcoma"],
-        },
-    ],
-    "Ewing Sarcoma": [
-        {
-            "name": "Dr. Leonard Wexler",
-            "region": "USA",
-            "title": "Pediatric Oncologist",
-            "experience_years": 35,
-            "city": "New York",
-            "country": "USA",
-            "institution": "MSKCC",
-            "specialties": ["Pediatric Oncology", "Ewing Sarcoma", "INT-0091 Trials"],
-        },
-        {
-            "name": "Dr. Viulnerability Liu",
-            "region": "Singapore",
-            "title": "Pediatric Oncologist",
-            "experience_years": 10,
-            "city": "Singapore",
-            "country": "Singapore",
-            "institution": "NUH",
-            "specialties": ["Pediatric Oncology", "Ewing Sarcoma", "VIDE/VAI Chemotherapy"],
-        },
-        {
-            "name": "Prof. Theodoros Grünewald",
-            "region": "Europe",
-            "title": "Oncologist",
-            "experience_years": 15,
-            "city": "Essen",
-            "country": "Germany",
-            "institution": "University Hospital Essen",
-            "specialties": ["Oncology", "Ewing Sarcoma Biology", "Euro-E.W.I.N.G."],
-        },
-        {
-            "name": "Dr. Santanu Sen",
-            "region": "India",
-            "title": "Pediatric Oncologist",
-            "experience_years": 20,
-            "city": "Kolkata",
-            "country": "India",
-            "institution": "Private Practice",
-            "specialties": ["Pediatric Oncology", "Ewing Sarcoma", "Cooperative Protocols"],
-        },
-    ],
-    "Retinoblastoma": [
-        {
-            "name": "Dr. Jesse L. Berry",
-            "region": "USA",
-            "title": "Ocular Oncologist",
-            "experience_years": 10,
-            "city": "Los Angeles",
-            "country": "USA",
-            "institution": "Children's Hospital LA",
-            "specialties": ["Ocular Oncology", "Retinoblastoma", "Intra-arterial Chemotherapy"],
-        },
-        {
-            "name": "Dr. Audrey Chia",
-            "region": "Singapore",
-            "title": "Senior Pediatric Ophthalmologist",
-            "experience_years": 20,
-            "city": "Singapore",
-            "country": "Singapore",
-            "institution": "SNEC",
-            "specialties": ["Pediatric Ophthalmology", "Retinoblastoma", "Chemoreduction"],
-        },
-        {
-            "name": "Prof. David H. Abramson",
-            "region": "Europe",
-            "title": "Ocular Oncologist",
-            "experience_years": 40,
-            "city": "New York",
-            "country": "USA",
-            "institution": "MSKCC",
-            "specialties": ["Ocular Oncology", "Retinoblastoma", "Local Therapies"],
-        },
-        {
-            "name": "Dr. Bikramjit Pal",
-            "region": "India",
-            "title": "Ocular Oncologist",
-            "experience_years": 15,
-            "city": "Chennai",
-            "country": "India",
-            "institution": "Sankara Nethralaya",
-            "specialties": ["Ocular Oncology", "Retinoblastoma", "Globe-conserving Treatment"],
-        },
-    ],
-    "Malignant Mesothelioma": [
-        {
-            "name": "Dr. Hedy Lee Kindler",
-            "region": "USA",
-            "title": "Medical Oncologist",
-            "experience_years": 25,
-            "city": "Chicago",
-            "country": "USA",
-            "institution": "University of Chicago",
-            "specialties": ["Medical Oncology", "Mesothelioma", "Pemetrexed Trials"],
-        },
-        {
-            "name": "Dr. Vyas Prasad",
-            "region": "Singapore",
-            "title": "Thoracic Surgeon",
-            "experience_years": 20,
-            "city": "Singapore",
-            "country": "Singapore",
-            "institution": "NCID/NCCS",
-            "specialties": ["Thoracic Surgery", "Mesothelioma", "Extrapleural Pneumonectomy"],
-        },
-        {
-            "name": "Prof. Marc de Perrot",
-            "region": "Europe",
-            "title": "Thoracic Surgeon",
-            "experience_years": 20,
-            "city": "Toronto",
-            "country": "Canada",
-            "institution": "Toronto General Hospital",
-            "specialties": ["Thoracic Surgery", "Mesothelioma Surgery", "Immunotherapy"],
-        },
-        {
-            "name": "Dr. S. Vijayakumar",
-            "region": "India",
-            "title": "Medical Oncologist",
-            "experience_years": 15,
-            "city": "Chennai",
-            "country": "India",
-            "institution": "Apollo Specialty",
-            "specialties": ["Medical Oncology", "Mesothelioma", "Multi-modality Treatment"],
-        },
-    ],
-    "Cancer of Unknown Primary (CUP)": [
-        {
-            "name": "Dr. Anthony Greco",
-            "region": "USA",
-            "title": "Medical Oncologist",
-            "experience_years": 45,
-            "city": "Nashville",
-            "country": "USA",
-            "institution": "Sarah Cannon Research Institute",
-            "specialties": ["Medical Oncology", "CUP", "Empiric Chemotherapy"],
-        },
-        {
-            "name": "Dr. Ravindran Kanesvaran",
-            "region": "Singapore",
-            "title": "Medical Oncologist",
-            "experience_years": 15,
-            "city": "Singapore",
-            "country": "Singapore",
-            "institution": "NCCS",
-            "specialties": ["Medical Oncology", "CUP Service", "Molecular Profiling"],
-        },
-        {
-            "name": "Prof. Fizazi Karim",
-            "region": "Europe",
-            "title": "Medical Oncologist",
-            "experience_years": 20,
-            "city": "Villejuif",
-            "country": "France",
-            "institution": "Gustave Roussy",
-            "specialties": ["Medical Oncology", "CUP Trials", "ESMO Guidelines"],
-        },
-        {
-            "name": "Dr. Harit Chaturvedi",
-            "region": "India",
-            "title": "Surgical Oncologist",
-            "experience_years": 30,
-            "city": "Delhi",
-            "country": "India",
-            "institution": "Max Healthcare",
-            "specialties": ["Surgical Oncology", "CUP", "Treatable Subsets"],
-        },
-    ],
-}
-
+def _derive(data):
+    data["RARE_CANCERS"] = data_seed.RARE_CANCERS
+    data["ALL_CANCERS"] = data_seed.ALL_CANCERS
 
-# Mapping of common cancer -> list of global specialist oncologists
-# Each specialist entry follows the same structure as RARE_CANCER_SPECIALISTS
-COMMON_CANCER_SPECIALISTS = {
-    "Breast Cancer": [
-        {
-            "name": "Dr. Rajeev Agarwal",
-            "region": "India",
-            "title": "Director of Breast Services",
-            "experience_years": 30,
-            "city": "Gurugram",
-            "country": "India",
-            "institution": "Medanta-The Medicity",
-            "specialties": ["Breast Surgical Oncology", "Breast conservation", "Reconstruction", "Sentinel node biopsy"],
-        },
-        {
-            "name": "Dr. Ramesh Sarin",
-            "region": "India",
-            "title": "Senior Consultant, Surgical Oncology",
-            "experience_years": 40,
-            "city": "New Delhi",
-            "country": "India",
-            "institution": "Indraprastha Apollo Hospital",
-            "specialties": ["Surgical Oncology", "Breast cancer"],
-        },
-        {
-            "name": "Dr. Harit Chaturvedi",
-            "region": "India",
-            "title": "Chairman of Cancer Care",
-            "experience_years": 38,
-            "city": "New Delhi",
-            "country": "India",
-            "institution": "Max Super Speciality Hospital, Saket",
-            "specialties": ["Surgical Oncology"],
-        },
-        {
-            "name": "Dr. Nisha Hariharan",
-            "region": "India",
-            "title": "Consultant Breast Surgeon",
-            "experience_years": 12,
-            "city": "Mumbai",
-            "country": "India",
-            "institution": "S. L. Raheja Hospital (Mahim)",
-            "specialties": ["Breast Surgical Oncology"],
-        },
-        {
-            "name": "Dr. Shona Nag",
-            "region": "India",
-            "title": "Director of Oncology",
-            "experience_years": 25,
-            "city": "Pune",
-            "country": "India",
-            "institution": "Sahyadri Hospitals",
-            "specialties": ["Medical Oncology", "Breast cancer", "Gynecologic cancers"],
-        },
-        {
-            "name": "Dr. Monica Morrow",
-            "region": "USA",
-            "title": "Chief of Breast Surgery",
-            "experience_years": 35,
-            "city": "New York City",
-            "country": "USA",
-            "institution": "Memorial Sloan Kettering Cancer Center (MSKCC)",
-            "specialties": ["Breast Surgical Oncology", "Breast-conserving surgery"],
-        },
-        {
-            "name": "Dr. Larry Norton",
-            "region": "USA",
-            "title": "Senior Medical Oncologist",
-            "experience_years": 40,
-            "city": "New York City",
-            "country": "USA",
-            "institution": "Memorial Sloan Kettering Cancer Center",
-            "specialties": ["Breast Medical Oncology", "Dose-dense chemotherapy"],
-        },
-        {
-            "name": "Dr. Eric Winer",
-            "region": "USA",
-            "title": "Director, Yale Cancer Center",
-            "experience_years": 30,
-            "city": "Boston",
-            "country": "USA",
-            "institution": "Yale Cancer Center (formerly at Dana-Farber)",
-            "specialties": ["Breast Medical Oncology", "Clinical trials"],
-        },
-        {
-            "name": "Dr. Vered Stearns",
-            "region": "USA",
-            "title": "Co-Director of Breast Cancer Program",
-            "experience_years": 25,
-            "city": "Baltimore",
-            "country": "USA",
-            "institution": "Johns Hopkins Medicine",
-            "specialties": ["Breast Medical Oncology", "Translational research"],
-        },
-        {
-            "name": "Prof. Ian Smith",
-            "region": "Europe",
-            "title": "Consultant Medical Oncologist",
-            "experience_years": 40,
-            "city": "London",
-            "country": "United Kingdom",
-            "institution": "The Royal Marsden Hospital",
-            "specialties": ["Breast Cancer Oncology", "Hormone therapy"],
-        },
-        {
-            "name": "Dr. Nigel Bundred",
-            "region": "Europe",
-            "title": "Breast Surgeon",
-            "experience_years": 30,
-            "city": "Manchester",
-            "country": "United Kingdom",
-            "institution": "The Christie",
-            "specialties": ["Breast Surgery"],
-        },
-        {
-            "name": "Dr. Suzette Delaloge",
-            "region": "Europe",
-            "title": "Medical Oncologist",
-            "experience_years": 25,
-            "city": "Paris",
-            "country": "France",
-            "institution": "Gustave Roussy Institute",
-            "specialties": ["Breast Medical Oncology"],
-        },
-        {
-            "name": "Dr. Masakazu Toi",
-            "region": "Asia-Pacific",
-            "title": "Breast Surgery Professor",
-            "experience_years": 30,
-            "city": "Tokyo",
-            "country": "Japan",
-            "institution": "Kyoto University",
-            "specialties": ["Breast Surgery"],
-        },
-        {
-            "name": "Dr. Shaheenah Dawood",
-            "region": "Middle East",
-            "title": "Medical Oncologist",
-            "experience_years": 20,
-            "city": "Dubai",
-            "country": "UAE",
-            "institution": "Mediclinic City Hospital",
-            "specialties": ["Breast and GI cancers"],
-        },
-    ],
-    "Lung Cancer": [
-        {
-            "name": "Dr. Sabyasachi Bal",
-            "region": "India",
-            "title": "Director of Thoracic Surgical Oncology",
-            "experience_years": 35,
-            "city": "New Delhi",
-            "country": "India",
-            "institution": "Fortis Vasant Kunj and Sir Ganga Ram Hospital",
-            "specialties": ["Thoracic Surgery", "Lung cancer", "Tracheal and esophageal tumors"],
-        },
-        {
-            "name": "Dr. Surender Kumar Dabas",
-            "region": "India",
-            "title": "Director of Surgical Oncology (Robotic Surgery)",
-            "experience_years": 21,
-            "city": "New Delhi",
-            "country": "India",
-            "institution": "BLK-Max Super Speciality Hospital",
-            "specialties": ["Thoracic and Head-Neck Surgical Oncology", "Robotic surgery"],
-        },
-        {
-            "name": "Dr. (Col) V. P. Singh",
-            "region": "India",
-            "title": "Senior Surgical Oncologist",
-            "experience_years": 40,
-            "city": "New Delhi",
-            "country": "India",
-            "institution": "Indraprastha Apollo Hospital",
-            "specialties": ["Surgical Oncology", "Lung and GI cancer surgeries"],
-        },
-        {
-            "name": "Dr. M. Chandrashekar",
-            "region": "India",
-            "title": "Senior Consultant Surgical Oncologist",
-            "experience_years": 48,
-            "city": "Bengaluru",
-            "country": "India",
-            "institution": "Apollo Hospitals",
-            "specialties": ["Surgical Oncology", "Lung, breast, and GI cancers"],
-        },
-        {
-            "name": "Dr. Somashekhar S.P.",
-            "region": "India",
-            "title": "Chairman, Surgical Oncology",
-            "experience_years": 29,
-            "city": "Bengaluru",
-            "country": "India",
-            "institution": "Aster CMI Hospital",
-            "specialties": ["Surgical Oncology & Robotic Surgery", "Thoracic and gynecologic cancers"],
-        },
-        {
-            "name": "Dr. Jayanthi S. Thumsi",
-            "region": "India",
-            "title": "Consultant Oncologist",
-            "experience_years": 26,
-            "city": "Hyderabad",
-            "country": "India",
-            "institution": "Gleneagles Global Hospitals",
-            "specialties": ["Surgical Oncology", "Breast and lung tumor surgeries"],
-        },
-        {
-            "name": "Dr. Suresh Advani",
-            "region": "India",
-            "title": "Senior Medical Oncologist",
-            "experience_years": 50,
-            "city": "Mumbai",
-            "country": "India",
-            "institution": "Nanavati Super Speciality Hospital",
-            "specialties": ["Medical Oncology", "Chemotherapy", "Bone marrow transplant"],
-        },
-        {
-            "name": "Dr. Raj Nagarkar",
-            "region": "India",
-            "title": "Chief Surgical Oncologist",
-            "experience_years": 19,
-            "city": "Nashik",
-            "country": "India",
-            "institution": "HCG Manavata Cancer Centre",
-            "specialties": ["Surgical Oncology", "Thoracic and breast cancers"],
-        },
-        {
-            "name": "Dr. Bülent Karagöz",
-            "region": "Europe",
-            "title": "Medical Oncologist",
-            "experience_years": 32,
-            "city": "Istanbul",
-            "country": "Turkey",
-            "institution": "Anadolu Medical Center",
-            "specialties": ["Lung Cancer Treatment", "Chemotherapy", "Immunotherapy", "Targeted therapy"],
-        },
-        {
-            "name": "Dr. Serkan Keskin",
-            "region": "Europe",
-            "title": "Medical Oncologist",
-            "experience_years": 24,
-            "city": "Istanbul",
-            "country": "Turkey",
-            "institution": "Memorial Şişli Hospital",
-            "specialties": ["Medical Oncology", "Lung and gastrointestinal cancers"],
-        },
-        {
-            "name": "Dr. Mustafa Solak",
-            "region": "Europe",
-            "title": "Medical Oncologist",
-            "experience_years": 19,
-            "city": "Istanbul",
-            "country": "Turkey",
-            "institution": "Hisar Intercontinental Hospital",
-            "specialties": ["Lung Cancer Treatment"],
-        },
-        {
-            "name": "Dr. Adnan Sayar",
-            "region": "Europe",
-            "title": "Professor of Thoracic Surgery",
-            "experience_years": 40,
-            "city": "Istanbul",
-            "country": "Turkey",
-            "institution": "Liv Hospital Vadistanbul",
-            "specialties": ["Thoracic Surgery", "Lung cancer surgery", "Minimally invasive techniques"],
-        },
-        {
-            "name": "Dr. Hale Başak Çağlar",
-            "region": "Europe",
-            "title": "Director of Radiation Oncology",
-            "experience_years": 20,
-            "city": "Istanbul",
-            "country": "Turkey",
-            "institution": "Anadolu Medical Center",
-            "specialties": ["Radiation Therapy", "Lung & Breast Cancer"],
-        },
-        {
-            "name": "Dr. Kenneth Keating",
-            "region": "USA",
-            "title": "Thoracic Surgeon",
-            "experience_years": 30,
-            "city": "Rochester",
-            "country": "USA",
-            "institution": "Mayo Clinic",
-            "specialties": ["Lung Cancer Surgery", "Minimally invasive lobectomy"],
-        },
-        {
-            "name": "Dr. Roy Herbst",
-            "region": "USA",
-            "title": "Chief of Medical Oncology",
-            "experience_years": 25,
-            "city": "New Haven",
-            "country": "USA",
-            "institution": "Yale Cancer Center (formerly at MD Anderson)",
-            "specialties": ["Lung Cancer Medical Oncology", "Targeted therapies"],
-        },
-        {
-            "name": "Dr. Naruke Tetsuya",
-            "region": "Asia-Pacific",
-            "title": "Thoracic Surgical Oncologist",
-            "experience_years": 30,
-            "city": "Tokyo",
-            "country": "Japan",
-            "institution": "National Cancer Center Hospital",
-            "specialties": ["Lung Cancer Surgery", "VATS lobectomy"],
-        },
-        {
-            "name": "Dr. Noriaki Kurimoto",
-            "region": "Asia-Pacific",
-            "title": "Director of Thoracic Oncology",
-            "experience_years": 28,
-            "city": "Osaka",
-            "country": "Japan",
-            "institution": "Osaka International Cancer Institute",
-            "specialties": ["Interventional Pulmonology", "Lung Cancer", "Bronchoscopy"],
-        },
-        {
-            "name": "Dr. Harvey Pass",
-            "region": "USA",
-            "title": "Thoracic Surgeon",
-            "experience_years": 35,
-            "city": "New York City",
-            "country": "USA",
-            "institution": "NYU Langone",
-            "specialties": ["Thoracic Surgery", "Lung cancer"],
-        },
-        {
-            "name": "Dr. Egbert Sondagsdam",
-            "region": "Europe",
-            "title": "Medical Oncologist",
-            "experience_years": 25,
-            "city": "Oslo",
-            "country": "Norway",
-            "institution": "Oslo University Hospital – Radiumhospitalet",
-            "specialties": ["Lung Cancer"],
-        },
-        {
-            "name": "Dr. Shou-Zhang Peng",
-            "region": "Asia-Pacific",
-            "title": "Thoracic Surgeon",
-            "experience_years": 30,
-            "city": "Bangkok",
-            "country": "Thailand",
-            "institution": "Siriraj Hospital",
-            "specialties": ["Thoracic Surgery", "Lung cancer"],
-        },
-    ],
-    "Colorectal Cancer": [
-        {
-            "name": "Dr. Vedant Kabra",
-            "region": "India",
-            "title": "Head of Surgical Oncology",
-            "experience_years": 20,
-            "city": "Gurugram",
-            "country": "India",
-            "institution": "Fortis Memorial Research Institute",
-            "specialties": ["Gastrointestinal Surgical Oncology", "Colon and rectal cancer surgery", "Robotic surgery"],
-        },
-        {
-            "name": "Dr. Sanjay Kumar",
-            "region": "India",
-            "title": "Director of GI Oncology",
-            "experience_years": 25,
-            "city": "New Delhi",
-            "country": "India",
-            "institution": "Rajiv Gandhi Cancer Institute & Research Centre",
-            "specialties": ["Colorectal Surgery", "Sphincter-preserving rectal cancer surgeries"],
-        },
-        {
-            "name": "Dr. Shailesh V. Shrikhande",
-            "region": "India",
-            "title": "Deputy Director",
-            "experience_years": 20,
-            "city": "Mumbai",
-            "country": "India",
-            "institution": "Tata Memorial Centre",
-            "specialties": ["Hepato-Pancreato-Biliary & Gastrointestinal Surgery", "Pancreatic and colorectal cancer surgery"],
-        },
-        {
-            "name": "Dr. K. S. Gopinath",
-            "region": "India",
-            "title": "Surgical Oncologist",
-            "experience_years": 47,
-            "city": "Bengaluru",
-            "country": "India",
-            "institution": "HCG Cancer Center",
-            "specialties": ["Surgical Oncology", "Colorectal and head-neck cancer surgery"],
-        },
-        {
-            "name": "Dr. C. B. Koppiker",
-            "region": "India",
-            "title": "Consultant Breast & Colorectal Surgeon",
-            "experience_years": 30,
-            "city": "Pune",
-            "country": "India",
-            "institution": "Orchids Breast Health Centre",
-            "specialties": ["Breast and Colorectal Surgery", "Oncoplastic surgery"],
-        },
-        {
-            "name": "Dr. Julio Garcia-Aguilar",
-            "region": "USA",
-            "title": "Chief of Colorectal Surgery",
-            "experience_years": 30,
-            "city": "New York City",
-            "country": "USA",
-            "institution": "Memorial Sloan Kettering",
-            "specialties": ["Colorectal Surgical Oncology", "Minimally invasive colorectal surgery", "Sphincter preservation"],
-        },
-        {
-            "name": "Dr. Jeffrey Meyerhardt",
-            "region": "USA",
-            "title": "Medical Oncologist",
-            "experience_years": 20,
-            "city": "Boston",
-            "country": "USA",
-            "institution": "Dana-Farber Cancer Institute",
-            "specialties": ["Colorectal Cancer Medical Oncology", "Chemo for GI cancers"],
-        },
-        {
-            "name": "Prof. René Adam",
-            "region": "Europe",
-            "title": "Hepato-Gastrointestinal Surgeon",
-            "experience_years": 35,
-            "city": "Paris",
-            "country": "France",
-            "institution": "AP-HP Paul Brousse Hospital",
-            "specialties": ["Liver metastasis surgery", "Colorectal liver metastasis resection"],
-        },
-        {
-            "name": "Prof. Jürgen Weitz",
-            "region": "Europe",
-            "title": "Chair of Visceral Surgery",
-            "experience_years": 25,
-            "city": "Heidelberg",
-            "country": "Germany",
-            "institution": "University Hospital Heidelberg",
-            "specialties": ["Colorectal and Pancreatic Surgery"],
-        },
-        {
-            "name": "Dr. Atthaphorn Trakarnsanga",
-            "region": "Asia-Pacific",
-            "title": "Colorectal Surgeon",
-            "experience_years": 15,
-            "city": "Bangkok",
-            "country": "Thailand",
-            "institution": "King Chulalongkorn Memorial Hospital",
-            "specialties": ["Colorectal Surgery", "Advanced rectal cancer", "Transanal TME surgery"],
-        },
-        {
-            "name": "Dr. Feza Remzi",
-            "region": "Middle East",
-            "title": "Colorectal Surgeon",
-            "experience_years": 30,
-            "city": "Abu Dhabi",
-            "country": "UAE",
-            "institution": "Cleveland Clinic Abu Dhabi (formerly NYU)",
-            "specialties": ["Colorectal Surgery"],
-        },
-        {
-            "name": "Dr. Cornelis (Kees) Punt",
-            "region": "Europe",
-            "title": "Medical Oncologist",
-            "experience_years": 30,
-            "city": "Amsterdam",
-            "country": "Netherlands",
-            "institution": "Amsterdam UMC",
-            "specialties": ["Medical Oncology", "Colorectal cancer"],
-        },
-        {
-            "name": "Dr. Yutaka Suzuki",
-            "region": "Asia-Pacific",
-            "title": "Colorectal Surgeon",
-            "experience_years": 25,
-            "city": "Tokyo",
-            "country": "Japan",
-            "institution": "National Cancer Center",
-            "specialties": ["Colorectal Surgery"],
-        },
-    ],
-    "Prostate Cancer": [
-        {
-            "name": "Dr. Ashok Kumar Hemal",
-            "region": "India",
-            "title": "Chairman of Urology and Robotic Surgery",
-            "experience_years": 35,
-            "city": "Gurugram",
-            "country": "India",
-            "institution": "Medanta Hospital",
-            "specialties": ["Urologic Oncology", "Robotic radical prostatectomy"],
-        },
-        {
-            "name": "Dr. Narmada P. Gupta",
-            "region": "India",
-            "title": "Chairman of Urology",
-            "experience_years": 45,
-            "city": "Gurugram",
-            "country": "India",
-            "institution": "FMRI (former AIIMS)",
-            "specialties": ["Urologic Oncology", "Prostate surgery"],
-        },
-        {
-            "name": "Dr. Mahesh Desai",
-            "region": "India",
-            "title": "Medical Director & Chief Urologist",
-            "experience_years": 40,
-            "city": "Nadiad",
-            "country": "India",
-            "institution": "Muljibhai Patel Urology Hospital",
-            "specialties": ["Uro-Oncology", "Prostate and kidney cancer surgery"],
-        },
-        {
-            "name": "Dr. Peter Scardino",
-            "region": "USA",
-            "title": "Urologic Surgeon",
-            "experience_years": 40,
-            "city": "New York City",
-            "country": "USA",
-            "institution": "Memorial Sloan Kettering Cancer Center",
-            "specialties": ["Prostate Cancer Surgery", "Nerve-sparing prostatectomy"],
-        },
-        {
-            "name": "Dr. Anthony D'Amico",
-            "region": "USA",
-            "title": "Chief of Genitourinary Radiation Oncology",
-            "experience_years": 30,
-            "city": "Boston",
-            "country": "USA",
-            "institution": "Brigham and Women's Hospital/Dana-Farber",
-            "specialties": ["Prostate Cancer", "Prostate brachytherapy", "Combined-modality therapy"],
-        },
-        {
-            "name": "Prof. Mark Emberton",
-            "region": "Europe",
-            "title": "Urologist",
-            "experience_years": 25,
-            "city": "London",
-            "country": "United Kingdom",
-            "institution": "University College Hospital",
-            "specialties": ["Focal Therapy for Prostate Cancer", "HIFU", "Active surveillance"],
-        },
-        {
-            "name": "Dr. Declan Murphy",
-            "region": "Asia-Pacific",
-            "title": "Urologic Oncologist",
-            "experience_years": 20,
-            "city": "Melbourne",
-            "country": "Australia",
-            "institution": "Peter MacCallum Cancer Centre",
-            "specialties": ["Robotic Prostate Surgery", "Prostate MRI-targeted biopsy"],
-        },
-        {
-            "name": "Dr. Maha Hussain",
-            "region": "USA",
-            "title": "Medical Oncologist",
-            "experience_years": 30,
-            "city": "Chicago",
-            "country": "USA",
-            "institution": "Northwestern Memorial Hospital",
-            "specialties": ["Medical Oncology", "Prostate & GU Cancers"],
-        },
-        {
-            "name": "Dr. Mohamed Al Zi'abi",
-            "region": "Middle East",
-            "title": "Consultant Urologist",
-            "experience_years": 20,
-            "city": "Abu Dhabi",
-            "country": "UAE",
-            "institution": "Cleveland Clinic Abu Dhabi",
-            "specialties": ["Urologic Oncology", "Prostate and bladder cancer", "Robotic surgery"],
-        },
-        {
-            "name": "Dr. Chawit Chuawiwat",
-            "region": "Asia-Pacific",
-            "title": "Urologist",
-            "experience_years": 15,
-            "city": "Bangkok",
-            "country": "Thailand",
-            "institution": "Bumrungrad International Hospital",
-            "specialties": ["Minimally Invasive Prostate Surgery", "Laparoscopic prostatectomy", "Prostate brachytherapy"],
-        },
-        {
-            "name": "Dr. Karin Fosså",
-            "region": "Europe",
-            "title": "GU Oncologist",
-            "experience_years": 30,
-            "city": "Oslo",
-            "country": "Norway",
-            "institution": "Oslo University Hospital (Radiumhospitalet)",
-            "specialties": ["GU Oncology", "Prostate cancer"],
-        },
-        {
-            "name": "Prof. Sadi Kerem Okutur",
-            "region": "Europe",
-            "title": "Medical Oncologist",
-            "experience_years": 20,
-            "city": "Istanbul",
-            "country": "Turkey",
-            "institution": "Memorial Bahçelievler Hospital",
-            "specialties": ["Medical Oncology", "Prostate cancer"],
-        },
-    ],
-    "Gastric Cancer": [
-        {
-            "name": "Dr. S. Jagannath",
-            "region": "India",
-            "title": "Chairman of Surgical Oncology",
-            "experience_years": 40,
-            "city": "Mumbai",
-            "country": "India",
-            "institution": "Lilavati Hospital",
-            "specialties": ["GI Surgical Oncology", "Gastric cancer", "GI surgeries"],
-        },
-        {
-            "name": "Dr. T. S. Chandrasekar",
-            "region": "India",
-            "title": "Senior Surgical Oncologist",
-            "experience_years": 30,
-            "city": "Chennai",
-            "country": "India",
-            "institution": "Cancer Institute (WIA)",
-            "specialties": ["Gastrointestinal Oncology", "Stomach and esophageal cancer surgeries"],
-        },
-        {
-            "name": "Dr. Dattatreyudu Nori",
-            "region": "India",
-            "title": "Chief of GI Oncology",
-            "experience_years": 20,
-            "city": "Hyderabad",
-            "country": "India",
-            "institution": "Apollo Hospitals",
-            "specialties": ["Medical and Radiation Oncology", "Gastric and esophageal cancers"],
-        },
-        {
-            "name": "Prof. Yutaka Yonemura",
-            "region": "Asia-Pacific",
-            "title": "Director",
-            "experience_years": 35,
-            "city": "Tokyo",
-            "country": "Japan",
-            "institution": "National Cancer Center Hospital East, Kashiwa",
-            "specialties": ["Gastric Cancer Surgery", "Intraperitoneal Chemotherapy", "Peritoneal metastases"],
-        },
-        {
-            "name": "Dr. Kazuhiro Yoshida",
-            "region": "Asia-Pacific",
-            "title": "Professor of Surgery",
-            "experience_years": 30,
-            "city": "Tokyo",
-            "country": "Japan",
-            "institution": "Nagoya University Hospital",
-            "specialties": ["Gastric and Gastroesophageal Junction Cancer Surgery"],
-        },
-        {
-            "name": "Dr. Sam Yoon",
-            "region": "USA",
-            "title": "Chief of Gastric and Mixed Tumor Surgery",
-            "experience_years": 25,
-            "city": "New York City",
-            "country": "USA",
-            "institution": "Memorial Sloan Kettering",
-            "specialties": ["Gastric Cancer and Sarcoma Surgery", "Complex gastric resections"],
-        },
-        {
-            "name": "Dr. Jae Ho Cheong",
-            "region": "Asia-Pacific",
-            "title": "Gastric Cancer Oncologist",
-            "experience_years": 20,
-            "city": "Seoul",
-            "country": "South Korea",
-            "institution": "Samsung Medical Center",
-            "specialties": ["Medical Oncology & Genomics", "Targeted therapy"],
-        },
-        {
-            "name": "Prof. Thomas Rückert",
-            "region": "Europe",
-            "title": "Chief of Surgery",
-            "experience_years": 25,
-            "city": "Berlin",
-            "country": "Germany",
-            "institution": "Charité – Campus Virchow",
-            "specialties": ["Upper GI Surgery", "Gastric and esophageal cancers", "Minimally invasive techniques"],
-        },
-        {
-            "name": "Dr. Marc-Olivier Chirouze",
-            "region": "Europe",
-            "title": "GI Oncologist",
-            "experience_years": 20,
-            "city": "Lyon",
-            "country": "France",
-            "institution": "Centre Léon Bérard",
-            "specialties": ["Digestive Oncology", "Gastric and pancreatic cancer chemotherapy"],
-        },
-        {
-            "name": "Dr. Chakrapani Bhatt",
-            "region": "Middle East",
-            "title": "Consultant Surgical Oncologist",
-            "experience_years": 30,
-            "city": "Riyadh",
-            "country": "Saudi Arabia",
-            "institution": "King Faisal Specialist Hospital",
-            "specialties": ["Gastrectomy", "GI surgical oncology"],
-        },
-    ],
-    "Liver Cancer (HCC)": [
-        {
-            "name": "Dr. Anand Khakhar",
-            "region": "India",
-            "title": "Director of Liver Transplant & HPB Surgery",
-            "experience_years": 20,
-            "city": "Chennai",
-            "country": "India",
-            "institution": "Apollo Hospitals",
-            "specialties": ["Hepatobiliary Surgery & Liver Transplant", "Liver cancer resections and transplants"],
-        },
-        {
-            "name": "Dr. Vivek Vij",
-            "region": "India",
-            "title": "Chief of Liver Transplant and HPB Surgery",
-            "experience_years": 20,
-            "city": "Noida",
-            "country": "India",
-            "institution": "Fortis Noida",
-            "specialties": ["Liver Cancer Surgery & Transplant"],
-        },
-        {
-            "name": "Dr. Ravi Kannan",
-            "region": "India",
-            "title": "Surgical Oncologist and Director",
-            "experience_years": 25,
-            "city": "Silchar",
-            "country": "India",
-            "institution": "Cachar Cancer Hospital",
-            "specialties": ["Surgical Oncology", "Liver and oral cancers"],
-        },
-        {
-            "name": "Prof. Pierre-Alain Clavien",
-            "region": "Europe",
-            "title": "Chair of Visceral & Transplant Surgery",
-            "experience_years": 30,
-            "city": "Zürich",
-            "country": "Switzerland",
-            "institution": "University Hospital Zürich",
-            "specialties": ["Liver Surgery", "Liver cancer surgery", "Bile duct cancers"],
-        },
-        {
-            "name": "Prof. Jin-Hong Cheng",
-            "region": "Asia-Pacific",
-            "title": "Hepatobiliary Surgeon",
-            "experience_years": 30,
-            "city": "Taipei",
-            "country": "Taiwan",
-            "institution": "Chang Gung Memorial Hospital",
-            "specialties": ["Liver Tumor Surgery", "Laparoscopic liver resection for HCC"],
-        },
-        {
-            "name": "Dr. Ghassan Abou-Alfa",
-            "region": "USA",
-            "title": "Medical Oncologist",
-            "experience_years": 20,
-            "city": "New York City",
-            "country": "USA",
-            "institution": "Memorial Sloan Kettering",
-            "specialties": ["Liver Cancer Systemic Therapy", "Hepatocellular carcinoma"],
-        },
-        {
-            "name": "Dr. Ahmed Kaseb",
-            "region": "USA",
-            "title": "Professor of GI Medical Oncology",
-            "experience_years": 20,
-            "city": "Houston",
-            "country": "USA",
-            "institution": "MD Anderson Cancer Center",
-            "specialties": ["Liver Cancer (HCC)", "Pancreatic Cancer Oncology"],
-        },
-        {
-            "name": "Dr. Shahid Husain",
-            "region": "Asia-Pacific",
-            "title": "Consultant Interventional Radiologist",
-            "experience_years": 25,
-            "city": "Karachi",
-            "country": "Pakistan",
-            "institution": "Aga Khan University Hospital",
-            "specialties": ["Liver Tumor Ablation", "TACE", "Image-guided therapies"],
-        },
-        {
-            "name": "Dr. Thomas Marjot",
-            "region": "Europe",
-            "title": "Hepatologist",
-            "experience_years": 15,
-            "city": "Oxford",
-            "country": "United Kingdom",
-            "institution": "Oxford University Hospitals",
-            "specialties": ["Medical Hepatology", "Liver cancer patients with cirrhosis"],
-        },
-        {
-            "name": "Dr. Yasser Farahat",
-            "region": "Middle East",
-            "title": "Consultant Hepatobiliary Surgeon",
-            "experience_years": 20,
-            "city": "Abu Dhabi",
-            "country": "UAE",
-            "institution": "Sheikh Shakhbout Medical City",
-            "specialties": ["Liver and Pancreas Surgery", "Complex liver resections"],
-        },
-        {
-            "name": "Dr. Pierce Chow",
-            "region": "Asia-Pacific",
-            "title": "Hepatobiliary Surgeon",
-            "experience_years": 25,
-            "city": "Singapore",
-            "country": "Singapore",
-            "institution": "National Cancer Centre",
-            "specialties": ["Liver Tumor Clinic"],
-        },
-    ],
-    "Cervical Cancer": [
-        {
-            "name": "Dr. Sarika Gupta",
-            "region": "India",
-            "title": "Gynecologic Oncologist",
-            "experience_years": 15,
-            "city": "New Delhi",
-            "country": "India",
-            "institution": "Indraprastha Apollo Hospital",
-            "specialties": ["Cervical & Uterine Cancer", "Minimal invasive surgeries", "Fertility-sparing surgeries"],
-        },
-        {
-            "name": "Dr. Neerja Bhatla",
-            "region": "India",
-            "title": "Professor of Gynecologic Oncology",
-            "experience_years": 30,
-            "city": "New Delhi",
-            "country": "India",
-            "institution": "AIIMS",
-            "specialties": ["Cervical Cancer", "HPV and cervical cancer prevention"],
-        },
-        {
-            "name": "Dr. Umesh Mahantshetty",
-            "region": "India",
-            "title": "Director of Radiation Oncology",
-            "experience_years": 25,
-            "city": "Mumbai",
-            "country": "India",
-            "institution": "Tata Memorial Centre",
-            "specialties": ["Gynecologic Radiation Oncology", "Image-guided brachytherapy"],
-        },
-        {
-            "name": "Dr. Rekha Wuntakal",
-            "region": "Europe",
-            "title": "Consultant Gynecologic Oncologist",
-            "experience_years": 20,
-            "city": "London",
-            "country": "United Kingdom",
-            "institution": "Queen's Hospital",
-            "specialties": ["Cervical Cancer Surgery", "Radical trachelectomy", "Pelvic lymphadenectomy"],
-        },
-        {
-            "name": "Dr. Marisa Adelman",
-            "region": "USA",
-            "title": "Gynecologic Oncologist",
-            "experience_years": 15,
-            "city": "Rochester",
-            "country": "USA",
-            "institution": "Mayo Clinic",
-            "specialties": ["Cervical and Ovarian Cancer", "Robotic surgery", "Chemoradiation"],
-        },
-        {
-            "name": "Dr. Deyana Borimechkov",
-            "region": "Middle East",
-            "title": "Consultant Gynecologic Oncologist",
-            "experience_years": 20,
-            "city": "Dubai",
-            "country": "UAE",
-            "institution": "American Hospital Dubai",
-            "specialties": ["Gynecologic Oncology", "Cervical, ovarian cancers"],
-        },
-        {
-            "name": "Dr. Chinthaka Liyanage",
-            "region": "Asia-Pacific",
-            "title": "Gynecologic Oncologist",
-            "experience_years": 25,
-            "city": "Colombo",
-            "country": "Sri Lanka",
-            "institution": "National Cancer Institute",
-            "specialties": ["Cervical Cancer Surgery"],
-        },
-        {
-            "name": "Dr. Koji Matsuo",
-            "region": "USA",
-            "title": "Associate Professor of Gynecologic Oncology",
-            "experience_years": 15,
-            "city": "Los Angeles",
-            "country": "USA",
-            "institution": "University of Southern California",
-            "specialties": ["Cervical Cancer research and surgery"],
-        },
-        {
-            "name": "Dr. Uğur Özdemir",
-            "region": "Europe",
-            "title": "Gynecologic Oncologist",
-            "experience_years": 20,
-            "city": "Istanbul",
-            "country": "Turkey",
-            "institution": "Acıbadem Maslak Hospital",
-            "specialties": ["Robotic Surgery for Cervical Cancer", "Radical hysterectomy", "Pelvic exenteration"],
-        },
-        {
-            "name": "Prof. Nicolas Fetal",
-            "region": "Europe",
-            "title": "Gynecologic Oncologist",
-            "experience_years": 25,
-            "city": "Paris",
-            "country": "France",
-            "institution": "Institut Gustave Roussy",
-            "specialties": ["Cervical Cancer", "Clinical trials", "Immunotherapy trials"],
-        },
-        {
-            "name": "Dr. Richard Pötter",
-            "region": "Europe",
-            "title": "Radiation Oncologist",
-            "experience_years": 30,
-            "city": "Vienna",
-            "country": "Austria",
-            "institution": "Medical University of Vienna",
-            "specialties": ["Brachytherapy", "Cervical cancer"],
-        },
-    ],
-    "Ovarian Cancer": [
-        {
-            "name": "Dr. Sudha Rao",
-            "region": "India",
-            "title": "Gynecologic Oncologist",
-            "experience_years": 20,
-            "city": "Hyderabad",
-            "country": "India",
-            "institution": "Basavatarakam Indo-American Cancer Hospital",
-            "specialties": ["Ovarian Cancer Cytoreductive Surgery", "Debulking surgeries"],
-        },
-        {
-            "name": "Dr. Shona Nag",
-            "region": "India",
-            "title": "Medical Oncologist",
-            "experience_years": 25,
-            "city": "Pune",
-            "country": "India",
-            "institution": "Ruby Hall Clinic",
-            "specialties": ["Breast & Ovarian Cancer Chemotherapy", "Targeted therapies"],
-        },
-        {
-            "name": "Dr. Uday Thanawala",
-            "region": "India",
-            "title": "Gynecologic Oncosurgeon",
-            "experience_years": 30,
-            "city": "Mumbai",
-            "country": "India",
-            "institution": "Jupiter Hospital",
-            "specialties": ["Gynecologic Oncology", "Ovarian tumor surgeries", "HIPEC"],
-        },
-        {
-            "name": "Dr. Robert Coleman",
-            "region": "USA",
-            "title": "Gynecologic Oncologist",
-            "experience_years": 30,
-            "city": "Houston",
-            "country": "USA",
-            "institution": "Texas Oncology and US Oncology Research (former MD Anderson)",
-            "specialties": ["Ovarian Cancer Treatment", "Clinical trials"],
-        },
-        {
-            "name": "Dr. Kathleen Moore",
-            "region": "USA",
-            "title": "Gynecologic Oncologist",
-            "experience_years": 15,
-            "city": "Oklahoma",
-            "country": "USA",
-            "institution": "Stephenson Cancer Center",
-            "specialties": ["Ovarian Cancer Medical Oncology", "PARP inhibitor trials"],
-        },
-        {
-            "name": "Prof. Christina Fotopoulou",
-            "region": "Europe",
-            "title": "Consultant Gynecologic Oncologist",
-            "experience_years": 20,
-            "city": "London",
-            "country": "United Kingdom",
-            "institution": "Imperial College London (Hammersmith Hospital)",
-            "specialties": ["Advanced Ovarian Cancer Surgery", "Ultra-radical ovarian debulking"],
-        },
-        {
-            "name": "Dr. Yasmin Shah",
-            "region": "Asia-Pacific",
-            "title": "Consultant Gynecologic Oncologist",
-            "experience_years": 15,
-            "city": "Singapore",
-            "country": "Singapore",
-            "institution": "National University Hospital",
-            "specialties": ["Ovarian and Endometrial Cancer", "Minimally invasive surgery", "Genetic counseling"],
-        },
-        {
-            "name": "Dr. Alan Tan",
-            "region": "Asia-Pacific",
-            "title": "Medical Oncologist",
-            "experience_years": 10,
-            "city": "Singapore",
-            "country": "Singapore",
-            "institution": "National Cancer Centre Singapore",
-            "specialties": ["Ovarian Cancer Medical Oncology"],
-        },
-        {
-            "name": "Dr. Seckin Ortaç",
-            "region": "Europe",
-            "title": "Gynecologic Oncologist",
-            "experience_years": 25,
-            "city": "Ankara",
-            "country": "Turkey",
-            "institution": "Memorial Ankara Hospital",
-            "specialties": ["Ovarian Cancer Surgery", "Complex ovarian tumors"],
-        },
-        {
-            "name": "Dr. Supachai Laowattana",
-            "region": "Asia-Pacific",
-            "title": "Gynecologic Oncologist",
-            "experience_years": 30,
-            "city": "Bangkok",
-            "country": "Thailand",
-            "institution": "King Chulalongkorn Memorial Hospital",
-            "specialties": ["Ovarian Cancer", "Surgical and chemo management"],
-        },
-        {
-            "name": "Dr. Richard Barakat",
-            "region": "USA",
-            "title": "Gynecologic Oncologist",
-            "experience_years": 30,
-            "city": "New York City",
-            "country": "USA",
-            "institution": "Memorial Sloan Kettering (now at Altman Cancer Center)",
-            "specialties": ["Gynecologic Oncology", "Ovarian cancer"],
-        },
-    ],
-    "Oral Cancer": [
-        {
-            "name": "Dr. Surender Dabas",
-            "region": "India",
-            "title": "Director of Head, Neck & Thoracic Oncology",
-            "experience_years": 21,
-            "city": "New Delhi",
-            "country": "India",
-            "institution": "BLK-Max Super Speciality Hospital",
-            "specialties": ["Head & Neck Surgical Oncology", "Robotic surgery", "Oral and throat cancers"],
-        },
-        {
-            "name": "Dr. Pankaj Chaturvedi",
-            "region": "India",
-            "title": "Deputy Director, Centre for Cancer",
-            "experience_years": 25,
-            "city": "Mumbai",
-            "country": "India",
-            "institution": "Karkinos Healthcare (formerly Tata Memorial Hospital)",
-            "specialties": ["Head & Neck Surgical Oncology", "Oral cancer surgery", "Tobacco control advocacy"],
-        },
-        {
-            "name": "Dr. Jatin Shah",
-            "region": "USA",
-            "title": "Surgeon Emeritus",
-            "experience_years": 50,
-            "city": "New York City",
-            "country": "USA",
-            "institution": "Memorial Sloan Kettering Cancer Center",
-            "specialties": ["Head & Neck Surgery"],
-        },
-        {
-            "name": "Dr. Nishant Agrawal",
-            "region": "USA",
-            "title": "Director of Head and Neck Surgery",
-            "experience_years": 20,
-            "city": "Chicago",
-            "country": "USA",
-            "institution": "The University of Chicago Medicine",
-            "specialties": ["Head & Neck Surgical Oncology", "HPV-related oropharyngeal cancer"],
-        },
-        {
-            "name": "Dr. Anne Gillenwater",
-            "region": "USA",
-            "title": "Head & Neck Surgeon",
-            "experience_years": 25,
-            "city": "Houston",
-            "country": "USA",
-            "institution": "MD Anderson Cancer Center",
-            "specialties": ["Oral Cancer", "Reconstructive Surgery", "Fluorescence-guided surgery"],
-        },
-        {
-            "name": "Dr. S. M. Balaji",
-            "region": "India",
-            "title": "Director",
-            "experience_years": 30,
-            "city": "Chennai",
-            "country": "India",
-            "institution": "Balaji Dental and Craniofacial Hospital",
-            "specialties": ["Oral Cancer Surgery & Reconstruction", "Craniofacial surgeon", "Jaw reconstruction"],
-        },
-        {
-            "name": "Dr. Avraham Eisbruch",
-            "region": "USA",
-            "title": "Professor of Radiation Oncology",
-            "experience_years": 30,
-            "city": "Ann Arbor",
-            "country": "USA",
-            "institution": "University of Michigan",
-            "specialties": ["Head & Neck Cancer Radiation Therapy", "IMRT"],
-        },
-        {
-            "name": "Dr. Carsten Evers",
-            "region": "Europe",
-            "title": "ENT and Head-Neck Surgeon",
-            "experience_years": 20,
-            "city": "Berlin",
-            "country": "Germany",
-            "institution": "Charité – Campus Mitte",
-            "specialties": ["Head & Neck Oncology", "Endoscopic laser surgery", "Laryngeal cancer"],
-        },
-        {
-            "name": "Dr. Khalid Al Khatib",
-            "region": "Middle East",
-            "title": "Consultant Head & Neck Surgeon",
-            "experience_years": 15,
-            "city": "Al Ain",
-            "country": "UAE",
-            "institution": "Tawam Hospital (Johns Hopkins affiliate)",
-            "specialties": ["Head & Neck Surgical Oncology", "Thyroid, oral, and laryngeal cancers"],
-        },
-        {
-            "name": "Dr. Teeravut Wongwaisayawan",
-            "region": "Asia-Pacific",
-            "title": "Head-Neck Surgeon",
-            "experience_years": 20,
-            "city": "Bangkok",
-            "country": "Thailand",
-            "institution": "Ramathibodi Hospital",
-            "specialties": ["Head & Neck Cancer", "Advanced hypopharyngeal cancer surgery", "Microvascular reconstruction"],
-        },
-        {
-            "name": "Dr. Venkatraman Radhakrishnan",
-            "region": "Europe",
-            "title": "Head & Neck Surgeon",
-            "experience_years": 25,
-            "city": "Manchester",
-            "country": "United Kingdom",
-            "institution": "The Christie",
-            "specialties": ["Head & Neck Surgery"],
-        },
-        {
-            "name": "Prof. Jean-Louis Lefebvre",
-            "region": "Europe",
-            "title": "Head & Neck Surgeon",
-            "experience_years": 35,
-            "city": "Lille",
-            "country": "France",
-            "institution": "Centre Oscar Lambret",
-            "specialties": ["Head & Neck Surgery"],
-        },
-    ],
-    "Leukemia": [
-        {
-            "name": "Dr. Suresh Advani",
-            "region": "India",
-            "title": "Medical Oncologist & Hematologist",
-            "experience_years": 50,
-            "city": "Mumbai",
-            "country": "India",
-            "institution": "Nanavati Hospital",
-            "specialties": ["Medical Oncology", "Hematology", "Bone marrow transplant", "Leukemias"],
-        },
-        {
-            "name": "Dr. Vinod Pullarkat",
-            "region": "USA",
-            "title": "Hematologist",
-            "experience_years": 25,
-            "city": "Los Angeles",
-            "country": "USA",
-            "institution": "City of Hope",
-            "specialties": ["Leukemia & Bone Marrow Transplant", "Acute leukemias", "Transplant immunology"],
-        },
-        {
-            "name": "Dr. Richard J. O'Reilly",
-            "region": "USA",
-            "title": "Chair of Pediatric BMT",
-            "experience_years": 45,
-            "city": "New York City",
-            "country": "USA",
-            "institution": "Memorial Sloan Kettering Cancer Center",
-            "specialties": ["Pediatric Leukemia", "Bone Marrow Transplant"],
-        },
-        {
-            "name": "Dr. Hari Menon",
-            "region": "India",
-            "title": "Hemato-oncologist",
-            "experience_years": 20,
-            "city": "Mumbai",
-            "country": "India",
-            "institution": "Tata Memorial Hospital",
-            "specialties": ["Adult Leukemias (ALL, CML)", "BMT"],
-        },
-        {
-            "name": "Dr. Reena Doshi",
-            "region": "India",
-            "title": "Hematologist",
-            "experience_years": 15,
-            "city": "New Delhi",
-            "country": "India",
-            "institution": "Max Super Speciality Hospital",
-            "specialties": ["Leukemia & Lymphoma", "Bone marrow transplant"],
-        },
-        {
-            "name": "Dr. Alessandro Aiuti",
-            "region": "Europe",
-            "title": "Clinical Hematologist",
-            "experience_years": 20,
-            "city": "Milan",
-            "country": "Italy",
-            "institution": "San Raffaele Institute",
-            "specialties": ["Gene Therapy for Leukemia", "ADA-SCID"],
-        },
-        {
-            "name": "Dr. Dietger Niederwieser",
-            "region": "Europe",
-            "title": "Professor of Hematology",
-            "experience_years": 35,
-            "city": "Leipzig",
-            "country": "Germany",
-            "institution": "Leipzig University Hospital",
-            "specialties": ["Leukemia", "Stem Cell Transplantation"],
-        },
-        {
-            "name": "Dr. Tze-Chiang Lin",
-            "region": "Asia-Pacific",
-            "title": "Hematologist",
-            "experience_years": 15,
-            "city": "Singapore",
-            "country": "Singapore",
-            "institution": "Singapore General Hospital",
-            "specialties": ["Acute Leukemia treatment", "Stem cell transplant"],
-        },
-        {
-            "name": "Dr. Ahmed Galal",
-            "region": "Middle East",
-            "title": "Hematologist",
-            "experience_years": 20,
-            "city": "Al Ain",
-            "country": "UAE",
-            "institution": "Tawam Hospital",
-            "specialties": ["Leukemia & BMT"],
-        },
-        {
-            "name": "Dr. Attaya Suvannasankha",
-            "region": "USA",
-            "title": "Hematologist",
-            "experience_years": 20,
-            "city": "Indianapolis",
-            "country": "USA",
-            "institution": "IU Health Simon Cancer Center",
-            "specialties": ["Leukemia", "Multiple Myeloma"],
-        },
-        {
-            "name": "Dr. Vikas Dua",
-            "region": "India",
-            "title": "Pediatric BMT Specialist",
-            "experience_years": 20,
-            "city": "Gurugram",
-            "country": "India",
-            "institution": "Fortis Memorial Research Institute",
-            "specialties": ["Pediatric BMT", "Leukemia"],
-        },
-        {
-            "name": "Dr. Franco Locatelli",
-            "region": "Europe",
-            "title": "Pediatric Hematologist",
-            "experience_years": 30,
-            "city": "Rome",
-            "country": "Italy",
-            "institution": "Bambino Gesù Children's Hospital",
-            "specialties": ["Pediatric Leukemias", "BMT"],
-        },
-    ],
-    "Non-Hodgkin Lymphoma": [
-        {
-            "name": "Dr. Shyam Aggarwal",
-            "region": "India",
-            "title": "Senior Medical Oncologist",
-            "experience_years": 35,
-            "city": "New Delhi",
-            "country": "India",
-            "institution": "Sir Ganga Ram Hospital",
-            "specialties": ["Lymphomas", "Blood Cancers", "NHL and HL"],
-        },
-        {
-            "name": "Dr. Mammen Chandy",
-            "region": "India",
-            "title": "Director",
-            "experience_years": 40,
-            "city": "Kolkata",
-            "country": "India",
-            "institution": "Tata Medical Center",
-            "specialties": ["Hematology & BMT", "Lymphoma and leukemia treatment"],
-        },
-        {
-            "name": "Dr. Matthew M. Bartlett",
-            "region": "USA",
-            "title": "Hematologist/Oncologist",
-            "experience_years": 20,
-            "city": "Rochester",
-            "country": "USA",
-            "institution": "Mayo Clinic",
-            "specialties": ["Lymphoma", "CAR-T cell therapy"],
-        },
-        {
-            "name": "Dr. Anas Younes",
-            "region": "USA",
-            "title": "Chief of Lymphoma Service",
-            "experience_years": 25,
-            "city": "New York City",
-            "country": "USA",
-            "institution": "Memorial Sloan Kettering",
-            "specialties": ["Hodgkin and Non-Hodgkin Lymphomas", "Targeted therapies"],
-        },
-        {
-            "name": "Dr. Nancy Bartlett",
-            "region": "USA",
-            "title": "Medical Oncologist",
-            "experience_years": 30,
-            "city": "St. Louis",
-            "country": "USA",
-            "institution": "Washington University Siteman Cancer Center",
-            "specialties": ["Lymphomas", "Immunotherapy"],
-        },
-        {
-            "name": "Dr. Martin Hutchings",
-            "region": "Europe",
-            "title": "Consultant in Lymphoma",
-            "experience_years": 20,
-            "city": "Copenhagen",
-            "country": "Denmark",
-            "institution": "Rigshospitalet",
-            "specialties": ["Lymphoma", "Monoclonal antibodies"],
-        },
-        {
-            "name": "Dr. Mohammad Abu-Tineh",
-            "region": "Middle East",
-            "title": "Senior Hematologist",
-            "experience_years": 15,
-            "city": "Doha",
-            "country": "Qatar",
-            "institution": "National Center for Cancer Care",
-            "specialties": ["Lymphoma & Leukemia"],
-        },
-        {
-            "name": "Dr. Grace Kong",
-            "region": "North America",
-            "title": "Hematologist",
-            "experience_years": 10,
-            "city": "Toronto",
-            "country": "Canada",
-            "institution": "Princess Margaret Cancer Centre",
-            "specialties": ["Lymphoma and CLL", "Novel agents"],
-        },
-        {
-            "name": "Dr. Radhakrishnan V",
-            "region": "Asia-Pacific",
-            "title": "Hematologist",
-            "experience_years": 20,
-            "city": "Singapore",
-            "country": "Singapore",
-            "institution": "Mount Elizabeth Hospital",
-            "specialties": ["Lymphomas", "Stem cell transplant"],
-        },
-        {
-            "name": "Dr. Gunjan Shah",
-            "region": "Middle East",
-            "title": "Clinical Hematologist",
-            "experience_years": 15,
-            "city": "Dubai",
-            "country": "UAE",
-            "institution": "King's College Hospital Dubai",
-            "specialties": ["Lymphoma & Myeloma"],
-        },
-    ],
-    "Pancreatic Cancer": [
-        {
-            "name": "Dr. Shailesh V. Shrikhande",
-            "region": "India",
-            "title": "Chief of GI & HPB Surgery",
-            "experience_years": 20,
-            "city": "Mumbai",
-            "country": "India",
-            "institution": "Tata Memorial Hospital",
-            "specialties": ["Pancreatic Cancer Surgery", "Whipple procedures"],
-        },
-        {
-            "name": "Dr. Vivek Mangla",
-            "region": "India",
-            "title": "HPB and GI Surgeon",
-            "experience_years": 25,
-            "city": "New Delhi",
-            "country": "India",
-            "institution": "Max Super Speciality Hospital, Saket",
-            "specialties": ["Pancreaticoduodenectomy (Whipple)", "Minimally invasive pancreatic surgery"],
-        },
-        {
-            "name": "Dr. Anil Agarwal",
-            "region": "India",
-            "title": "Director of HPB Surgery",
-            "experience_years": 30,
-            "city": "New Delhi",
-            "country": "India",
-            "institution": "AIIMS New Delhi",
-            "specialties": ["Pancreatic & Biliary Surgery", "Complex pancreatic tumor surgeries"],
-        },
-        {
-            "name": "Dr. Syed A. Hussain",
-            "region": "India",
-            "title": "Senior Consultant Medical Oncologist",
-            "experience_years": 20,
-            "city": "Chennai",
-            "country": "India",
-            "institution": "Apollo Cancer Centre",
-            "specialties": ["Pancreatic Cancer Chemotherapy"],
-        },
-        {
-            "name": "Prof. Markus Büchler",
-            "region": "Europe",
-            "title": "Director, Department of Surgery",
-            "experience_years": 35,
-            "city": "Heidelberg",
-            "country": "Germany",
-            "institution": "University of Heidelberg",
-            "specialties": ["Pancreatic Surgery", "Pancreatic cancer surgery outcomes"],
-        },
-        {
-            "name": "Dr. William Jarnagin",
-            "region": "USA",
-            "title": "Chief of Hepatopancreatobiliary Surgery",
-            "experience_years": 25,
-            "city": "New York City",
-            "country": "USA",
-            "institution": "Memorial Sloan Kettering",
-            "specialties": ["Pancreatic and Liver Cancer Surgery", "Clinical trials"],
-        },
-        {
-            "name": "Dr. Robert Fine",
-            "region": "USA",
-            "title": "Gastrointestinal Medical Oncologist",
-            "experience_years": 30,
-            "city": "New York City",
-            "country": "USA",
-            "institution": "Columbia University Irving Medical Center",
-            "specialties": ["Pancreatic Cancer Oncology", "Chemo regimens"],
-        },
-        {
-            "name": "Dr. Dae-Won Koh",
-            "region": "Asia-Pacific",
-            "title": "HPB Surgeon",
-            "experience_years": 20,
-            "city": "Seoul",
-            "country": "South Korea",
-            "institution": "Asan Medical Center",
-            "specialties": ["Pancreatic Cancer Surgery"],
-        },
-        {
-            "name": "Dr. Uğur Yılmaz",
-            "region": "Europe",
-            "title": "HPB Surgeon",
-            "experience_years": 15,
-            "city": "Istanbul",
-            "country": "Turkey",
-            "institution": "Koç University Hospital",
-            "specialties": ["Pancreatic and Liver Surgery", "Pancreatic tumors"],
-        },
-        {
-            "name": "Dr. Prasit Witehira",
-            "region": "Asia-Pacific",
-            "title": "HPB Surgeon",
-            "experience_years": 25,
-            "city": "Bangkok",
-            "country": "Thailand",
-            "institution": "King Chulalongkorn Memorial Hospital",
-            "specialties": ["Pancreatic Surgery", "Whipple procedure"],
-        },
-    ],
-    "Thyroid Cancer": [
-        {
-            "name": "Dr. Ashok R. Shah",
-            "region": "India",
-            "title": "Surgical Oncologist",
-            "experience_years": 30,
-            "city": "Mumbai",
-            "country": "India",
-            "institution": "Hinduja Hospital",
-            "specialties": ["Endocrine Surgery", "Thyroid and parathyroid tumor surgeries"],
-        },
-        {
-            "name": "Dr. S. Vijaya",
-            "region": "India",
-            "title": "Professor of Endocrine Surgery",
-            "experience_years": 25,
-            "city": "New Delhi",
-            "country": "India",
-            "institution": "AIIMS",
-            "specialties": ["Thyroid Cancer Surgery", "Thyroidectomies", "Neck dissection"],
-        },
-        {
-            "name": "Dr. K. K. Handa",
-            "region": "India",
-            "title": "ENT and Head-Neck Surgeon",
-            "experience_years": 25,
-            "city": "Gurugram",
-            "country": "India",
-            "institution": "Medanta Hospital",
-            "specialties": ["Thyroid and Laryngeal Tumors", "Minimally invasive thyroidectomy"],
-        },
-        {
-            "name": "Dr. R. Michael Tuttle",
-            "region": "USA",
-            "title": "Endocrinologist",
-            "experience_years": 25,
-            "city": "New York City",
-            "country": "USA",
-            "institution": "Memorial Sloan Kettering",
-            "specialties": ["Thyroid Oncology", "Advanced thyroid cancers", "Systemic therapy"],
-        },
-        {
-            "name": "Dr. Gregory Randolph",
-            "region": "USA",
-            "title": "Thyroid Surgeon",
-            "experience_years": 30,
-            "city": "Boston",
-            "country": "USA",
-            "institution": "Massachusetts Eye and Ear Infirmary/Harvard Medical School",
-            "specialties": ["Thyroid and Parathyroid Surgery", "Nerve monitoring"],
-        },
-        {
-            "name": "Dr. Khalid Alzahrani",
-            "region": "Middle East",
-            "title": "Endocrinologist",
-            "experience_years": 20,
-            "city": "Riyadh",
-            "country": "Saudi Arabia",
-            "institution": "King Faisal Specialist Hospital",
-            "specialties": ["Thyroid Cancer", "Radioactive iodine therapy"],
-        },
-        {
-            "name": "Dr. Suguru Matsuo",
-            "region": "Asia-Pacific",
-            "title": "Head-Neck Surgeon",
-            "experience_years": 15,
-            "city": "Tokyo",
-            "country": "Japan",
-            "institution": "National Cancer Center Hospital",
-            "specialties": ["Thyroid and Salivary Gland Cancers", "Endoscopic thyroid surgeries"],
-        },
-        {
-            "name": "Dr. Markus Luster",
-            "region": "Europe",
-            "title": "Nuclear Medicine Physician",
-            "experience_years": 25,
-            "city": "Marburg",
-            "country": "Germany",
-            "institution": "University Hospital Marburg",
-            "specialties": ["Thyroid Cancer", "Radioiodine therapy"],
-        },
-        {
-            "name": "Dr. Aye Moe Thu",
-            "region": "Asia-Pacific",
-            "title": "Consultant Endocrine Surgeon",
-            "experience_years": 15,
-            "city": "Singapore",
-            "country": "Singapore",
-            "institution": "Mount Elizabeth Novena",
-            "specialties": ["Thyroid Cancer Surgery", "Robotic and scarless thyroidectomy"],
-        },
-        {
-            "name": "Dr. Charatsee Mongkolwat",
-            "region": "Asia-Pacific",
-            "title": "Endocrinologist",
-            "experience_years": 20,
-            "city": "Bangkok",
-            "country": "Thailand",
-            "institution": "Siriraj Hospital",
-            "specialties": ["Thyroid nodules and cancer management"],
-        },
-    ],
-    "Bladder Cancer": [
-        {
-            "name": "Dr. S. V. Kotwal",
-            "region": "India",
-            "title": "Senior Urologist",
-            "experience_years": 35,
-            "city": "New Delhi",
-            "country": "India",
-            "institution": "Sir Ganga Ram Hospital",
-            "specialties": ["Urologic Oncology", "Radical cystectomy"],
-        },
-        {
-            "name": "Dr. Shrinivas Narayan",
-            "region": "India",
-            "title": "Urologic Oncologist",
-            "experience_years": 20,
-            "city": "Mumbai",
-            "country": "India",
-            "institution": "Kokilaben Dhirubhai Ambani Hospital",
-            "specialties": ["Bladder and Kidney Cancer Surgery", "Robotic cystectomy", "Neobladder reconstruction"],
-        },
-        {
-            "name": "Dr. Narmada P Gupta",
-            "region": "India",
-            "title": "Urologic Surgeon",
-            "experience_years": 45,
-            "city": "Gurugram",
-            "country": "India",
-            "institution": "FMRI Gurgaon",
-            "specialties": ["Uro-Oncology", "Bladder and prostate cancer surgeries"],
-        },
-        {
-            "name": "Dr. Ashish Kamat",
-            "region": "USA",
-            "title": "Professor of Urologic Oncology",
-            "experience_years": 25,
-            "city": "Houston",
-            "country": "USA",
-            "institution": "MD Anderson Cancer Center",
-            "specialties": ["Bladder Cancer", "Immunotherapy"],
-        },
-        {
-            "name": "Dr. Gary Steinberg",
-            "region": "USA",
-            "title": "Director of Bladder Cancer Program",
-            "experience_years": 30,
-            "city": "New York City",
-            "country": "USA",
-            "institution": "Perlmutter Cancer Center, NYU Langone",
-            "specialties": ["Bladder Cancer Surgery", "Nerve-sparing radical cystectomy", "Bladder preservation"],
-        },
-        {
-            "name": "Dr. Peter Hoskin",
-            "region": "Europe",
-            "title": "Consultant Oncologist",
-            "experience_years": 35,
-            "city": "London",
-            "country": "United Kingdom",
-            "institution": "Mount Vernon Cancer Centre",
-            "specialties": ["Bladder Cancer Radiotherapy", "Bladder brachytherapy"],
-        },
-        {
-            "name": "Dr. Mahesh S",
-            "region": "India",
-            "title": "Urologist",
-            "experience_years": 20,
-            "city": "Chennai",
-            "country": "India",
-            "institution": "Apollo Hospital",
-            "specialties": ["Endoscopic management of bladder tumors", "Radical surgery"],
-        },
-        {
-            "name": "Dr. Yair Lotan",
-            "region": "USA",
-            "title": "Professor of Urology",
-            "experience_years": 20,
-            "city": "Dallas",
-            "country": "USA",
-            "institution": "UT Southwestern Medical Center",
-            "specialties": ["Bladder Cancer", "Biomarkers", "Non-invasive detection"],
-        },
-        {
-            "name": "Dr. Teoman Tapan",
-            "region": "Europe",
-            "title": "Urologic Surgeon",
-            "experience_years": 15,
-            "city": "Istanbul",
-            "country": "Turkey",
-            "institution": "Acibadem Maslak Hospital",
-            "specialties": ["Bladder and Prostate Cancer Surgery", "Robotic cystectomy"],
-        },
-        {
-            "name": "Dr. Chartchai Rattanatran",
-            "region": "Asia-Pacific",
-            "title": "Urologic Oncologist",
-            "experience_years": 25,
-            "city": "Bangkok",
-            "country": "Thailand",
-            "institution": "Bumrungrad International",
-            "specialties": ["Bladder Cancer Treatment", "Surgery", "Intravesical therapies"],
-        },
-    ],
-    "Brain Tumors (High-Grade Gliomas)": [
-        {
-            "name": "Dr. Basant Misra",
-            "region": "India",
-            "title": "Chairman of Neurosurgery",
-            "experience_years": 35,
-            "city": "Mumbai",
-            "country": "India",
-            "institution": "Hinduja Hospital",
-            "specialties": ["Neuro-Oncology Surgery", "Brain tumor microsurgery", "Gamma Knife"],
-        },
-        {
-            "name": "Dr. S. K. Sogani",
-            "region": "India",
-            "title": "Senior Neurosurgeon",
-            "experience_years": 40,
-            "city": "New Delhi",
-            "country": "India",
-            "institution": "Indraprastha Apollo Hospital",
-            "specialties": ["Brain Tumor Surgery", "Skull base tumors"],
-        },
-        {
-            "name": "Dr. Allegheny L. Ramos",
-            "region": "USA",
-            "title": "Professor of Neuro-Oncology",
-            "experience_years": 20,
-            "city": "Houston",
-            "country": "USA",
-            "institution": "MD Anderson Cancer Center",
-            "specialties": ["Medical Neuro-Oncology", "Glioblastoma chemotherapies"],
-        },
-        {
-            "name": "Dr. Mark Gilbert",
-            "region": "USA",
-            "title": "Chief of Neuro-Oncology Branch",
-            "experience_years": 30,
-            "city": "Bethesda",
-            "country": "USA",
-            "institution": "NCI/NIH",
-            "specialties": ["Brain Cancer", "Clinical trials for gliomas"],
-        },
-        {
-            "name": "Prof. Roger Stupp",
-            "region": "Europe",
-            "title": "Chairman of Oncology",
-            "experience_years": 30,
-            "city": "Zürich",
-            "country": "Switzerland",
-            "institution": "University of Zurich Hospital",
-            "specialties": ["Neuro-Oncology", "Stupp protocol for glioblastoma"],
-        },
-        {
-            "name": "Dr. Zulma Tovar-Spinoza",
-            "region": "USA",
-            "title": "Neurosurgeon",
-            "experience_years": 25,
-            "city": "Syracuse",
-            "country": "USA",
-            "institution": "SUNY Upstate Medical University",
-            "specialties": ["Pediatric Brain Tumor Surgery", "Laser Ablation"],
-        },
-        {
-            "name": "Dr. Tetsuya Tsuboi",
-            "region": "Asia-Pacific",
-            "title": "Neurosurgeon",
-            "experience_years": 15,
-            "city": "Tokyo",
-            "country": "Japan",
-            "institution": "National Cancer Center Hospital",
-            "specialties": ["Brain and Skull Base Tumors", "Minimally invasive endoscopic tumor resections"],
-        },
-        {
-            "name": "Dr. Ampornkit Jirayarojanakorn",
-            "region": "Asia-Pacific",
-            "title": "Neuro-Oncologist",
-            "experience_years": 20,
-            "city": "Bangkok",
-            "country": "Thailand",
-            "institution": "King Chulalongkorn Memorial Hospital",
-            "specialties": ["Brain Tumor Chemotherapy & Care", "High-grade gliomas", "CNS lymphomas"],
-        },
-        {
-            "name": "Dr. Emel Çınarlı",
-            "region": "Europe",
-            "title": "Radiation Oncologist",
-            "experience_years": 15,
-            "city": "Istanbul",
-            "country": "Turkey",
-            "institution": "Anadolu Medical Center",
-            "specialties": ["Stereotactic Radiosurgery for Brain Tumors", "Gamma Knife", "CyberKnife"],
-        },
-        {
-            "name": "Dr. Øyvind Salvesen",
-            "region": "Europe",
-            "title": "Neurosurgeon",
-            "experience_years": 25,
-            "city": "Oslo",
-            "country": "Norway",
-            "institution": "Oslo University Hospital – Rikshospitalet",
-            "specialties": ["Neuro-Oncology Surgery", "Gliomas", "Metastatic brain tumors"],
-        },
-    ],
-    "Melanoma": [
-        {
-            "name": "Dr. S. Vidyasagar",
-            "region": "India",
-            "title": "Senior Consultant Dermatologist & Oncologist",
-            "experience_years": 30,
-            "city": "Chennai",
-            "country": "India",
-            "institution": "Adyar Cancer Institute",
-            "specialties": ["Melanoma", "Skin cancers", "Surgery", "Immunotherapy"],
-        },
-        {
-            "name": "Dr. Devendra Gupta",
-            "region": "India",
-            "title": "Surgical Oncologist",
-            "experience_years": 20,
-            "city": "New Delhi",
-            "country": "India",
-            "institution": "RGCI&RC",
-            "specialties": ["Surgical Oncology", "Melanomas", "Advanced skin cancers", "Sentinel node biopsies"],
-        },
-        {
-            "name": "Dr. Reinhard Dummer",
-            "region": "Europe",
-            "title": "Vice-Chair of Dermatology",
-            "experience_years": 30,
-            "city": "Zürich",
-            "country": "Switzerland",
-            "institution": "University Hospital Zürich",
-            "specialties": ["Melanoma Oncology", "Targeted therapy"],
-        },
-        {
-            "name": "Dr. Jedd Wolchok",
-            "region": "USA",
-            "title": "Medical Oncologist",
-            "experience_years": 25,
-            "city": "New York City",
-            "country": "USA",
-            "institution": "MSKCC (now at Weill Cornell)",
-            "specialties": ["Melanoma Immunotherapy", "CTLA-4 checkpoint inhibitor trials"],
-        },
-        {
-            "name": "Dr. John M. Kirkwood",
-            "region": "USA",
-            "title": "Professor of Medicine",
-            "experience_years": 40,
-            "city": "Pittsburgh",
-            "country": "USA",
-            "institution": "UPMC Hillman Cancer Center",
-            "specialties": ["Melanoma", "Interferon", "Immunotherapy development"],
-        },
-        {
-            "name": "Dr. Caroline Robert",
-            "region": "Europe",
-            "title": "Head of Dermatology",
-            "experience_years": 25,
-            "city": "Paris",
-            "country": "France",
-            "institution": "Gustave Roussy Institute",
-            "specialties": ["Melanoma", "Novel melanoma therapies", "EORTC trials"],
-        },
-        {
-            "name": "Dr. Georgina Long",
-            "region": "Asia-Pacific",
-            "title": "Co-Medical Director",
-            "experience_years": 20,
-            "city": "Sydney",
-            "country": "Australia",
-            "institution": "Melanoma Institute Australia",
-            "specialties": ["Melanoma Medical Oncology", "Targeted therapy trials"],
-        },
-        {
-            "name": "Dr. Ahmed Al Qurashi",
-            "region": "Middle East",
-            "title": "Consultant Oncologist",
-            "experience_years": 15,
-            "city": "Amman",
-            "country": "Jordan",
-            "institution": "King Hussein Cancer Center",
-            "specialties": ["Melanoma & Sarcoma", "Advanced melanoma", "Immunotherapies"],
-        },
-        {
-            "name": "Dr. Porntip Kanjanawan",
-            "region": "Asia-Pacific",
-            "title": "Dermato-oncologist",
-            "experience_years": 15,
-            "city": "Bangkok",
-            "country": "Thailand",
-            "institution": "Bangkok Hospital",
-            "specialties": ["Skin Cancer", "Melanoma", "Non-melanoma skin cancers"],
-        },
-        {
-            "name": "Dr. Naheed Ridolfi",
-            "region": "Middle East",
-            "title": "Dermatologist",
-            "experience_years": 20,
-            "city": "Abu Dhabi",
-            "country": "UAE",
-            "institution": "Cleveland Clinic Abu Dhabi",
-            "specialties": ["Skin Oncology", "Melanoma", "Complex skin cancers"],
-        },
-    ],
-    "Uterine Cancer": [
-        {
-            "name": "Dr. Dennis S. Chi",
-            "region": "USA",
-            "title": "Gynecologic Surgeon",
-            "experience_years": 25,
-            "city": "New York City",
-            "country": "USA",
-            "institution": "Memorial Sloan Kettering Cancer Center (MSK)",
-            "specialties": ["Gynecologic Surgery", "Uterine/Endometrial Cancer"],
-        },
-        {
-            "name": "Dr. Vicky Makker",
-            "region": "USA",
-            "title": "Gynecologic Medical Oncologist",
-            "experience_years": 20,
-            "city": "New York City",
-            "country": "USA",
-            "institution": "Memorial Sloan Kettering Cancer Center",
-            "specialties": ["Gynecologic Medical Oncology", "Endometrial cancer"],
-        },
-        {
-            "name": "Dr. Patricia Pautier",
-            "region": "Europe",
-            "title": "Medical Oncologist",
-            "experience_years": 25,
-            "city": "Paris",
-            "country": "France",
-            "institution": "Gustave Roussy, Villejuif",
-            "specialties": ["Medical Oncology", "Uterine & rare gyn tumors"],
-        },
-        {
-            "name": "Prof. Alexandra Leary",
-            "region": "Europe",
-            "title": "Gynecologic Oncologist",
-            "experience_years": 20,
-            "city": "Paris",
-            "country": "France",
-            "institution": "Gustave Roussy",
-            "specialties": ["Gynaecologic cancers"],
-        },
-        {
-            "name": "Dr. Chay Wen Yee",
-            "region": "Asia-Pacific",
-            "title": "Gynecologic Oncologist",
-            "experience_years": 20,
-            "city": "Singapore",
-            "country": "Singapore",
-            "institution": "National Cancer Centre Singapore (NCCS)",
-            "specialties": ["Gynecologic cancers"],
-        },
-        {
-            "name": "Dr. Jack Chan Junjie",
-            "region": "Asia-Pacific",
-            "title": "Gynecologic Oncologist",
-            "experience_years": 18,
-            "city": "Singapore",
-            "country": "Singapore",
-            "institution": "National Cancer Centre Singapore (NCCS)",
-            "specialties": ["Gynecologic cancers"],
-        },
-        {
-            "name": "Dr. Soh Lay Tin",
-            "region": "Asia-Pacific",
-            "title": "Medical Oncologist",
-            "experience_years": 30,
-            "city": "Singapore",
-            "country": "Singapore",
-            "institution": "National Cancer Centre Singapore (NCCS)",
-            "specialties": ["Medical Oncology", "Gynecologic cancers"],
-        },
-    ],
-    "Kidney Cancer": [
-        {
-            "name": "Dr. Srikala Sridhar",
-            "region": "North America",
-            "title": "Medical Oncology Lead",
-            "experience_years": 20,
-            "city": "Toronto",
-            "country": "Canada",
-            "institution": "Princess Margaret Cancer Centre",
-            "specialties": ["Medical Oncology", "Kidney Cancer", "Genitourinary cancers"],
-        },
-        {
-            "name": "Dr. Keith Lawson",
-            "region": "North America",
-            "title": "Urologic Surgeon/Scientist",
-            "experience_years": 25,
-            "city": "Toronto",
-            "country": "Canada",
-            "institution": "Princess Margaret Cancer Centre",
-            "specialties": ["Urologic Surgery", "Kidney Cancer"],
-        },
-    ],
-    "Esophageal Cancer": [
-        {
-            "name": "Dr. Jaffer A. Ajani",
-            "region": "USA",
-            "title": "GI Medical Oncologist",
-            "experience_years": 30,
-            "city": "Houston",
-            "country": "USA",
-            "institution": "MD Anderson Cancer Center",
-            "specialties": ["GI Medical Oncology", "Esophageal Cancer"],
-        },
-        {
-            "name": "Dr. Wayne Hofstetter",
-            "region": "USA",
-            "title": "Thoracic Surgeon",
-            "experience_years": 25,
-            "city": "Houston",
-            "country": "USA",
-            "institution": "MD Anderson Cancer Center",
-            "specialties": ["Thoracic Surgery", "Esophageal Cancer"],
-        },
-    ],
-    "Multiple Myeloma": [
-        {
-            "name": "Dr. Paul G. Richardson",
-            "region": "USA",
-            "title": "Medical Oncologist",
-            "experience_years": 30,
-            "city": "Boston",
-            "country": "USA",
-            "institution": "Dana-Farber Cancer Institute",
-            "specialties": ["Multiple Myeloma"],
-        },
-        {
-            "name": "Dr. Nikhil C. Munshi",
-            "region": "USA",
-            "title": "Medical Oncologist",
-            "experience_years": 35,
-            "city": "Boston",
-            "country": "USA",
-            "institution": "Dana-Farber Cancer Institute",
-            "specialties": ["Multiple Myeloma"],
-        },
-        {
-            "name": "Dr. Omar Nadeem",
-            "region": "USA",
-            "title": "Medical Oncologist",
-            "experience_years": 15,
-            "city": "Boston",
-            "country": "USA",
-            "institution": "Dana-Farber Cancer Institute",
-            "specialties": ["Multiple Myeloma"],
-        },
-        {
-            "name": "Dr. Adam Sperling",
-            "region": "USA",
-            "title": "Medical Oncologist",
-            "experience_years": 12,
-            "city": "Boston",
-            "country": "USA",
-            "institution": "Dana-Farber Cancer Institute",
-            "specialties": ["Multiple Myeloma"],
-        },
-        {
-            "name": "Dr. Ashish Vijay Bakshi",
-            "region": "India",
-            "title": "Medical Oncologist",
-            "experience_years": 30,
-            "city": "Mumbai",
-            "country": "India",
-            "institution": "Tata Memorial Hospital",
-            "specialties": ["Medical Oncology", "Blood cancers", "Multiple Myeloma"],
-        },
-        {
-            "name": "Dr. Samar Kulkarni",
-            "region": "Europe",
-            "title": "Consultant Haematologist",
-            "experience_years": 20,
-            "city": "Manchester",
-            "country": "United Kingdom",
-            "institution": "The Christie",
-            "specialties": ["Haematology", "Multiple Myeloma"],
-        },
-        {
-            "name": "Dr. Ahmed Abdulgawad",
-            "region": "Europe",
-            "title": "Haematology Consultant",
-            "experience_years": 15,
-            "city": "Manchester",
-            "country": "United Kingdom",
-            "institution": "The Christie",
-            "specialties": ["Haematology", "Multiple Myeloma"],
-        },
-    ],
-    "Testicular Cancer": [
-        {
-            "name": "Princess Margaret Genitourinary Site Group",
-            "region": "North America",
-            "title": "Genitourinary Oncology Program",
-            "experience_years": 30,
-            "city": "Toronto",
-            "country": "Canada",
-            "institution": "Princess Margaret Cancer Centre / University Health Network",
-            "specialties": ["Genitourinary Oncology", "Testicular Cancer", "Kidney Cancer"],
-        },
-    ],
-}
 
+__getattr__ = lazy_seed_module(globals(), Path(__file__).with_suffix(".json"), __all__, _derive)
@@ -2,19 +2,126 @@
 Business logic for Rare Cancers API
 """
 from typing import List, Optional, Dict, Any
-from .seed_data import RARE_CANCERS, ALL_CANCERS, RARE_CANCER_DETAILS, RARE_CANCER_SPECIALISTS, COMMON_CANCER_SPECIALISTS
-import uuid
+from . import seed_data
+from .search_index import SearchIndex, SearchResults, SubstringIndex
+from catalog import stable_id
+from functools import cached_property, lru_cache
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Bound on remembered fuzzy (partial-match) name resolutions
+FUZZY_RESOLUTION_MEMO_SIZE = 512
 
 
 class RareCancersService:
     """Service class for rare cancer-related operations"""
     
-    def __init__(self):
-        self.rare_cancers = RARE_CANCERS
-        self.all_cancers = ALL_CANCERS
-        self.rare_cancer_details = RARE_CANCER_DETAILS
-        self.rare_cancer_specialists = RARE_CANCER_SPECIALISTS
-        self.common_cancer_specialists = COMMON_CANCER_SPECIALISTS
+    # Seed catalogs and the indexes over them are loaded on first use,
+    # not when the router is created at startup
+    @property
+    def rare_cancers(self) -> List[Dict[str, Any]]:
+        return seed_data.RARE_CANCERS
+    
+    @property
+    def all_cancers(self) -> List[Dict[str, Any]]:
+        return seed_data.ALL_CANCERS
+    
+    @property
+    def rare_cancer_details(self) -> Dict[str, Dict[str, Any]]:
+        return seed_data.RARE_CANCER_DETAILS
+    
+    @property
+    def rare_cancer_specialists(self) -> Dict[str, List[Dict[str, Any]]]:
+        return seed_data.RARE_CANCER_SPECIALISTS
+    
+    @property
+    def common_cancer_specialists(self) -> Dict[str, List[Dict[str, Any]]]:
+        return seed_data.COMMON_CANCER_SPECIALISTS
+    
+    @cached_property
+    def all_specialists(self) -> Dict[str, List[Dict[str, Any]]]:
+        """Combined map (common entries win on duplicate names, as before)"""
+        return {**self.rare_cancer_specialists, **self.common_cancer_specialists}
+    
+    @cached_property
+    def specialist_aliases(self) -> Dict[str, str]:
+        """Normalized cancer name -> canonical specialists key (first key wins)"""
+        aliases: Dict[str, str] = {}
+        for key in self.all_specialists:
+            aliases.setdefault(key.lower().strip(), key)
+        return aliases
+    
+    @cached_property
+    def _resolve_fuzzy(self):
+        return lru_cache(maxsize=FUZZY_RESOLUTION_MEMO_SIZE)(self._match_partial)
+    
+    def _match_partial(self, normalized_name: str) -> Optional[str]:
+        """First specialists key that contains, or is contained in, the name"""
+        for key in self.all_specialists:
+            key_lower = key.lower().strip()
+            if normalized_name in key_lower or key_lower in normalized_name:
+                return key
+        return None
+    
+    def resolve_specialists_key(self, cancer_name: str) -> Optional[str]:
+        """
+        Map a cancer name to its key in the specialists map:
+        exact name, then normalized alias, then (memoized) partial match.
+        """
+        if cancer_name in self.all_specialists:
+            return cancer_name
+        normalized = cancer_name.lower().strip()
+        key = self.specialist_aliases.get(normalized)
+        if key is not None:
+            return key
+        return self._resolve_fuzzy(normalized)
+    
+    @cached_property
+    def cancer_search(self) -> SearchIndex:
+        """Full-text index over rare cancers"""
+        return SearchIndex(
+            self.rare_cancers,
+            {
+                "name": (None, 3.0),
+                "type": (None, 2.0),
+                "description": (lambda c: self.rare_cancer_details.get(c.get("name", ""), {}).get("description"), 1.0),
+                "symptoms": (lambda c: self.rare_cancer_details.get(c.get("name", ""), {}).get("symptoms"), 0.5),
+            },
+            # Everything the old name/type "contains" search found
+            substring_fields=("name", "type"),
+        )
+    
+    @cached_property
+    def specialist_entries(self) -> List[Dict[str, Any]]:
+        """Flattened specialists (rare and common), in the order get_all_specialists returns them"""
+        return [
+            {**doc, "cancer_name": cancer}
+            for cancer, specialists in self.all_specialists.items()
+            for doc in specialists
+        ]
+    
+    @cached_property
+    def specialist_search(self) -> SearchIndex:
+        """Full-text index over specialists"""
+        return SearchIndex(
+            self.specialist_entries,
+            {
+                "name": (None, 3.0),
+                "institution": (None, 1.0),
+                "specialties": (None, 1.5),
+                "cancer_name": (None, 1.5),
+                "title": (None, 0.5),
+            },
+        )
+    
+    @cached_property
+    def _specialist_names(self) -> SubstringIndex:
+        return SubstringIndex(e.get("name", "") for e in self.specialist_entries)
+    
+    @cached_property
+    def _specialist_cancers(self) -> SubstringIndex:
+        return SubstringIndex(e["cancer_name"] for e in self.specialist_entries)
     
     def get_all_rare_cancers(
         self,
@@ -33,7 +140,7 @@ class RareCancersService:
         result = []
         for cancer in cancers:
             cancer_data = {
-                "id": str(uuid.uuid4()),
+                "id": stable_id("cancer", cancer.get("name", "")),
                 "name": cancer.get("name", ""),
                 "category": cancer.get("category", "rare"),
                 "type": cancer.get("type", ""),
@@ -62,7 +169,7 @@ class RareCancersService:
         details = self.rare_cancer_details.get(cancer_name, {})
         
         return {
-            "id": str(uuid.uuid4()),
+            "id": stable_id("cancer", cancer.get("name", "")),
             "name": cancer.get("name", ""),
             "category": cancer.get("category", "rare"),
             "type": cancer.get("type", ""),
@@ -102,40 +209,11 @@ class RareCancersService:
 
     def get_specialists_for_cancer(self, cancer_name: str) -> List[Dict[str, Any]]:
         """Return specialists mapped to a specific cancer name (rare or common)."""
-        import logging
-        logger = logging.getLogger(__name__)
-        
-        logger.info(f"Looking for specialists for: '{cancer_name}'")
-        
-        # Combine both rare and common cancer specialists dictionaries
-        all_specialists = {**self.rare_cancer_specialists, **self.common_cancer_specialists}
-        
-        logger.info(f"Available cancer types in specialists dict: {list(all_specialists.keys())[:5]}...")
-        
-        # Try exact match first
-        if cancer_name in all_specialists:
-            result = all_specialists[cancer_name]
-            logger.info(f"Found {len(result)} specialists with exact match")
-            return result
-        
-        # Try case-insensitive match
-        cancer_name_lower = cancer_name.lower().strip()
-        for key in all_specialists.keys():
-            if key.lower().strip() == cancer_name_lower:
-                result = all_specialists[key]
-                logger.info(f"Found {len(result)} specialists with case-insensitive match: '{key}'")
-                return result
-        
-        # Try partial match (in case of slight variations)
-        for key in all_specialists.keys():
-            key_lower = key.lower().strip()
-            if cancer_name_lower in key_lower or key_lower in cancer_name_lower:
-                result = all_specialists[key]
-                logger.info(f"Found {len(result)} specialists with partial match: '{key}'")
-                return result
-        
-        logger.warning(f"No specialists found for: '{cancer_name}'")
-        return []
+        key = self.resolve_specialists_key(cancer_name)
+        if key is None:
+            logger.debug(f"No specialists found for: '{cancer_name}'")
+            return []
+        return self.all_specialists[key]
 
     def get_all_specialists(
         self,
@@ -143,55 +221,60 @@ class RareCancersService:
         cancer_name: Optional[str] = None,
         region: Optional[str] = None,
         min_experience: Optional[int] = None,
+        query: Optional[str] = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
     ) -> List[Dict[str, Any]]:
         """
         Flatten all cancer specialists (rare and common) into a single list.
-        Supports light filtering for the Find Oncologists page.
+        Supports light filtering for the Find Oncologists page; name and
+        cancer_name are "contains" filters answered from trigram indexes.
+        With query, matches are ranked by full-text relevance instead of
+        catalog order.
         """
-        results: List[Dict[str, Any]] = []
-        name_q = name.lower() if name else None
-        cancer_q = cancer_name.lower() if cancer_name else None
-        region_q = region.lower() if region else None
-
-        # Combine both rare and common cancer specialists
-        all_specialists = {**self.rare_cancer_specialists, **self.common_cancer_specialists}
+        positions = None
+        if name:
+            positions = self._specialist_names.matches(name)
+        if cancer_name:
+            cancer_matches = self._specialist_cancers.matches(cancer_name)
+            positions = cancer_matches if positions is None else positions & cancer_matches
+        if region or min_experience is not None:
+            region_q = region.lower() if region else None
+            candidates = range(len(self.specialist_entries)) if positions is None else positions
+            positions = {
+                p for p in candidates
+                if (not region_q or region_q == self.specialist_entries[p].get("region", "").lower())
+                and (min_experience is None or self.specialist_entries[p].get("experience_years", 0) >= min_experience)
+            }
 
-        for cancer, specialists in all_specialists.items():
-            for doc in specialists:
-                entry = {
-                    **doc,
-                    "cancer_name": cancer,
-                }
-                if name_q and name_q not in doc.get("name", "").lower():
-                    continue
-                if cancer_q and cancer_q not in cancer.lower():
-                    continue
-                if region_q and region_q != doc.get("region", "").lower():
-                    continue
-                if min_experience is not None and doc.get("experience_years", 0) < min_experience:
-                    continue
-                results.append(entry)
+        if query:
+            return self.specialist_search.search(query, limit=limit, offset=offset, allowed=positions).items
 
-        return results
+        if positions is None:
+            results = self.specialist_entries
+        else:
+            results = [self.specialist_entries[p] for p in sorted(positions)]
+        end = None if limit is None else offset + limit
+        return results[offset:end]
     
     def get_cancers_by_category(self, category: str) -> List[Dict[str, Any]]:
         """Get all cancers in a specific category"""
         return self.get_all_rare_cancers(category=category)
     
-    def search_rare_cancers(self, query: str) -> List[Dict[str, Any]]:
-        """Search rare cancers by name or type"""
-        query_lower = query.lower()
-        results = []
-        
-        for cancer in self.rare_cancers:
-            if (query_lower in cancer.get("name", "").lower() or 
-                query_lower in cancer.get("type", "").lower()):
-                results.append({
-                    "id": str(uuid.uuid4()),
-                    "name": cancer.get("name", ""),
-                    "category": cancer.get("category", "rare"),
-                    "type": cancer.get("type", "")
-                })
-        
-        return results
-
+    def search_rare_cancers(self, query: str, limit: Optional[int] = None, offset: int = 0) -> SearchResults:
+        """
+        Full-text search over rare cancer name, type, description and symptoms.
+        Results are ranked (BM25F) and tolerate prefixes, partial words and
+        small typos; every name or type containing the query is included.
+        """
+        results = self.cancer_search.search(query, limit=limit, offset=offset)
+        items = [
+            {
+                "id": stable_id("cancer", cancer.get("name", "")),
+                "name": cancer.get("name", ""),
+                "category": cancer.get("category", "rare"),
+                "type": cancer.get("type", "")
+            }
+            for cancer in results.items
+        ]
+        return SearchResults(items, results.total)
@@ -0,0 +1,136 @@
+"""
+In-process response cache for read endpoints over static seed data
+Stores pre-serialized JSON bodies keyed on route + normalized query params
+and evicts least-recently-used entries to stay within a byte budget.
+The seed catalogs ship with the build and are never reloaded in-process,
+so entries stay valid for the life of the process; a deploy starts empty.
+"""
+import os
+import logging
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from http_cache import CachedBody
+
+logger = logging.getLogger(__name__)
+
+CacheKey = Tuple[str, Tuple[Tuple[str, str], ...]]
+
+# Default byte budget for cached bodies (override with RESPONSE_CACHE_MAX_BYTES)
+DEFAULT_MAX_BYTES = 16 * 1024 * 1024
+
+
+def normalize_params(params: Optional[Dict[str, Any]]) -> Tuple[Tuple[str, str], ...]:
+    """Drop unset params and sort the rest so equivalent queries share a key"""
+    if not params:
+        return ()
+    return tuple(sorted((name, str(value)) for name, value in params.items() if value is not None))
+
+
+class ResponseCache:
+    """
+    LRU of CachedBody entries bounded by total body size.
+    Tracks hits/misses per route for the metrics endpoint.
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[CacheKey, CachedBody]" = OrderedDict()
+        self._bytes = 0
+        self._route_stats: Dict[str, Dict[str, int]] = {}
+        self.evictions = 0
+        self.invalidations = 0
+
+    def _stats(self, route: str) -> Dict[str, int]:
+        stats = self._route_stats.get(route)
+        if stats is None:
+            stats = self._route_stats[route] = {"hits": 0, "misses": 0}
+        return stats
+
+    def get(self, route: str, params: Optional[Dict[str, Any]] = None) -> Optional[CachedBody]:
+        """Cached body for route+params, or None (counts as a miss)"""
+        key = (route, normalize_params(params))
+        cached = self._entries.get(key)
+        stats = self._stats(route)
+        if cached is None:
+            stats["misses"] += 1
+            return None
+        self._entries.move_to_end(key)
+        stats["hits"] += 1
+        return cached
+
+    def put(self, route: str, params: Optional[Dict[str, Any]], cached: CachedBody) -> CachedBody:
+        """Store a body, evicting least-recently-used entries past the byte budget"""
+        size = len(cached)
+        if size > self.max_bytes:
+            # Larger than the whole budget - serve it, don't keep it
+            return cached
+        key = (route, normalize_params(params))
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self._bytes -= len(previous)
+        self._entries[key] = cached
+        self._bytes += size
+        while self._bytes > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self._bytes -= len(evicted)
+            self.evictions += 1
+        return cached
+
+    def get_or_build(
+        self,
+        route: str,
+        params: Optional[Dict[str, Any]],
+        builder: Callable[[], Any],
+    ) -> CachedBody:
+        """Return the cached body, or build the payload, serialize it once and cache it"""
+        cached = self.get(route, params)
+        if cached is not None:
+            return cached
+        return self.put(route, params, CachedBody.from_payload(builder()))
+
+    def clear(self):
+        """Explicitly invalidate every entry"""
+        self._entries.clear()
+        self._bytes = 0
+        self.invalidations += 1
+
+    def metrics(self) -> Dict[str, Any]:
+        """Per-route hit/miss counters plus global size figures"""
+        entries_per_route: Dict[str, int] = {}
+        bytes_per_route: Dict[str, int] = {}
+        for (route, _), cached in self._entries.items():
+            entries_per_route[route] = entries_per_route.get(route, 0) + 1
+            bytes_per_route[route] = bytes_per_route.get(route, 0) + len(cached)
+
+        routes = {}
+        for route, stats in sorted(self._route_stats.items()):
+            lookups = stats["hits"] + stats["misses"]
+            routes[route] = {
+                "hits": stats["hits"],
+                "misses": stats["misses"],
+                "hit_rate": round(stats["hits"] / lookups, 4) if lookups else 0.0,
+                "entries": entries_per_route.get(route, 0),
+                "bytes": bytes_per_route.get(route, 0),
+            }
+
+        return {
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "max_bytes": self.max_bytes,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+            "routes": routes,
+        }
+
+
+def _max_bytes_from_env() -> int:
+    try:
+        return int(os.environ.get("RESPONSE_CACHE_MAX_BYTES", "").strip() or DEFAULT_MAX_BYTES)
+    except ValueError:
+        logger.warning("Invalid RESPONSE_CACHE_MAX_BYTES, using default")
+        return DEFAULT_MAX_BYTES
+
+
+# Global cache instance for seed-catalog read endpoints
+response_cache = ResponseCache(max_bytes=_max_bytes_from_env())
@@ -0,0 +1,53 @@
+"""
+Lazy loading of JSON seed catalogs
+Seed modules expose their catalogs through a PEP 562 module __getattr__, so
+importing them is cheap and the JSON is parsed on first attribute access.
+"""
+import json
+import logging
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Optional
+
+logger = logging.getLogger(__name__)
+
+# module name -> milliseconds spent parsing its catalog (for the startup profile)
+LOAD_TIMINGS: Dict[str, float] = {}
+
+
+def lazy_seed_module(
+    module_globals: Dict[str, Any],
+    data_file: Path,
+    exported: Iterable[str],
+    derive: Optional[Callable[[Dict[str, Any]], None]] = None,
+) -> Callable[[str], Any]:
+    """
+    Build a module __getattr__ that loads data_file into module_globals the
+    first time one of the exported names is read. derive can add computed
+    names to the loaded dict before it is published.
+    """
+    exported = frozenset(exported)
+    module_name = module_globals["__name__"]
+    lock = threading.Lock()
+
+    def load():
+        with lock:
+            if module_name in LOAD_TIMINGS:
+                return
+            start = time.perf_counter()
+            with open(data_file, encoding="utf-8") as f:
+                data = json.load(f)
+            if derive:
+                derive(data)
+            module_globals.update(data)
+            LOAD_TIMINGS[module_name] = round((time.perf_counter() - start) * 1000, 2)
+            logger.info(f"Loaded seed catalog {data_file.name} in {LOAD_TIMINGS[module_name]} ms")
+
+    def __getattr__(name: str) -> Any:
+        if name in exported:
+            load()
+            return module_globals[name]
+        raise AttributeError(f"module {module_name!r} has no attribute {name!r}")
+
+    return __getattr__
@@ -15,6 +15,8 @@ import uuid
 from datetime import datetime, timezone
 import asyncio
 import time
+from contextlib import contextmanager
+from functools import lru_cache
 
 # ======================================
 # Logging Configuration
@@ -160,14 +162,30 @@ _backend_dir = Path(__file__).parent.absolute()
 if str(_backend_dir) not in sys.path:
     sys.path.insert(0, str(_backend_dir))
 
-from data_seed import (
-    HOSPITALS,
-    DOCTORS,
-    ALL_CANCERS,
-    RARE_CANCERS,
-    COMMON_CANCERS,
-    CITIES,
-)
+# ======================================
+# Startup Import Profiler
+# ======================================
+# section name -> milliseconds spent importing/creating it at startup
+STARTUP_IMPORT_TIMINGS: Dict[str, float] = {}
+
+
+@contextmanager
+def profile_startup(section: str):
+    """Record how long a startup section (e.g. a router import) takes"""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        STARTUP_IMPORT_TIMINGS[section] = round((time.perf_counter() - start) * 1000, 2)
+
+
+# Seed catalogs load on first attribute access (see seed_loader.py)
+import data_seed
+import seed_loader
+from catalog import get_hospital_index, get_doctor_index, get_hospitals_by_id, stable_id
+import catalog
+from http_cache import CachedBody, cached_json_response
+from response_cache import response_cache
 
 # ======================================
 # MODELS
@@ -258,52 +276,9 @@ class ContactResponse(BaseModel):
 # HELPER FUNCTIONS
 # ======================================
 
-def filter_hospitals(
-    city: Optional[str] = None,
-    cancer_type: Optional[str] = None,
-    budget_max: Optional[int] = None,
-    insurance: Optional[str] = None,
-    international_patient: Optional[bool] = False,
-) -> List[Dict[str, Any]]:
-    results = []
-    cities_to_search = [city] if city else CITIES
-
-    for search_city in cities_to_search:
-        if search_city not in HOSPITALS:
-            continue
-
-        for hospital in HOSPITALS[search_city]:
-            if cancer_type and cancer_type not in hospital["specializations"]:
-                continue
-            if budget_max and hospital["cost_range"]["min"] > budget_max:
-                continue
-            if insurance and insurance not in hospital.get("insurance_types", []):
-                continue
-            if international_patient and not hospital.get("international_patients", False):
-                continue
-
-            results.append(hospital)
-
-    results.sort(
-        key=lambda x: (x["success_rate"], x["beds_available"]), reverse=True
-    )
-    return results
-
-
-def filter_doctors(
-    city: Optional[str] = None, hospital_ids: Optional[List[str]] = None
-) -> List[Dict[str, Any]]:
-    results = []
-
-    for doctor in DOCTORS:
-        if city and doctor["city"] != city:
-            continue
-        if hospital_ids and doctor["hospital_id"] not in hospital_ids:
-            continue
-        results.append(doctor)
-
-    results.sort(key=lambda x: (x["rating"], x["experience"]), reverse=True)
-    return results
+# Result sizes returned by /api/match-hospitals
+MATCH_HOSPITALS_LIMIT = 10
+MATCH_DOCTORS_LIMIT = 15
 
 
 async def get_ai_recommendation(
@@ -359,43 +334,45 @@ async def get_status_checks():
 # -------------------------
 # Cancer Types
 # -------------------------
-@api_router.get("/cancer-types")
-async def get_cancer_types():
+def _build_cancer_types_payload() -> Dict[str, Any]:
     """
-    Get all cancer types.
-    Returns format compatible with both old and new frontend expectations.
+    Build the /api/cancer-types payload.
+    IDs are derived from the cancer name so the body is byte-identical across calls.
     """
+    def describe(cancer: Dict[str, Any]) -> str:
+        return cancer.get("type", "") + " - " + cancer.get("category", "common")
+
     # Format for RareCancersPage (expects {rare_cancers, common_cancers})
     rare_cancers_list = [
         {
-            "id": str(uuid.uuid4()),
+            "id": stable_id("cancer", cancer.get("name", "")),
             "name": cancer.get("name", ""),
             "category": cancer.get("category", "rare"),
             "type": cancer.get("type", ""),
-            "description": cancer.get("type", "") + " - " + cancer.get("category", "common")
+            "description": describe(cancer)
         }
-        for cancer in RARE_CANCERS
+        for cancer in data_seed.RARE_CANCERS
     ]
     
     common_cancers_list = [
         {
-            "id": str(uuid.uuid4()),
+            "id": stable_id("cancer", cancer.get("name", "")),
             "name": cancer.get("name", ""),
             "category": cancer.get("category", "common"),
             "type": cancer.get("type", ""),
-            "description": cancer.get("type", "") + " - " + cancer.get("category", "common")
+            "description": describe(cancer)
         }
-        for cancer in COMMON_CANCERS
+        for cancer in data_seed.COMMON_CANCERS
     ]
     
     # Also return as flat array for FindHospitalsPage compatibility
     all_cancers_list = [
         {
-            "id": str(uuid.uuid4()),
+            "id": stable_id("cancer", cancer.get("name", "")),
             "name": cancer.get("name", ""),
-            "description": cancer.get("type", "") + " - " + cancer.get("category", "common")
+            "description": describe(cancer)
         }
-        for cancer in ALL_CANCERS
+        for cancer in data_seed.ALL_CANCERS
     ]
     
     # Return both formats for backward compatibility
@@ -406,12 +383,28 @@ async def get_cancer_types():
     }
 
 
+@lru_cache(maxsize=None)
+def _cancer_types_response() -> CachedBody:
+    """Built and serialized once, on first request"""
+    return CachedBody.from_payload(_build_cancer_types_payload())
+
+
+@api_router.get("/cancer-types")
+async def get_cancer_types(request: Request):
+    """
+    Get all cancer types.
+    Returns format compatible with both old and new frontend expectations.
+    Served from a pre-serialized body with a strong ETag (304 on If-None-Match).
+    """
+    return cached_json_response(request, _cancer_types_response())
+
+
 # -------------------------
 # Cities
 # -------------------------
 @api_router.get("/cities")
 async def get_cities():
-    return {"cities": CITIES}
+    return {"cities": data_seed.CITIES}
 
 
 # -------------------------
@@ -420,26 +413,32 @@ async def get_cities():
 @api_router.post("/match-hospitals")
 async def match_hospitals(request: PatientMatchRequest):
     try:
-        hospitals = filter_hospitals(
+        # Top-K evaluation: only the returned hospitals/doctors are materialised,
+        # totals for match_score come from the index cardinalities
+        hospital_index = get_hospital_index()
+        hospital_mask = hospital_index.match_mask(
             city=request.city,
             cancer_type=request.cancer_type,
             budget_max=request.budget_max,
             insurance=request.insurance,
             international_patient=request.international_patient,
         )
+        hospitals = hospital_index.top_k(MATCH_HOSPITALS_LIMIT, mask=hospital_mask)
+        doctors = get_doctor_index().top_k(
+            MATCH_DOCTORS_LIMIT,
+            city=request.city,
+            hospital_ids=hospital_index.ids(hospital_mask),
+        )
 
-        hospital_ids = [h["id"] for h in hospitals]
-        doctors = filter_doctors(city=request.city, hospital_ids=hospital_ids)
-
-        match_score = min(100, len(hospitals) * 10 + len(doctors) * 5)
+        match_score = min(100, hospitals.total * 10 + doctors.total * 5)
 
         ai_recommendation = await get_ai_recommendation(
-            request.cancer_type, request.city, request.budget_max, hospitals
+            request.cancer_type, request.city, request.budget_max, hospitals.items
         )
 
         return {
-            "hospitals": hospitals[:10],
-            "doctors": doctors[:15],
+            "hospitals": hospitals.items,
+            "doctors": doctors.items,
             "match_score": match_score,
             "ai_recommendation": ai_recommendation,
         }
@@ -531,14 +530,9 @@ async def book_appointment(request: AppointmentRequest):
         
         # If hospital_id is provided, find the hospital
         if request.hospital_id:
-            for city_hospitals in HOSPITALS.values():
-                for h in city_hospitals:
-                    if h["id"] == request.hospital_id:
-                        hospital = h
-                        hospital_name = hospital["name"]
-                        break
-                if hospital:
-                    break
+            hospital = get_hospitals_by_id().get(request.hospital_id)
+            if hospital:
+                hospital_name = hospital["name"]
 
         appointment_doc = {
             "id": appointment_id,
@@ -741,10 +735,9 @@ async def update_contact_status(contact_id: str, status: str):
         raise HTTPException(status_code=500, detail="Failed to update contact status")
 
 
-@api_router.get("/stats")
-async def get_stats():
-    total_hospitals = sum(len(city_hospitals) for city_hospitals in HOSPITALS.values())
-    total_doctors = len(DOCTORS)
+def _build_stats_payload():
+    total_hospitals = sum(len(city_hospitals) for city_hospitals in data_seed.HOSPITALS.values())
+    total_doctors = len(data_seed.DOCTORS)
     
     # Count specialists from rare cancer specialists
     from rare_cancers.seed_data import RARE_CANCER_SPECIALISTS
@@ -752,18 +745,24 @@ async def get_stats():
     
     # Total oncologists = regular doctors + specialists
     total_oncologists = total_doctors + total_specialists
-    total_cancer_types = len(ALL_CANCERS)
+    total_cancer_types = len(data_seed.ALL_CANCERS)
 
     return {
         "hospitals_mapped": total_hospitals,
         "doctors_available": total_oncologists,  # Now includes specialists
         "cancer_types_supported": total_cancer_types,
-        "cities_covered": len(CITIES),
-        "rare_cancers": len(RARE_CANCERS),
-        "common_cancers": len(COMMON_CANCERS),
+        "cities_covered": len(data_seed.CITIES),
+        "rare_cancers": len(data_seed.RARE_CANCERS),
+        "common_cancers": len(data_seed.COMMON_CANCERS),
     }
 
 
+@api_router.get("/stats")
+async def get_stats(request: Request):
+    cached = response_cache.get_or_build("/api/stats", None, _build_stats_payload)
+    return cached_json_response(request, cached)
+
+
 # ======================================
 # Register Router + CORS
 # ======================================
@@ -838,6 +837,21 @@ async def debug_mongo_config():
         "sanitized_mongo_url_has_newline": "\n" in clean_mongo_url or "\r" in clean_mongo_url
     }
 
+@api_router.get("/debug/response-cache")
+async def debug_response_cache():
+    """Per-route hit/miss counters and size of the seed-catalog response cache"""
+    return response_cache.metrics()
+
+
+@api_router.get("/debug/startup-profile")
+async def debug_startup_profile():
+    """Per-router import cost at startup, plus seed catalog load times"""
+    return {
+        "routers_ms": STARTUP_IMPORT_TIMINGS,
+        "total_routers_ms": round(sum(STARTUP_IMPORT_TIMINGS.values()), 2),
+        "seed_catalogs_ms": seed_loader.LOAD_TIMINGS,
+    }
+
 app.include_router(api_router)
 
 # ======================================
@@ -846,67 +860,76 @@ app.include_router(api_router)
 cost_calculator_path = Path(__file__).parent / "cost_calculator"
 sys.path.insert(0, str(cost_calculator_path))
 
-from api_routes import create_api_router as create_cost_calculator_router
-cost_calculator_router = create_cost_calculator_router(db)
-app.include_router(cost_calculator_router)
+with profile_startup("cost_calculator"):
+    from api_routes import create_api_router as create_cost_calculator_router
+    cost_calculator_router = create_cost_calculator_router(db)
+    app.include_router(cost_calculator_router)
 
 # ======================================
 # Hospitals Routes (Modular)
 # ======================================
-from hospitals.api_routes import create_api_router as create_hospitals_router
-hospitals_router = create_hospitals_router()
-app.include_router(hospitals_router)
+with profile_startup("hospitals"):
+    from hospitals.api_routes import create_api_router as create_hospitals_router
+    hospitals_router = create_hospitals_router()
+    app.include_router(hospitals_router)
 
 # ======================================
 # Rare Cancers Routes (Modular)
 # ======================================
-from rare_cancers.api_routes import create_api_router as create_rare_cancers_router
-rare_cancers_router = create_rare_cancers_router()
-app.include_router(rare_cancers_router)
+with profile_startup("rare_cancers"):
+    from rare_cancers.api_routes import create_api_router as create_rare_cancers_router
+    rare_cancers_router = create_rare_cancers_router()
+    app.include_router(rare_cancers_router)
 
 # ======================================
 # Authentication Routes
 # ======================================
-from auth.api_routes import create_api_router as create_auth_router
-auth_router = create_auth_router(db)
-app.include_router(auth_router)
+with profile_startup("auth"):
+    from auth.api_routes import create_api_router as create_auth_router
+    auth_router = create_auth_router(db)
+    app.include_router(auth_router)
 
 # ======================================
 # Payment Routes
 # ======================================
-from payments.api_routes import create_api_router as create_payments_router
-payments_router, razorpay_router = create_payments_router(db)
-app.include_router(payments_router)
-app.include_router(razorpay_router)
+with profile_startup("payments"):
+    from payments.api_routes import create_api_router as create_payments_router
+    payments_router, razorpay_router = create_payments_router(db)
+    app.include_router(payments_router)
+    app.include_router(razorpay_router)
 
 # ======================================
 # Get Started Routes
 # ======================================
-from get_started.api_routes import create_api_router as create_get_started_router
-get_started_router = create_get_started_router(db)
-app.include_router(get_started_router)
+with profile_startup("get_started"):
+    from get_started.api_routes import create_api_router as create_get_started_router
+    get_started_router = create_get_started_router(db)
+    app.include_router(get_started_router)
 
 # ======================================
 # Waitlist Routes
 # ======================================
-from waitlist.api_routes import create_api_router as create_waitlist_router
-waitlist_router = create_waitlist_router(db)
-app.include_router(waitlist_router)
+with profile_startup("waitlist"):
+    from waitlist.api_routes import create_api_router as create_waitlist_router
+    waitlist_router = create_waitlist_router(db)
+    app.include_router(waitlist_router)
 
 # ======================================
 # Journey Builder Routes
 # ======================================
-from journey_builder.api_routes import create_api_router as create_journey_builder_router
-journey_builder_router = create_journey_builder_router()
-app.include_router(journey_builder_router)
+with profile_startup("journey_builder"):
+    from journey_builder.api_routes import create_api_router as create_journey_builder_router
+    journey_builder_router = create_journey_builder_router()
+    app.include_router(journey_builder_router)
 
 # ======================================
 # Second Opinion AI Routes
 # ======================================
 try:
-    from second_opinion.api_routes import create_api_router as create_second_opinion_ai_router
-    second_opinion_ai_router = create_second_opinion_ai_router()
-    app.include_router(second_opinion_ai_router)
+    with profile_startup("second_opinion"):
+        from second_opinion.api_routes import create_api_router as create_second_opinion_ai_router
+        second_opinion_ai_router = create_second_opinion_ai_router()
+        app.include_router(second_opinion_ai_router)
     logger.info("✅ Included second_opinion_ai_router")
 except Exception as e:
     logger.error(f"❌ Failed to include second_opinion_ai_router: {e}")
@@ -915,19 +938,47 @@ except Exception as e:
 # WhatsApp Routes
 # ======================================
 try:
-    from whatsapp.api_routes import create_api_router as create_whatsapp_router
-    whatsapp_router = create_whatsapp_router()
-    app.include_router(
-        whatsapp_router,
-        prefix="/api/whatsapp",
-        tags=["WhatsApp"]
-    )
+    with profile_startup("whatsapp"):
+        from whatsapp.api_routes import create_api_router as create_whatsapp_router
+        whatsapp_router = create_whatsapp_router()
+        app.include_router(
+            whatsapp_router,
+            prefix="/api/whatsapp",
+            tags=["WhatsApp"]
+        )
     logger.info("✅ Included whatsapp_router")
 except Exception as e:
     logger.error(f"❌ Failed to include whatsapp_router: {e}")
 
 # CORS middleware already added above after app creation
 
+logger.info(
+    "Startup import profile (ms): "
+    + ", ".join(f"{name}={ms}" for name, ms in sorted(STARTUP_IMPORT_TIMINGS.items(), key=lambda item: -item[1]))
+)
+
+
+# ======================================
+# Startup Handler - Warm seed catalog
+# ======================================
+def _warm_seed_catalog():
+    start = time.perf_counter()
+    catalog.warm_up()
+    _cancer_types_response()
+    logger.info(f"Seed catalog warmed in {round((time.perf_counter() - start) * 1000, 2)} ms")
+
+
+@app.on_event("startup")
+async def warm_seed_catalog():
+    """
+    Load the seed catalog and build its indexes in a worker thread once the
+    server is up, so the first request after a cold start doesn't pay for it.
+    Set CATALOG_WARMUP=0 to load purely on demand.
+    """
+    if env("CATALOG_WARMUP", "1") == "0":
+        return
+    asyncio.get_running_loop().run_in_executor(None, _warm_seed_catalog)
+
 
 # ======================================
 # Startup Handler - Log Razorpay env status
@@ -0,0 +1,329 @@
+"""
+Test cases for the seed catalog indexes and the response cache
+Each index must answer exactly like the linear scan it replaced
+"""
+import itertools
+import sys
+from pathlib import Path
+
+# Add current directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+import data_seed
+from catalog import get_hospital_index, get_doctor_index, get_doctor_directory
+from http_cache import CachedBody
+from response_cache import ResponseCache
+
+# Budgets around the seed cost_range.min values (None = no budget filter)
+BUDGETS = [None, 100000, 500000, 1000000, 2500000, 10000000]
+
+
+def linear_filter_hospitals(city=None, cancer_type=None, budget_max=None, insurance=None, international_patient=False):
+    """The original /api/match-hospitals scan, kept as the reference"""
+    results = []
+    cities_to_search = [city] if city else data_seed.CITIES
+    for search_city in cities_to_search:
+        if search_city not in data_seed.HOSPITALS:
+            continue
+        for hospital in data_seed.HOSPITALS[search_city]:
+            if cancer_type and cancer_type not in hospital["specializations"]:
+                continue
+            if budget_max and hospital["cost_range"]["min"] > budget_max:
+                continue
+            if insurance and insurance not in hospital.get("insurance_types", []):
+                continue
+            if international_patient and not hospital.get("international_patients", False):
+                continue
+            results.append(hospital)
+    results.sort(key=lambda x: (x["success_rate"], x["beds_available"]), reverse=True)
+    return results
+
+
+def linear_filter_doctors(city=None, hospital_ids=None):
+    """The original doctor scan behind /api/match-hospitals"""
+    results = []
+    for doctor in data_seed.DOCTORS:
+        if city and doctor["city"] != city:
+            continue
+        if hospital_ids and doctor["hospital_id"] not in hospital_ids:
+            continue
+        results.append(doctor)
+    results.sort(key=lambda x: (x["rating"], x["experience"]), reverse=True)
+    return results
+
+
+def linear_doctor_directory(city=None, specialty=None):
+    """The original /api/doctors scan: seed doctors plus specialists, filtered in place"""
+    from rare_cancers.seed_data import RARE_CANCER_SPECIALISTS
+    doctors = list(data_seed.DOCTORS)
+    for cancer_name, specialists in RARE_CANCER_SPECIALISTS.items():
+        for specialist in specialists:
+            doctors.append({
+                "name": specialist.get("name", ""),
+                "specialty": ", ".join(specialist.get("specialties", [])) if specialist.get("specialties") else specialist.get("title", "Oncology"),
+                "city": specialist.get("city", ""),
+                "specialties": specialist.get("specialties", []),
+                "cancer_specialization": cancer_name,
+            })
+    if city:
+        doctors = [d for d in doctors if d.get("city", "").lower() == city.lower()]
+    if specialty:
+        doctors = [
+            d for d in doctors
+            if specialty.lower() in d.get("specialty", "").lower()
+            or any(specialty.lower() in s.lower() for s in d.get("specialties", []))
+        ]
+    return doctors
+
+
+def directory_key(entry):
+    """Identity of a directory entry that doesn't depend on how IDs are assigned"""
+    return (entry.get("name"), entry.get("city"), entry.get("specialty"), entry.get("cancer_specialization"))
+
+
+def all_hospitals():
+    return [hospital for hospitals in data_seed.HOSPITALS.values() for hospital in hospitals]
+
+
+def hospital_filter_cases():
+    """Every city x cancer type, then every budget x insurance x international combination"""
+    hospitals = all_hospitals()
+    cities = [None, *data_seed.CITIES, "Atlantis"]
+    cancer_types = [None, *sorted({s for h in hospitals for s in h["specializations"]}), "Unknown Cancer"]
+    insurances = [None, *sorted({i for h in hospitals for i in h.get("insurance_types", [])}), "Unknown Insurance"]
+    for city, cancer_type in itertools.product(cities, cancer_types):
+        yield dict(city=city, cancer_type=cancer_type)
+    for city, budget_max, insurance, international in itertools.product(
+        [None, data_seed.CITIES[0]], BUDGETS, insurances, [False, True]
+    ):
+        yield dict(city=city, budget_max=budget_max, insurance=insurance, international_patient=international)
+
+
+def test_hospital_index():
+    """HospitalIndex.top_k must return the linear scan's order, top 10 and total"""
+    print(f"\n{'='*60}")
+    print("TEST: Hospital Index vs Linear Filter")
+    print(f"{'='*60}")
+
+    try:
+        index = get_hospital_index()
+        cases = 0
+        for filters in hospital_filter_cases():
+            expected = linear_filter_hospitals(**filters)
+            mask = index.match_mask(**filters)
+            result = index.top_k(10, mask=mask)
+            assert [h["id"] for h in result.items] == [h["id"] for h in expected[:10]], f"Top 10 differ for {filters}"
+            assert result.total == len(expected), f"Total {result.total} != {len(expected)} for {filters}"
+            assert index.ids(mask) == [h["id"] for h in expected], f"Matched IDs differ for {filters}"
+            cases += 1
+
+        print("✅ PASSED")
+        print(f"   {cases} filter combinations agree with the linear scan")
+        return True
+    except Exception as e:
+        print(f"❌ FAILED: {str(e)}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def test_doctor_index():
+    """DoctorIndex.top_k joined on matched hospitals must equal the linear doctor scan"""
+    print(f"\n{'='*60}")
+    print("TEST: Doctor Join Index vs Linear Filter")
+    print(f"{'='*60}")
+
+    try:
+        hospital_index = get_hospital_index()
+        doctor_index = get_doctor_index()
+        cases = 0
+        for filters in hospital_filter_cases():
+            hospital_ids = hospital_index.ids(hospital_index.match_mask(**filters))
+            expected = linear_filter_doctors(city=filters.get("city"), hospital_ids=hospital_ids)
+            result = doctor_index.top_k(15, city=filters.get("city"), hospital_ids=hospital_ids)
+            assert [d["id"] for d in result.items] == [d["id"] for d in expected[:15]], f"Top 15 differ for {filters}"
+            assert result.total == len(expected), f"Total {result.total} != {len(expected)} for {filters}"
+            cases += 1
+
+        # Unfiltered and unknown-hospital joins
+        everyone = doctor_index.top_k(None)
+        assert [d["id"] for d in everyone.items] == [d["id"] for d in linear_filter_doctors()], "Full ranking differs"
+        assert doctor_index.top_k(15, hospital_ids=["no-such-hospital"]).total == 0, "Unknown hospital matched doctors"
+
+        print("✅ PASSED")
+        print(f"   {cases} hospital joins agree with the linear scan")
+        return True
+    except Exception as e:
+        print(f"❌ FAILED: {str(e)}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def test_response_cache_eviction():
+    """ResponseCache must stay within its byte budget, evicting least recently used first"""
+    print(f"\n{'='*60}")
+    print("TEST: Response Cache Byte Budget")
+    print(f"{'='*60}")
+
+    try:
+        body = CachedBody.from_payload(["x" * 95])
+        size = len(body)
+        cache = ResponseCache(max_bytes=size * 3)
+
+        for page in range(3):
+            cache.put("/api/hospitals", {"page": page}, body)
+        assert cache.metrics()["bytes"] == size * 3, "Budget not filled exactly"
+
+        # Touch page 0 so page 1 is now the least recently used
+        assert cache.get("/api/hospitals", {"page": 0}) is body, "Cached body not returned"
+        cache.put("/api/hospitals", {"page": 3}, body)
+        metrics = cache.metrics()
+        assert metrics["entries"] == 3 and metrics["bytes"] <= cache.max_bytes, f"Over budget: {metrics}"
+        assert metrics["evictions"] == 1, f"Expected one eviction, got {metrics['evictions']}"
+        assert cache.get("/api/hospitals", {"page": 1}) is None, "LRU entry was not evicted"
+        for page in (0, 2, 3):
+            assert cache.get("/api/hospitals", {"page": page}) is body, f"Page {page} evicted out of LRU order"
+
+        # Re-putting a key replaces its bytes instead of adding them
+        cache.put("/api/hospitals", {"page": 3}, body)
+        assert cache.metrics()["bytes"] == size * 3, "Replaced entry counted twice"
+
+        # A body larger than the whole budget is served but never stored
+        huge = CachedBody.from_payload(["x" * (size * 4)])
+        assert cache.put("/api/doctors", None, huge) is huge, "Oversized body not returned"
+        assert cache.get("/api/doctors") is None, "Oversized body was cached"
+        assert cache.metrics()["evictions"] == 1, "Oversized body evicted other entries"
+
+        # Equivalent queries share a key: unset params and order don't matter
+        cache.put("/api/doctors", {"city": "Mumbai", "specialty": None}, body)
+        assert cache.get("/api/doctors", {"city": "Mumbai"}) is body, "Unset params changed the key"
+
+        print("✅ PASSED")
+        print(f"   LRU eviction kept {cache.metrics()['bytes']} of {cache.max_bytes} bytes")
+        return True
+    except Exception as e:
+        print(f"❌ FAILED: {str(e)}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def test_doctor_directory():
+    """DoctorDirectory.search must return the linear /api/doctors scan, in the same order"""
+    print(f"\n{'='*60}")
+    print("TEST: Doctor Directory vs Linear Filter")
+    print(f"{'='*60}")
+
+    try:
+        directory = get_doctor_directory()
+        entries = linear_doctor_directory()
+        assert [directory_key(e) for e in directory.entries] == [directory_key(e) for e in entries], "Directory entries differ"
+
+        cities = {e.get("city", "") for e in entries if e.get("city")}
+        cities = [None, "Atlantis", *sorted(cities), *(c.upper() for c in sorted(cities)[:3])]
+        terms = {t for e in entries for t in [e.get("specialty", ""), *e.get("specialties", [])] if t}
+        # Whole terms, case changes, fragments, and something that matches nothing
+        specialties = [None, "onc", "SURG", "radiation", "pediatric", "zzz", *sorted(terms)]
+        specialties += [term[1:6] for term in sorted(terms)[:20]]
+
+        cases = 0
+        for city, specialty in itertools.product(cities, specialties):
+            expected = [directory_key(e) for e in linear_doctor_directory(city, specialty)]
+            result = [directory_key(e) for e in directory.search(city=city, specialty=specialty)]
+            assert result == expected, f"Directory search differs for city={city!r} specialty={specialty!r}"
+            cases += 1
+
+        # Specialist IDs are derived from names, so they survive rebuilds
+        ids = [e["id"] for e in directory.entries if e.get("is_specialist")]
+        assert len(set(ids)) == len(ids), "Duplicate specialist IDs"
+
+        print("✅ PASSED")
+        print(f"   {cases} city/specialty searches agree with the linear scan")
+        return True
+    except Exception as e:
+        print(f"❌ FAILED: {str(e)}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def test_bulk_id_lookup():
+    """?ids= must return what /{id} returns for each known ID, in request order, skipping unknown IDs"""
+    print(f"\n{'='*60}")
+    print("TEST: Bulk ?ids= Lookup")
+    print(f"{'='*60}")
+
+    try:
+        from fastapi import FastAPI
+        from fastapi.testclient import TestClient
+        from hospitals.api_routes import create_api_router as create_hospitals_router
+
+        app = FastAPI()
+        app.include_router(create_hospitals_router())
+        client = TestClient(app)
+
+        hospital_ids = [h["id"] for h in all_hospitals()]
+        specialist_ids = [e["id"] for e in get_doctor_directory().entries if e.get("is_specialist")]
+        doctor_ids = [d["id"] for d in data_seed.DOCTORS] + specialist_ids[:5]
+
+        for route, known in (("/api/hospitals", hospital_ids), ("/api/doctors", doctor_ids)):
+            # Reversed order, an unknown ID, a duplicate and blanks in between
+            requested = [known[3], "no-such-id", known[0], known[-1], known[3]]
+            response = client.get(route, params={"ids": " , ".join(requested) + ",,"})
+            assert response.status_code == 200, f"{route}?ids= returned {response.status_code}"
+            bulk = response.json()
+            expected_ids = [known[3], known[0], known[-1]]
+            assert [record["id"] for record in bulk] == expected_ids, f"{route}?ids= order/skip wrong: {[r['id'] for r in bulk]}"
+            for record in bulk:
+                single = client.get(f"{route}/{record['id']}")
+                assert single.status_code == 200 and single.json() == record, f"{route}/{record['id']} differs from bulk"
+
+            assert client.get(route, params={"ids": "no-such-id"}).json() == [], f"{route} returned unknown IDs"
+            assert client.get(route, params={"ids": ""}).json() == [], f"{route}?ids= (empty) not empty"
+            assert client.get(f"{route}/no-such-id").status_code == 404, f"{route}/<unknown> not 404"
+
+        # A specialist reads the same in the full list, by ID and in a bulk lookup
+        specialist = next(e for e in get_doctor_directory().entries if e.get("is_specialist") and e.get("specialties"))
+        listed = [d for d in client.get("/api/doctors").json() if d["id"] == specialist["id"]]
+        single = client.get(f"/api/doctors/{specialist['id']}").json()
+        bulk = client.get("/api/doctors", params={"ids": specialist["id"]}).json()
+        assert listed == [single] == bulk, f"specialist {specialist['id']} differs: {listed} / {single} / {bulk}"
+        assert single["qualifications"] == specialist.get("title", "MD, DM"), f"specialist qualifications {single}"
+        assert single["specialization"] == ", ".join(specialist["specialties"]), f"specialist specialization {single}"
+
+        print("✅ PASSED")
+        print(f"   Bulk lookups match /{{id}} for {len(hospital_ids)} hospitals and {len(doctor_ids)} doctors")
+        return True
+    except Exception as e:
+        print(f"❌ FAILED: {str(e)}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def run_all_tests():
+    tests = [
+        test_hospital_index, test_doctor_index, test_response_cache_eviction,
+        test_doctor_directory, test_bulk_id_lookup,
+    ]
+    passed = sum(1 for test in tests if test())
+    failed = len(tests) - passed
+
+    print("\n" + "="*60)
+    print("TEST SUMMARY")
+    print("="*60)
+    print(f"Total Tests: {passed + failed}")
+    print(f"✅ Passed: {passed}")
+    print(f"❌ Failed: {failed}")
+    print("="*60)
+
+    if failed == 0:
+        print("\n🎉 ALL TESTS PASSED! Catalog indexes match the linear scans.")
+    else:
+        print(f"\n⚠️ {failed} test(s) failed. Review errors above.")
+    return failed == 0
+
+
+if __name__ == "__main__":
+    exit(0 if run_all_tests() else 1)
@@ -0,0 +1,127 @@
+"""
+Test cases for the rare cancer full-text search
+Ranked search must still return every cancer the old name/type
+"contains" scan found
+"""
+import sys
+from pathlib import Path
+
+# Add current directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from rare_cancers import seed_data
+from rare_cancers.search_index import tokenize
+from rare_cancers.service import RareCancersService
+
+
+def linear_search_rare_cancers(query):
+    """The original /api/rare-cancers/search scan, kept as the reference"""
+    query_lower = query.lower()
+    return [
+        cancer.get("name", "") for cancer in seed_data.RARE_CANCERS
+        if query_lower in cancer.get("name", "").lower() or query_lower in cancer.get("type", "").lower()
+    ]
+
+
+def search_queries():
+    """Whole words, word fragments and phrases taken from the catalog"""
+    queries = {"sarcoma", "lymph", "cell prolym", "ll pro", "a", "T-cell", "(ASPS)"}
+    for cancer in seed_data.RARE_CANCERS:
+        for text in (cancer.get("name", ""), cancer.get("type", "")):
+            queries.add(text)
+            for word in tokenize(text):
+                queries.add(word)
+                queries.update(word[start:start + 4] for start in range(len(word) - 3))
+    return sorted(queries)
+
+
+def test_substring_superset():
+    """Every old substring match is returned, and the total counts every match"""
+    print(f"\n{'='*60}")
+    print("TEST: Search Includes Old Substring Matches")
+    print(f"{'='*60}")
+
+    try:
+        service = RareCancersService()
+        queries = search_queries()
+        for query in queries:
+            results = service.search_rare_cancers(query)
+            names = [item["name"] for item in results.items]
+            missing = set(linear_search_rare_cancers(query)) - set(names)
+            assert not missing, f"'{query}' lost {sorted(missing)}"
+            assert results.total == len(names), f"'{query}' total {results.total} != {len(names)} items"
+            assert len(set(names)) == len(names), f"'{query}' returned duplicates"
+
+        print("✅ PASSED")
+        print(f"   {len(queries)} queries return every old substring match")
+        return True
+    except Exception as e:
+        print(f"❌ FAILED: {str(e)}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def test_infix_route_regressions():
+    """/search/sarcoma and /search/lymph keep the cancers that only contain the query inside a word"""
+    print(f"\n{'='*60}")
+    print("TEST: Infix Matches Through /api/rare-cancers/search")
+    print(f"{'='*60}")
+
+    try:
+        from fastapi import FastAPI
+        from fastapi.testclient import TestClient
+        from rare_cancers.api_routes import create_api_router as create_rare_cancers_router
+
+        app = FastAPI()
+        app.include_router(create_rare_cancers_router())
+        client = TestClient(app)
+
+        cases = [
+            ("sarcoma", 7, "Osteosarcoma"),
+            ("lymph", 4, "T-cell Prolymphocytic Leukemia (T-PLL)"),
+        ]
+        for query, count, infix_match in cases:
+            response = client.get(f"/api/rare-cancers/search/{query}")
+            assert response.status_code == 200, f"/search/{query} returned {response.status_code}"
+            names = [item["name"] for item in response.json()]
+            assert len(names) == count, f"/search/{query} returned {len(names)} results, expected {count}: {names}"
+            assert infix_match in names, f"/search/{query} lost {infix_match}"
+            assert response.headers["X-Total-Count"] == str(count), f"/search/{query} X-Total-Count wrong"
+
+        # A whole-word hit still outranks a match inside a longer word
+        names = [item["name"] for item in client.get("/api/rare-cancers/search/osteosarcoma").json()]
+        assert names[:1] == ["Osteosarcoma"], f"/search/osteosarcoma ranked {names}"
+
+        print("✅ PASSED")
+        print("   sarcoma -> 7 results incl. Osteosarcoma, lymph -> 4 incl. T-PLL")
+        return True
+    except Exception as e:
+        print(f"❌ FAILED: {str(e)}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def run_all_tests():
+    tests = [test_substring_superset, test_infix_route_regressions]
+    passed = sum(1 for test in tests if test())
+    failed = len(tests) - passed
+
+    print("\n" + "="*60)
+    print("TEST SUMMARY")
+    print("="*60)
+    print(f"Total Tests: {passed + failed}")
+    print(f"✅ Passed: {passed}")
+    print(f"❌ Failed: {failed}")
+    print("="*60)
+
+    if failed == 0:
+        print("\n🎉 ALL TESTS PASSED! Search keeps every substring match.")
+    else:
+        print(f"\n⚠️ {failed} test(s) failed. Review errors above.")
+    return failed == 0
+
+
+if __name__ == "__main__":
+    exit(0 if run_all_tests() else 1)
@@ -0,0 +1,266 @@
+"""
+Test cases for the WhatsApp webhook work queue
+The webhook must ack quickly even when the queue is full, every message
+must be handled exactly once (after redelivery, if deferred), and each
+user's messages run one at a time in order while users run in parallel
+"""
+import asyncio
+import sys
+import time
+import uuid
+from pathlib import Path
+
+# Add current directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+import httpx
+from fastapi import FastAPI
+
+from whatsapp import api_routes
+from whatsapp.api_routes import create_api_router as create_whatsapp_router
+from whatsapp.parser import IncomingMessage
+from whatsapp.work_queue import MessageWorkQueue
+
+
+def webhook_payload(messages):
+    """Meta webhook body carrying (wa_id, message_id, text) messages"""
+    return {
+        "object": "whatsapp_business_account",
+        "entry": [{"changes": [{"value": {
+            "messaging_product": "whatsapp",
+            "messages": [
+                {"from": wa_id, "id": message_id, "timestamp": "0", "type": "text", "text": {"body": text}}
+                for wa_id, message_id, text in messages
+            ],
+        }}]}],
+    }
+
+
+def new_message_id():
+    return f"wamid.test-{uuid.uuid4().hex}"
+
+
+async def post_webhook(queue, payload):
+    """POST payload to /api/whatsapp/webhook, queueing on queue; returns (response, seconds)"""
+    app = FastAPI()
+    app.include_router(create_whatsapp_router(), prefix="/api/whatsapp")
+    previous, api_routes.work_queue = api_routes.work_queue, queue
+    try:
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+            started = time.perf_counter()
+            response = await client.post("/api/whatsapp/webhook", json=payload)
+            return response, time.perf_counter() - started
+    finally:
+        api_routes.work_queue = previous
+
+
+def test_backpressure_ack_time():
+    """A full queue holds the ack for one enqueue timeout per payload, not one per message"""
+    print(f"\n{'='*60}")
+    print("TEST: Webhook Backpressure")
+    print(f"{'='*60}")
+
+    async def scenario():
+        release = asyncio.Event()
+        handled = []
+
+        async def handler(message):
+            await release.wait()
+            handled.append(message.message_id)
+
+        # One running plus two waiting fit; the other users' messages don't
+        timeout = 0.2
+        queue = MessageWorkQueue(handler, workers=1, max_size=2, enqueue_timeout=timeout, lane_idle_timeout=1.0)
+        messages = [(f"91999900{user:04d}", new_message_id(), f"hello {user}") for user in range(6)]
+        payload = webhook_payload(messages)
+
+        response, seconds = await post_webhook(queue, payload)
+        assert response.status_code == 503 and response.json() == {"status": "retry"}, \
+            f"full queue answered {response.status_code} {response.text}"
+        assert seconds < timeout * 1.5, f"ack took {seconds:.2f}s for a {timeout}s enqueue timeout"
+        assert queue.rejected == 3 and queue.enqueued == 3, f"enqueued {queue.enqueued}, rejected {queue.rejected}"
+
+        # Meta redelivers once there's room: queued messages are deduped, deferred ones queued now
+        release.set()
+        await asyncio.sleep(0.05)
+        response, _ = await post_webhook(queue, payload)
+        assert response.status_code == 200, f"redelivery answered {response.status_code}"
+        await queue.stop()
+        assert sorted(handled) == sorted(message_id for _, message_id, _ in messages), \
+            f"handled {len(handled)} of {len(messages)} messages, {len(set(handled))} distinct"
+        return seconds
+
+    try:
+        seconds = asyncio.run(scenario())
+        print("✅ PASSED")
+        print(f"   6 users into a queue of 3: 503 after {seconds*1000:.0f}ms, all handled once after redelivery")
+        return True
+    except Exception as e:
+        print(f"❌ FAILED: {str(e)}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def test_enqueue_error_redelivery():
+    """A message whose enqueue raises gets a 503 and is handled when Meta redelivers it"""
+    print(f"\n{'='*60}")
+    print("TEST: Enqueue Error Redelivery")
+    print(f"{'='*60}")
+
+    async def scenario():
+        handled = []
+
+        async def handler(message):
+            handled.append(message.message_id)
+
+        class FlakyQueue(MessageWorkQueue):
+            failures = 1
+
+            async def enqueue(self, message, deadline=None):
+                if self.failures:
+                    self.failures -= 1
+                    raise RuntimeError("enqueue failed")
+                return await super().enqueue(message, deadline)
+
+        queue = FlakyQueue(handler, workers=1, max_size=10, enqueue_timeout=0.1, lane_idle_timeout=1.0)
+        messages = [("919999000001", new_message_id(), "first"), ("919999000001", new_message_id(), "second")]
+        payload = webhook_payload(messages)
+
+        response, _ = await post_webhook(queue, payload)
+        assert response.status_code == 503 and response.json() == {"status": "retry"}, \
+            f"enqueue error answered {response.status_code} {response.text}"
+        assert queue.enqueued == 0, f"a later message of the same user jumped ahead: enqueued {queue.enqueued}"
+
+        response, _ = await post_webhook(queue, payload)
+        assert response.status_code == 200, f"redelivery answered {response.status_code}"
+        await queue.stop()
+        assert handled == [message_id for _, message_id, _ in messages], f"handled {handled}"
+
+    try:
+        asyncio.run(scenario())
+        print("✅ PASSED")
+        print("   enqueue error answered 503, both messages handled in order after redelivery")
+        return True
+    except Exception as e:
+        print(f"❌ FAILED: {str(e)}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def test_lane_ordering():
+    """Each wa_id's messages run one at a time in arrival order; users don't wait for each other"""
+    print(f"\n{'='*60}")
+    print("TEST: Per-User Lanes")
+    print(f"{'='*60}")
+
+    async def scenario():
+        running = {}
+        concurrent = {"now": 0, "max": 0}
+        handled = []
+
+        async def handler(message):
+            running[message.wa_id] = running.get(message.wa_id, 0) + 1
+            concurrent["now"] += 1
+            concurrent["max"] = max(concurrent["max"], concurrent["now"])
+            assert running[message.wa_id] == 1, f"two messages of {message.wa_id} ran at once"
+            # The first message of user a is a slow job (e.g. OCR)
+            await asyncio.sleep(0.3 if message.message_body == "a0" else 0.01)
+            running[message.wa_id] -= 1
+            concurrent["now"] -= 1
+            handled.append((message.wa_id, message.message_body, time.perf_counter()))
+
+        queue = MessageWorkQueue(handler, workers=2, max_size=100, enqueue_timeout=0.1, lane_idle_timeout=1.0)
+        arrivals = ["a0", "b0", "a1", "c0", "b1", "a2", "c1", "b2", "c2"]
+        for body in arrivals:
+            assert await queue.enqueue(IncomingMessage(f"9199990000{body[0]}", new_message_id(), "0", body)), "rejected"
+        await queue.stop()
+
+        assert len(handled) == len(arrivals), f"handled {len(handled)} of {len(arrivals)}"
+        for user in "abc":
+            order = [body for wa_id, body, _ in handled if wa_id.endswith(user)]
+            assert order == [body for body in arrivals if body[0] == user], f"user {user} handled out of order: {order}"
+        assert concurrent["max"] <= 2, f"{concurrent['max']} messages ran at once with 2 workers"
+        finished = {body: at for _, body, at in handled}
+        assert max(finished[f"{user}{k}"] for user in "bc" for k in range(3)) < finished["a0"], \
+            "other users waited for a's slow message"
+        return queue.stats()
+
+    try:
+        stats = asyncio.run(scenario())
+        print("✅ PASSED")
+        print(f"   3 users, {stats['processed']} messages in order per user, {stats['max_lanes']} lanes at most")
+        return True
+    except Exception as e:
+        print(f"❌ FAILED: {str(e)}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def test_idle_lane_eviction():
+    """Lanes idle for lane_idle_timeout are evicted; a returning user gets a new lane"""
+    print(f"\n{'='*60}")
+    print("TEST: Idle Lane Eviction")
+    print(f"{'='*60}")
+
+    async def scenario():
+        handled = []
+
+        async def handler(message):
+            handled.append(message.message_body)
+
+        idle = 0.1
+        queue = MessageWorkQueue(handler, workers=4, max_size=100, enqueue_timeout=0.1, lane_idle_timeout=idle)
+        for user in range(3):
+            await queue.enqueue(IncomingMessage(f"91999900{user:04d}", new_message_id(), "0", f"first {user}"))
+        await asyncio.sleep(idle / 2)
+        stats = queue.stats()
+        assert stats["lanes"] == 3 and stats["lanes_evicted"] == 0, f"lanes evicted before going idle: {stats}"
+
+        await asyncio.sleep(idle * 1.5)
+        stats = queue.stats()
+        assert stats["lanes"] == 0 and stats["lanes_evicted"] == 3, f"idle lanes kept: {stats}"
+
+        await queue.enqueue(IncomingMessage("919999000000", new_message_id(), "0", "back again"))
+        await queue.stop()
+        stats = queue.stats()
+        assert stats["lanes_created"] == 4 and handled[-1] == "back again", f"returning user not handled: {stats}"
+        assert stats["processed"] == 4 and stats["depth"] == 0, f"messages lost: {stats}"
+        return stats
+
+    try:
+        stats = asyncio.run(scenario())
+        print("✅ PASSED")
+        print(f"   {stats['lanes_evicted']} idle lanes evicted, {stats['lanes_created']} created")
+        return True
+    except Exception as e:
+        print(f"❌ FAILED: {str(e)}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def run_all_tests():
+    tests = [test_backpressure_ack_time, test_enqueue_error_redelivery, test_lane_ordering, test_idle_lane_eviction]
+    passed = sum(1 for test in tests if test())
+    failed = len(tests) - passed
+
+    print("\n" + "="*60)
+    print("TEST SUMMARY")
+    print("="*60)
+    print(f"Total Tests: {passed + failed}")
+    print(f"✅ Passed: {passed}")
+    print(f"❌ Failed: {failed}")
+    print("="*60)
+
+    if failed == 0:
+        print("\n🎉 ALL TESTS PASSED! The work queue acks quickly and keeps every message.")
+    else:
+        print(f"\n⚠️ {failed} test(s) failed. Review errors above.")
+    return failed == 0
+
+
+if __name__ == "__main__":
+    exit(0 if run_all_tests() else 1)
@@ -11,7 +11,8 @@ from .config import config
 from .parser import parse_webhook_payload
 from .store import store
 from .client import send_text_message, verify_connection
-from .messages import get_response_for_user_async
+from .processor import mask_wa_id
+from .work_queue import work_queue
 
 logger = logging.getLogger(__name__)
 
@@ -68,9 +69,12 @@ def create_api_router() -> APIRouter:
     async def handle_webhook(request: Request):
         """
         Handle incoming WhatsApp webhook events from Meta.
-        Processes messages and sends replies.
+        Parses, dedupes and queues messages; replies are sent by the work
+        queue's workers (see work_queue.py), so Meta is acked immediately.
         No authentication required - this is called by Meta.
-        ALWAYS returns HTTP 200 with {"status": "ok"} to Meta.
+        Returns HTTP 200 with {"status": "ok"} to Meta, except 503 when a
+        message couldn't be queued (queue full or enqueue error) so Meta
+        redelivers the deferred messages.
         """
         # Log incoming request
         logger.info(f"POST /api/whatsapp/webhook - method={request.method}, path={request.url.path}")
@@ -97,11 +101,15 @@ def create_api_router() -> APIRouter:
             
             logger.info(f"Parsed {len(messages)} incoming message(s)")
             
-            # Process each message
+            # Dedupe and hand each message to the work queue; workers send the replies.
+            # One deadline for the whole payload, so a full queue delays the ack once
+            deferred = 0
+            deferred_wa_ids = set()
+            enqueue_deadline = work_queue.enqueue_deadline()
             for msg in messages:
                 try:
                     # Mask wa_id for logging (PRIVACY: never log full wa_id or user text)
-                    masked_wa_id = f"{msg.wa_id[:6]}****{msg.wa_id[-4:]}" if len(msg.wa_id) > 10 else "****"
+                    masked_wa_id = mask_wa_id(msg.wa_id)
                     message_preview = msg.message_body[:30] + "..." if len(msg.message_body) > 30 else msg.message_body
                     logger.info(f"Incoming message: type={msg.message_type}, from={masked_wa_id}, preview={message_preview}, message_id={msg.message_id[:20]}...")
                     
@@ -110,109 +118,34 @@ def create_api_router() -> APIRouter:
                         logger.info(f"Message {msg.message_id[:20]}... already processed, skipping")
                         continue
                     
-                    # Mark as processed
-                    store.mark_message_processed(msg.message_id)
-                    
-                    # Handle video messages (polite rejection)
-                    if msg.message_type == "video":
-                        response_text = "I can only process text messages, images, and PDF documents. Videos are not supported. Please send a photo or PDF of your medical report instead."
-                        try:
-                            await send_text_message(msg.wa_id, response_text)
-                            logger.info(f"✅ Sent video rejection message to {masked_wa_id}")
-                        except Exception as e:
-                            logger.error(f"❌ Failed to send video rejection to {masked_wa_id}: {type(e).__name__}", exc_info=False)
+                    # Keep the user's order: once one of their messages is deferred, so are the rest
+                    if msg.wa_id in deferred_wa_ids:
+                        deferred += 1
                         continue
                     
-                    # Handle image and document attachments
-                    if msg.message_type in ["image", "document"]:
-                        from .messages import process_attachment_async
-                        
-                        logger.info(f"Processing {msg.message_type} attachment: media_id={msg.media_id[:20] if msg.media_id else 'None'}..., mime_type={msg.mime_type}")
-                        
-                        try:
-                            response_text, extracted_text, metadata = await process_attachment_async(
-                                msg.wa_id,
-                                msg.media_id,
-                                msg.mime_type or "",
-                                msg.message_type,
-                                msg.caption
-                            )
-                            
-                            # Log extraction details
-                            if metadata:
-                                logger.info(
-                                    f"Attachment processed: type={msg.message_type}, "
-                                    f"size={metadata.get('file_size', 0)} bytes, "
-                                    f"method={metadata.get('extraction_method')}, "
-                                    f"pages={metadata.get('pages_processed', 0)}, "
-                                    f"text_length={metadata.get('extracted_text_length', 0)}"
-                                )
-                            
-                            # Send response
-                            await send_text_message(msg.wa_id, response_text)
-                            logger.info(f"✅ Sent attachment response to {masked_wa_id}")
-                            
-                        except Exception as e:
-                            logger.error(f"❌ Failed to process attachment for {masked_wa_id}: {type(e).__name__}", exc_info=True)
-                            await send_text_message(
-                                msg.wa_id,
-                                "I encountered an error processing your file. Please try uploading again or contact support."
-                            )
-                        continue
-                    
-                    # Handle text messages (existing flow)
-                    # Get user state and determine response (async with OpenAI integration + safety checks)
-                    response_text = await get_response_for_user_async(msg.wa_id, msg.message_body)
+                    # Mark as processed before awaiting, so a concurrent redelivery is skipped
+                    store.mark_message_processed(msg.message_id)
                     
-                    # Send reply
-                    try:
-                        await send_text_message(msg.wa_id, response_text)
-                        logger.info(f"✅ Sent reply to {masked_wa_id}")
-                        
-                        # If this was an acknowledgment, send the actual AI response in a follow-up
-                        from .messages import ACKNOWLEDGMENT_MESSAGE, get_ai_response
-                        if response_text == ACKNOWLEDGMENT_MESSAGE:
-                            # Get the actual AI response
-                            user = store.get_user(msg.wa_id)
-                            if user and user.get("onboarding_step") == "complete":
-                                profile = user.get("profile", {})
-                                message_upper = msg.message_body.upper().strip()
-                                menu_selection = None
-                                
-                                # Determine prompt based on menu selection or direct question
-                                if message_upper in ["1", "REPORTS"]:
-                                    menu_selection = "1"
-                                    prompt = "I need help understanding medical reports and test results. "
-                                elif message_upper in ["2", "SIDE EFFECTS", "SYMPTOMS"]:
-                                    menu_selection = "2"
-                                    prompt = "I need information about treatment side effects and symptoms. "
-                                elif message_upper in ["3", "NUTRITION"]:
-                                    menu_selection = "3"
-                                    prompt = "I need cancer-friendly nutrition and diet guidance. "
-                                elif message_upper in ["4", "HOSPITAL", "COSTS"]:
-                                    menu_selection = "4"
-                                    prompt = "I need help finding hospitals and estimating treatment costs. "
-                                else:
-                                    prompt = msg.message_body
-                                
-                                # Get AI response
-                                try:
-                                    ai_response = await get_ai_response(prompt, profile, menu_selection)
-                                    await send_text_message(msg.wa_id, ai_response)
-                                    logger.info(f"✅ Sent AI response to {masked_wa_id}")
-                                except Exception as e:
-                                    logger.error(f"❌ Failed to get/send AI response to {masked_wa_id}: {type(e).__name__}", exc_info=True)
-                                    await send_text_message(msg.wa_id, "I apologize, but I encountered an error processing your question. Please try rephrasing it or contact support.")
-                    except Exception as e:
-                        logger.error(f"❌ Failed to send reply to {masked_wa_id}: {type(e).__name__}", exc_info=False)  # Don't log full error with PII
-                        # Continue processing other messages even if one fails
+                    if not await work_queue.enqueue(msg, enqueue_deadline):
+                        # Queue full: let Meta redeliver it later
+                        store.unmark_message_processed(msg.message_id)
+                        deferred_wa_ids.add(msg.wa_id)
+                        deferred += 1
                 
                 except Exception as e:
-                    logger.error(f"Error processing message {msg.message_id}: {e}", exc_info=True)
-                    continue
+                    # Don't drop it: forget the mark and defer it like a full queue
+                    logger.error(f"Error queueing message {msg.message_id}: {e}", exc_info=True)
+                    store.unmark_message_processed(msg.message_id)
+                    deferred_wa_ids.add(msg.wa_id)
+                    deferred += 1
             
-            # Always return 200 to Meta
-            logger.info("✅ WhatsApp webhook POST processed successfully")
+            if deferred:
+                # Non-200 makes Meta retry the payload; already queued messages are deduped then
+                logger.warning(f"⚠️ WhatsApp webhook POST deferred {deferred} message(s) - not queued")
+                return JSONResponse({"status": "retry"}, status_code=503)
+            
+            # Every message is queued or a duplicate: ack with 200
+            logger.info("✅ WhatsApp webhook POST queued successfully")
             return JSONResponse({"status": "ok"})
         
         except Exception as e:
@@ -263,6 +196,19 @@ def create_api_router() -> APIRouter:
             "api_error": verification.get("error") if not verification.get("ready") else None
         })
     
+    @router.get("/debug/queue")
+    async def queue_status():
+        """
+        Work queue metrics: depth, backpressure and worker latency.
+        Counts only - no message content or WhatsApp IDs.
+        """
+        return JSONResponse(work_queue.stats())
+    
+    @router.on_event("shutdown")
+    async def stop_work_queue():
+        """Give queued messages a chance to be answered before shutdown"""
+        await work_queue.stop()
+    
     @router.get("/debug/webhook-status")
     async def webhook_status():
         """
@@ -15,6 +15,17 @@ def env(name: str, default: str = "") -> str:
     return value.strip()
 
 
+def env_number(name: str, default: float, minimum: float) -> float:
+    """Numeric environment variable; default if unset or invalid"""
+    raw = env(name)
+    try:
+        value = float(raw) if raw else default
+    except ValueError:
+        logger.warning(f"⚠️ Invalid {name}={raw!r}, using {default}")
+        return default
+    return max(value, minimum)
+
+
 class WhatsAppConfig:
     """WhatsApp configuration from environment variables"""
     
@@ -26,6 +37,12 @@ class WhatsAppConfig:
         self.app_env = env("APP_ENV", "local")
         self.admin_api_key = env("ADMIN_API_KEY", "")
         
+        # Background processing of webhook messages (see work_queue.py)
+        self.queue_workers = int(env_number("WHATSAPP_QUEUE_WORKERS", 8, 1))
+        self.queue_max_size = int(env_number("WHATSAPP_QUEUE_MAX_SIZE", 1000, 1))
+        self.queue_enqueue_timeout = env_number("WHATSAPP_QUEUE_ENQUEUE_TIMEOUT_SECONDS", 2.0, 0.0)
+        self.lane_idle_timeout = env_number("WHATSAPP_LANE_IDLE_SECONDS", 30.0, 0.0)
+        
         # Validate required fields
         if not self.access_token:
             logger.warning("⚠️ WHATSAPP_ACCESS_TOKEN not set - outbound messages will fail")
@@ -0,0 +1,118 @@
+"""
+Processing of a single incoming WhatsApp message
+Runs on the work queue's workers (see work_queue.py), after the webhook
+has acknowledged the payload: video rejection, attachment extraction, the
+conversation flow and the replies.
+"""
+import logging
+
+from .parser import IncomingMessage
+from .store import store
+from .client import send_text_message
+from .messages import get_response_for_user_async
+
+logger = logging.getLogger(__name__)
+
+
+def mask_wa_id(wa_id: str) -> str:
+    """PRIVACY: never log full wa_id"""
+    return f"{wa_id[:6]}****{wa_id[-4:]}" if len(wa_id) > 10 else "****"
+
+
+async def process_message(msg: IncomingMessage):
+    """Handle one deduplicated message and send the replies"""
+    masked_wa_id = mask_wa_id(msg.wa_id)
+    
+    # Handle video messages (polite rejection)
+    if msg.message_type == "video":
+        response_text = "I can only process text messages, images, and PDF documents. Videos are not supported. Please send a photo or PDF of your medical report instead."
+        try:
+            await send_text_message(msg.wa_id, response_text)
+            logger.info(f"✅ Sent video rejection message to {masked_wa_id}")
+        except Exception as e:
+            logger.error(f"❌ Failed to send video rejection to {masked_wa_id}: {type(e).__name__}", exc_info=False)
+        return
+    
+    # Handle image and document attachments
+    if msg.message_type in ["image", "document"]:
+        from .messages import process_attachment_async
+        
+        logger.info(f"Processing {msg.message_type} attachment: media_id={msg.media_id[:20] if msg.media_id else 'None'}..., mime_type={msg.mime_type}")
+        
+        try:
+            response_text, extracted_text, metadata = await process_attachment_async(
+                msg.wa_id,
+                msg.media_id,
+                msg.mime_type or "",
+                msg.message_type,
+                msg.caption
+            )
+            
+            # Log extraction details
+            if metadata:
+                logger.info(
+                    f"Attachment processed: type={msg.message_type}, "
+                    f"size={metadata.get('file_size', 0)} bytes, "
+                    f"method={metadata.get('extraction_method')}, "
+                    f"pages={metadata.get('pages_processed', 0)}, "
+                    f"text_length={metadata.get('extracted_text_length', 0)}"
+                )
+            
+            # Send response
+            await send_text_message(msg.wa_id, response_text)
+            logger.info(f"✅ Sent attachment response to {masked_wa_id}")
+            
+        except Exception as e:
+            logger.error(f"❌ Failed to process attachment for {masked_wa_id}: {type(e).__name__}", exc_info=True)
+            await send_text_message(
+                msg.wa_id,
+                "I encountered an error processing your file. Please try uploading again or contact support."
+            )
+        return
+    
+    # Handle text messages (existing flow)
+    # Get user state and determine response (async with OpenAI integration + safety checks)
+    response_text = await get_response_for_user_async(msg.wa_id, msg.message_body)
+    
+    # Send reply
+    try:
+        await send_text_message(msg.wa_id, response_text)
+        logger.info(f"✅ Sent reply to {masked_wa_id}")
+        
+        # If this was an acknowledgment, send the actual AI response in a follow-up
+        from .messages import ACKNOWLEDGMENT_MESSAGE, get_ai_response
+        if response_text == ACKNOWLEDGMENT_MESSAGE:
+            # Get the actual AI response
+            user = store.get_user(msg.wa_id)
+            if user and user.get("onboarding_step") == "complete":
+                profile = user.get("profile", {})
+                message_upper = msg.message_body.upper().strip()
+                menu_selection = None
+                
+                # Determine prompt based on menu selection or direct question
+                if message_upper in ["1", "REPORTS"]:
+                    menu_selection = "1"
+                    prompt = "I need help understanding medical reports and test results. "
+                elif message_upper in ["2", "SIDE EFFECTS", "SYMPTOMS"]:
+                    menu_selection = "2"
+                    prompt = "I need information about treatment side effects and symptoms. "
+                elif message_upper in ["3", "NUTRITION"]:
+                    menu_selection = "3"
+                    prompt = "I need cancer-friendly nutrition and diet guidance. "
+                elif message_upper in ["4", "HOSPITAL", "COSTS"]:
+                    menu_selection = "4"
+                    prompt = "I need help finding hospitals and estimating treatment costs. "
+                else:
+                    prompt = msg.message_body
+                
+                # Get AI response
+                try:
+                    ai_response = await get_ai_response(prompt, profile, menu_selection)
+                    await send_text_message(msg.wa_id, ai_response)
+                    logger.info(f"✅ Sent AI response to {masked_wa_id}")
+                except Exception as e:
+                    logger.error(f"❌ Failed to get/send AI response to {masked_wa_id}: {type(e).__name__}", exc_info=True)
+                    await send_text_message(msg.wa_id, "I apologize, but I encountered an error processing your question. Please try rephrasing it or contact support.")
+    except Exception as e:
+        logger.error(f"❌ Failed to send reply to {masked_wa_id}: {type(e).__name__}", exc_info=False)  # Don't log full error with PII
+        # Continue processing other messages even if one fails
@@ -227,6 +227,10 @@ class WhatsAppStore:
             to_remove = list(self.processed_message_ids)[:1000]
             for msg_id in to_remove:
                 self.processed_message_ids.discard(msg_id)
+    
+    def unmark_message_processed(self, message_id: str):
+        """Forget a message that couldn't be handled, so a redelivery is processed"""
+        self.processed_message_ids.discard(message_id)
 
 
 # Global store instance (in-memory)
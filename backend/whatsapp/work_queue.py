@@ -0,0 +1,232 @@
+"""
+Bounded background work queue for incoming WhatsApp messages
+The webhook only parses, deduplicates and enqueues, then acks Meta right
+away; the slow part (media download, OCR, OpenAI, replies) runs here.
+
+Scheduling is keyed by wa_id: each user gets a serial lane, so their
+messages - and the onboarding state changes they make in the store - are
+handled one at a time in arrival order, even across concurrent webhooks.
+Different users' lanes run in parallel, up to WHATSAPP_QUEUE_WORKERS
+messages at once, so one slow OCR job only holds up its own user. A lane
+with nothing to do for WHATSAPP_LANE_IDLE_SECONDS is evicted.
+
+Backpressure: at most WHATSAPP_QUEUE_MAX_SIZE messages wait across all
+lanes. When that's reached, enqueue waits for room until a deadline and
+then gives up, so the webhook can ask Meta to redeliver instead of
+dropping the message. The webhook uses one deadline,
+WHATSAPP_QUEUE_ENQUEUE_TIMEOUT_SECONDS after it starts queueing, for the
+whole payload: once it has passed, the remaining messages are only
+queued if there is room right away, so the ack is never held longer.
+"""
+import asyncio
+import logging
+import time
+from typing import Any, Awaitable, Callable, Dict, NamedTuple, Optional
+
+from .config import config
+from .parser import IncomingMessage
+from .processor import process_message
+
+logger = logging.getLogger(__name__)
+
+# How long shutdown waits for queued messages before cancelling lanes
+DRAIN_TIMEOUT_SECONDS = 10.0
+
+
+class QueuedMessage(NamedTuple):
+    message: IncomingMessage
+    enqueued_at: float  # monotonic
+
+
+class _Lane:
+    """Messages of one wa_id and the task working through them"""
+    __slots__ = ('queue', 'task')
+
+    def __init__(self):
+        self.queue: asyncio.Queue = asyncio.Queue()
+        self.task: Optional[asyncio.Task] = None
+
+
+class MessageWorkQueue:
+    """Serial lane per wa_id, parallel across users under a global concurrency limit"""
+
+    def __init__(
+        self,
+        handler: Callable[[IncomingMessage], Awaitable[Any]],
+        workers: int,
+        max_size: int,
+        enqueue_timeout: float,
+        lane_idle_timeout: float,
+    ):
+        self.handler = handler
+        self.workers = max(1, workers)
+        self.max_size = max(1, max_size)
+        self.enqueue_timeout = enqueue_timeout
+        self.lane_idle_timeout = lane_idle_timeout
+        self._lanes: Dict[str, _Lane] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._slots: Optional[asyncio.Semaphore] = None    # room for waiting messages
+        self._running: Optional[asyncio.Semaphore] = None  # messages handled at once
+        self._drained: Optional[asyncio.Event] = None
+        self._unfinished = 0
+        # Metrics
+        self.enqueued = 0
+        self.rejected = 0
+        self.started = 0
+        self.processed = 0
+        self.failed = 0
+        self.in_flight = 0
+        self.depth = 0
+        self.high_water = 0
+        self.lanes_created = 0
+        self.lanes_evicted = 0
+        self.max_lanes = 0
+        self.total_wait_seconds = 0.0
+        self.max_wait_seconds = 0.0
+        self.total_run_seconds = 0.0
+
+    def _ensure_started(self):
+        """Bind to the running loop (lazily, on first use)"""
+        loop = asyncio.get_running_loop()
+        if self._loop is loop:
+            return
+        if self._loop is not None:
+            logger.warning(f"WhatsApp work queue restarted on a new event loop, dropping {self.depth} queued message(s)")
+        self._lanes = {}
+        self._slots = asyncio.Semaphore(self.max_size)
+        self._running = asyncio.Semaphore(self.workers)
+        self._drained = asyncio.Event()
+        self._drained.set()
+        self._unfinished = 0
+        self.depth = 0
+        self._loop = loop
+        logger.info(f"Started WhatsApp work queue: {self.workers} concurrent, capacity {self.max_size}")
+
+    def enqueue_deadline(self) -> float:
+        """Deadline for queueing a batch of messages that starts now"""
+        return time.monotonic() + self.enqueue_timeout
+
+    async def enqueue(self, message: IncomingMessage, deadline: Optional[float] = None) -> bool:
+        """
+        Queue message on its wa_id's lane; False if the queue stayed full until
+        deadline (default: enqueue_deadline()) - backpressure. A passed deadline
+        only takes room that is free right away.
+        """
+        self._ensure_started()
+        timeout = (self.enqueue_deadline() if deadline is None else deadline) - time.monotonic()
+        try:
+            if timeout > 0:
+                await asyncio.wait_for(self._slots.acquire(), timeout)
+            elif self._slots.locked():
+                raise asyncio.TimeoutError
+            else:
+                await self._slots.acquire()
+        except asyncio.TimeoutError:
+            self.rejected += 1
+            logger.warning(f"WhatsApp work queue full (depth {self.depth}), deferring message {message.message_id[:20]}...")
+            return False
+
+        # No awaits from here on: the lane can't be evicted between lookup and put
+        lane = self._lanes.get(message.wa_id)
+        if lane is None:
+            lane = self._lanes[message.wa_id] = _Lane()
+            lane.task = self._loop.create_task(self._run_lane(message.wa_id, lane))
+            self.lanes_created += 1
+            self.max_lanes = max(self.max_lanes, len(self._lanes))
+        lane.queue.put_nowait(QueuedMessage(message, time.monotonic()))
+        self._unfinished += 1
+        self._drained.clear()
+        self.enqueued += 1
+        self.depth += 1
+        self.high_water = max(self.high_water, self.depth)
+        return True
+
+    async def _next(self, wa_id: str, lane: _Lane) -> Optional[QueuedMessage]:
+        """Next message of the lane, or None once it has been idle long enough to evict"""
+        while True:
+            try:
+                if self.lane_idle_timeout > 0:
+                    return await asyncio.wait_for(lane.queue.get(), self.lane_idle_timeout)
+                return lane.queue.get_nowait()
+            except (asyncio.TimeoutError, asyncio.QueueEmpty):
+                # Checked and removed without awaiting, so enqueue never sees a dead lane
+                if lane.queue.empty():
+                    if self._lanes.get(wa_id) is lane:
+                        del self._lanes[wa_id]
+                    self.lanes_evicted += 1
+                    return None
+
+    async def _run_lane(self, wa_id: str, lane: _Lane):
+        while True:
+            item = await self._next(wa_id, lane)
+            if item is None:
+                return
+            try:
+                async with self._running:
+                    # Counts against capacity until it runs, so waiting lanes stay bounded too
+                    self.depth -= 1
+                    self._slots.release()
+                    started = time.monotonic()
+                    wait = started - item.enqueued_at
+                    self.total_wait_seconds += wait
+                    self.max_wait_seconds = max(self.max_wait_seconds, wait)
+                    self.started += 1
+                    self.in_flight += 1
+                    try:
+                        await self.handler(item.message)
+                        self.processed += 1
+                    except Exception as e:
+                        self.failed += 1
+                        logger.error(f"Error processing message {item.message.message_id[:20]}...: {type(e).__name__}", exc_info=True)
+                    finally:
+                        self.in_flight -= 1
+                        self.total_run_seconds += time.monotonic() - started
+            finally:
+                self._unfinished -= 1
+                if self._unfinished == 0:
+                    self._drained.set()
+
+    async def stop(self, drain_timeout: float = DRAIN_TIMEOUT_SECONDS):
+        """Let the lanes finish what's queued (up to drain_timeout), then cancel them"""
+        if self._loop is not asyncio.get_running_loop():
+            return
+        try:
+            await asyncio.wait_for(self._drained.wait(), drain_timeout)
+        except asyncio.TimeoutError:
+            logger.warning(f"WhatsApp work queue stopped with {self._unfinished} message(s) unprocessed")
+        tasks = [lane.task for lane in self._lanes.values()]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._lanes, self._loop = {}, None
+
+    def stats(self) -> Dict[str, Any]:
+        started, finished = self.started, self.processed + self.failed
+        return {
+            'workers': self.workers,
+            'capacity': self.max_size,
+            'depth': self.depth,
+            'high_water': self.high_water,
+            'in_flight': self.in_flight,
+            'lanes': len(self._lanes),
+            'max_lanes': self.max_lanes,
+            'lanes_created': self.lanes_created,
+            'lanes_evicted': self.lanes_evicted,
+            'enqueued': self.enqueued,
+            'rejected': self.rejected,
+            'processed': self.processed,
+            'failed': self.failed,
+            'avg_wait_ms': round(self.total_wait_seconds / started * 1000, 2) if started else 0.0,
+            'max_wait_ms': round(self.max_wait_seconds * 1000, 2),
+            'avg_run_ms': round(self.total_run_seconds / finished * 1000, 2) if finished else 0.0,
+        }
+
+
+# Global work queue instance
+work_queue = MessageWorkQueue(
+    process_message,
+    workers=config.queue_workers,
+    max_size=config.queue_max_size,
+    enqueue_timeout=config.queue_enqueue_timeout,
+    lane_idle_timeout=config.lane_idle_timeout,
+)
@@ -234,7 +234,8 @@ const CostCalculator = () => {
 
       const payload = buildRequestPayload();
 
-      const response = await fetch(`${API_BASE}/calculate-cost`, {
+      // Assumption text is only rendered by the API when asked for
+      const response = await fetch(`${API_BASE}/calculate-cost?include=assumptions`, {
         method: 'POST',
         headers: {
           'Content-Type': 'application/json',
@@ -228,7 +228,7 @@ const CostCalculator = () => {
 
       const payload = buildRequestPayload();
 
-      const response = await fetch(`${API_BASE}/calculate-cost`, {
+      const response = await fetch(`${API_BASE}/calculate-cost?include=assumptions`, {
         method: 'POST',
         headers: {
           'Content-Type': 'application/json',